@@ -8,7 +8,8 @@ integrate with the RAG system, and provide consistent responses using self-consi
 import logging
 import asyncio
 import os
-from typing import Any, Dict, List, Optional, Callable
+import weakref
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from pydantic import BaseModel
 
 import httpx
@@ -20,6 +21,26 @@ from ..shared.terminology import InsuranceTerminologyTranslator
 from ..shared.consistency import SelfConsistencyChecker
 from agents.shared.rate_limiting import get_anthropic_rate_limiter
 
+# Self-consistency variant generation. The concurrency cap is shared by every
+# request in the process so a burst of queries cannot multiply LLM load.
+MAX_RESPONSE_VARIANTS = 3
+VARIANT_TIMEOUT_SECONDS = 15.0
+VARIANT_CONCURRENCY = int(os.getenv("IR_VARIANT_CONCURRENCY", "6"))
+
+_variant_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_variant_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on in-flight variant LLM calls for the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _variant_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(VARIANT_CONCURRENCY)
+        _variant_semaphores[loop] = semaphore
+    return semaphore
+
 
 class InformationRetrievalAgent(BaseAgent):
     """
@@ -440,56 +461,49 @@ Return ONLY the reframed query, nothing else:"""
         document_context = self._prepare_document_context(chunks)
         self.logger.info(f"Document context prepared: {len(document_context)} characters")
         
-        # Generate multiple variants
-        variants = []
-        max_variants = 3  # Start with 3 variants for MVP
+        # Fan out all variants at once under the shared concurrency cap and
+        # stop as soon as the completed ones are consistent enough
+        max_variants = MAX_RESPONSE_VARIANTS
+        semaphore = _get_variant_semaphore()
         
-        self.logger.info(f"=== GENERATING {max_variants} RESPONSE VARIANTS ===")
+        self.logger.info(f"=== GENERATING {max_variants} RESPONSE VARIANTS CONCURRENTLY ===")
         
-        for i in range(max_variants):
-            try:
-                self.logger.info(f"=== GENERATING VARIANT {i+1}/{max_variants} ===")
-                
-                # Create variant-specific prompt
-                self.logger.info("Creating variant-specific prompt...")
-                variant_prompt = self._create_variant_prompt(
-                    user_query, expert_query, document_context, variant_num=i+1
-                )
-                self.logger.info(f"Variant prompt created: {len(variant_prompt)} characters")
-                
-                # Generate variant using LLM with isolated timeout
-                self.logger.info(f"=== CALLING LLM FOR VARIANT {i+1} ===")
-                # Addresses: FM-043 - Replace deprecated get_event_loop() with get_running_loop()
-                loop = asyncio.get_running_loop()
-                start_time = loop.time()
-                
+        tasks = [
+            asyncio.create_task(
+                self._generate_variant(semaphore, user_query, expert_query, document_context, variant_num)
+            )
+            for variant_num in range(1, max_variants + 1)
+        ]
+        
+        completed: Dict[int, str] = {}
+        try:
+            for iteration, next_done in enumerate(asyncio.as_completed(tasks), start=1):
                 try:
-                    variant_response = await asyncio.wait_for(
-                        self._call_llm(variant_prompt),
-                        timeout=15.0  # 15 second timeout per variant
-                    )
-                    end_time = loop.time()
-                    self.logger.info(f"LLM call for variant {i+1} completed in {end_time - start_time:.2f}s")
-                    
-                except asyncio.TimeoutError:
-                    self.logger.error(f"LLM call for variant {i+1} timed out after 15 seconds")
-                    continue
+                    variant_num, variant = await next_done
                 except Exception as e:
-                    self.logger.error(f"LLM call for variant {i+1} failed: {e}")
+                    self.logger.error(f"Error generating variant: {e}")
                     continue
+                if variant:
+                    completed[variant_num] = variant
                 
-                # Clean and validate variant
-                self.logger.info(f"Cleaning and validating variant {i+1}...")
-                cleaned_variant = self._clean_response_variant(variant_response)
-                if cleaned_variant:
-                    variants.append(cleaned_variant)
-                    self.logger.info(f"Variant {i+1} successfully generated and cleaned")
-                else:
-                    self.logger.warning(f"Variant {i+1} failed validation")
-                
-            except Exception as e:
-                self.logger.error(f"Error generating variant {i+1}: {e}")
-                continue
+                current_variants = [completed[num] for num in sorted(completed)]
+                if iteration < max_variants and not self.consistency_checker.should_continue_generation(
+                    current_variants, iteration
+                ):
+                    self.logger.info(
+                        f"Stopping early after {iteration}/{max_variants} variants: consistency threshold met"
+                    )
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Keep any variant that finished before the remaining ones were cancelled
+        for outcome in outcomes:
+            if isinstance(outcome, tuple) and outcome[1]:
+                completed.setdefault(outcome[0], outcome[1])
+        variants = [completed[num] for num in sorted(completed)]
         
         self.logger.info(f"=== SELF-CONSISTENCY LOOP COMPLETED: {len(variants)} variants generated ===")
         
@@ -500,6 +514,54 @@ Return ONLY the reframed query, nothing else:"""
         
         return variants
     
+    async def _generate_variant(
+        self,
+        semaphore: asyncio.Semaphore,
+        user_query: str,
+        expert_query: str,
+        document_context: str,
+        variant_num: int
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Generate and clean a single response variant.
+        
+        Args:
+            semaphore: Shared cap on in-flight variant LLM calls
+            user_query: Original user query
+            expert_query: Expert-reframed query
+            document_context: Document chunks context
+            variant_num: Variant number for diversity
+            
+        Returns:
+            Tuple of (variant_num, cleaned variant), with None if generation failed
+        """
+        variant_prompt = self._create_variant_prompt(
+            user_query, expert_query, document_context, variant_num=variant_num
+        )
+        
+        async with semaphore:
+            # Addresses: FM-043 - Replace deprecated get_event_loop() with get_running_loop()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            try:
+                variant_response = await asyncio.wait_for(
+                    self._call_llm(variant_prompt),
+                    timeout=VARIANT_TIMEOUT_SECONDS
+                )
+                self.logger.info(f"LLM call for variant {variant_num} completed in {loop.time() - start_time:.2f}s")
+            except asyncio.TimeoutError:
+                self.logger.error(f"LLM call for variant {variant_num} timed out after {VARIANT_TIMEOUT_SECONDS:.0f} seconds")
+                return variant_num, None
+            except Exception as e:
+                self.logger.error(f"LLM call for variant {variant_num} failed: {e}")
+                return variant_num, None
+        
+        cleaned_variant = self._clean_response_variant(variant_response)
+        if not cleaned_variant:
+            self.logger.warning(f"Variant {variant_num} failed validation")
+            return variant_num, None
+        return variant_num, cleaned_variant
+    
     def _prepare_document_context(self, chunks: List[ChunkWithContext]) -> str:
         """
         Prepare document context for LLM processing.
@@ -147,3 +147,96 @@ class TestAsyncPatterns:
                         f"Deprecated get_event_loop() found at line {i}: {line.strip()}"
                     )
 
+
+
+class TestConcurrentVariantGeneration:
+    """Test concurrent self-consistency variant generation."""
+    
+    @pytest.fixture
+    def agent(self):
+        """Create agent instance for testing."""
+        return InformationRetrievalAgent(use_mock=True)
+    
+    @pytest.fixture
+    def chunks(self):
+        """Create retrieved chunks for variant prompts."""
+        from agents.tooling.rag.core import ChunkWithContext
+        return [
+            ChunkWithContext(
+                id="chunk_1",
+                doc_id="doc_1",
+                chunk_index=0,
+                content="Your plan covers outpatient physician services with a $25 copay.",
+                section_title="Physician Services",
+                page_start=1,
+                page_end=1,
+                similarity=0.85,
+                tokens=15
+            )
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_variants_generated_concurrently(self, agent, chunks):
+        """Test variant LLM calls overlap instead of running back to back."""
+        responses = iter([
+            "Doctor visits: your plan covers primary care visits with a $25 copay.",
+            "Specialist visits: a $40 copay applies and prior authorization may be needed.",
+            "Prescriptions: generic and brand name medications are covered.",
+        ])
+        
+        async def slow_llm(prompt):
+            await asyncio.sleep(0.2)
+            return next(responses)
+        
+        with patch.object(agent, '_call_llm', side_effect=slow_llm):
+            start = asyncio.get_running_loop().time()
+            variants = await agent._generate_response_variants(chunks, "doctor visits", "physician services")
+            elapsed = asyncio.get_running_loop().time() - start
+        
+        assert len(variants) == 3
+        assert elapsed < 0.5  # Sequential generation would take at least 0.6s
+    
+    @pytest.mark.asyncio
+    async def test_early_stop_cancels_outstanding_variants(self, agent, chunks):
+        """Test generation stops once completed variants are consistent."""
+        consistent = "Physician services: your plan covers outpatient visits with a $25 copay for primary care."
+        delays = iter([0.01, 0.02, 5.0])
+        cancelled = []
+        
+        async def llm(prompt):
+            delay = next(delays)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return consistent
+        
+        with patch.object(agent, '_call_llm', side_effect=llm):
+            start = asyncio.get_running_loop().time()
+            variants = await agent._generate_response_variants(chunks, "doctor visits", "physician services")
+            elapsed = asyncio.get_running_loop().time() - start
+        
+        assert variants == [consistent, consistent]
+        assert cancelled == [5.0]
+        assert elapsed < 1.0
+    
+    @pytest.mark.asyncio
+    async def test_failed_variants_are_skipped(self, agent, chunks):
+        """Test a failing variant does not discard the others."""
+        outcomes = iter([
+            RuntimeError("upstream error"),
+            "Doctor visits: your plan covers primary care visits with a $25 copay.",
+            "Specialist visits: a $40 copay applies and prior authorization may be needed.",
+        ])
+        
+        async def flaky_llm(prompt):
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        
+        with patch.object(agent, '_call_llm', side_effect=flaky_llm):
+            variants = await agent._generate_response_variants(chunks, "doctor visits", "physician services")
+        
+        assert len(variants) == 2
@@ -485,6 +485,7 @@ class EnhancedCLIInterface:
             print(f"     Total translations: {router_stats['total_translations']}")
             print(f"     Fallback usage: {router_stats['fallback_usage']}")
             print(f"     Total cost tracked: ${router_stats['cost_tracking']['total_cost']:.6f}")
+            print(f"     Cache: {router_stats['cache']['hits']} hits, {router_stats['cache']['misses']} misses")
             print(f"     Circuit breaker state: {router_stats['circuit_breaker_status']['router_state']}")
             
         except Exception as e:
@@ -35,6 +35,7 @@ class InputProcessingConfig:
     # Cache configuration
     cache_size: int = 1000
     cache_ttl: int = 3600  # seconds
+    cache_disk_path: Optional[str] = None  # SQLite file for persistent translation cache
     
     # Performance settings
     max_concurrent_requests: int = 10
@@ -67,6 +68,7 @@ class InputProcessingConfig:
             max_text_length=int(os.getenv("INPUT_PROCESSING_MAX_TEXT_LENGTH", "5000")),
             cache_size=int(os.getenv("INPUT_PROCESSING_CACHE_SIZE", "1000")),
             cache_ttl=int(os.getenv("INPUT_PROCESSING_CACHE_TTL", "3600")),
+            cache_disk_path=os.getenv("INPUT_PROCESSING_CACHE_DISK_PATH") or None,
             max_concurrent_requests=int(os.getenv("INPUT_PROCESSING_MAX_CONCURRENT", "10")),
             request_timeout=float(os.getenv("INPUT_PROCESSING_REQUEST_TIMEOUT", "30.0")),
             retry_attempts=int(os.getenv("INPUT_PROCESSING_RETRY_ATTEMPTS", "3")),
@@ -186,7 +188,12 @@ class InputProcessingConfig:
             "preferred_provider": self.preferred_provider,
             "enable_fallback": self.enable_fallback,
             "default_language": self.default_language,
-            "target_language": self.target_language
+            "target_language": self.target_language,
+            "cache": {
+                "size": self.cache_size,
+                "ttl": self.cache_ttl,
+                "disk_path": self.cache_disk_path
+            }
         }
         return router_config
 
@@ -236,7 +243,8 @@ def get_cache_config() -> Dict[str, Any]:
     config = get_config()
     return {
         "size": config.cache_size,
-        "ttl": config.cache_ttl
+        "ttl": config.cache_ttl,
+        "disk_path": config.cache_disk_path
     }
 
 
@@ -17,6 +17,7 @@ from .providers.elevenlabs import ElevenLabsProvider
 from .providers.flash import FlashProvider, FlashProviderFactory
 from .performance_monitor import track_performance, get_performance_monitor
 from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from .translation_cache import TranslationCache
 from .types import TranslationResult, TranslationError
 
 logger = logging.getLogger(__name__)
@@ -81,6 +82,7 @@ class IntelligentTranslationRouter:
         performance_monitor: Performance monitoring instance
         providers: Dictionary of configured translation providers
         router_circuit_breaker: Circuit breaker for router-level protection
+        translation_cache: Cache of translations served before any routing
         routing_decisions: History of routing decisions made
         fallback_usage_stats: Statistics on fallback provider usage
         total_cost_tracked: Total cost tracked across all providers
@@ -101,6 +103,7 @@ class IntelligentTranslationRouter:
                 - enable_fallback: Whether fallback is enabled
                 - default_language: Default source language
                 - target_language: Target language for translations
+                - cache: Optional translation cache settings (size, ttl, disk_path)
                 
         Raises:
             ValueError: If no translation providers are available
@@ -134,6 +137,14 @@ class IntelligentTranslationRouter:
         self.total_cost_tracked = 0.0
         self.cost_by_provider: Dict[str, float] = defaultdict(float)
         
+        # Translation cache, checked before routing and provider calls
+        cache_config = self.config.get("cache", {})
+        self.translation_cache = TranslationCache(
+            max_entries=cache_config.get("size", 1000),
+            ttl_seconds=cache_config.get("ttl", 3600),
+            disk_cache_path=cache_config.get("disk_path")
+        )
+        
         logger.info("Intelligent translation router initialized")
     
     def _initialize_providers(self) -> None:
@@ -540,6 +551,10 @@ class IntelligentTranslationRouter:
     ) -> TranslationResult:
         """Translate text with intelligent fallback chain.
         
+        Cached translations are returned without routing, circuit breaker
+        checks or provider calls; concurrent requests for the same text,
+        language pair and routing preferences share one translation.
+        
         Args:
             text: Text to translate
             source_lang: Source language
@@ -547,11 +562,33 @@ class IntelligentTranslationRouter:
             user_preferences: User preferences for cost/quality trade-offs
             
         Returns:
-            Translation result from best available provider
+            Translation result from the cache or the best available provider
             
         Raises:
             TranslationError: If all providers fail
         """
+        return await self.translation_cache.get_or_translate(
+            text, source_lang, target_lang,
+            lambda: self._route_and_translate(text, source_lang, target_lang, user_preferences),
+            variant=self._routing_cache_variant(user_preferences)
+        )
+    
+    def _routing_cache_variant(self, user_preferences: Optional[Dict[str, Any]]) -> str:
+        """Cache key component for the preferences make_routing_decision reads."""
+        user_preferences = user_preferences or {}
+        return "|".join(
+            f"{name}={user_preferences.get(name, 'balanced')}"
+            for name in ("cost_sensitivity", "quality_preference")
+        )
+    
+    async def _route_and_translate(
+        self, 
+        text: str, 
+        source_lang: str, 
+        target_lang: str,
+        user_preferences: Optional[Dict[str, Any]]
+    ) -> TranslationResult:
+        """Route a translation request and run it through the fallback chain."""
         # Use circuit breaker for fault tolerance
         from .circuit_breaker import circuit_breaker_protection
         
@@ -709,7 +746,8 @@ class IntelligentTranslationRouter:
             "circuit_breaker_status": {
                 "router_state": self.router_circuit_breaker.state.value,
                 "router_failures": self.router_circuit_breaker.failure_count
-            }
+            },
+            "cache": self.translation_cache.get_stats()
         }
     
     async def health_check(self) -> bool:
@@ -0,0 +1,202 @@
+"""
+Collocated unit tests for the translation cache and its use in the router.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from .router import IntelligentTranslationRouter
+from .translation_cache import TranslationCache, translation_cache_key
+from .types import TranslationError, TranslationResult
+
+
+def make_result(text: str) -> TranslationResult:
+    return TranslationResult(
+        text=f"translated: {text}",
+        confidence=0.9,
+        provider="elevenlabs",
+        cost_estimate=0.002,
+        source_language="es",
+        target_language="en"
+    )
+
+
+class CountingTranslator:
+    """Translator that counts calls and can be slowed down or made to fail."""
+
+    def __init__(self, delay: float = 0.0, error: Exception = None):
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    def __call__(self, text: str):
+        async def translate():
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return make_result(text)
+        return translate
+
+
+@pytest.fixture
+def router():
+    """Router with only the ElevenLabs provider, whose API calls are faked."""
+    router = IntelligentTranslationRouter({
+        "elevenlabs": {"enabled": True, "api_key": "test-key", "max_retries": 1},
+        "flash": {"enabled": False},
+        "cache": {"size": 2, "ttl": 60}
+    })
+    provider = router.providers["elevenlabs"].provider
+    provider.calls = 0
+
+    async def translate(text, source_lang, target_lang):
+        provider.calls += 1
+        await asyncio.sleep(0.01)
+        return make_result(text)
+
+    async def health_check():
+        return True
+
+    provider.translate = translate
+    provider.health_check = health_check
+    return router
+
+
+class TestTranslationCache:
+    """Test key normalization, expiry, eviction and deduplication."""
+
+    def test_key_normalizes_whitespace_and_language_case(self):
+        """Test equivalent requests share a key and language pairs do not."""
+        key = translation_cache_key("¿Cuánto  cuesta\n mi deducible?", "ES", "en")
+        assert key == translation_cache_key(" ¿Cuánto cuesta mi deducible? ", "es", "EN")
+        assert key != translation_cache_key("¿Cuánto cuesta mi deducible?", "es", "fr")
+        assert key != translation_cache_key("¿Cuánto cuesta mi deducible?", "es", "en", "quality_preference=high")
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_translator_and_costs_nothing(self):
+        """Test the second request is served from cache with zero cost."""
+        cache = TranslationCache()
+        translator = CountingTranslator()
+
+        first = await cache.get_or_translate("hola", "es", "en", translator("hola"))
+        second = await cache.get_or_translate("hola", "es", "en", translator("hola"))
+
+        assert translator.calls == 1
+        assert first.cost_estimate == 0.002
+        assert second.text == first.text and second.cost_estimate == 0.0
+        assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_and_lru_eviction(self):
+        """Test expired entries are re-translated and the least recent entry is evicted."""
+        cache = TranslationCache(max_entries=2, ttl_seconds=60)
+        translator = CountingTranslator()
+
+        for text in ("uno", "dos"):
+            await cache.get_or_translate(text, "es", "en", translator(text))
+        await cache.get_or_translate("uno", "es", "en", translator("uno"))  # "dos" is now least recent
+        await cache.get_or_translate("tres", "es", "en", translator("tres"))
+        assert cache.stats.evictions == 1
+        await cache.get_or_translate("uno", "es", "en", translator("uno"))
+        assert translator.calls == 3
+
+        cache._entries[translation_cache_key("uno", "es", "en")].timestamp = time.time() - 61
+        await cache.get_or_translate("uno", "es", "en", translator("uno"))
+        assert translator.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_translation(self):
+        """Test in-flight deduplication, and that failures reach every waiter uncached."""
+        cache = TranslationCache()
+        translator = CountingTranslator(delay=0.05)
+
+        results = await asyncio.gather(*[
+            cache.get_or_translate("hola", "es", "en", translator("hola")) for _ in range(5)
+        ])
+        assert translator.calls == 1
+        assert {r.text for r in results} == {"translated: hola"}
+        assert cache.stats.coalesced == 4
+
+        failing = CountingTranslator(delay=0.05, error=TranslationError("down"))
+        outcomes = await asyncio.gather(*[
+            cache.get_or_translate("adiós", "es", "en", failing("adiós")) for _ in range(3)
+        ], return_exceptions=True)
+        assert failing.calls == 1
+        assert all(isinstance(outcome, TranslationError) for outcome in outcomes)
+        assert cache.get_stats()["cached_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        """Test callers coalesced onto a cancelled first request still get the translation."""
+        cache = TranslationCache()
+        translator = CountingTranslator(delay=0.05)
+
+        leader = asyncio.create_task(cache.get_or_translate("hola", "es", "en", translator("hola")))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(cache.get_or_translate("hola", "es", "en", translator("hola")))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled()
+        assert translator.calls == 1
+        assert {r.text for r in results} == {"translated: hola"}
+        assert cache.get_stats()["cached_entries"] == 1 and cache.get_stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """Test a new cache instance is served from the persistent tier."""
+        path = str(tmp_path / "translations.sqlite")
+        translator = CountingTranslator()
+
+        cache = TranslationCache(disk_cache_path=path)
+        await cache.get_or_translate("hola", "es", "en", translator("hola"))
+        cache.close()
+
+        restarted = TranslationCache(disk_cache_path=path)
+        result = await restarted.get_or_translate("hola", "es", "en", translator("hola"))
+        restarted.close()
+
+        assert translator.calls == 1
+        assert result.text == "translated: hola" and result.cost_estimate == 0.0
+        assert restarted.stats.disk_hits == 1
+
+
+class TestRouterTranslationCache:
+    """Test the router serves cache hits without routing or provider calls."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_bypasses_routing(self, router):
+        """Test repeated translations skip routing and appear in router stats."""
+        await router.translate_with_fallback("Necesito ver a un cardiólogo", "es")
+        await router.translate_with_fallback("Necesito  ver a un cardiólogo ", "es")
+
+        provider = router.providers["elevenlabs"].provider
+        stats = router.get_router_stats()
+        assert provider.calls == 1
+        assert stats["total_translations"] == 1  # One routing decision
+        assert stats["cache"]["hits"] == 1 and stats["cache"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_router_requests_deduplicated(self, router):
+        """Test concurrent identical requests make one provider call."""
+        await asyncio.gather(*[router.translate_with_fallback("hola", "es") for _ in range(4)])
+
+        assert router.providers["elevenlabs"].provider.calls == 1
+        assert router.get_router_stats()["cache"]["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_routing_preferences_are_part_of_the_key(self, router):
+        """Test requests routed with different preferences never share a cached translation."""
+        await router.translate_with_fallback("hola", "es")
+        await router.translate_with_fallback("hola", "es", user_preferences={"quality_preference": "balanced"})
+        await router.translate_with_fallback("hola", "es", user_preferences={"quality_preference": "high"})
+
+        assert router.providers["elevenlabs"].provider.calls == 2
+        assert router.get_router_stats()["cache"]["hits"] == 1
@@ -0,0 +1,282 @@
+"""Translation result cache for the translation router.
+
+Caches successful translations keyed on a hash of the normalized text, the
+language pair and any routing inputs that change the result, with TTL expiry
+and LRU eviction bounded by the configured cache size. Concurrent requests for
+the same key share one provider call, and an optional SQLite tier lets cached
+translations survive process restarts.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .types import CacheEntry, TranslationResult
+
+logger = logging.getLogger(__name__)
+
+# Produces a translation on a cache miss
+Translator = Callable[[], Awaitable[TranslationResult]]
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys: NFKC and collapsed whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def translation_cache_key(text: str, source_lang: str, target_lang: str, variant: str = "") -> str:
+    """Cache key for a text, language pair and routing variant."""
+    payload = (
+        f"{source_lang.lower()}\x00{target_lang.lower()}\x00{variant}\x00{normalize_text(text)}"
+    ).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+@dataclass
+class TranslationCacheStats:
+    """Counters for translation cache effectiveness."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class _DiskTranslationCache:
+    """SQLite-backed persistent tier; all calls run in a worker thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str, ttl_seconds: float) -> Optional[Tuple[TranslationResult, float]]:
+        async with self._lock:
+            row = await asyncio.to_thread(self._get, key)
+        if row is None:
+            return None
+        result, created_at = row
+        if time.time() - created_at > ttl_seconds:
+            return None
+        return TranslationResult(**json.loads(result)), created_at
+
+    async def put(self, key: str, result: TranslationResult, created_at: float) -> None:
+        payload = json.dumps(dataclasses.asdict(result))
+        async with self._lock:
+            await asyncio.to_thread(self._put, key, payload, created_at)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _get(self, key: str) -> Optional[Tuple[str, float]]:
+        return self._conn.execute(
+            "SELECT result, created_at FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _put(self, key: str, payload: str, created_at: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO translations (key, result, created_at) VALUES (?, ?, ?)",
+            (key, payload, created_at)
+        )
+        self._conn.commit()
+
+
+class TranslationCache:
+    """TTL/LRU translation cache with in-flight deduplication.
+
+    Lookups check the in-memory entries, then the optional disk tier. Misses
+    for the same key are coalesced onto one call of the supplied translator,
+    which runs in its own task so cancelling the first caller does not cancel
+    the callers waiting on it; failed translations are not cached. Cached
+    results are returned with a zero cost estimate, since serving them costs
+    nothing.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 3600.0,
+        disk_cache_path: Optional[str] = None
+    ):
+        """Initialize the translation cache.
+
+        Args:
+            max_entries: Maximum translations held in memory
+            ttl_seconds: Age after which cached translations expire
+            disk_cache_path: Optional SQLite file for the persistent tier
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = TranslationCacheStats()
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._disk: Optional[_DiskTranslationCache] = None
+        if disk_cache_path:
+            try:
+                self._disk = _DiskTranslationCache(disk_cache_path)
+            except Exception as e:
+                logger.warning(f"Translation disk cache disabled ({disk_cache_path}): {e}")
+
+    async def get_or_translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        translator: Translator,
+        variant: str = ""
+    ) -> TranslationResult:
+        """Return a cached translation, or translate and cache it.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language
+            target_lang: Target language
+            translator: Called on a miss to produce the translation
+            variant: Routing inputs that change the translation (e.g. user
+                preferences); requests with different variants never share
+                a result
+
+        Returns:
+            Translation result, from cache or from the translator
+        """
+        key = translation_cache_key(text, source_lang, target_lang, variant)
+
+        # Check memory and in-flight requests without yielding, so concurrent
+        # callers for the same key see each other's claims
+        cached = self._get_memory(key)
+        if cached is not None:
+            return self._as_cache_hit(cached)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            return self._as_cache_hit(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(self._load_or_translate(key, translator))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters and occupancy."""
+        return {
+            **self.stats.to_dict(),
+            "cached_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "inflight": len(self._inflight),
+            "disk_tier": self._disk is not None,
+        }
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        self._entries.clear()
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    async def _load_or_translate(self, key: str, translator: Translator) -> TranslationResult:
+        cached = await self._get_disk(key)
+        if cached is not None:
+            return self._as_cache_hit(cached)
+        self.stats.misses += 1
+        result = await translator()
+        stored_at = time.time()
+        self._store_memory(key, result, stored_at)
+        await self._put_disk(key, result, stored_at)
+        return result
+
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark retrieved so failures nobody awaited are not logged
+        if not task.cancelled():
+            task.exception()
+
+    def _as_cache_hit(self, result: TranslationResult) -> TranslationResult:
+        return dataclasses.replace(result, cost_estimate=0.0)
+
+    def _get_memory(self, key: str) -> Optional[TranslationResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry.timestamp > entry.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        entry.access_count += 1
+        self.stats.hits += 1
+        return entry.translation_result
+
+    async def _get_disk(self, key: str) -> Optional[TranslationResult]:
+        if self._disk is None:
+            return None
+        try:
+            cached = await self._disk.get(key, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Translation disk cache read failed: {e}")
+            return None
+        if cached is None:
+            return None
+        result, created_at = cached
+        self._store_memory(key, result, created_at)
+        self.stats.hits += 1
+        self.stats.disk_hits += 1
+        return result
+
+    async def _put_disk(self, key: str, result: TranslationResult, stored_at: float) -> None:
+        if self._disk is None:
+            return
+        try:
+            await self._disk.put(key, result, stored_at)
+        except Exception as e:
+            logger.warning(f"Translation disk cache write failed: {e}")
+
+    def _store_memory(self, key: str, result: TranslationResult, timestamp: float) -> None:
+        self._entries[key] = CacheEntry(
+            key=key,
+            translation_result=result,
+            timestamp=timestamp,
+            access_count=0,
+            ttl=self.ttl_seconds
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
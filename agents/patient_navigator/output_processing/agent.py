@@ -5,14 +5,90 @@ This agent transforms technical agent outputs into warm, empathetic, user-friend
 using the BaseAgent pattern and Claude Haiku LLM.
 """
 
+import asyncio
+import json
 import logging
 import time
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
 from agents.base_agent import BaseAgent
+from agents.shared.http_clients import (
+    ANTHROPIC_HOST,
+    ANTHROPIC_MESSAGES_URL,
+    anthropic_headers,
+    get_http_client_registry,
+)
+from agents.shared.monitoring.resource_sampler import get_resource_sampler
 from .types import CommunicationRequest, CommunicationResponse, AgentOutput
 from .config import OutputProcessingConfig
 
+# Upper bound on one enhancement LLM call
+LLM_TIMEOUT_SECONDS = 60.0
+
+# Statuses retried before the first streamed byte (529: Anthropic overloaded)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+JSON_RESPONSE_INSTRUCTION = "\n\nIMPORTANT: You must respond with ONLY valid JSON. Do not include any other text, explanations, or formatting outside the JSON object."
+
+
+def _clean_llm_content(content: str) -> str:
+    """Strip code fences and unwrap a JSON {"enhanced_content": ...} reply."""
+    # The response should now be plain text, not JSON
+    content = content.strip()
+    
+    # If the response starts with a backtick, extract the content from within
+    if content.startswith("```json"):
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif content.startswith("```"):
+        content = content.split("```")[1].split("```")[0].strip()
+    
+    # Check if the response is still JSON format (fallback for old behavior)
+    if content.startswith('{'):
+        logging.warning("Claude Haiku returned JSON format instead of plain text, extracting content...")
+        try:
+            parsed_json = json.loads(content)
+            return parsed_json.get("enhanced_content", content)
+        except json.JSONDecodeError:
+            # If JSON parsing fails, return the content as-is
+            pass
+    
+    # Return the plain text content directly
+    return content
+
+
+async def _clean_llm_stream(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Incremental _clean_llm_content: the joined output always equals cleaning
+    the full reply.
+    
+    Plain text passes through as it arrives, minus leading and trailing
+    whitespace. A reply that opens with a code fence or a JSON object can only
+    be cleaned once complete, so it is buffered and yielded as one chunk.
+    """
+    head = ""
+    plain = False
+    pending = ""  # Trailing whitespace, held until more text follows it
+    async for text in chunks:
+        if not plain:
+            head += text
+            stripped = head.lstrip()
+            if len(stripped) < 3 or stripped.startswith(("```", "{")):
+                continue
+            plain = True
+            text = stripped
+        body = pending + text
+        trimmed = body.rstrip()
+        pending = body[len(trimmed):]
+        if trimmed:
+            yield trimmed
+    
+    if not plain:
+        if not head:
+            raise ValueError("Empty response from Claude Haiku")
+        yield _clean_llm_content(head)
+
 
 def _get_claude_haiku_llm():
     """
@@ -35,7 +111,7 @@ def _get_claude_haiku_llm():
             """Call Claude Haiku with the given prompt."""
             try:
                 # Add explicit JSON formatting instruction to the prompt
-                json_prompt = prompt + "\n\nIMPORTANT: You must respond with ONLY valid JSON. Do not include any other text, explanations, or formatting outside the JSON object."
+                json_prompt = prompt + JSON_RESPONSE_INSTRUCTION
                 
                 resp = client.messages.create(
                     model=model,
@@ -49,29 +125,7 @@ def _get_claude_haiku_llm():
                 if not content:
                     raise ValueError("Empty response from Claude Haiku")
                 
-                # The response should now be plain text, not JSON
-                content = content.strip()
-                
-                # If the response starts with a backtick, extract the content from within
-                if content.startswith("```json"):
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif content.startswith("```"):
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                # Check if the response is still JSON format (fallback for old behavior)
-                if content.startswith('{'):
-                    logging.warning("Claude Haiku returned JSON format instead of plain text, extracting content...")
-                    try:
-                        import json
-                        parsed_json = json.loads(content)
-                        enhanced_content = parsed_json.get("enhanced_content", content)
-                        return enhanced_content
-                    except json.JSONDecodeError:
-                        # If JSON parsing fails, return the content as-is
-                        pass
-                
-                # Return the plain text content directly
-                return content
+                return _clean_llm_content(content)
                 
             except Exception as e:
                 logging.error(f"Claude Haiku API call failed: {e}")
@@ -84,6 +138,116 @@ def _get_claude_haiku_llm():
         return None
 
 
+class AsyncClaudeClient:
+    """
+    Native async Claude client with token streaming.
+    
+    Requests go over the pooled Anthropic client from the process-wide HTTP
+    client registry, so they share keep-alive connections and the upstream
+    concurrency cap instead of occupying a worker thread per call. Rate
+    limit and server errors are retried with exponential backoff (or the
+    Retry-After delay) until the stream starts; once text has been yielded
+    errors propagate, since the caller has already consumed part of it.
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        max_tokens: int = 4000,
+        temperature: float = 0.2,
+        timeout: float = LLM_TIMEOUT_SECONDS,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+    
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield text deltas as the messages API streams them."""
+        payload = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "stream": True,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        for attempt in range(self.max_retries + 1):
+            retry_delay = None
+            async with get_http_client_registry().checkout(ANTHROPIC_HOST) as client:
+                async with client.stream(
+                    "POST",
+                    ANTHROPIC_MESSAGES_URL,
+                    json=payload,
+                    headers=anthropic_headers(self.api_key),
+                    timeout=self.timeout
+                ) as response:
+                    if response.status_code != 200:
+                        body = (await response.aread()).decode(errors="replace")
+                        if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_retries:
+                            raise RuntimeError(f"Anthropic API error: {response.status_code} - {body[:500]}")
+                        retry_delay = self._retry_delay(attempt, response.headers.get("retry-after"))
+                        logging.warning(
+                            f"Anthropic API returned {response.status_code}, retrying in {retry_delay:.1f}s "
+                            f"(attempt {attempt + 1}/{self.max_retries})"
+                        )
+                    else:
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            event = json.loads(line[5:])
+                            event_type = event.get("type")
+                            if event_type == "content_block_delta":
+                                text = event.get("delta", {}).get("text")
+                                if text:
+                                    yield text
+                            elif event_type == "error":
+                                raise RuntimeError(f"Anthropic stream error: {event.get('error')}")
+                            elif event_type == "message_stop":
+                                break
+                        return
+            # Back off without holding a pooled connection slot
+            await asyncio.sleep(retry_delay)
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Seconds to wait before the next attempt, honoring Retry-After."""
+        try:
+            if retry_after is not None:
+                return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        return self.retry_base_delay * (2 ** attempt)
+    
+    async def complete(self, prompt: str) -> str:
+        """Return the full, cleaned completion (same contract as the sync client)."""
+        return "".join([text async for text in _clean_llm_stream(self.stream(prompt + JSON_RESPONSE_INSTRUCTION))])
+
+
+def _get_async_claude_client() -> Optional[AsyncClaudeClient]:
+    """Return an AsyncClaudeClient when ANTHROPIC_API_KEY is set, else None."""
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        return None
+    return AsyncClaudeClient(api_key=api_key, model=os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5"))
+
+
+# App-wide executor for injected synchronous LLM clients
+_llm_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_llm_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get or create the shared, bounded executor for synchronous LLM calls."""
+    global _llm_executor
+    if _llm_executor is None:
+        _llm_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="comm_agent")
+    return _llm_executor
+
+
 class CommunicationAgent(BaseAgent):
     """
     Communication Agent that enhances agent outputs with warm, empathetic communication.
@@ -92,22 +256,31 @@ class CommunicationAgent(BaseAgent):
     Uses Claude Haiku LLM for consistent performance and cost efficiency.
     """
     
-    def __init__(self, llm_client=None, config: Optional[OutputProcessingConfig] = None, **kwargs):
+    def __init__(
+        self,
+        llm_client=None,
+        config: Optional[OutputProcessingConfig] = None,
+        async_llm_client: Optional[AsyncClaudeClient] = None,
+        **kwargs
+    ):
         """
         Initialize the Communication Agent.
         
         Args:
-            llm_client: LLM client for Claude Haiku (or None for auto-detection)
+            llm_client: Synchronous LLM callable for Claude Haiku (or None for auto-detection)
             config: Configuration for the agent
+            async_llm_client: Native async client used by enhance_response and
+                stream_response (auto-detected along with llm_client)
             **kwargs: Additional arguments passed to BaseAgent
         """
         # Store the original config before BaseAgent initialization
         original_config = config or OutputProcessingConfig.from_environment()
         
-        # Auto-detect LLM client if not provided
-        if llm_client is None:
+        # Auto-detect LLM clients if not provided
+        if llm_client is None and async_llm_client is None:
+            async_llm_client = _get_async_claude_client()
             llm_client = _get_claude_haiku_llm()
-            if llm_client:
+            if async_llm_client or llm_client:
                 logging.info("Auto-detected Claude Haiku LLM client")
             else:
                 logging.info("No Claude Haiku client available, using mock mode")
@@ -117,13 +290,14 @@ class CommunicationAgent(BaseAgent):
             prompt=os.path.join(os.path.dirname(__file__), "prompts", "system_prompt.md"),
             output_schema=CommunicationResponse,
             llm=llm_client,  # Claude Haiku client or None for mock mode
-            mock=llm_client is None,
+            mock=llm_client is None and async_llm_client is None,
             config=original_config.to_dict(),  # Pass config as dictionary to BaseAgent
             **kwargs
         )
         
         # Restore the original config object after BaseAgent initialization
         self.config = original_config
+        self.async_llm = async_llm_client
         
         self.logger = logging.getLogger(f"agent.{self.name}")
         self.logger.info(f"Initialized Communication Agent with config: {self.config.to_dict()}")
@@ -154,24 +328,7 @@ class CommunicationAgent(BaseAgent):
                 llm_result = self.llm(prompt)
                 self.logger.info(f"[{self.name}] LLM call completed, result length: {len(str(llm_result))} characters")
                 
-                # Handle plain text response instead of JSON
-                enhanced_content = str(llm_result).strip()
-                
-                # Extract user_context if provided
-                user_context = kwargs.get('user_context', {})
-                
-                # Create CommunicationResponse with plain text content
-                response = CommunicationResponse(
-                    enhanced_content=enhanced_content,
-                    original_sources=["unknown"],  # Will be set by caller
-                    processing_time=0.0,  # Will be calculated by caller
-                    metadata={
-                        "tone_applied": "warm_empathetic",
-                        "content_type": "enhanced_response",
-                        "enhancement_quality": "high"
-                    }
-                )
-                
+                response = self._llm_response(llm_result)
                 self.logger.info(f"[{self.name}] Response created successfully")
                 return response
                 
@@ -185,6 +342,20 @@ class CommunicationAgent(BaseAgent):
         else:
             self.logger.info("Running in mock mode - no LLM client available")
     
+    @staticmethod
+    def _llm_response(llm_result: Any) -> CommunicationResponse:
+        """Wrap a plain text LLM reply (not JSON) in a CommunicationResponse."""
+        return CommunicationResponse(
+            enhanced_content=str(llm_result).strip(),
+            original_sources=["unknown"],  # Will be set by caller
+            processing_time=0.0,  # Will be calculated by caller
+            metadata={
+                "tone_applied": "warm_empathetic",
+                "content_type": "enhanced_response",
+                "enhancement_quality": "high"
+            }
+        )
+    
     def mock_output(self, user_input: str) -> CommunicationResponse:
         """
         Generate a realistic mock output for testing.
@@ -286,67 +457,20 @@ class CommunicationAgent(BaseAgent):
             formatted_input = self._format_agent_outputs(request)
             self.logger.info(f"Formatted input length: {len(formatted_input)} characters")
             
-            # Call the agent (inherited from BaseAgent) with async timeout handling
+            # Generate on the event loop; only injected sync clients use a worker thread
             self.logger.info("Step 3: Calling LLM with async timeout handling")
-            import asyncio
-            import concurrent.futures
-            import psutil
-            import os
-            
-            # Use asyncio.run_in_executor for proper async handling
-            # Addresses: FM-043 - Replace deprecated get_event_loop() with get_running_loop()
-            loop = asyncio.get_running_loop()
-            
-            # Production environment detection and resource monitoring
-            is_production = os.getenv("ENVIRONMENT", "").lower() in ["production", "prod"]
-            if is_production:
-                self.logger.info("=== PRODUCTION ENVIRONMENT DETECTED ===")
-                # Log system resources for production debugging
-                try:
-                    memory_info = psutil.virtual_memory()
-                    self.logger.info(f"Memory usage: {memory_info.percent}% ({memory_info.available / 1024 / 1024:.1f}MB available)")
-                    cpu_percent = psutil.cpu_percent(interval=1)
-                    self.logger.info(f"CPU usage: {cpu_percent}%")
-                except Exception as e:
-                    self.logger.warning(f"Could not get system metrics: {e}")
-            else:
-                self.logger.info("=== DEVELOPMENT ENVIRONMENT DETECTED ===")
-            
-            def llm_call():
-                try:
-                    self.logger.info("Executor started for Communication Agent LLM call")
-                    # Make the actual LLM call
-                    response = self(formatted_input, user_context=request.user_context)
-                    self.logger.info("Executor completed Communication Agent LLM call successfully")
-                    return response
-                except Exception as e:
-                    self.logger.error(f"Executor failed with exception: {e}")
-                    raise
-            
-            # Run LLM call in thread pool with timeout and production-optimized settings
+            self._log_resource_usage()
             try:
-                self.logger.info("Starting LLM call with 60-second timeout")
-                
-                # Use a dedicated thread pool executor for better resource management
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="comm_agent") as executor:
-                    response = await asyncio.wait_for(
-                        loop.run_in_executor(executor, llm_call),
-                        timeout=60.0
-                    )
-                
-                self.logger.info("=== CLAUDE API RESPONSE RECEIVED ===")
-                self.logger.info(f"Response type: {type(response)}")
-                self.logger.info(f"Response length: {len(str(response))}")
-                self.logger.info("=== STARTING POST-PROCESSING ===")
+                response = await asyncio.wait_for(
+                    self._generate(formatted_input, request.user_context),
+                    timeout=LLM_TIMEOUT_SECONDS
+                )
+                self.logger.info(f"LLM response received, length: {len(response.enhanced_content)}")
             except asyncio.TimeoutError:
-                self.logger.error("Communication Agent LLM call timed out after 60 seconds")
-                # Add production-specific timeout handling
-                self.logger.warning("Production timeout detected - this may indicate resource constraints")
-                raise asyncio.TimeoutError("Communication Agent LLM call timed out after 60 seconds")
+                self.logger.error(f"Communication Agent LLM call timed out after {LLM_TIMEOUT_SECONDS:.0f} seconds")
+                raise
             except Exception as e:
-                self.logger.error(f"Communication Agent LLM call failed: {e}")
-                # Add production-specific error handling
-                self.logger.warning(f"Production error detected: {type(e).__name__}")
+                self.logger.error(f"Communication Agent LLM call failed: {type(e).__name__}: {e}")
                 raise
             
             # Calculate processing time
@@ -380,10 +504,12 @@ class CommunicationAgent(BaseAgent):
             
         except asyncio.TimeoutError:
             processing_time = time.time() - start_time
-            self.logger.error(f"Communication agent timed out after 30 seconds")
+            self.logger.error(f"Communication agent timed out after {LLM_TIMEOUT_SECONDS:.0f} seconds")
             
             if self.config.enable_fallback and self.config.fallback_to_original:
-                return self._create_fallback_response(request, processing_time, "Communication agent timeout after 30 seconds")
+                return self._create_fallback_response(
+                    request, processing_time, f"Communication agent timeout after {LLM_TIMEOUT_SECONDS:.0f} seconds"
+                )
             else:
                 raise
         except Exception as e:
@@ -395,6 +521,90 @@ class CommunicationAgent(BaseAgent):
             else:
                 raise
     
+    async def stream_response(self, request: CommunicationRequest) -> AsyncIterator[str]:
+        """
+        Stream the enhanced response as text chunks while the LLM generates it.
+        
+        Lets callers start rendering before the full completion arrives. Mock
+        mode and injected sync clients yield the whole response as one chunk.
+        If generation fails before anything was yielded and fallback is
+        enabled, the consolidated original outputs are yielded instead.
+        
+        Args:
+            request: CommunicationRequest containing agent outputs and user context
+            
+        Yields:
+            Text chunks of the enhanced response
+        """
+        start_time = time.time()
+        yielded = False
+        try:
+            self._validate_request(request)
+            formatted_input = self._format_agent_outputs(request)
+            self._log_resource_usage()
+            
+            if self.async_llm is not None and not self.mock:
+                prompt = self.format_prompt(formatted_input, user_context=request.user_context)
+                # Bound the whole generation, but not the caller's work between chunks
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + LLM_TIMEOUT_SECONDS
+                # Same prompt and cleaning as complete(), applied as text streams
+                raw_chunks = self.async_llm.stream(prompt + JSON_RESPONSE_INSTRUCTION)
+                chunks = _clean_llm_stream(raw_chunks)
+                try:
+                    while True:
+                        try:
+                            text = await asyncio.wait_for(chunks.__anext__(), timeout=max(0.0, deadline - loop.time()))
+                        except StopAsyncIteration:
+                            break
+                        yielded = True
+                        yield text
+                finally:
+                    await chunks.aclose()
+                    await raw_chunks.aclose()
+            else:
+                response = await asyncio.wait_for(
+                    self._generate(formatted_input, request.user_context),
+                    timeout=LLM_TIMEOUT_SECONDS
+                )
+                yielded = True
+                yield response.enhanced_content
+            
+            self.logger.info(f"Streamed enhanced response in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            self.logger.error(f"Error streaming response: {type(e).__name__}: {e}")
+            if yielded or not (self.config.enable_fallback and self.config.fallback_to_original):
+                raise
+            yield self._create_fallback_response(request, time.time() - start_time, str(e)).enhanced_content
+    
+    async def _generate(self, formatted_input: str, user_context: Optional[Dict[str, Any]]) -> CommunicationResponse:
+        """Produce the enhanced response without blocking the event loop."""
+        if self.async_llm is not None and not self.mock:
+            prompt = self.format_prompt(formatted_input, user_context=user_context)
+            return self._llm_response(await self.async_llm.complete(prompt))
+        
+        if self.mock or self.llm is None:
+            # Mock output is cheap and synchronous
+            return self(formatted_input, user_context=user_context)
+        
+        # Injected synchronous client: run on the shared, bounded executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_llm_executor(self.config.max_concurrent_requests),
+            partial(self, formatted_input, user_context=user_context)
+        )
+    
+    def _log_resource_usage(self) -> None:
+        """Log the background sampler's latest resource snapshot in production."""
+        if os.getenv("ENVIRONMENT", "").lower() not in ["production", "prod"]:
+            return
+        snapshot = get_resource_sampler().latest()
+        if snapshot is not None:
+            self.logger.info(
+                f"Resource usage: CPU {snapshot.cpu_percent}%, memory {snapshot.memory_percent}% "
+                f"({snapshot.memory_available_mb:.1f}MB available, sampled {snapshot.age_seconds:.1f}s ago)"
+            )
+    
     def _validate_request(self, request: CommunicationRequest) -> None:
         """Validate the communication request."""
         if not request.agent_outputs:
@@ -11,7 +11,7 @@ making the system more maintainable and the output more natural.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -258,24 +258,7 @@ class StageTwoHumanFormatter:
             FormattedResponse: Human-readable formatted response
         """
         self.logger.info(f"Stage 2: Formatting {extracted_content.content_type.value} content")
-        
-        # Create agent output for communication agent
-        agent_output = AgentOutput(
-            agent_id="two_stage_synthesizer",
-            content=self._create_structured_content(extracted_content),
-            metadata={
-                "content_type": extracted_content.content_type.value,
-                "main_topic": extracted_content.main_topic,
-                "confidence_score": extracted_content.confidence_score,
-                "source_workflows": extracted_content.source_workflows
-            }
-        )
-        
-        # Use communication agent for final formatting
-        request = CommunicationRequest(
-            agent_outputs=[agent_output],
-            user_context=user_context
-        )
+        request = self._build_request(extracted_content, user_context)
         
         try:
             self.logger.info("=== CALLING COMMUNICATION AGENT ENHANCE_RESPONSE ===")
@@ -303,6 +286,50 @@ class StageTwoHumanFormatter:
             self.logger.error(f"Communication agent error type: {type(e).__name__}")
             return self._create_fallback_response(extracted_content)
     
+    async def stream_response(self, extracted_content: ExtractedContent, user_context: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the human-readable response as the communication agent generates it.
+        
+        Args:
+            extracted_content: Structured content from Stage 1
+            user_context: User context for personalization
+            
+        Yields:
+            Text chunks of the formatted response
+        """
+        self.logger.info(f"Stage 2: Streaming {extracted_content.content_type.value} content")
+        request = self._build_request(extracted_content, user_context)
+        yielded = False
+        try:
+            async for chunk in self.communication_agent.stream_response(request):
+                yielded = True
+                yield chunk
+        except Exception as e:
+            self.logger.error(f"Communication agent stream failed: {type(e).__name__}: {e}")
+            if yielded:
+                raise
+            yield self._create_fallback_response(extracted_content).content
+    
+    def _build_request(self, extracted_content: ExtractedContent, user_context: Dict[str, Any]) -> CommunicationRequest:
+        """Wrap extracted content in a request for the communication agent."""
+        # Create agent output for communication agent
+        agent_output = AgentOutput(
+            agent_id="two_stage_synthesizer",
+            content=self._create_structured_content(extracted_content),
+            metadata={
+                "content_type": extracted_content.content_type.value,
+                "main_topic": extracted_content.main_topic,
+                "confidence_score": extracted_content.confidence_score,
+                "source_workflows": extracted_content.source_workflows
+            }
+        )
+        
+        # Use communication agent for final formatting
+        return CommunicationRequest(
+            agent_outputs=[agent_output],
+            user_context=user_context
+        )
+    
     def _create_structured_content(self, extracted_content: ExtractedContent) -> str:
         """Create structured content string for communication agent."""
         content_parts = []
@@ -414,6 +441,35 @@ class TwoStageOutputSynthesizer:
             self.logger.error(f"Two-stage synthesis failed: {e}")
             return self._create_error_response(agent_outputs, str(e))
     
+    async def stream_outputs(
+        self,
+        agent_outputs: List[AgentOutput],
+        user_context: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Synthesize agent outputs, yielding Stage 2 text as it is generated.
+        
+        Stage 1 is local and fast, so the first chunk arrives as soon as the
+        LLM starts producing tokens rather than after the full completion.
+        
+        Args:
+            agent_outputs: List of agent outputs to process
+            user_context: User context for personalization
+            
+        Yields:
+            Text chunks of the final response
+        """
+        self.logger.info(f"Starting streaming two-stage synthesis for {len(agent_outputs)} agent outputs")
+        try:
+            extracted_content = self.stage_one.extract_content(agent_outputs)
+        except Exception as e:
+            self.logger.error(f"Two-stage synthesis failed: {e}")
+            yield self._create_error_response(agent_outputs, str(e)).enhanced_content
+            return
+        
+        async for chunk in self.stage_two.stream_response(extracted_content, user_context):
+            yield chunk
+    
     def _create_error_response(self, agent_outputs: List[AgentOutput], error: str) -> CommunicationResponse:
         """Create error response when synthesis fails."""
         return CommunicationResponse(
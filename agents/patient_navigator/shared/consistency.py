@@ -5,9 +5,16 @@ This module provides functionality for implementing self-consistency methodology
 in response generation, ensuring high-quality and reliable responses.
 """
 
+from collections import Counter
 from typing import List, Dict, Any, Optional
 import re
-from difflib import SequenceMatcher
+
+import numpy as np
+
+# Character n-gram sizes used as shingles for response similarity. Bigrams keep
+# short paraphrases close; trigrams stop long, unrelated answers from looking
+# alike just because they share common English letter pairs.
+SHINGLE_SIZES = (2, 3)
 
 
 class SelfConsistencyChecker:
@@ -67,19 +74,60 @@ class SelfConsistencyChecker:
         if len(responses) < 2:
             return 1.0  # Single response is perfectly consistent
         
-        # Calculate pairwise similarities
-        similarities = []
+        # Average of all pairwise similarities (upper triangle of the matrix)
+        similarities = self.similarity_matrix(responses)
+        pairs = np.triu_indices(len(responses), k=1)
+        return float(similarities[pairs].mean())
+    
+    def similarity_matrix(self, responses: List[str]) -> np.ndarray:
+        """
+        Pairwise similarity of all responses in one pass.
         
-        for i in range(len(responses)):
-            for j in range(i + 1, len(responses)):
-                similarity = self._calculate_pairwise_similarity(responses[i], responses[j])
-                similarities.append(similarity)
+        Each response becomes a count vector over its character shingles and
+        the matrix is the cosine similarity of those vectors, so the cost is
+        linear in response length plus a single n x n matrix product, rather
+        than a quadratic string alignment per pair.
         
-        # Return average similarity as consistency score
-        if similarities:
-            return sum(similarities) / len(similarities)
-        else:
-            return 0.0
+        Args:
+            responses: List of response strings to compare
+            
+        Returns:
+            Symmetric (n, n) array of similarities between 0.0 and 1.0
+        """
+        shingle_counts = [self._shingle_counts(response) for response in responses]
+        
+        vocabulary: Dict[str, int] = {}
+        for counts in shingle_counts:
+            for shingle in counts:
+                vocabulary.setdefault(shingle, len(vocabulary))
+        
+        vectors = np.zeros((len(responses), len(vocabulary)))
+        for row, counts in enumerate(shingle_counts):
+            columns = [vocabulary[shingle] for shingle in counts]
+            vectors[row, columns] = list(counts.values())
+        
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        # Rounding keeps identical responses at exactly 1.0
+        return np.clip(np.round(vectors @ vectors.T, 6), 0.0, 1.0)
+    
+    def _shingle_counts(self, text: str) -> Counter:
+        """
+        Count the character shingles of a normalized response.
+        
+        Args:
+            text: Response string
+            
+        Returns:
+            Counter of shingle -> occurrences
+        """
+        normalized = " " + re.sub(r'\s+', ' ', text.lower().strip()) + " "
+        counts: Counter = Counter()
+        for size in SHINGLE_SIZES:
+            if len(normalized) <= size:
+                counts[normalized] += 1
+                continue
+            counts.update(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+        return counts
     
     def _calculate_pairwise_similarity(self, response1: str, response2: str) -> float:
         """
@@ -92,9 +140,7 @@ class SelfConsistencyChecker:
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        # Use sequence matcher for string similarity
-        matcher = SequenceMatcher(None, response1.lower(), response2.lower())
-        return matcher.ratio()
+        return float(self.similarity_matrix([response1, response2])[0, 1])
     
     def extract_key_points(self, responses: List[str]) -> List[str]:
         """
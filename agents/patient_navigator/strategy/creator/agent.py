@@ -1,7 +1,9 @@
+import asyncio
 import logging
 import hashlib
 import json
-from typing import List, Dict, Any, Optional
+from contextlib import nullcontext
+from typing import AsyncIterator, List, Dict, Any, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -34,6 +36,8 @@ class StrategyCreatorAgent(BaseAgent):
         )
         
         self.optimization_types = ['speed', 'cost', 'effort', 'balanced']
+        # Optional semaphore shared with other agents to cap in-flight LLM calls
+        self.llm_semaphore: Optional[asyncio.Semaphore] = None
 
     async def generate_strategies(
         self,
@@ -41,23 +45,51 @@ class StrategyCreatorAgent(BaseAgent):
         plan_constraints: PlanConstraints
     ) -> List[Strategy]:
         """
-        Generate 4 strategies with different optimization approaches
+        Generate 4 strategies with different optimization approaches concurrently
         """
-        strategies = []
-
-        for optimization_type in self.optimization_types:
-            try:
-                strategy = await self._generate_single_strategy(
-                    context,
-                    plan_constraints,
-                    optimization_type
-                )
-                strategies.append(strategy)
-            except Exception as error:
-                self.logger.error(f"Failed to generate {optimization_type} strategy: {error}")
-                # Continue with other strategies
-
-        return strategies
+        results = await asyncio.gather(*[
+            self._try_generate_strategy(context, plan_constraints, optimization_type)
+            for optimization_type in self.optimization_types
+        ])
+
+        # Keep optimization-type order; failed strategies are skipped
+        return [strategy for strategy in results if strategy is not None]
+
+    async def iter_strategies(
+        self,
+        context: ContextRetrievalResult,
+        plan_constraints: PlanConstraints
+    ) -> AsyncIterator[Strategy]:
+        """
+        Generate all strategies concurrently, yielding each as soon as it is ready
+        """
+        tasks = [
+            asyncio.create_task(self._try_generate_strategy(context, plan_constraints, optimization_type))
+            for optimization_type in self.optimization_types
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                strategy = await next_done
+                if strategy is not None:
+                    yield strategy
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _try_generate_strategy(
+        self,
+        context: ContextRetrievalResult,
+        plan_constraints: PlanConstraints,
+        optimization_type: str
+    ) -> Optional[Strategy]:
+        """
+        Generate a single strategy, logging and returning None on failure
+        """
+        try:
+            return await self._generate_single_strategy(context, plan_constraints, optimization_type)
+        except Exception as error:
+            self.logger.error(f"Failed to generate {optimization_type} strategy: {error}")
+            return None
 
     async def _generate_single_strategy(
         self,
@@ -264,12 +296,13 @@ Format your response as JSON:
         Call LLM with error handling
         """
         try:
-            if self.mock:
+            async with self.llm_semaphore or nullcontext():
+                if self.mock:
+                    return self._generate_mock_response()
+                
+                # This would integrate with actual LLM client
+                # For now, return mock response
                 return self._generate_mock_response()
-            
-            # This would integrate with actual LLM client
-            # For now, return mock response
-            return self._generate_mock_response()
         except Exception as error:
             self.logger.error('LLM call failed:', error)
             raise error
@@ -17,7 +17,7 @@ class StrategyMemoryLiteWorkflow:
     4. Strategy ingestion service logs markdown into strategies_buffer
     5. Valid entries are committed to strategies table
     6. Markdown content is passed to embedding pipeline
-    7. Embeddings are stored via strategy_vector_buffer → strategy_vectors
+    7. Embeddings are stored in strategy_vectors in the same transaction
     """
     
     def __init__(self, use_mock: bool = False):
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import json
+from contextlib import nullcontext
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pydantic import BaseModel
@@ -31,28 +33,35 @@ class RegulatoryAgent(BaseAgent):
             mock=use_mock,
             **kwargs
         )
+        # Optional semaphore shared with other agents to cap in-flight LLM calls
+        self.llm_semaphore: Optional[asyncio.Semaphore] = None
 
     async def validate_strategies(
         self,
         strategies: List[Strategy],
-        regulatory_context: str
+        regulatory_context: str = ""
     ) -> List[ValidationResult]:
         """
-        Validate strategies using LLM-based compliance checking
+        Validate strategies concurrently using LLM-based compliance checking
         """
-        validation_results = []
-
-        for strategy in strategies:
-            try:
-                validation = await self._validate_single_strategy(strategy, regulatory_context)
-                validation_results.append(validation)
-            except Exception as error:
-                self.logger.error(f"Failed to validate strategy {strategy.id}: {error}")
-                
-                # Add fallback validation result
-                validation_results.append(self._create_fallback_validation(strategy))
+        return list(await asyncio.gather(*[
+            self.validate_strategy(strategy, regulatory_context)
+            for strategy in strategies
+        ]))
 
-        return validation_results
+    async def validate_strategy(
+        self,
+        strategy: Strategy,
+        regulatory_context: str = ""
+    ) -> ValidationResult:
+        """
+        Validate one strategy, falling back to a default result on failure
+        """
+        try:
+            return await self._validate_single_strategy(strategy, regulatory_context)
+        except Exception as error:
+            self.logger.error(f"Failed to validate strategy {strategy.id}: {error}")
+            return self._create_fallback_validation(strategy)
 
     async def _validate_single_strategy(
         self,
@@ -62,11 +71,12 @@ class RegulatoryAgent(BaseAgent):
         """
         Validate a single strategy using ReAct pattern
         """
-        # Step 1: Reason - Quality Assessment
-        quality_assessment = await self._assess_strategy_quality(strategy)
-        
-        # Step 2: Act - Compliance Validation
-        compliance_validation = await self._validate_compliance(strategy, regulatory_context)
+        # Steps 1 and 2 are independent: Reason (quality assessment) and
+        # Act (compliance validation) run concurrently
+        quality_assessment, compliance_validation = await asyncio.gather(
+            self._assess_strategy_quality(strategy),
+            self._validate_compliance(strategy, regulatory_context)
+        )
         
         # Step 3: Observe - Final Assessment
         final_assessment = await self._synthesize_validation(strategy, quality_assessment, compliance_validation)
@@ -301,12 +311,13 @@ Format your response as JSON:
         Call LLM with error handling
         """
         try:
-            if self.mock:
+            async with self.llm_semaphore or nullcontext():
+                if self.mock:
+                    return self._generate_mock_response()
+                
+                # This would integrate with actual LLM client
+                # For now, return mock response
                 return self._generate_mock_response()
-            
-            # This would integrate with actual LLM client
-            # For now, return mock response
-            return self._generate_mock_response()
         except Exception as error:
             self.logger.error('LLM call failed:', error)
             raise error
@@ -99,4 +99,5 @@ class WorkflowConfig:
     timeout_seconds: int = 30
     max_retries: int = 3
     enable_logging: bool = True
-    enable_audit_trail: bool = True 
\ No newline at end of file
+    enable_audit_trail: bool = True
+    max_concurrent_llm_calls: int = 4  # Shared by strategy generation and validation 
\ No newline at end of file
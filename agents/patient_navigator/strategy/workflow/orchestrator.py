@@ -17,6 +17,7 @@ from ..workflow.state import StrategyWorkflowStateManager
 from ..creator.agent import StrategyCreatorAgent
 from ..regulatory.agent import RegulatoryAgent
 from ..memory.workflow import StrategyMemoryLiteWorkflow
+from .pipeline import StrategyPipeline
 from agents.tooling.mcp.strategy.core import StrategyMCPTool
 
 class StrategyWorkflowOrchestrator:
@@ -25,6 +26,8 @@ class StrategyWorkflowOrchestrator:
     
     Implements the complete workflow: StrategyMCP → StrategyCreator → RegulatoryAgent → StrategyMemoryLiteWorkflow
     with dual mode operation (mock/real APIs) and comprehensive error handling.
+    Strategy generation and regulatory validation are pipelined: strategies are
+    generated concurrently and each is validated as soon as it is ready.
     """
     
     def __init__(self, config: WorkflowConfig):
@@ -42,6 +45,11 @@ class StrategyWorkflowOrchestrator:
         self.strategy_creator = StrategyCreatorAgent(use_mock=config.use_mock)
         self.regulatory_agent = RegulatoryAgent(use_mock=config.use_mock)
         self.strategy_memory = StrategyMemoryLiteWorkflow(use_mock=config.use_mock)
+        self.strategy_pipeline = StrategyPipeline(
+            self.strategy_creator,
+            self.regulatory_agent,
+            max_concurrent_llm_calls=config.max_concurrent_llm_calls
+        )
         
         # Performance tracking
         self.start_time: Optional[float] = None
@@ -67,24 +75,21 @@ class StrategyWorkflowOrchestrator:
             # Step 1: Context Gathering
             await self._execute_context_gathering(state_manager)
             
-            # Step 2: Strategy Generation
-            await self._execute_strategy_generation(state_manager)
-            
-            # Step 3: Regulatory Validation
-            await self._execute_regulatory_validation(state_manager)
+            # Steps 2-3: Strategy Generation pipelined into Regulatory Validation
+            await self._execute_generation_and_validation(state_manager)
             
             # Step 4: Storage
             await self._execute_storage(state_manager)
             
         except Exception as error:
             self.logger.error(f"Workflow execution failed: {error}")
-            state_manager.addError(f"Workflow execution failed: {str(error)}")
+            state_manager.add_error(f"Workflow execution failed: {str(error)}")
             
         finally:
             # Log performance metrics
             self._log_performance_metrics(state_manager)
             
-        return state_manager.getState()
+        return state_manager.get_state()
     
     async def _execute_context_gathering(
         self, 
@@ -97,84 +102,59 @@ class StrategyWorkflowOrchestrator:
             self.logger.info("Starting context gathering...")
             
             context_result = await self.strategy_mcp.gather_context(
-                plan_constraints=state_manager.getState().plan_constraints
+                plan_constraints=state_manager.get_state().plan_constraints
             )
             
-            state_manager.updateContextResult(context_result)
+            state_manager.update_context_result(context_result)
             self.logger.info(f"Context gathering completed: {len(context_result.web_search_results)} web results")
             
         except Exception as error:
             self.logger.error(f"Context gathering failed: {error}")
-            state_manager.addError(f"Context gathering failed: {str(error)}")
+            state_manager.add_error(f"Context gathering failed: {str(error)}")
             # Continue with empty context for graceful degradation
             
         finally:
             self.step_times['context_gathering'] = time.time() - step_start
     
-    async def _execute_strategy_generation(
+    async def _execute_generation_and_validation(
         self, 
         state_manager: StrategyWorkflowStateManager
     ) -> None:
-        """Execute strategy generation step with error handling."""
+        """Execute pipelined strategy generation and regulatory validation with error handling."""
         step_start = time.time()
         
         try:
-            self.logger.info("Starting strategy generation...")
+            self.logger.info("Starting strategy generation and validation...")
             
-            state = state_manager.getState()
+            state = state_manager.get_state()
             if not state.context_result:
                 raise ValueError("No context available for strategy generation")
             
-            strategies = await self.strategy_creator.generate_strategies(
+            result = await self.strategy_pipeline.run(
                 context=state.context_result,
-                plan_constraints=state.plan_constraints
+                plan_constraints=state.plan_constraints,
+                regulatory_context=getattr(state.context_result, 'regulatory_context', None)
             )
+            self.step_times['strategy_generation'] = result.generation_seconds
+            self.step_times['regulatory_validation'] = result.validation_seconds
             
-            if not strategies:
+            if not result.strategies:
                 raise ValueError("No strategies generated")
                 
-            state_manager.updateStrategies(strategies)
-            self.logger.info(f"Strategy generation completed: {len(strategies)} strategies")
-            
-        except Exception as error:
-            self.logger.error(f"Strategy generation failed: {error}")
-            state_manager.addError(f"Strategy generation failed: {str(error)}")
-            # Continue with empty strategies for graceful degradation
-            
-        finally:
-            self.step_times['strategy_generation'] = time.time() - step_start
-    
-    async def _execute_regulatory_validation(
-        self, 
-        state_manager: StrategyWorkflowStateManager
-    ) -> None:
-        """Execute regulatory validation step with error handling."""
-        step_start = time.time()
-        
-        try:
-            self.logger.info("Starting regulatory validation...")
-            
-            state = state_manager.getState()
-            if not state.strategies:
-                raise ValueError("No strategies available for validation")
-            
-            validation_results = await self.regulatory_agent.validate_strategies(
-                strategies=state.strategies
+            state_manager.update_strategies(result.strategies)
+            state_manager.update_validation_results(result.validation_results)
+            self.logger.info(
+                f"Strategy generation and validation completed: {len(result.strategies)} strategies, "
+                f"{len(result.validation_results)} validations"
             )
             
-            if not validation_results:
-                raise ValueError("No validation results generated")
-                
-            state_manager.updateValidationResults(validation_results)
-            self.logger.info(f"Regulatory validation completed: {len(validation_results)} validations")
-            
         except Exception as error:
-            self.logger.error(f"Regulatory validation failed: {error}")
-            state_manager.addError(f"Regulatory validation failed: {str(error)}")
-            # Continue with empty validations for graceful degradation
+            self.logger.error(f"Strategy generation and validation failed: {error}")
+            state_manager.add_error(f"Strategy generation and validation failed: {str(error)}")
+            # Continue with empty strategies for graceful degradation
             
         finally:
-            self.step_times['regulatory_validation'] = time.time() - step_start
+            self.step_times['generation_and_validation'] = time.time() - step_start
     
     async def _execute_storage(
         self, 
@@ -186,7 +166,7 @@ class StrategyWorkflowOrchestrator:
         try:
             self.logger.info("Starting strategy storage...")
             
-            state = state_manager.getState()
+            state = state_manager.get_state()
             if not state.strategies or not state.validation_results:
                 raise ValueError("No strategies or validation results available for storage")
             
@@ -216,12 +196,12 @@ class StrategyWorkflowOrchestrator:
                     timestamp=datetime.now()
                 )
             
-            state_manager.updateStorageConfirmation(storage_result)
+            state_manager.update_storage_confirmation(storage_result)
             self.logger.info(f"Strategy storage completed: {storage_result.storage_status}")
             
         except Exception as error:
             self.logger.error(f"Strategy storage failed: {error}")
-            state_manager.addError(f"Strategy storage failed: {str(error)}")
+            state_manager.add_error(f"Strategy storage failed: {str(error)}")
             
         finally:
             self.step_times['storage'] = time.time() - step_start
@@ -246,9 +226,9 @@ class StrategyWorkflowOrchestrator:
             self.logger.info(f"Workflow completed within {self.config.timeout_seconds}s target")
         
         # Log any errors
-        if state_manager.hasErrors():
-            self.logger.error(f"Workflow completed with {len(state_manager.getErrors())} errors")
-            for error in state_manager.getErrors():
+        if state_manager.has_errors():
+            self.logger.error(f"Workflow completed with {len(state_manager.get_errors())} errors")
+            for error in state_manager.get_errors():
                 self.logger.error(f"  - {error}")
         
         self.logger.info("=== End Performance Metrics ===")
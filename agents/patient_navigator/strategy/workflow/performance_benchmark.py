@@ -10,11 +10,13 @@ Usage:
     python performance_benchmark.py --real    # Benchmark with real APIs (requires API keys)
     python performance_benchmark.py --stress  # Stress testing with concurrent requests
     python performance_benchmark.py --detailed # Detailed performance analysis
+    python performance_benchmark.py --pipeline # Sequential vs pipelined generation/validation
 """
 
 import asyncio
 import argparse
 import logging
+import random
 import sys
 import time
 import statistics
@@ -22,6 +24,7 @@ import json
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+from contextlib import nullcontext
 
 # Add the project root to the path for imports
 sys.path.append('../../../')
@@ -306,6 +309,92 @@ class PerformanceBenchmark:
         
         return component_metrics
     
+    def _create_delayed_agents(self, generation_delay: float, validation_delay: float):
+        """Create mock agents whose LLM calls take a realistic, jittered amount of time."""
+        from agents.patient_navigator.strategy.creator.agent import StrategyCreatorAgent
+        from agents.patient_navigator.strategy.regulatory.agent import RegulatoryAgent
+        
+        class DelayedStrategyCreator(StrategyCreatorAgent):
+            async def _call_llm(self, prompt: str) -> str:
+                async with self.llm_semaphore or nullcontext():
+                    await asyncio.sleep(generation_delay * random.uniform(0.75, 1.25))
+                    return self._generate_mock_response()
+        
+        class DelayedRegulatoryAgent(RegulatoryAgent):
+            async def _call_llm(self, prompt: str) -> str:
+                async with self.llm_semaphore or nullcontext():
+                    await asyncio.sleep(validation_delay * random.uniform(0.75, 1.25))
+                    return self._generate_mock_response()
+        
+        return DelayedStrategyCreator(use_mock=True), DelayedRegulatoryAgent(use_mock=True)
+    
+    async def benchmark_pipeline_latency(
+        self,
+        iterations: int = 5,
+        generation_delay: float = 0.8,
+        validation_delay: float = 0.4,
+        max_concurrent_llm_calls: int = 4
+    ) -> List[PerformanceMetrics]:
+        """
+        Compare sequential generation/validation against the concurrent pipeline.
+        
+        Before: 4 strategies generated one after another, then each validated
+        with quality, compliance and synthesis LLM calls in series (16 round
+        trips). After: StrategyPipeline with the given LLM call budget.
+        """
+        from agents.patient_navigator.strategy.workflow.pipeline import StrategyPipeline
+        
+        mock_context = type('MockContext', (), {
+            'web_search_results': [],
+            'relevant_strategies': [],
+            'regulatory_context': 'Standard healthcare regulations apply.'
+        })()
+        mock_constraints = type('MockPlanConstraints', (), {
+            'specialty_access': 'Cardiology',
+            'urgency_level': 'medium',
+            'budget_constraints': {'max_cost': 500},
+            'location_constraints': {'max_distance': 25},
+            'time_constraints': {'preferred_timeframe': '2 weeks'}
+        })()
+        
+        async def run_sequential():
+            creator, regulatory = self._create_delayed_agents(generation_delay, validation_delay)
+            strategies = [
+                await creator._generate_single_strategy(mock_context, mock_constraints, optimization_type)
+                for optimization_type in creator.optimization_types
+            ]
+            validations = []
+            for strategy in strategies:
+                quality = await regulatory._assess_strategy_quality(strategy)
+                compliance = await regulatory._validate_compliance(strategy, mock_context.regulatory_context)
+                validations.append(await regulatory._synthesize_validation(strategy, quality, compliance))
+            return strategies, validations
+        
+        async def run_pipelined():
+            creator, regulatory = self._create_delayed_agents(generation_delay, validation_delay)
+            pipeline = StrategyPipeline(creator, regulatory, max_concurrent_llm_calls=max_concurrent_llm_calls)
+            result = await pipeline.run(mock_context, mock_constraints, mock_context.regulatory_context)
+            return result.strategies, result.validation_results
+        
+        all_metrics = []
+        for test_name, run in [
+            ("Sequential Generation + Validation", run_sequential),
+            (f"Pipelined Generation + Validation (budget {max_concurrent_llm_calls})", run_pipelined),
+        ]:
+            durations = []
+            successes = 0
+            for i in range(iterations):
+                start_time = time.time()
+                strategies, validations = await run()
+                duration = time.time() - start_time
+                durations.append(duration)
+                if len(strategies) == 4 and len(validations) == 4:
+                    successes += 1
+                self.logger.info(f"{test_name} iteration {i+1}/{iterations}: {duration:.2f}s")
+            all_metrics.append(self._calculate_metrics(test_name, durations, successes, iterations))
+        
+        return all_metrics
+    
     def _calculate_metrics(
         self, 
         test_name: str, 
@@ -405,13 +494,15 @@ async def main():
     parser.add_argument("--stress", action="store_true", help="Stress testing with concurrent requests")
     parser.add_argument("--component", action="store_true", help="Component-level benchmarking")
     parser.add_argument("--detailed", action="store_true", help="Detailed performance analysis")
+    parser.add_argument("--pipeline", action="store_true", help="Sequential vs pipelined generation/validation")
+    parser.add_argument("--max-concurrent-llm-calls", type=int, default=4, help="LLM call budget for the pipeline")
     parser.add_argument("--all", action="store_true", help="Run all benchmarks")
     parser.add_argument("--report", action="store_true", help="Generate detailed report")
     
     args = parser.parse_args()
     
     # If no specific benchmark is selected, run mock benchmark by default
-    if not any([args.mock, args.real, args.stress, args.component, args.detailed, args.all]):
+    if not any([args.mock, args.real, args.stress, args.component, args.detailed, args.pipeline, args.all]):
         args.mock = True
     
     # Setup logging
@@ -455,6 +546,17 @@ async def main():
             benchmark.print_metrics(metrics)
             all_metrics.append(metrics)
     
+    if args.pipeline or args.all:
+        print("\n5. Strategy Generation/Validation Pipeline Benchmarking...")
+        sequential, pipelined = await benchmark.benchmark_pipeline_latency(
+            max_concurrent_llm_calls=args.max_concurrent_llm_calls
+        )
+        for metrics in (sequential, pipelined):
+            benchmark.print_metrics(metrics)
+            all_metrics.append(metrics)
+        if pipelined.average_duration:
+            print(f"\nPipeline speedup: {sequential.average_duration / pipelined.average_duration:.1f}x")
+    
     # Generate summary
     if all_metrics:
         print("\n" + "="*80)
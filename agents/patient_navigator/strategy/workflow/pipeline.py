@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from ..types import ContextRetrievalResult, PlanConstraints, Strategy, ValidationResult
+from ..creator.agent import StrategyCreatorAgent
+from ..regulatory.agent import RegulatoryAgent
+
+
+@dataclass
+class PipelineResult:
+    """Strategies, their validations and stage timings from one pipeline run."""
+    strategies: List[Strategy] = field(default_factory=list)
+    validation_results: List[ValidationResult] = field(default_factory=list)
+    generation_seconds: float = 0.0
+    validation_seconds: float = 0.0  # Validation time left after the last strategy was generated
+    total_seconds: float = 0.0
+
+
+class StrategyPipeline:
+    """
+    Strategy Generation → Regulatory Validation Pipeline
+
+    All optimization-type strategies are generated concurrently, and each one
+    is handed to the RegulatoryAgent as soon as it is generated instead of
+    waiting for the whole batch. Every LLM call made by either agent draws
+    from one shared budget, so concurrency stays bounded however the work
+    overlaps.
+    """
+
+    def __init__(
+        self,
+        strategy_creator: StrategyCreatorAgent,
+        regulatory_agent: RegulatoryAgent,
+        max_concurrent_llm_calls: int = 4
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            strategy_creator: Agent generating the strategies
+            regulatory_agent: Agent validating each strategy
+            max_concurrent_llm_calls: In-flight LLM call budget shared by both agents
+        """
+        self.strategy_creator = strategy_creator
+        self.regulatory_agent = regulatory_agent
+        self.max_concurrent_llm_calls = max_concurrent_llm_calls
+        self.logger = logging.getLogger(__name__)
+
+        self.llm_budget = asyncio.Semaphore(max_concurrent_llm_calls)
+        self.strategy_creator.llm_semaphore = self.llm_budget
+        self.regulatory_agent.llm_semaphore = self.llm_budget
+
+    async def run(
+        self,
+        context: ContextRetrievalResult,
+        plan_constraints: PlanConstraints,
+        regulatory_context: Optional[str] = None
+    ) -> PipelineResult:
+        """
+        Generate and validate strategies.
+
+        Args:
+            context: Gathered context for strategy generation
+            plan_constraints: User's insurance plan constraints
+            regulatory_context: Regulatory text for compliance validation
+
+        Returns:
+            PipelineResult with strategies and validations in matching order
+        """
+        start = time.time()
+        result = PipelineResult()
+        validations: List[asyncio.Task] = []
+
+        try:
+            async for strategy in self.strategy_creator.iter_strategies(context, plan_constraints):
+                self.logger.info(f"Strategy generated ({strategy.category}), starting validation")
+                result.strategies.append(strategy)
+                validations.append(asyncio.create_task(
+                    self.regulatory_agent.validate_strategy(strategy, regulatory_context or "")
+                ))
+
+            generated_at = time.time()
+            result.generation_seconds = generated_at - start
+            result.validation_results = list(await asyncio.gather(*validations))
+            result.validation_seconds = time.time() - generated_at
+        finally:
+            for task in validations:
+                task.cancel()
+            result.total_seconds = time.time() - start
+
+        return result
@@ -0,0 +1,325 @@
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..types import Strategy, StorageResult
+
+EMBEDDING_DIMENSIONS = 1536
+EMBEDDING_MODEL_VERSION = "text-embedding-3-small"
+
+# Minimum cosine similarity for a stored strategy to be returned
+DEFAULT_MATCH_THRESHOLD = 0.7
+
+
+def strategy_embedding_text(strategy: Strategy) -> str:
+    """Text embedded for a strategy's vector."""
+    return f"{strategy.title} {strategy.approach} {strategy.rationale}"
+
+
+def constraint_query_text(plan_constraints: Dict[str, Any]) -> str:
+    """Text embedded as the similarity query for a set of plan constraints."""
+    specialties = plan_constraints.get("specialty_access") or ["general"]
+    return f"healthcare {specialties[0]} access"
+
+
+def _vector_text(embedding: Sequence[float]) -> str:
+    """Format an embedding as pgvector text."""
+    return "[" + ",".join(str(float(x)) for x in embedding) + "]"
+
+
+def _as_text_array(value: Any) -> Optional[List[str]]:
+    """Normalize a constraint value to a text[] parameter (None disables the filter)."""
+    if value is None or value == [] or value == "":
+        return None
+    if isinstance(value, str):
+        return [value]
+    return [str(item) for item in value]
+
+
+# Buffer rows, strategies and vectors are written with one statement each,
+# all inside one transaction. Strategies whose content_hash already exists
+# are skipped by ON CONFLICT and reported as duplicates.
+INSERT_BUFFER_SQL = """
+    INSERT INTO strategies.strategies_buffer (strategy_data, content_hash, status)
+    SELECT u.strategy_data::jsonb, u.content_hash, 'processing'
+    FROM unnest($1::text[], $2::text[]) AS u(strategy_data, content_hash)
+    RETURNING id
+"""
+
+INSERT_STRATEGIES_SQL = """
+    INSERT INTO strategies.strategies (
+        id, title, category, approach, rationale, actionable_steps, plan_constraints,
+        llm_score_speed, llm_score_cost, llm_score_effort,
+        content_hash, validation_status, created_at
+    )
+    SELECT u.id, u.title, u.category, u.approach, u.rationale,
+           u.actionable_steps::jsonb, u.plan_constraints::jsonb,
+           u.speed, u.cost, u.effort,
+           u.content_hash, u.validation_status, u.created_at
+    FROM unnest(
+        $1::uuid[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::text[],
+        $8::numeric[], $9::numeric[], $10::numeric[], $11::text[], $12::text[], $13::timestamptz[]
+    ) AS u(
+        id, title, category, approach, rationale, actionable_steps, plan_constraints,
+        speed, cost, effort, content_hash, validation_status, created_at
+    )
+    ON CONFLICT (content_hash) DO NOTHING
+    RETURNING id
+"""
+
+INSERT_VECTORS_SQL = """
+    INSERT INTO strategies.strategy_vectors (strategy_id, embedding, model_version)
+    SELECT u.strategy_id, u.embedding::vector(1536), $3
+    FROM unnest($1::uuid[], $2::text[]) AS u(strategy_id, embedding)
+    ON CONFLICT (strategy_id) DO NOTHING
+"""
+
+COMPLETE_BUFFER_SQL = """
+    UPDATE strategies.strategies_buffer
+    SET status = 'completed', updated_at = NOW()
+    WHERE id = ANY($1::uuid[])
+"""
+
+# Constraint filters and the pgvector search run as one statement. A NULL
+# parameter disables its filter; ?| on the JSONB arrays can use the expression
+# GIN indexes on plan_constraints->'specialty_access' and ->'network_providers'
+# (the GIN index on the whole column cannot serve a -> sub-expression).
+SEARCH_SQL = """
+    SELECT s.id, s.title, s.category, s.approach, s.rationale,
+           s.actionable_steps, s.plan_constraints,
+           s.llm_score_speed, s.llm_score_cost, s.llm_score_effort,
+           s.content_hash, s.validation_status, s.created_at,
+           1 - (v.embedding <=> $1::vector(1536)) AS similarity
+    FROM strategies.strategies s
+    JOIN strategies.strategy_vectors v ON v.strategy_id = s.id
+    WHERE ($2::text[] IS NULL OR s.plan_constraints->'specialty_access' ?| $2::text[])
+      AND ($3::text[] IS NULL OR s.plan_constraints->'network_providers' ?| $3::text[])
+      AND ($4::text IS NULL OR s.plan_constraints->>'geographic_scope' = $4::text)
+      AND 1 - (v.embedding <=> $1::vector(1536)) >= $5
+    ORDER BY v.embedding <=> $1::vector(1536)
+    LIMIT $6
+"""
+
+
+class StrategyStore:
+    """
+    Async strategy store on the shared asyncpg pool.
+
+    Writes a batch of strategies through strategies_buffer → strategies →
+    strategy_vectors in one transaction, and retrieves strategies with
+    constraint filtering and pgvector similarity in a single query. The pool
+    and the embedding service are the process-wide ones unless injected.
+    """
+
+    def __init__(self, pool=None, embedding_service=None, match_threshold: float = DEFAULT_MATCH_THRESHOLD):
+        """
+        Initialize the strategy store.
+
+        Args:
+            pool: asyncpg pool (defaults to the shared RAG database pool)
+            embedding_service: Service with async embed/embed_batch (defaults to the shared one)
+            match_threshold: Minimum similarity for retrieved strategies
+        """
+        self._pool = pool
+        self._embedding_service = embedding_service
+        self.match_threshold = match_threshold
+        self.logger = logging.getLogger(__name__)
+
+    async def _get_pool(self):
+        """Get the pool, initializing the shared one on first use."""
+        if self._pool is None:
+            from agents.tooling.rag.database_manager import get_pool_manager
+            self._pool = (await get_pool_manager()).pool
+        return self._pool
+
+    def _get_embedding_service(self):
+        """Get the embedding service, resolving the shared one on first use."""
+        if self._embedding_service is None:
+            from backend.shared.external.embedding_service import get_embedding_service
+            self._embedding_service = get_embedding_service()
+        return self._embedding_service
+
+    async def store_strategies(self, strategies: List[Strategy]) -> List[StorageResult]:
+        """
+        Store a batch of strategies with the buffer → commit workflow.
+
+        Embeddings are generated before the transaction opens so no connection
+        is held during the embedding request. If any statement fails the whole
+        batch is rolled back and every strategy is reported as failed.
+
+        Args:
+            strategies: Strategies to store
+
+        Returns:
+            StorageResult for each strategy, in input order
+        """
+        if not strategies:
+            return []
+
+        try:
+            embeddings = await self._get_embedding_service().embed_batch(
+                [strategy_embedding_text(strategy) for strategy in strategies]
+            )
+            for embedding in embeddings:
+                if not embedding or len(embedding) != EMBEDDING_DIMENSIONS:
+                    raise ValueError(
+                        f"Invalid embedding generated: expected {EMBEDDING_DIMENSIONS} dimensions, "
+                        f"got {len(embedding) if embedding else 0}"
+                    )
+
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    inserted_ids = await self._write_batch(conn, strategies, embeddings)
+        except Exception as error:
+            self.logger.error(f"Batch storage of {len(strategies)} strategies failed: {error}")
+            return [
+                StorageResult(
+                    strategy_id=strategy.id,
+                    storage_status="failed",
+                    message=f"Storage failed: {str(error)}",
+                    timestamp=datetime.now()
+                )
+                for strategy in strategies
+            ]
+
+        results = []
+        for strategy in strategies:
+            if strategy.id in inserted_ids:
+                results.append(StorageResult(
+                    strategy_id=strategy.id,
+                    storage_status="success",
+                    message="Strategy stored successfully with buffer workflow",
+                    timestamp=datetime.now()
+                ))
+            else:
+                results.append(StorageResult(
+                    strategy_id=strategy.id,
+                    storage_status="duplicate",
+                    message=f"Strategy with content hash {strategy.content_hash} already stored",
+                    timestamp=datetime.now()
+                ))
+        return results
+
+    async def _write_batch(self, conn, strategies: List[Strategy], embeddings: List[List[float]]) -> set:
+        """Run the buffer, strategy, vector and buffer-completion statements; return inserted ids."""
+        records = [self._strategy_record(strategy) for strategy in strategies]
+
+        buffer_rows = await conn.fetch(
+            INSERT_BUFFER_SQL,
+            [json.dumps(record, default=str) for record in records],
+            [strategy.content_hash for strategy in strategies]
+        )
+
+        inserted_rows = await conn.fetch(
+            INSERT_STRATEGIES_SQL,
+            [strategy.id for strategy in strategies],
+            [record["title"] for record in records],
+            [record["category"] for record in records],
+            [record["approach"] for record in records],
+            [record["rationale"] for record in records],
+            [json.dumps(record["actionable_steps"]) for record in records],
+            [json.dumps(record["plan_constraints"]) for record in records],
+            [record["llm_score_speed"] for record in records],
+            [record["llm_score_cost"] for record in records],
+            [record["llm_score_effort"] for record in records],
+            [record["content_hash"] for record in records],
+            [record["validation_status"] for record in records],
+            [strategy.created_at for strategy in strategies]
+        )
+        inserted_ids = {str(row["id"]) for row in inserted_rows}
+
+        vector_ids = [strategy.id for strategy in strategies if strategy.id in inserted_ids]
+        if vector_ids:
+            vectors = [
+                _vector_text(embedding)
+                for strategy, embedding in zip(strategies, embeddings)
+                if strategy.id in inserted_ids
+            ]
+            await conn.execute(INSERT_VECTORS_SQL, vector_ids, vectors, EMBEDDING_MODEL_VERSION)
+
+        await conn.execute(COMPLETE_BUFFER_SQL, [row["id"] for row in buffer_rows])
+        return inserted_ids
+
+    def _strategy_record(self, strategy: Strategy) -> Dict[str, Any]:
+        """Column values for a strategy, also used as the buffer payload."""
+        return {
+            "title": strategy.title,
+            "category": strategy.category,
+            "approach": strategy.approach,
+            "rationale": strategy.rationale,
+            "actionable_steps": strategy.actionable_steps,
+            "plan_constraints": strategy.plan_constraints.__dict__,
+            "llm_score_speed": strategy.llm_scores.speed,
+            "llm_score_cost": strategy.llm_scores.cost,
+            "llm_score_effort": strategy.llm_scores.effort,
+            "content_hash": strategy.content_hash,
+            "validation_status": strategy.validation_status,
+            "created_at": strategy.created_at.isoformat()
+        }
+
+    async def search_strategies(
+        self,
+        plan_constraints: Dict[str, Any],
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Find stored strategies matching plan constraints, most similar first.
+
+        Args:
+            plan_constraints: Plan constraints; specialty_access, network_providers
+                and geographic_scope are applied as filters when present
+            limit: Maximum number of strategies to return
+
+        Returns:
+            Strategy dictionaries with llm_scores and similarity
+        """
+        query_embedding = await self._get_embedding_service().embed(constraint_query_text(plan_constraints))
+        if not query_embedding or len(query_embedding) != EMBEDDING_DIMENSIONS:
+            raise ValueError(
+                f"Invalid query embedding generated: expected {EMBEDDING_DIMENSIONS} dimensions, "
+                f"got {len(query_embedding) if query_embedding else 0}"
+            )
+
+        geographic_scope = plan_constraints.get("geographic_scope") or None
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                SEARCH_SQL,
+                _vector_text(query_embedding),
+                _as_text_array(plan_constraints.get("specialty_access")),
+                _as_text_array(plan_constraints.get("network_providers")),
+                str(geographic_scope) if geographic_scope is not None else None,
+                self.match_threshold,
+                limit
+            )
+
+        return [self._row_to_strategy(row) for row in rows]
+
+    def _row_to_strategy(self, row) -> Dict[str, Any]:
+        """Convert a search row to the dictionary shape returned by retrieval."""
+        def _json(value):
+            return json.loads(value) if isinstance(value, str) else value
+
+        def _score(value):
+            return float(value) if value is not None else None
+
+        return {
+            "id": str(row["id"]),
+            "title": row["title"],
+            "category": row["category"],
+            "approach": row["approach"],
+            "rationale": row["rationale"],
+            "actionable_steps": _json(row["actionable_steps"]),
+            "plan_constraints": _json(row["plan_constraints"]),
+            "llm_scores": {
+                "speed": _score(row["llm_score_speed"]),
+                "cost": _score(row["llm_score_cost"]),
+                "effort": _score(row["llm_score_effort"])
+            },
+            "content_hash": row["content_hash"],
+            "validation_status": row["validation_status"],
+            "created_at": row["created_at"],
+            "similarity": float(row["similarity"])
+        }
@@ -0,0 +1,27 @@
+"""Pooled HTTP clients for external API calls."""
+
+from .registry import (
+    ANTHROPIC_HOST,
+    ANTHROPIC_MESSAGES_URL,
+    BRAVE_SEARCH_HOST,
+    TAVILY_HOST,
+    HTTPClientRegistry,
+    UpstreamConfig,
+    UpstreamStats,
+    anthropic_headers,
+    close_http_client_registry,
+    get_http_client_registry,
+)
+
+__all__ = [
+    "ANTHROPIC_HOST",
+    "ANTHROPIC_MESSAGES_URL",
+    "BRAVE_SEARCH_HOST",
+    "TAVILY_HOST",
+    "HTTPClientRegistry",
+    "UpstreamConfig",
+    "UpstreamStats",
+    "anthropic_headers",
+    "close_http_client_registry",
+    "get_http_client_registry",
+]
@@ -0,0 +1,297 @@
+"""
+Process-level registry of pooled HTTP clients, keyed by upstream host.
+
+Guardrails, tools and the navigator agent used to build their own
+httpx.AsyncClient, several of them once per request, so every call paid for
+a fresh TCP + TLS handshake and nothing bounded the total connections opened
+against an upstream. The registry owns one client per host with tuned
+connection limits, keep-alive and (where the upstream negotiates it) HTTP/2,
+plus a per-upstream concurrency cap. Callers check a client out for the
+duration of a request:
+
+    async with get_http_client_registry().checkout(ANTHROPIC_HOST) as client:
+        response = await client.post(ANTHROPIC_MESSAGES_URL, json=payload, headers=headers)
+
+Clients carry no credentials; callers pass their own auth headers per request.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+ANTHROPIC_HOST = "api.anthropic.com"
+ANTHROPIC_MESSAGES_URL = f"https://{ANTHROPIC_HOST}/v1/messages"
+ANTHROPIC_VERSION = "2023-06-01"
+BRAVE_SEARCH_HOST = "api.search.brave.com"
+TAVILY_HOST = "api.tavily.com"
+
+# HTTP/2 needs the optional h2 package; without it clients fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Pool and concurrency settings for one upstream host."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    max_concurrency: Optional[int] = None  # In-flight request cap; None for unbounded
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+
+
+# Tuned defaults for the upstreams the navigator talks to. Concurrency caps
+# can be overridden per host with <NAME>_MAX_CONCURRENCY.
+DEFAULT_UPSTREAMS: Dict[str, UpstreamConfig] = {
+    ANTHROPIC_HOST: UpstreamConfig(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry=60.0,
+        http2=True,
+        max_concurrency=int(os.getenv("ANTHROPIC_MAX_CONCURRENCY", "16")),
+        timeout=60.0
+    ),
+    BRAVE_SEARCH_HOST: UpstreamConfig(
+        max_connections=20,
+        max_keepalive_connections=10,
+        http2=True,
+        max_concurrency=int(os.getenv("BRAVE_MAX_CONCURRENCY", "10")),
+        timeout=5.0,
+        connect_timeout=2.0
+    ),
+    TAVILY_HOST: UpstreamConfig(
+        max_connections=10,
+        max_keepalive_connections=5,
+        max_concurrency=int(os.getenv("TAVILY_MAX_CONCURRENCY", "5")),
+        timeout=30.0
+    ),
+}
+
+
+@dataclass
+class UpstreamStats:
+    """Checkout and connection counters for one upstream."""
+    checkouts: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+    waiting: int = 0
+    waited_checkouts: int = 0  # Checkouts that queued behind the concurrency cap
+    wait_time_ms_total: float = 0.0
+    wait_time_ms_max: float = 0.0
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def connection_reuse_ratio(self) -> float:
+        """Fraction of requests served on an already-open connection."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1.0 - self.connections_opened / self.requests)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "waiting": self.waiting,
+            "waited_checkouts": self.waited_checkouts,
+            "avg_wait_ms": self.wait_time_ms_total / self.checkouts if self.checkouts else 0.0,
+            "max_wait_ms": self.wait_time_ms_max,
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+            "connection_reuse_ratio": self.connection_reuse_ratio,
+        }
+
+
+class _Upstream:
+    """One pooled client, its concurrency cap and its counters."""
+
+    def __init__(self, host: str, config: UpstreamConfig):
+        self.host = host
+        self.config = config
+        self.stats = UpstreamStats()
+        self.semaphore = (
+            asyncio.Semaphore(config.max_concurrency) if config.max_concurrency else None
+        )
+        self.http2 = config.http2 and HTTP2_AVAILABLE
+        self.transport = httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry
+            )
+        )
+        self.client = httpx.AsyncClient(
+            transport=self.transport,
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            event_hooks={"request": [self._on_request]}
+        )
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        """Count requests and attach an httpcore trace hook."""
+        self.stats.requests += 1
+        request.extensions["trace"] = self._trace_connection_event
+
+    async def _trace_connection_event(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback; connect events only fire for new connections."""
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            self.stats.tls_handshakes += 1
+
+    def pool_state(self) -> Dict[str, int]:
+        """Live connection counts from the underlying httpcore pool."""
+        pool = getattr(self.transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "connections": len(connections),
+            "idle_connections": idle,
+            "active_connections": len(connections) - idle,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.stats.to_dict(),
+            **self.pool_state(),
+            "http2": self.http2,
+            "max_connections": self.config.max_connections,
+            "max_concurrency": self.config.max_concurrency,
+        }
+
+
+class HTTPClientRegistry:
+    """
+    Process-wide owner of one pooled httpx.AsyncClient per upstream host.
+
+    Clients are built on first checkout and live until aclose(); a closed
+    registry rebuilds them on the next checkout, so components created after
+    shutdown keep working.
+    """
+
+    def __init__(self, upstreams: Optional[Dict[str, UpstreamConfig]] = None):
+        """
+        Args:
+            upstreams: Per-host settings; defaults to DEFAULT_UPSTREAMS. Hosts
+                not listed get UpstreamConfig() defaults.
+        """
+        self.configs: Dict[str, UpstreamConfig] = dict(
+            DEFAULT_UPSTREAMS if upstreams is None else upstreams
+        )
+        self._upstreams: Dict[str, _Upstream] = {}
+
+    def configure(self, host: str, **overrides) -> UpstreamConfig:
+        """Override settings for a host; takes effect when its client is next built."""
+        config = replace(self.configs.get(host, UpstreamConfig()), **overrides)
+        self.configs[host] = config
+        return config
+
+    def _upstream(self, host: str) -> _Upstream:
+        upstream = self._upstreams.get(host)
+        if upstream is None or upstream.client.is_closed:
+            upstream = _Upstream(host, self.configs.get(host, UpstreamConfig()))
+            self._upstreams[host] = upstream
+            logger.info(
+                f"HTTP client pool created for {host} "
+                f"(http2={upstream.http2}, max_connections={upstream.config.max_connections}, "
+                f"max_concurrency={upstream.config.max_concurrency})"
+            )
+        return upstream
+
+    def get_client(self, host: str) -> httpx.AsyncClient:
+        """
+        Return the pooled client for a host without taking a concurrency slot.
+
+        Prefer checkout() for requests so the per-upstream cap and wait
+        metrics apply.
+        """
+        return self._upstream(host).client
+
+    @asynccontextmanager
+    async def checkout(self, host: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold one of the host's concurrency slots while using its client."""
+        upstream = self._upstream(host)
+        stats = upstream.stats
+        stats.checkouts += 1
+
+        if upstream.semaphore is not None:
+            wait_start = time.perf_counter()
+            if upstream.semaphore.locked():
+                stats.waited_checkouts += 1
+            stats.waiting += 1
+            try:
+                await upstream.semaphore.acquire()
+            finally:
+                stats.waiting -= 1
+            wait_ms = (time.perf_counter() - wait_start) * 1000
+            stats.wait_time_ms_total += wait_ms
+            stats.wait_time_ms_max = max(stats.wait_time_ms_max, wait_ms)
+
+        stats.in_use += 1
+        stats.peak_in_use = max(stats.peak_in_use, stats.in_use)
+        try:
+            yield upstream.client
+        finally:
+            stats.in_use -= 1
+            if upstream.semaphore is not None:
+                upstream.semaphore.release()
+
+    def get_upstream_stats(self, host: str) -> Optional[UpstreamStats]:
+        """Counters for a host, or None if no client was built for it."""
+        upstream = self._upstreams.get(host)
+        return upstream.stats if upstream is not None else None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Live pool metrics for every upstream, for health endpoints."""
+        return {host: upstream.to_dict() for host, upstream in self._upstreams.items()}
+
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        upstreams, self._upstreams = self._upstreams, {}
+        for host, upstream in upstreams.items():
+            try:
+                await upstream.client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client for {host}: {e}")
+
+
+def anthropic_headers(api_key: str) -> Dict[str, str]:
+    """Per-request headers for the Anthropic messages API."""
+    return {
+        "Content-Type": "application/json",
+        "x-api-key": api_key,
+        "anthropic-version": ANTHROPIC_VERSION
+    }
+
+
+# Global registry instance
+_http_client_registry: Optional[HTTPClientRegistry] = None
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Get or create the process-wide HTTP client registry."""
+    global _http_client_registry
+    if _http_client_registry is None:
+        _http_client_registry = HTTPClientRegistry()
+    return _http_client_registry
+
+
+async def close_http_client_registry() -> None:
+    """Close all pooled clients (called on application shutdown)."""
+    global _http_client_registry
+    if _http_client_registry is not None:
+        await _http_client_registry.aclose()
+        _http_client_registry = None
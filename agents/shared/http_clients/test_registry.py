@@ -0,0 +1,114 @@
+"""
+Collocated unit tests for the HTTP client registry.
+"""
+
+import asyncio
+
+import pytest
+
+from .registry import (
+    ANTHROPIC_HOST,
+    HTTPClientRegistry,
+    UpstreamConfig,
+    UpstreamStats,
+    close_http_client_registry,
+    get_http_client_registry,
+)
+
+
+class TestHTTPClientRegistry:
+    """Test client sharing, concurrency caps and pool metrics."""
+
+    @pytest.fixture
+    async def registry(self):
+        registry = HTTPClientRegistry({"api.example.com": UpstreamConfig(max_concurrency=2)})
+        yield registry
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_one_client_per_host(self, registry):
+        """Checkouts for a host share one client; other hosts get their own."""
+        async with registry.checkout("api.example.com") as first:
+            pass
+        async with registry.checkout("api.example.com") as second:
+            pass
+        async with registry.checkout("other.example.com") as other:
+            pass
+
+        assert first is second
+        assert other is not first
+        assert registry.get_client("api.example.com") is first
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_queues_checkouts(self, registry):
+        """No more than max_concurrency checkouts are held at once."""
+        release = asyncio.Event()
+
+        async def hold():
+            async with registry.checkout("api.example.com"):
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        stats = registry.get_stats()["api.example.com"]
+        assert stats["in_use"] == 2
+        assert stats["waiting"] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        stats = registry.get_stats()["api.example.com"]
+        assert stats["checkouts"] == 5
+        assert stats["peak_in_use"] == 2
+        assert stats["waited_checkouts"] == 3
+        assert stats["in_use"] == 0
+        assert stats["waiting"] == 0
+        assert stats["max_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_stats_report_pool_state(self, registry):
+        """Health metrics include live connection counts and pool settings."""
+        async with registry.checkout("api.example.com"):
+            pass
+
+        stats = registry.get_stats()["api.example.com"]
+        assert stats["connections"] == 0
+        assert stats["idle_connections"] == 0
+        assert stats["max_concurrency"] == 2
+        assert stats["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_closed_registry_rebuilds_clients(self, registry):
+        """Clients are rebuilt after aclose() and pick up configure() overrides."""
+        first = registry.get_client("api.example.com")
+        await registry.aclose()
+        registry.configure("api.example.com", max_concurrency=4)
+
+        second = registry.get_client("api.example.com")
+
+        assert first.is_closed
+        assert second is not first
+        assert registry.get_stats()["api.example.com"]["max_concurrency"] == 4
+
+    @pytest.mark.asyncio
+    async def test_global_registry(self):
+        """The process-wide registry is created once and reset on close."""
+        registry = get_http_client_registry()
+        assert get_http_client_registry() is registry
+        assert ANTHROPIC_HOST in registry.configs
+
+        await close_http_client_registry()
+        assert get_http_client_registry() is not registry
+        await close_http_client_registry()
+
+
+class TestUpstreamStats:
+    """Test connection reuse accounting."""
+
+    def test_connection_reuse_ratio(self):
+        stats = UpstreamStats(requests=10, connections_opened=2)
+        assert stats.connection_reuse_ratio == pytest.approx(0.8)
+        assert stats.to_dict()["avg_wait_ms"] == 0.0
+
+    def test_connection_reuse_ratio_without_requests(self):
+        assert UpstreamStats().connection_reuse_ratio == 0.0
@@ -2,5 +2,9 @@
 # Addresses: FM-043 - Basic concurrency monitoring implementation
 
 from .concurrency_monitor import ConcurrencyMonitor, get_monitor, start_background_monitoring
+from .resource_sampler import ResourceSampler, ResourceSnapshot, get_resource_sampler
 
-__all__ = ['ConcurrencyMonitor', 'get_monitor', 'start_background_monitoring']
\ No newline at end of file
+__all__ = [
+    'ConcurrencyMonitor', 'get_monitor', 'start_background_monitoring',
+    'ResourceSampler', 'ResourceSnapshot', 'get_resource_sampler'
+]
@@ -0,0 +1,121 @@
+# Background Resource Sampler
+# Keeps a recent CPU/memory snapshot so request paths can log resource usage
+# without calling psutil.cpu_percent(interval=...) inline, which blocks the
+# calling thread (and with it the event loop) for the whole interval.
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """System resource usage at one sampling instant."""
+    sampled_at: float
+    cpu_percent: float
+    memory_percent: float
+    memory_available_mb: float
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.sampled_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cpu_percent": self.cpu_percent,
+            "memory_percent": self.memory_percent,
+            "memory_available_mb": round(self.memory_available_mb, 1),
+            "age_seconds": round(self.age_seconds, 1),
+        }
+
+
+class ResourceSampler:
+    """
+    Samples CPU and memory on a daemon thread at a fixed interval.
+
+    cpu_percent is measured over each sampling interval with psutil's
+    non-blocking mode (interval=None), so readers only ever copy the latest
+    snapshot. The thread starts on first use and is independent of any event
+    loop, so sync and async callers can share one sampler.
+    """
+
+    def __init__(self, interval_seconds: float = 5.0):
+        """
+        Args:
+            interval_seconds: Time between samples
+        """
+        self.interval_seconds = interval_seconds
+        self.logger = logging.getLogger(__name__)
+        self._snapshot: Optional[ResourceSnapshot] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Start the sampling thread; returns False when psutil is unavailable."""
+        with self._lock:
+            if self.is_running:
+                return True
+            try:
+                import psutil
+            except ImportError:
+                self.logger.warning("psutil not available - resource sampling disabled")
+                return False
+
+            # Prime the CPU counter so the first real sample covers one interval
+            psutil.cpu_percent(interval=None)
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(psutil,), name="resource_sampler", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=self.interval_seconds + 1.0)
+
+    def latest(self) -> Optional[ResourceSnapshot]:
+        """Most recent snapshot (starting the sampler if needed); None before the first sample."""
+        if not self.is_running:
+            self.start()
+        return self._snapshot
+
+    def _run(self, psutil) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                memory = psutil.virtual_memory()
+                self._snapshot = ResourceSnapshot(
+                    sampled_at=time.time(),
+                    cpu_percent=psutil.cpu_percent(interval=None),
+                    memory_percent=memory.percent,
+                    memory_available_mb=memory.available / 1024 / 1024
+                )
+            except Exception as e:
+                self.logger.debug(f"Resource sample failed: {e}")
+
+
+# Global sampler instance
+_sampler: Optional[ResourceSampler] = None
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """
+    Get the global resource sampler instance.
+
+    Returns:
+        ResourceSampler instance
+    """
+    global _sampler
+    if _sampler is None:
+        _sampler = ResourceSampler()
+    return _sampler
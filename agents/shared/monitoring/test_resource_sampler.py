@@ -0,0 +1,34 @@
+"""
+Collocated unit tests for the background resource sampler.
+"""
+
+import time
+
+import pytest
+
+from .resource_sampler import ResourceSampler
+
+
+class TestResourceSampler:
+    """Test background sampling and non-blocking reads."""
+
+    def test_latest_is_non_blocking_and_fills_in(self):
+        pytest.importorskip("psutil")
+        sampler = ResourceSampler(interval_seconds=0.01)
+        try:
+            start = time.perf_counter()
+            sampler.latest()
+            assert time.perf_counter() - start < 0.1
+
+            deadline = time.time() + 2.0
+            while sampler.latest() is None and time.time() < deadline:
+                time.sleep(0.01)
+
+            snapshot = sampler.latest()
+            assert snapshot is not None
+            assert 0.0 <= snapshot.memory_percent <= 100.0
+            assert set(snapshot.to_dict()) == {"cpu_percent", "memory_percent", "memory_available_mb", "age_seconds"}
+        finally:
+            sampler.stop()
+
+        assert not sampler.is_running
@@ -9,11 +9,21 @@ import asyncio
 import os
 import time
 import logging
-from typing import Optional
+from collections import deque
+from typing import Callable, Deque, Optional
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 
+from api.upload_pipeline.utils.gcra import (
+    TAT_EPSILON as _TAT_EPSILON,
+    GCRALimit,
+    InMemoryRateLimitStore,
+    RateLimitStore,
+    gcra_remaining,
+    gcra_retry_after,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,22 +61,34 @@ class TokenBucketRateLimiter(RateLimiter):
     Token bucket rate limiter implementation.
     
     Allows burst traffic up to bucket size while maintaining average rate.
+    Runs on the same GCRA engine and RateLimitStore interface as the upload
+    pipeline API limiter: the only state is the theoretical arrival time (TAT)
+    for this limiter's key, so acquire() is O(1). The default store is
+    process-local; pass a shared store (e.g. the upload pipeline's Postgres
+    store) to enforce one budget across processes.
     """
     
-    def __init__(self, config: RateLimitConfig):
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        store: Optional[RateLimitStore] = None,
+        key: str = "default",
+        clock: Callable[[], float] = time.time
+    ):
         """
         Initialize token bucket rate limiter.
         
         Args:
             config: Rate limit configuration
+            store: TAT store (defaults to a private in-memory store)
+            key: Key this limiter's state is stored under
+            clock: Wall-clock time source shared by every user of the store
         """
-        self.config = config
-        self.requests_per_minute = config.requests_per_minute
-        self.bucket_size = config.burst_size or config.requests_per_minute
-        self.tokens = float(self.bucket_size)
-        self.last_refill = time.time()
-        self.refill_rate = self.requests_per_minute / 60.0  # tokens per second
-        self._lock = asyncio.Lock()
+        self.store = store or InMemoryRateLimitStore()
+        self.key = key
+        self.clock = clock
+        self.tat: Optional[float] = None
+        self._apply_config(config)
         
         logger.info(
             f"TokenBucketRateLimiter initialized: "
@@ -75,63 +97,47 @@ class TokenBucketRateLimiter(RateLimiter):
             f"refill_rate={self.refill_rate:.2f} tokens/sec"
         )
     
+    def _apply_config(self, config: RateLimitConfig) -> None:
+        self.config = config
+        self.requests_per_minute = config.requests_per_minute
+        self.bucket_size = config.burst_size or config.requests_per_minute
+        self.refill_rate = self.requests_per_minute / 60.0  # tokens per second
+        self.limit = GCRALimit(
+            emission_interval=1.0 / self.refill_rate,
+            burst_offset=self.bucket_size / self.refill_rate
+        )
+    
     async def acquire(self) -> None:
         """Acquire a token from the bucket. Blocks until token available."""
-        async with self._lock:
-            await self._refill_tokens()
-            
-            # Wait until we have at least one token
-            while self.tokens < 1.0:
-                # Calculate wait time for next token
-                tokens_needed = 1.0 - self.tokens
-                wait_time = tokens_needed / self.refill_rate
-                
-                # Release lock and wait
-                await asyncio.sleep(wait_time)
-                
-                # Refill again after wait
-                await self._refill_tokens()
-            
-            # Consume one token
-            self.tokens -= 1.0
-            logger.debug(f"Token acquired. Remaining tokens: {self.tokens:.2f}")
-    
-    async def _refill_tokens(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = time.time()
-        elapsed = now - self.last_refill
-        
-        if elapsed > 0:
-            # Add tokens based on refill rate
-            tokens_to_add = elapsed * self.refill_rate
-            self.tokens = min(self.bucket_size, self.tokens + tokens_to_add)
-            self.last_refill = now
+        while True:
+            now = self.clock()
+            allowed, tat = await self.store.acquire(self.key, now, self.limit)
+            if allowed:
+                self.tat = tat
+                break
+            # Sleep outside any lock until the next slot frees up, then retry
+            await asyncio.sleep(max(gcra_retry_after(tat, now, self.limit), _TAT_EPSILON))
+        logger.debug(f"Token acquired. Remaining tokens: {self.get_available_requests()}")
     
     def get_available_requests(self) -> int:
-        """Get number of available requests (tokens)."""
-        return int(self.tokens)
+        """Get number of available requests (tokens) as of this limiter's last acquire."""
+        return gcra_remaining(self.tat, self.clock(), self.limit)
     
     def update_config(self, config: RateLimitConfig) -> None:
         """Update rate limit configuration at runtime."""
-        async def _update():
-            async with self._lock:
-                self.config = config
-                self.requests_per_minute = config.requests_per_minute
-                self.bucket_size = config.burst_size or config.requests_per_minute
-                self.refill_rate = self.requests_per_minute / 60.0
-                # Don't exceed bucket size when updating
-                self.tokens = min(self.bucket_size, self.tokens)
-                logger.info(f"Rate limiter config updated: {self.requests_per_minute} req/min")
-        
-        # Schedule update (in real async context, this would be awaited)
-        asyncio.create_task(_update())
+        # The stored TAT keeps the consumed budget as time owed; it refills at
+        # the new rate and never exceeds the new bucket size
+        self._apply_config(config)
+        logger.info(f"Rate limiter config updated: {self.requests_per_minute} req/min")
 
 
 class SlidingWindowRateLimiter(RateLimiter):
     """
     Sliding window rate limiter implementation.
     
-    Tracks requests in a time window and enforces strict rate limits.
+    Tracks requests in a time window and enforces strict rate limits. Request
+    times are kept in a deque in arrival order, so expiring old requests pops
+    from the left instead of rebuilding the list on every call.
     """
     
     def __init__(self, config: RateLimitConfig):
@@ -144,7 +150,7 @@ class SlidingWindowRateLimiter(RateLimiter):
         self.config = config
         self.requests_per_minute = config.requests_per_minute
         self.window_size_seconds = config.window_size_seconds
-        self.request_times: list[float] = []
+        self.request_times: Deque[float] = deque()
         self._lock = asyncio.Lock()
         
         logger.info(
@@ -153,35 +159,28 @@ class SlidingWindowRateLimiter(RateLimiter):
             f"window_size={self.window_size_seconds}s"
         )
     
+    def _expire(self, now: float) -> None:
+        cutoff_time = now - self.window_size_seconds
+        while self.request_times and self.request_times[0] <= cutoff_time:
+            self.request_times.popleft()
+    
     async def acquire(self) -> None:
         """Acquire permission to make a request. Blocks until available."""
         async with self._lock:
-            now = time.time()
-            
-            # Remove requests outside the window
-            cutoff_time = now - self.window_size_seconds
-            self.request_times = [t for t in self.request_times if t > cutoff_time]
+            now = time.monotonic()
+            self._expire(now)
             
             # Calculate max requests allowed in window
             max_requests = (self.requests_per_minute * self.window_size_seconds) / 60.0
             
             # Wait if we're at the limit
             while len(self.request_times) >= max_requests:
-                # Calculate wait time until oldest request expires
-                if self.request_times:
-                    oldest_time = min(self.request_times)
-                    wait_time = (oldest_time + self.window_size_seconds) - now + 0.01
-                    wait_time = max(0, wait_time)
-                else:
-                    wait_time = self.window_size_seconds / max_requests
+                # Wait until the oldest request leaves the window
+                wait_time = (self.request_times[0] + self.window_size_seconds) - now + 0.01
+                await asyncio.sleep(max(0, wait_time))
                 
-                # Release lock and wait
-                await asyncio.sleep(wait_time)
-                
-                # Update window after wait
-                now = time.time()
-                cutoff_time = now - self.window_size_seconds
-                self.request_times = [t for t in self.request_times if t > cutoff_time]
+                now = time.monotonic()
+                self._expire(now)
             
             # Record this request
             self.request_times.append(now)
@@ -189,23 +188,16 @@ class SlidingWindowRateLimiter(RateLimiter):
     
     def get_available_requests(self) -> int:
         """Get number of available requests in current window."""
-        now = time.time()
-        cutoff_time = now - self.window_size_seconds
-        current_requests = len([t for t in self.request_times if t > cutoff_time])
+        self._expire(time.monotonic())
         max_requests = int((self.requests_per_minute * self.window_size_seconds) / 60.0)
-        return max(0, max_requests - current_requests)
+        return max(0, max_requests - len(self.request_times))
     
     def update_config(self, config: RateLimitConfig) -> None:
         """Update rate limit configuration at runtime."""
-        async def _update():
-            async with self._lock:
-                self.config = config
-                self.requests_per_minute = config.requests_per_minute
-                self.window_size_seconds = config.window_size_seconds
-                logger.info(f"Rate limiter config updated: {self.requests_per_minute} req/min")
-        
-        # Schedule update
-        asyncio.create_task(_update())
+        self.config = config
+        self.requests_per_minute = config.requests_per_minute
+        self.window_size_seconds = config.window_size_seconds
+        logger.info(f"Rate limiter config updated: {self.requests_per_minute} req/min")
 
 
 def create_rate_limiter(
@@ -232,7 +224,9 @@ def create_rate_limiter(
     )
     
     if algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
-        return TokenBucketRateLimiter(config)
+        return TokenBucketRateLimiter(
+            config, store=kwargs.get("store"), key=kwargs.get("key", "default")
+        )
     elif algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
         return SlidingWindowRateLimiter(config)
     else:
@@ -251,7 +245,8 @@ def get_openai_rate_limiter() -> RateLimiter:
         requests_per_min = int(os.getenv("OPENAI_RATE_LIMIT", "60"))
         _openai_limiter = create_rate_limiter(
             requests_per_minute=requests_per_min,
-            algorithm=RateLimitAlgorithm.TOKEN_BUCKET
+            algorithm=RateLimitAlgorithm.TOKEN_BUCKET,
+            key="openai"
         )
     return _openai_limiter
 
@@ -263,7 +258,8 @@ def get_anthropic_rate_limiter() -> RateLimiter:
         requests_per_min = int(os.getenv("ANTHROPIC_RATE_LIMIT", "50"))
         _anthropic_limiter = create_rate_limiter(
             requests_per_minute=requests_per_min,
-            algorithm=RateLimitAlgorithm.TOKEN_BUCKET
+            algorithm=RateLimitAlgorithm.TOKEN_BUCKET,
+            key="anthropic"
         )
     return _anthropic_limiter
 
@@ -65,6 +65,28 @@ class TestTokenBucketRateLimiter:
         available = limiter.get_available_requests()
         assert available == 9
 
+    
+    @pytest.mark.asyncio
+    async def test_limiters_sharing_a_store_share_one_budget(self):
+        """Test two limiters on the same store and key draw from one bucket."""
+        from api.upload_pipeline.utils.gcra import InMemoryRateLimitStore
+        
+        config = RateLimitConfig(requests_per_minute=60, burst_size=4)
+        store = InMemoryRateLimitStore()
+        first = TokenBucketRateLimiter(config, store=store, key="openai")
+        second = TokenBucketRateLimiter(config, store=store, key="openai")
+        
+        for _ in range(2):
+            await first.acquire()
+            await second.acquire()
+        
+        assert second.get_available_requests() == 0
+        assert list(store.tats) == ["openai"]
+        
+        # The fifth request overall has to wait for a refill
+        start = time.time()
+        await first.acquire()
+        assert time.time() - start >= 0.9
 
 class TestSlidingWindowRateLimiter:
     """Test sliding window algorithm."""
@@ -19,6 +19,60 @@ import logging
 from datetime import datetime
 from .observability import RAGPerformanceMonitor, threshold_manager
 
+# Number of nearest chunks whose similarities are sampled for the histogram
+SIMILARITY_SAMPLE_SIZE = 100
+
+# Estimate for chunks stored without a token count (~4 characters per token)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough token count for chunks that predate stored token counts."""
+    return -(-len(text or "") // CHARS_PER_TOKEN)
+
+
+def build_retrieval_sql(schema: str) -> str:
+    """
+    Build the single-round-trip retrieval query.
+
+    Parameters: $1 query vector, $2 user_id, $3 similarity threshold,
+    $4 max_chunks, $5 sample size. Returns the nearest $5 chunks ordered by
+    distance with their similarity; rows with selected = true are the top
+    $4 above the threshold and are the only rows that carry chunk text.
+    """
+    return f"""
+        WITH candidates AS MATERIALIZED (
+            SELECT dc.chunk_id, d.document_id, dc.chunk_ord, dc.text,
+                   dc.tokens, dc.section_path, dc.section_title, dc.page_start, dc.page_end,
+                   dc.embedding <=> $1::vector(1536) AS distance
+            FROM {schema}.document_chunks dc
+            -- Duplicated documents may share another document's chunk set
+            JOIN {schema}.documents d
+              ON dc.document_id = COALESCE(d.chunk_source_document_id, d.document_id)
+            WHERE d.user_id = $2
+              AND dc.embedding IS NOT NULL
+            ORDER BY distance
+            LIMIT $5
+        ), ranked AS (
+            -- Similarity falls monotonically with distance, so rows above the
+            -- threshold form a prefix and row_number() is their rank
+            SELECT c.*,
+                   1 - c.distance AS similarity,
+                   (1 - c.distance > $3 AND row_number() OVER (ORDER BY c.distance) <= $4) AS selected
+            FROM candidates c
+        )
+        SELECT r.chunk_id, r.document_id, r.chunk_ord AS chunk_index,
+               CASE WHEN r.selected THEN r.text END AS content,
+               r.section_path, r.section_title,
+               r.page_start, r.page_end,
+               r.tokens,
+               r.similarity,
+               r.selected
+        FROM ranked r
+        ORDER BY r.distance
+    """
+
+
 # --- RetrievalConfig ---
 @dataclass
 class RetrievalConfig:
@@ -105,6 +159,7 @@ class RAGTool:
         self.config = config or RetrievalConfig.default()
         self.logger = logging.getLogger("RAGTool")
         self.performance_monitor = RAGPerformanceMonitor()
+        self._embedding_validator = None
         
         # Override threshold with configurable threshold if available
         configurable_threshold = threshold_manager.get_threshold(user_id, context)
@@ -155,48 +210,36 @@ class RAGTool:
             
             self.logger.debug(f"Vector string length: {len(vector_string)}, first 100 chars: {vector_string[:100]}")
             
-            # First, get all chunks above threshold to calculate similarity distribution
-            # This query gets all chunks without the threshold filter for histogram analysis
-            all_similarities_sql = f"""
-                SELECT 1 - (dc.embedding <=> $1::vector(1536)) as similarity
-                FROM {schema}.document_chunks dc
-                JOIN {schema}.documents d ON dc.document_id = d.document_id
-                WHERE d.user_id = $2
-                  AND dc.embedding IS NOT NULL
-                ORDER BY dc.embedding <=> $1::vector(1536)
-                LIMIT 100
-            """
-            all_similarity_rows = await conn.fetch(all_similarities_sql, vector_string, self.user_id)
-            all_similarities = [float(row["similarity"]) for row in all_similarity_rows]
+            # One round trip: the nearest SIMILARITY_SAMPLE_SIZE chunks feed the
+            # similarity histogram, and the top max_chunks above threshold are
+            # flagged for return. Distance is computed once per candidate row.
+            sample_size = max(SIMILARITY_SAMPLE_SIZE, self.config.max_chunks)
+            self.logger.debug(f"Executing similarity query with threshold: {self.config.similarity_threshold}, max_chunks: {self.config.max_chunks}")
+            scored_rows = await conn.fetch(
+                build_retrieval_sql(schema),
+                vector_string,
+                self.user_id,
+                self.config.similarity_threshold,
+                self.config.max_chunks,
+                sample_size
+            )
+            all_similarities = [float(row["similarity"]) for row in scored_rows]
+            rows = [row for row in scored_rows if row["selected"]]
             
-            self.logger.info(f"Found {len(all_similarity_rows)} total chunks for user {self.user_id}, similarities range: {min(all_similarities) if all_similarities else 'N/A'} to {max(all_similarities) if all_similarities else 'N/A'}")
+            self.logger.info(f"Found {len(scored_rows)} total chunks for user {self.user_id}, similarities range: {min(all_similarities) if all_similarities else 'N/A'} to {max(all_similarities) if all_similarities else 'N/A'}")
             
             # Record similarity scores for histogram analysis (if operation_metrics available)
             if operation_metrics:
                 self.performance_monitor.record_similarity_scores(operation_metrics.operation_uuid, all_similarities)
             
-            # Now get the actual results with threshold filtering
-            sql = f"""
-                SELECT dc.chunk_id, dc.document_id, dc.chunk_ord as chunk_index, dc.text as content,
-                       NULL as section_path, NULL as section_title,
-                       NULL as page_start, NULL as page_end,
-                       NULL as tokens,
-                       1 - (dc.embedding <=> $1::vector(1536)) as similarity
-                FROM {schema}.document_chunks dc
-                JOIN {schema}.documents d ON dc.document_id = d.document_id
-                WHERE d.user_id = $2
-                  AND dc.embedding IS NOT NULL
-                  AND 1 - (dc.embedding <=> $1::vector(1536)) > $3
-                ORDER BY dc.embedding <=> $1::vector(1536)
-                LIMIT $4
-            """
-            self.logger.debug(f"Executing similarity query with threshold: {self.config.similarity_threshold}, max_chunks: {self.config.max_chunks}")
-            rows = await conn.fetch(sql, vector_string, self.user_id, self.config.similarity_threshold, self.config.max_chunks)
             self.logger.info(f"Query returned {len(rows)} rows above threshold {self.config.similarity_threshold}")
             chunks = []
             total_tokens = 0
             for row in rows:
-                tokens = row.get("tokens") or 0
+                tokens = row.get("tokens")
+                if tokens is None:
+                    # Chunks stored before token counts were recorded
+                    tokens = estimate_tokens(row["content"])
                 if total_tokens + tokens > self.config.token_budget:
                     break
                 chunk = ChunkWithContext(
@@ -220,7 +263,7 @@ class RAGTool:
                     operation_metrics.operation_uuid,
                     chunks_returned=len(chunks),
                     total_tokens_used=total_tokens,
-                    total_chunks_available=len(all_similarity_rows)
+                    total_chunks_available=len(scored_rows)
                 )
                 
                 # Complete the operation successfully
@@ -276,7 +319,7 @@ class RAGTool:
             self.logger.info(f"PRE-EMBEDDING: About to call _generate_embedding for query: {query_text[:100]}...")
             self.logger.info("PRE-EMBEDDING: Checkpoint - calling await self._generate_embedding()")
             self.logger.info("CHECKPOINT G: About to await self._generate_embedding()")
-            query_embedding = await self._generate_embedding(query_text)
+            query_embedding = await self._generate_embedding(query_text, operation_metrics)
             self.logger.info("CHECKPOINT H: await self._generate_embedding() returned!")
             self.logger.info("POST-EMBEDDING: _generate_embedding() returned successfully")
             
@@ -303,12 +346,13 @@ class RAGTool:
             self.performance_monitor.complete_operation(operation_metrics.operation_uuid, success=False, error_message=str(e))
             return []
 
-    async def _generate_embedding(self, text: str) -> List[float]:
+    async def _generate_embedding(self, text: str, operation_metrics=None) -> List[float]:
         """
         Generate embedding for text using OpenAI text-embedding-3-small model.
         
         Args:
             text: Text to embed
+            operation_metrics: Optional RAG operation to record cache/latency results on
         Returns:
             List of floats representing the embedding
         """
@@ -321,55 +365,26 @@ class RAGTool:
         self.logger.info(f"Text length: {len(text)} characters")
         
         try:
-            import os
-            import time
-            import httpx
-            
-            # Get OpenAI API key
-            api_key = os.getenv('OPENAI_API_KEY')
-            if not api_key:
-                self.logger.error("OPENAI_API_KEY not found - RAG will not work properly")
-                raise ValueError("OPENAI_API_KEY is required for RAG functionality")
-            
-            # Record start time for performance monitoring
-            start_time = time.time()
+            from backend.shared.external.embedding_service import get_embedding_service
             
-            # Prepare request payload
-            payload = {
-                "model": "text-embedding-3-small",
-                "input": text,
-                "encoding_format": "float"
-            }
+            # Shared service: pooled keep-alive connections, in-flight coalescing
+            # and a normalized-text cache, so repeated questions skip the API
+            embedding_service = get_embedding_service()
+            lookup = await embedding_service.lookup(text)
+            embedding = lookup.embedding
             
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}"
-            }
-            
-            # Use httpx.AsyncClient for async HTTP requests
-            # Increased timeout to 60s to match chat processing timeout
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                self.logger.info("Making OpenAI API request using httpx.AsyncClient")
-                
-                response = await client.post(
-                    "https://api.openai.com/v1/embeddings",
-                    json=payload,
-                    headers=headers
+            self.logger.info(
+                f"Query embedding {'served from cache' if lookup.cache_hit else 'generated'} "
+                f"in {lookup.latency_ms:.1f}ms ({len(embedding)} dimensions)"
+            )
+            if operation_metrics:
+                self.performance_monitor.record_embedding(
+                    operation_metrics.operation_uuid,
+                    cache_hit=lookup.cache_hit,
+                    latency_ms=lookup.latency_ms,
+                    coalesced=lookup.coalesced,
+                    cache_hit_rate=embedding_service.stats.hit_rate
                 )
-                
-                # Check response status
-                if response.status_code != 200:
-                    error_text = response.text
-                    self.logger.error(f"OpenAI API error: {response.status_code} - {error_text}")
-                    raise RuntimeError(f"OpenAI API error: {response.status_code} - {error_text}")
-                
-                # Parse response
-                result = response.json()
-                embedding = result["data"][0]["embedding"]
-                
-                end_time = time.time()
-                self.logger.info(f"OpenAI API call completed in {end_time - start_time:.2f}s")
-                self.logger.info(f"Successfully generated embedding: {len(embedding)} dimensions")
             
             # Validate embedding quality
             if not self._validate_embedding(embedding, "query"):
@@ -401,14 +416,14 @@ class RAGTool:
         # Import validator here to avoid circular imports
         try:
             from backend.shared.validation.embedding_validator import EmbeddingValidator, EmbeddingIssueType
-            from backend.shared.monitoring.embedding_monitor import EmbeddingQualityMonitor
         except ImportError:
             # Fallback to basic validation if modules not available
             return self._basic_validate_embedding(embedding, source)
         
-        # Use enhanced validator
-        validator = EmbeddingValidator()
-        monitor = EmbeddingQualityMonitor(validator=validator)
+        # Use enhanced validator (vectorized; reused across queries)
+        if self._embedding_validator is None:
+            self._embedding_validator = EmbeddingValidator()
+        validator = self._embedding_validator
         
         source_info = {
             "source": source,
@@ -490,31 +505,37 @@ class RAGTool:
             self.logger.error(f"WRONG_EMBEDDING_DIMENSION: Expected 1536, got {len(embedding)} from {source}")
             return False
         
+        import math
+        
+        # One Python-level pass: min/max/sum run in C and NaN or inf
+        # propagate into the sum, so only the zero count walks the values
+        max_val = max(embedding)
+        min_val = min(embedding)
+        total = sum(embedding)
+        
         # Check for all zeros (critical issue)
-        if all(abs(x) < 1e-10 for x in embedding):
+        if max(max_val, -min_val) < 1e-10:
             self.logger.error(f"ZERO_EMBEDDING_DETECTED: All embedding values are zero from {source}")
             raise ValueError(f"ZERO_EMBEDDING_DETECTED: All embedding values are zero from {source}. This indicates a critical failure in embedding generation.")
         
         # Check for mostly zeros (critical issue)
-        zero_count = sum(1 for x in embedding if abs(x) < 1e-10)
+        zero_count = sum(1 for x in embedding if -1e-10 < x < 1e-10)
         zero_fraction = zero_count / len(embedding)
         if zero_fraction > 0.95:
             self.logger.error(f"MOSTLY_ZERO_EMBEDDING: {zero_fraction*100:.1f}% of values are zero from {source}")
             raise ValueError(f"MOSTLY_ZERO_EMBEDDING_DETECTED: {zero_fraction*100:.1f}% of embedding values are zero from {source}. This suggests partial failure in embedding generation.")
         
-        # Check for NaN or infinite values
-        import math
-        for i, val in enumerate(embedding):
-            if math.isnan(val):
-                self.logger.error(f"NAN_VALUE_DETECTED: NaN found at index {i} from {source}")
-                raise ValueError(f"NAN_VALUE_DETECTED: Embedding contains NaN values from {source}")
-            if math.isinf(val):
-                self.logger.error(f"INFINITE_VALUE_DETECTED: Infinite value found at index {i} from {source}")
-                raise ValueError(f"INFINITE_VALUE_DETECTED: Embedding contains infinite values from {source}")
+        # Check for NaN or infinite values (locate the first one only on failure)
+        if not math.isfinite(total):
+            for i, val in enumerate(embedding):
+                if math.isnan(val):
+                    self.logger.error(f"NAN_VALUE_DETECTED: NaN found at index {i} from {source}")
+                    raise ValueError(f"NAN_VALUE_DETECTED: Embedding contains NaN values from {source}")
+                if math.isinf(val):
+                    self.logger.error(f"INFINITE_VALUE_DETECTED: Infinite value found at index {i} from {source}")
+                    raise ValueError(f"INFINITE_VALUE_DETECTED: Embedding contains infinite values from {source}")
         
         # Check for reasonable value ranges (warning level)
-        max_val = max(embedding)
-        min_val = min(embedding)
         if max_val > 10 or min_val < -10:
             self.logger.warning(f"UNUSUAL_EMBEDDING_VALUES: Extreme values from {source}: min={min_val:.3f}, max={max_val:.3f}")
         
@@ -52,6 +52,12 @@ class RAGOperationMetrics:
     max_similarity: Optional[float] = None
     median_similarity: Optional[float] = None
     
+    # Query embedding metrics
+    embedding_cache_hit: Optional[bool] = None
+    embedding_coalesced: Optional[bool] = None
+    embedding_latency_ms: Optional[float] = None
+    embedding_cache_hit_rate: Optional[float] = None
+    
     # Status
     success: bool = True
     error_message: Optional[str] = None
@@ -177,6 +183,10 @@ class RAGObservabilityLogger:
             "total_tokens_used": metrics.total_tokens_used,
             "similarity_threshold": metrics.similarity_threshold,
             "avg_similarity": metrics.avg_similarity,
+            "embedding_cache_hit": metrics.embedding_cache_hit,
+            "embedding_coalesced": metrics.embedding_coalesced,
+            "embedding_latency_ms": metrics.embedding_latency_ms,
+            "embedding_cache_hit_rate": metrics.embedding_cache_hit_rate,
             "event_type": "rag_operation_end",
             **kwargs
         }
@@ -276,6 +286,18 @@ class RAGPerformanceMonitor:
             hist_counts, _ = np.histogram(similarities, bins=metrics.histogram_bins)
             metrics.histogram_counts = hist_counts.tolist()
     
+    def record_embedding(self, operation_uuid: str, cache_hit: bool, latency_ms: float,
+                         coalesced: bool = False, cache_hit_rate: Optional[float] = None):
+        """Record query embedding cache and latency results for an operation."""
+        if operation_uuid not in self.operation_metrics:
+            return
+        
+        metrics = self.operation_metrics[operation_uuid]
+        metrics.embedding_cache_hit = cache_hit
+        metrics.embedding_coalesced = coalesced
+        metrics.embedding_latency_ms = latency_ms
+        metrics.embedding_cache_hit_rate = cache_hit_rate
+    
     def record_retrieval_results(self, operation_uuid: str, chunks_returned: int, 
                                total_tokens_used: int, total_chunks_available: int = 0):
         """Record retrieval results for an operation."""
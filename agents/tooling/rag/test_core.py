@@ -0,0 +1,88 @@
+"""
+Collocated unit tests for RAGTool single-query retrieval.
+
+The retrieval query is replaced by canned rows so the selection, histogram
+and token budget handling run without Postgres.
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from .core import SIMILARITY_SAMPLE_SIZE, RAGTool, RetrievalConfig, build_retrieval_sql
+
+
+def _row(similarity, selected, content="Deductible is $500", tokens=10):
+    return {
+        "chunk_id": uuid.uuid4(), "document_id": uuid.uuid4(), "chunk_index": 0,
+        "content": content if selected else None,
+        "section_path": None, "section_title": None, "page_start": None, "page_end": None,
+        "tokens": tokens, "similarity": similarity, "selected": selected,
+    }
+
+
+class TestBuildRetrievalSql:
+    """Test the shape of the single-round-trip query."""
+
+    def test_distance_is_computed_once_per_candidate(self):
+        sql = build_retrieval_sql("upload_pipeline")
+
+        assert sql.count("<=>") == 1
+        assert "AS MATERIALIZED" in sql
+        assert "row_number() OVER (ORDER BY c.distance)" in sql
+        assert "COALESCE(d.chunk_source_document_id, d.document_id)" in sql
+
+
+class TestRetrieveChunks:
+    """Test RAGTool.retrieve_chunks over one fetch."""
+
+    @pytest.fixture
+    def conn(self):
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[
+            _row(0.91, True),
+            _row(0.82, True, tokens=None, content="x" * 40),
+            _row(0.40, False),
+            _row(0.12, False),
+        ])
+        return conn
+
+    async def _retrieve(self, tool, conn, operation_metrics=None):
+        with patch(
+            "agents.tooling.rag.database_manager.get_db_connection", new=AsyncMock(return_value=conn)
+        ), patch("agents.tooling.rag.database_manager.release_db_connection", new=AsyncMock()) as release:
+            chunks = await tool.retrieve_chunks([0.1] * 1536, operation_metrics=operation_metrics)
+        release.assert_awaited_once_with(conn)
+        return chunks
+
+    @pytest.mark.asyncio
+    async def test_one_query_returns_selected_rows_and_samples_all(self, conn):
+        tool = RAGTool("user_1", config=RetrievalConfig(max_chunks=5))
+        tool.performance_monitor = MagicMock()
+        metrics = SimpleNamespace(operation_uuid="op-1")
+
+        chunks = await self._retrieve(tool, conn, operation_metrics=metrics)
+
+        conn.fetch.assert_awaited_once()
+        _, vector, user_id, threshold, max_chunks, sample_size = conn.fetch.await_args.args
+        assert vector.startswith("[0.1,") and user_id == "user_1"
+        assert (threshold, max_chunks, sample_size) == (tool.config.similarity_threshold, 5, SIMILARITY_SAMPLE_SIZE)
+
+        assert [chunk.similarity for chunk in chunks] == [0.91, 0.82]
+        # A chunk without a stored token count is estimated from its text
+        assert [chunk.tokens for chunk in chunks] == [10, 10]
+        tool.performance_monitor.record_similarity_scores.assert_called_once_with(
+            "op-1", [0.91, 0.82, 0.40, 0.12]
+        )
+        assert tool.performance_monitor.record_retrieval_results.call_args.kwargs["total_chunks_available"] == 4
+
+    @pytest.mark.asyncio
+    async def test_sample_covers_max_chunks_and_budget_limits_results(self, conn):
+        tool = RAGTool("user_1", config=RetrievalConfig(max_chunks=150, token_budget=15))
+
+        chunks = await self._retrieve(tool, conn)
+
+        assert conn.fetch.await_args.args[5] == 150
+        assert len(chunks) == 1
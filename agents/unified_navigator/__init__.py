@@ -6,6 +6,7 @@ multi-agent supervisor system with guardrails and tool integration.
 """
 
 from .navigator_agent import UnifiedNavigatorAgent
+from .runtime import NavigatorRuntime, get_navigator_runtime
 from .models import (
     UnifiedNavigatorInput,
     UnifiedNavigatorOutput,
@@ -17,6 +18,8 @@ from .models import (
 
 __all__ = [
     "UnifiedNavigatorAgent",
+    "NavigatorRuntime",
+    "get_navigator_runtime",
     "UnifiedNavigatorInput", 
     "UnifiedNavigatorOutput",
     "ToolType",
@@ -17,6 +17,13 @@ from typing import Any, Dict, List, Optional, Set
 import httpx
 import os
 
+from agents.shared.http_clients import (
+    ANTHROPIC_HOST,
+    ANTHROPIC_MESSAGES_URL,
+    anthropic_headers,
+    get_http_client_registry,
+)
+
 from ..models import (
     InputSafetyResult, 
     SafetyLevel, 
@@ -34,7 +41,17 @@ class InputSanitizer:
     Stage 2: LLM validation for uncertain cases (200-500ms)
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[Any] = None
+    ):
+        """
+        Args:
+            http_client: Optional Anthropic client override (owned by the caller);
+                by default requests check a client out of the HTTP client registry
+            rate_limiter: Optional process-wide limiter acquired before LLM calls
+        """
         self.logger = logging.getLogger("unified_navigator.input_sanitizer")
         
         # Insurance domain keywords (expand as needed)
@@ -73,22 +90,19 @@ class InputSanitizer:
             re.compile(r'(?:cost|price|premium|deductible|copay)', re.IGNORECASE),
         ]
         
-        # Initialize HTTP client for LLM calls
-        self.http_client: Optional[httpx.AsyncClient] = None
+        # LLM calls check a pooled client out of the HTTP client registry
+        self.http_client: Optional[httpx.AsyncClient] = http_client
+        self.rate_limiter = rate_limiter
+        self.request_timeout = 10.0
+        self.api_key: Optional[str] = None
+        self.llm_enabled = False
         self._setup_llm_client()
     
     def _setup_llm_client(self):
-        """Initialize async HTTP client for LLM calls."""
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if api_key:
-            self.http_client = httpx.AsyncClient(
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01"
-                },
-                timeout=10.0
-            )
+        """Read Anthropic settings; requests use the pooled registry client."""
+        self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        if self.api_key:
+            self.llm_enabled = True
             self.anthropic_model = os.getenv("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001")
         else:
             self.logger.warning("ANTHROPIC_API_KEY not found - LLM safety checks will be skipped")
@@ -136,7 +150,7 @@ class InputSanitizer:
                 return state
             
             # Stage 2: LLM-based validation for uncertain cases
-            if self.http_client and fast_check.needs_llm_check:
+            if self.llm_enabled and fast_check.needs_llm_check:
                 llm_check = await self._llm_safety_check(state["user_query"], langfuse_trace=state.get("langfuse_trace"))
                 
                 state["input_safety"] = InputSafetyResult(
@@ -169,7 +183,7 @@ class InputSanitizer:
                     reasoning="Rule-based validation only",
                     processing_time_ms=(time.time() - start_time) * 1000
                 )
-                if state["input_safety"].is_safe and self.http_client:
+                if state["input_safety"].is_safe and self.llm_enabled:
                     await self._improve_query_for_context_extraction(state)
             
             # Record input safety score in Langfuse
@@ -262,7 +276,7 @@ class InputSanitizer:
         start_time = time.time()
         call_start = datetime.now(timezone.utc)
 
-        if not self.http_client:
+        if not self.llm_enabled:
             return LLMSafetyCheck(
                 is_safe=True,
                 is_unsafe=False,
@@ -300,10 +314,7 @@ Respond in JSON format:
                 "messages": [{"role": "user", "content": prompt}]
             }
 
-            response = await self.http_client.post(
-                "https://api.anthropic.com/v1/messages",
-                json=payload
-            )
+            response = await self._post_messages(payload)
 
             if response.status_code != 200:
                 raise Exception(f"Anthropic API error: {response.status_code}")
@@ -371,7 +382,7 @@ Respond in JSON format:
         insurance context, reframe it toward teaching (so the system can explain).
         Updates state["user_query"] in place when improvement is returned.
         """
-        if not self.http_client:
+        if not self.llm_enabled:
             return
         query = (state.get("user_query") or "").strip()
         if not query:
@@ -399,10 +410,7 @@ Rewrite this into a single, clear question that is a better input for context re
                 "max_tokens": 150,
                 "messages": [{"role": "user", "content": prompt}],
             }
-            response = await self.http_client.post(
-                "https://api.anthropic.com/v1/messages",
-                json=payload,
-            )
+            response = await self._post_messages(payload)
             if response.status_code != 200:
                 return
             result = response.json()
@@ -443,10 +451,22 @@ Rewrite this into a single, clear question that is a better input for context re
             self.logger.debug("Query improvement skipped: %s", e)
             return
 
+    async def _post_messages(self, payload: Dict[str, Any]) -> httpx.Response:
+        """POST to the Anthropic messages API, honouring the shared rate limiter."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        request = {
+            "json": payload,
+            "headers": anthropic_headers(self.api_key),
+            "timeout": self.request_timeout
+        }
+        if self.http_client is not None:
+            return await self.http_client.post(ANTHROPIC_MESSAGES_URL, **request)
+        async with get_http_client_registry().checkout(ANTHROPIC_HOST) as client:
+            return await client.post(ANTHROPIC_MESSAGES_URL, **request)
+    
     async def cleanup(self):
-        """Clean up resources."""
-        if self.http_client:
-            await self.http_client.aclose()
+        """Clean up resources (pooled clients belong to the HTTP client registry)."""
 
 
 # LangGraph node function
@@ -460,6 +480,12 @@ async def input_guardrail_node(state: UnifiedNavigatorState) -> UnifiedNavigator
     Returns:
         Updated state with input safety assessment
     """
+    from ..runtime import get_navigator_runtime
+    
+    runtime = get_navigator_runtime()
+    if runtime is not None and runtime.input_sanitizer is not None:
+        return await runtime.input_sanitizer.sanitize_input(state)
+    
     sanitizer = InputSanitizer()
     try:
         return await sanitizer.sanitize_input(state)
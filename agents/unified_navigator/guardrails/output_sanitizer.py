@@ -15,6 +15,13 @@ from typing import Any, Dict, List, Optional, Set
 import httpx
 import os
 
+from agents.shared.http_clients import (
+    ANTHROPIC_HOST,
+    ANTHROPIC_MESSAGES_URL,
+    anthropic_headers,
+    get_http_client_registry,
+)
+
 from ..models import OutputSanitationResult, UnifiedNavigatorState
 
 
@@ -26,7 +33,17 @@ class OutputSanitizer:
     usage for edge cases only.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[Any] = None
+    ):
+        """
+        Args:
+            http_client: Optional Anthropic client override (owned by the caller);
+                by default requests check a client out of the HTTP client registry
+            rate_limiter: Optional process-wide limiter acquired before LLM calls
+        """
         self.logger = logging.getLogger("unified_navigator.output_sanitizer")
         
         # Insurance domain terms that should be preserved
@@ -63,22 +80,19 @@ class OutputSanitizer:
             "insufficient_context": "I'd be happy to help with your insurance question, but I need a bit more context to provide the most accurate information."
         }
         
-        # Initialize HTTP client for LLM calls (minimal usage)
-        self.http_client: Optional[httpx.AsyncClient] = None
+        # LLM calls (minimal usage) check a pooled client out of the HTTP client registry
+        self.http_client: Optional[httpx.AsyncClient] = http_client
+        self.rate_limiter = rate_limiter
+        self.request_timeout = 5.0
+        self.api_key: Optional[str] = None
+        self.llm_enabled = False
         self._setup_llm_client()
     
     def _setup_llm_client(self):
-        """Initialize async HTTP client for edge case LLM sanitization."""
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if api_key:
-            self.http_client = httpx.AsyncClient(
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01"
-                },
-                timeout=5.0  # Short timeout for output sanitization
-            )
+        """Read Anthropic settings for edge case LLM sanitization."""
+        self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        if self.api_key:
+            self.llm_enabled = True
             self.anthropic_model = os.getenv("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001")
     
     async def sanitize_output(self, state: UnifiedNavigatorState, response: str) -> UnifiedNavigatorState:
@@ -105,7 +119,7 @@ class OutputSanitizer:
                 confidence_score = 0.9
                 warnings = [f"Applied template: {template_result['reason']}"]
                 
-            elif template_result["is_problematic"] and self.http_client:
+            elif template_result["is_problematic"] and self.llm_enabled:
                 # Stage 2: LLM sanitization for edge cases
                 llm_result = await self._llm_sanitize(response, langfuse_trace=state.get("langfuse_trace"))
                 sanitized_response = llm_result.get("sanitized_response", response)
@@ -254,7 +268,7 @@ class OutputSanitizer:
         Returns:
             Dict with sanitization results
         """
-        if not self.http_client:
+        if not self.llm_enabled:
             return {
                 "sanitized_response": response,
                 "was_modified": False,
@@ -290,10 +304,7 @@ Respond in JSON format:
                 "messages": [{"role": "user", "content": prompt}]
             }
 
-            response_obj = await self.http_client.post(
-                "https://api.anthropic.com/v1/messages",
-                json=payload
-            )
+            response_obj = await self._post_messages(payload)
 
             if response_obj.status_code != 200:
                 raise Exception(f"Anthropic API error: {response_obj.status_code}")
@@ -351,10 +362,22 @@ Respond in JSON format:
                 "warnings": [f"LLM sanitization failed: {str(e)}"]
             }
     
+    async def _post_messages(self, payload: Dict[str, Any]) -> httpx.Response:
+        """POST to the Anthropic messages API, honouring the shared rate limiter."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        request = {
+            "json": payload,
+            "headers": anthropic_headers(self.api_key),
+            "timeout": self.request_timeout
+        }
+        if self.http_client is not None:
+            return await self.http_client.post(ANTHROPIC_MESSAGES_URL, **request)
+        async with get_http_client_registry().checkout(ANTHROPIC_HOST) as client:
+            return await client.post(ANTHROPIC_MESSAGES_URL, **request)
+    
     async def cleanup(self):
-        """Clean up resources."""
-        if self.http_client:
-            await self.http_client.aclose()
+        """Clean up resources (pooled clients belong to the HTTP client registry)."""
 
 
 # LangGraph node function
@@ -373,6 +396,12 @@ async def output_guardrail_node(state: UnifiedNavigatorState) -> UnifiedNavigato
         state["final_response"] = "I apologize, but I wasn't able to generate a response. How can I help you with your insurance questions?"
         return state
     
+    from ..runtime import get_navigator_runtime
+    
+    runtime = get_navigator_runtime()
+    if runtime is not None and runtime.output_sanitizer is not None:
+        return await runtime.output_sanitizer.sanitize_output(state, state["final_response"])
+    
     sanitizer = OutputSanitizer()
     try:
         return await sanitizer.sanitize_output(state, state["final_response"])
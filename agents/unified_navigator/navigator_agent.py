@@ -7,6 +7,7 @@ for workflow orchestration with guardrails and tool selection.
 """
 
 import asyncio
+import contextvars
 import logging
 import os
 import time
@@ -16,6 +17,12 @@ from datetime import datetime, timezone
 
 from langgraph.graph import StateGraph, END
 from agents.base_agent import BaseAgent
+from agents.shared.http_clients import (
+    ANTHROPIC_HOST,
+    ANTHROPIC_MESSAGES_URL,
+    anthropic_headers,
+    get_http_client_registry,
+)
 from agents.shared.rate_limiting import get_anthropic_rate_limiter
 
 from .models import (
@@ -37,6 +44,12 @@ from .tools.rag_search import rag_search_node, combined_search_node
 from .logging import get_workflow_logger, LLMInteraction
 from agents.shared.langfuse_client import create_trace, flush as langfuse_flush
 
+# The Langfuse trace for the request being executed. Kept in a context variable
+# rather than on the instance so one agent can serve concurrent requests.
+_current_trace_var: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
+    "unified_navigator_current_trace", default=None
+)
+
 
 class UnifiedNavigatorAgent(BaseAgent):
     """
@@ -46,12 +59,19 @@ class UnifiedNavigatorAgent(BaseAgent):
     that has guardrails and tool selection capabilities.
     """
     
-    def __init__(self, use_mock: bool = False, **kwargs):
+    def __init__(
+        self,
+        use_mock: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        **kwargs
+    ):
         """
         Initialize the unified navigator agent.
         
         Args:
             use_mock: If True, use mock responses for testing
+            http_client: Optional Anthropic client override (owned by the caller);
+                by default calls check a client out of the HTTP client registry
             **kwargs: Additional arguments passed to BaseAgent
         """
         # Auto-detect LLM client if not provided
@@ -72,12 +92,24 @@ class UnifiedNavigatorAgent(BaseAgent):
             **kwargs
         )
         
+        # Pooled clients belong to the HTTP client registry; an override is closed by its owner
+        self._http_client: Optional[httpx.AsyncClient] = http_client
+        
         # Initialize workflow logger
         self.workflow_logger = get_workflow_logger()
         
         # Build LangGraph workflow
         self.workflow = self._build_workflow()
     
+    @property
+    def _current_trace(self) -> Optional[Any]:
+        """Langfuse trace for the request running in the current task."""
+        return _current_trace_var.get()
+    
+    @_current_trace.setter
+    def _current_trace(self, trace: Optional[Any]) -> None:
+        _current_trace_var.set(trace)
+    
     def _get_claude_sonnet_llm(self) -> Optional[Callable[[str], str]]:
         """
         Return an async callable for Claude Sonnet, or None for mock mode.
@@ -109,7 +141,7 @@ class UnifiedNavigatorAgent(BaseAgent):
         langfuse_parent: Optional[Any] = None,
     ) -> str:
         """
-        Call Claude API using async httpx with rate limiting.
+        Call Claude API on a pooled registry client with rate limiting.
 
         Args:
             prompt: The prompt to send
@@ -128,24 +160,19 @@ class UnifiedNavigatorAgent(BaseAgent):
         call_start = datetime.now(timezone.utc)
 
         try:
-            if not hasattr(self, '_http_client') or self._http_client is None:
-                self._http_client = httpx.AsyncClient(
-                    timeout=60.0,
-                    headers={
-                        "Content-Type": "application/json",
-                        "x-api-key": self._anthropic_api_key,
-                        "anthropic-version": "2023-06-01"
-                    }
-                )
-
-            response = await self._http_client.post(
-                "https://api.anthropic.com/v1/messages",
-                json={
+            request = {
+                "json": {
                     "model": use_model,
                     "max_tokens": max_tokens,
                     "messages": [{"role": "user", "content": prompt}]
-                }
-            )
+                },
+                "headers": anthropic_headers(self._anthropic_api_key)
+            }
+            if self._http_client is not None:
+                response = await self._http_client.post(ANTHROPIC_MESSAGES_URL, **request)
+            else:
+                async with get_http_client_registry().checkout(ANTHROPIC_HOST) as client:
+                    response = await client.post(ANTHROPIC_MESSAGES_URL, **request)
 
             if response.status_code != 200:
                 raise Exception(f"Anthropic API error: {response.status_code}")
@@ -179,6 +206,9 @@ class UnifiedNavigatorAgent(BaseAgent):
             self.logger.error(f"LLM call failed: {e}")
             return f"I apologize, but I'm having trouble processing your request right now. Error: {str(e)}"
 
+    async def aclose(self) -> None:
+        """Release resources; pooled clients are closed with the HTTP client registry."""
+
     async def _call_haiku(
         self,
         prompt: str,
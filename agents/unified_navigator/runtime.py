@@ -0,0 +1,299 @@
+"""
+Process-wide runtime for the Unified Navigator Agent.
+
+Building a UnifiedNavigatorAgent per chat message means every request pays for
+fresh Anthropic TLS connections, new guardrail and tool instances, and a rate
+limiter that never sees concurrent traffic. The NavigatorRuntime is created
+once per process (owned by the ServiceManager) and shares those resources
+across all concurrent requests. Upstream connections live in the process-wide
+HTTP client registry, which the runtime closes on shutdown.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from agents.shared.http_clients import (
+    ANTHROPIC_HOST,
+    close_http_client_registry,
+    get_http_client_registry,
+)
+from agents.shared.rate_limiting import get_anthropic_rate_limiter
+
+from .models import UnifiedNavigatorInput, UnifiedNavigatorOutput
+
+logger = logging.getLogger("unified_navigator.runtime")
+
+
+@dataclass
+class NavigatorRuntimeMetrics:
+    """Counters describing how much work the shared runtime saves."""
+
+    started_at: float = field(default_factory=time.time)
+    cold_start_ms: float = 0.0  # Cost of building agent + guardrails + tools once
+    requests_served: int = 0
+    requests_failed: int = 0
+    active_requests: int = 0
+    peak_concurrency: int = 0
+    total_request_time_ms: float = 0.0
+
+    # Upstream connection reuse on the pooled Anthropic client
+    upstream_requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def connection_reuse_ratio(self) -> float:
+        """Fraction of upstream requests served on an already-open connection."""
+        if self.upstream_requests == 0:
+            return 0.0
+        return max(0.0, 1.0 - self.connections_opened / self.upstream_requests)
+
+    @property
+    def time_saved_ms_per_request(self) -> float:
+        """Per-request construction cost avoided by reusing the runtime."""
+        return self.cold_start_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize metrics for health endpoints and logging."""
+        avg_request_ms = (
+            self.total_request_time_ms / self.requests_served if self.requests_served else 0.0
+        )
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "cold_start_ms": self.cold_start_ms,
+            "requests_served": self.requests_served,
+            "requests_failed": self.requests_failed,
+            "active_requests": self.active_requests,
+            "peak_concurrency": self.peak_concurrency,
+            "avg_request_ms": avg_request_ms,
+            "upstream_requests": self.upstream_requests,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+            "connection_reuse_ratio": self.connection_reuse_ratio,
+            "time_saved_ms_per_request": self.time_saved_ms_per_request,
+            "time_saved_ms_total": self.time_saved_ms_per_request * self.requests_served,
+        }
+
+
+class NavigatorRuntime:
+    """
+    App-lifetime owner of the unified navigator and its shared resources.
+
+    One pair of guardrails, one set of tools and the process-wide Anthropic
+    rate limiter are created at startup and reused by every request. They all
+    check pooled clients out of the HTTP client registry. The agent keeps no
+    per-request state on the instance, so a single agent serves concurrent
+    requests.
+    """
+
+    def __init__(
+        self,
+        use_mock: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None
+    ):
+        """
+        Initialize the runtime (resources are built in start()).
+
+        Args:
+            use_mock: Force mock mode; defaults to USE_MOCK_NAVIGATOR
+            max_connections: Override the registry's Anthropic connection cap
+            max_keepalive_connections: Override the idle connections kept warm
+            keepalive_expiry: Override the seconds an idle connection stays open
+        """
+        if use_mock is None:
+            use_mock = os.getenv("USE_MOCK_NAVIGATOR", "false").lower() == "true"
+        self.use_mock = use_mock
+        self.pool_overrides = {
+            name: value for name, value in (
+                ("max_connections", max_connections),
+                ("max_keepalive_connections", max_keepalive_connections),
+                ("keepalive_expiry", keepalive_expiry),
+            ) if value is not None
+        }
+        self.metrics = NavigatorRuntimeMetrics()
+        self.rate_limiter = get_anthropic_rate_limiter()
+
+        self.http_clients = None
+        self.agent = None
+        self.input_sanitizer = None
+        self.output_sanitizer = None
+        self.web_search_tool = None
+        self.access_strategy_tool = None
+        self.quick_info_tool = None
+        self._started = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_started(self) -> bool:
+        return self._started
+
+    async def start(self) -> "NavigatorRuntime":
+        """Build the shared guardrails, tools and agent."""
+        async with self._lock:
+            if self._started:
+                return self
+
+            from .navigator_agent import UnifiedNavigatorAgent
+            from .guardrails.input_sanitizer import InputSanitizer
+            from .guardrails.output_sanitizer import OutputSanitizer
+            from .tools.web_search import WebSearchTool
+            from .tools.access_strategy_tool import AccessStrategyTool
+            from .tools.quick_info_tool import QuickInfoTool
+
+            build_start = time.perf_counter()
+
+            self.http_clients = get_http_client_registry()
+            if self.pool_overrides:
+                self.http_clients.configure(ANTHROPIC_HOST, **self.pool_overrides)
+
+            self.input_sanitizer = InputSanitizer(rate_limiter=self.rate_limiter)
+            self.output_sanitizer = OutputSanitizer(rate_limiter=self.rate_limiter)
+            self.web_search_tool = WebSearchTool()
+            self.access_strategy_tool = AccessStrategyTool()
+            self.quick_info_tool = QuickInfoTool()
+            self.agent = UnifiedNavigatorAgent(use_mock=self.use_mock)
+
+            self.metrics.cold_start_ms = (time.perf_counter() - build_start) * 1000
+
+            # Keep per-user quick info indexes fresh as the worker embeds documents
+            if not self.use_mock:
+                await self.quick_info_tool.index_manager.start_listener()
+            self._started = True
+            set_navigator_runtime(self)
+
+            logger.info(
+                "Navigator runtime started in %.1fms (mock=%s)",
+                self.metrics.cold_start_ms,
+                self.agent.mock
+            )
+            return self
+
+    async def execute(self, input_data: UnifiedNavigatorInput) -> UnifiedNavigatorOutput:
+        """Run one chat request through the shared agent."""
+        if not self._started:
+            await self.start()
+
+        self.metrics.active_requests += 1
+        self.metrics.peak_concurrency = max(self.metrics.peak_concurrency, self.metrics.active_requests)
+        start_time = time.perf_counter()
+        try:
+            output = await self.agent.execute(input_data)
+            if not output.success:
+                self.metrics.requests_failed += 1
+            return output
+        except Exception:
+            self.metrics.requests_failed += 1
+            raise
+        finally:
+            self.metrics.active_requests -= 1
+            self.metrics.requests_served += 1
+            self.metrics.total_request_time_ms += (time.perf_counter() - start_time) * 1000
+            await self._publish_metrics()
+
+    async def shutdown(self) -> None:
+        """Release shared resources; called from the ServiceManager shutdown hook."""
+        async with self._lock:
+            if not self._started:
+                return
+
+            if get_navigator_runtime() is self:
+                set_navigator_runtime(None)
+
+            if self.quick_info_tool is not None:
+                await self.quick_info_tool.index_manager.stop_listener()
+
+            for name, component in (
+                ("quick_info_tool", self.quick_info_tool),
+                ("web_search_tool", self.web_search_tool),
+                ("access_strategy_tool", self.access_strategy_tool),
+                ("input_sanitizer", self.input_sanitizer),
+                ("output_sanitizer", self.output_sanitizer),
+            ):
+                if component is None:
+                    continue
+                try:
+                    await component.cleanup()
+                except Exception as e:
+                    logger.warning(f"Error cleaning up {name}: {e}")
+
+            if self.agent is not None:
+                await self.agent.aclose()
+            await close_http_client_registry()
+            self.http_clients = None
+
+            self._started = False
+            logger.info(f"Navigator runtime shut down: {self.metrics.to_dict()}")
+
+    async def health_check(self) -> bool:
+        """Runtime is healthy once started."""
+        return self._started and self.agent is not None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return runtime metrics as a dictionary."""
+        self._sync_upstream_metrics()
+        metrics = self.metrics.to_dict()
+        if self.quick_info_tool is not None:
+            metrics["quick_info_index"] = self.quick_info_tool.index_manager.get_stats()
+        return metrics
+
+    def _sync_upstream_metrics(self) -> None:
+        """Copy Anthropic connection counters from the HTTP client registry."""
+        if self.http_clients is None:
+            return
+        stats = self.http_clients.get_upstream_stats(ANTHROPIC_HOST)
+        if stats is not None:
+            self.metrics.upstream_requests = stats.requests
+            self.metrics.connections_opened = stats.connections_opened
+            self.metrics.tls_handshakes = stats.tls_handshakes
+
+    async def _publish_metrics(self) -> None:
+        """Push runtime counters into the system monitor."""
+        self._sync_upstream_metrics()
+        try:
+            from core.resilience import get_system_monitor
+            metrics = get_system_monitor().metrics
+            tags = {"component": "navigator_runtime"}
+            await metrics.increment_counter("navigator_runtime.requests", tags=tags)
+            await metrics.set_gauge(
+                "navigator_runtime.connection_reuse_ratio",
+                self.metrics.connection_reuse_ratio,
+                tags=tags
+            )
+            await metrics.set_gauge(
+                "navigator_runtime.time_saved_ms_per_request",
+                self.metrics.time_saved_ms_per_request,
+                tags=tags
+            )
+            await metrics.set_gauge(
+                "navigator_runtime.active_requests",
+                self.metrics.active_requests,
+                tags=tags
+            )
+            if self.http_clients is not None:
+                for host, pool in self.http_clients.get_stats().items():
+                    pool_tags = {**tags, "upstream": host}
+                    for name in ("in_use", "waiting", "idle_connections", "avg_wait_ms"):
+                        await metrics.set_gauge(f"http_client.{name}", pool[name], tags=pool_tags)
+        except Exception as e:
+            logger.debug(f"Navigator runtime metrics publish skipped: {e}")
+
+
+# Global runtime instance (set by NavigatorRuntime.start)
+_navigator_runtime: Optional[NavigatorRuntime] = None
+
+
+def get_navigator_runtime() -> Optional[NavigatorRuntime]:
+    """Get the active navigator runtime, or None outside the API process."""
+    return _navigator_runtime
+
+
+def set_navigator_runtime(runtime: Optional[NavigatorRuntime]) -> None:
+    """Install (or clear) the active navigator runtime."""
+    global _navigator_runtime
+    _navigator_runtime = runtime
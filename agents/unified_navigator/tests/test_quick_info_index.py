@@ -0,0 +1,118 @@
+"""
+Tests for the persistent per-user quick info index.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from ..tools.quick_info_index import BM25Scorer, QuickInfoIndexManager
+
+
+def _chunk(chunk_id: str, document_id: str, text: str) -> dict:
+    return {"id": chunk_id, "document_id": document_id, "content": text, "title": "policy.pdf"}
+
+
+class TestBM25Scorer:
+    """Test cases for the inverted-index BM25 scorer."""
+
+    def test_scores_only_matching_documents(self):
+        scorer = BM25Scorer()
+        scorer.add_documents([
+            _chunk("c1", "d1", "annual deductible is 500 dollars"),
+            _chunk("c2", "d1", "copay for specialist visits"),
+            _chunk("c3", "d2", "deductible resets every january"),
+        ])
+
+        results = scorer.score_documents("deductible", top_k=5)
+
+        assert {doc["id"] for _, _, doc in results} == {"c1", "c3"}
+        assert all(score > 0 for score, _, _ in results)
+
+    def test_remove_documents(self):
+        scorer = BM25Scorer()
+        scorer.add_documents([
+            _chunk("c1", "d1", "deductible amount"),
+            _chunk("c2", "d2", "deductible waiver"),
+        ])
+
+        removed = scorer.remove_documents(lambda doc: doc["document_id"] == "d1")
+
+        assert removed == 1
+        assert [doc["id"] for _, _, doc in scorer.score_documents("deductible")] == ["c2"]
+
+
+class TestQuickInfoIndexManager:
+    """Test cases for index caching and incremental updates."""
+
+    @pytest.mark.asyncio
+    async def test_put_documents_serves_cached_index(self):
+        manager = QuickInfoIndexManager()
+        manager.put_documents("user_1", [_chunk("c1", "d1", "out of pocket maximum")])
+
+        with patch.object(manager, "_load_chunks", new=AsyncMock()) as load:
+            entry = await manager.get_index("user_1")
+
+        load.assert_not_awaited()
+        assert entry.chunk_count == 1
+        assert manager.get_stats()["hits"] == 1
+
+    def test_lru_eviction(self):
+        manager = QuickInfoIndexManager(max_users=2)
+        for user_id in ("user_1", "user_2", "user_3"):
+            manager.put_documents(user_id, [_chunk("c1", "d1", "coverage")])
+
+        assert manager.get_stats()["cached_users"] == 2
+        assert manager.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_on_document_embedded_updates_index(self):
+        manager = QuickInfoIndexManager()
+        first = manager.put_documents("user_1", [_chunk("c1", "d1", "deductible amount")])
+        generation = first.generation
+
+        new_chunks = [_chunk("c2", "d2", "prior authorization required")]
+        with patch.object(manager, "_load_chunks", new=AsyncMock(return_value=new_chunks)):
+            await manager.on_document_embedded("user_1", "d2")
+
+        entry = await manager.get_index("user_1")
+        assert entry.generation > generation
+        assert entry.chunk_count == 2
+        assert entry.scorer.score_documents("authorization")[0][2]["id"] == "c2"
+
+    @pytest.mark.asyncio
+    async def test_lookup_relistens_after_connection_drop(self):
+        class FakeConnection:
+            def __init__(self):
+                self.closed = False
+                self.channels = []
+
+            def is_closed(self):
+                return self.closed
+
+            async def add_listener(self, channel, callback):
+                self.channels.append(channel)
+
+            async def remove_listener(self, channel, callback):
+                self.channels.remove(channel)
+
+        connections = [FakeConnection(), FakeConnection()]
+        manager = QuickInfoIndexManager()
+        with patch(
+            "agents.tooling.rag.database_manager.get_db_connection",
+            new=AsyncMock(side_effect=connections)
+        ), patch("agents.tooling.rag.database_manager.release_db_connection", new=AsyncMock()) as release:
+            assert await manager.start_listener() is True
+            manager.put_documents("user_1", [_chunk("c1", "d1", "deductible amount")])
+
+            connections[0].closed = True
+            with patch.object(manager, "_load_chunks", new=AsyncMock(return_value=[])):
+                await manager.get_index("user_1")
+
+        release.assert_awaited_once_with(connections[0])
+        assert manager._listener_conn is connections[1]
+        assert connections[1].channels == ["upload_pipeline_document_embedded"]
+        stats = manager.get_stats()
+        assert stats["relistens"] == 1
+        assert stats["listening"] is True
+        # The cached index may have missed updates, so it was rebuilt
+        assert stats["builds"] == 1
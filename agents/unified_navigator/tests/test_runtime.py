@@ -0,0 +1,81 @@
+"""
+Tests for the process-wide NavigatorRuntime.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from ..runtime import (
+    NavigatorRuntime,
+    NavigatorRuntimeMetrics,
+    get_navigator_runtime,
+)
+from ..guardrails.input_sanitizer import input_guardrail_node
+
+
+class TestNavigatorRuntime:
+    """Test cases for NavigatorRuntime lifecycle and sharing."""
+
+    @pytest.fixture
+    async def runtime(self, monkeypatch):
+        """Start a mock-mode runtime and shut it down afterwards."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        runtime = await NavigatorRuntime(use_mock=True).start()
+        yield runtime
+        await runtime.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_start_registers_global_runtime(self, runtime):
+        """Starting the runtime installs it as the process-wide instance."""
+        assert runtime.is_started
+        assert get_navigator_runtime() is runtime
+        assert runtime.agent is not None
+        assert runtime.input_sanitizer is not None
+        assert runtime.output_sanitizer is not None
+        assert await runtime.health_check()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_clears_global_runtime(self, monkeypatch):
+        """Shutdown clears the global runtime and is idempotent."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        runtime = await NavigatorRuntime(use_mock=True).start()
+        await runtime.shutdown()
+        await runtime.shutdown()
+        assert get_navigator_runtime() is None
+        assert not await runtime.health_check()
+
+    @pytest.mark.asyncio
+    async def test_guardrail_node_uses_shared_sanitizer(self, runtime):
+        """The input guardrail node reuses the runtime's sanitizer."""
+        state = {"user_query": "What is my deductible?", "user_id": "user_1"}
+        with patch.object(
+            runtime.input_sanitizer, "sanitize_input", new=AsyncMock(return_value=state)
+        ) as sanitize:
+            await input_guardrail_node(state)
+        sanitize.assert_awaited_once_with(state)
+
+    @pytest.mark.asyncio
+    async def test_execute_counts_requests(self, runtime):
+        """Executing through the runtime updates request metrics."""
+        output = AsyncMock()
+        output.success = True
+        with patch.object(runtime.agent, "execute", new=AsyncMock(return_value=output)):
+            await runtime.execute(object())
+            await runtime.execute(object())
+
+        metrics = runtime.get_metrics()
+        assert metrics["requests_served"] == 2
+        assert metrics["requests_failed"] == 0
+        assert metrics["active_requests"] == 0
+        assert metrics["time_saved_ms_total"] == pytest.approx(2 * metrics["cold_start_ms"])
+
+
+class TestNavigatorRuntimeMetrics:
+    """Test cases for connection reuse accounting."""
+
+    def test_connection_reuse_ratio(self):
+        metrics = NavigatorRuntimeMetrics(upstream_requests=10, connections_opened=2)
+        assert metrics.connection_reuse_ratio == pytest.approx(0.8)
+
+    def test_connection_reuse_ratio_without_requests(self):
+        assert NavigatorRuntimeMetrics().connection_reuse_ratio == 0.0
@@ -6,10 +6,16 @@ This package contains the tool implementations for web search and RAG search.
 
 from .web_search import WebSearchTool, web_search_node
 from .rag_search import RAGSearchTool, rag_search_node, combined_search_node
+from .quick_info_tool import QuickInfoTool, quick_info_node
+from .quick_info_index import QuickInfoIndexManager, get_quick_info_index_manager
 
 __all__ = [
     "WebSearchTool",
     "RAGSearchTool", 
+    "QuickInfoTool",
+    "QuickInfoIndexManager",
+    "get_quick_info_index_manager",
+    "quick_info_node",
     "web_search_node",
     "rag_search_node",
     "combined_search_node"
@@ -10,7 +10,8 @@ import logging
 import time
 import os
 from typing import Any, Dict, List, Optional
-import httpx
+
+from agents.shared.http_clients import TAVILY_HOST, get_http_client_registry
 
 from ..models import AccessStrategyResult, ToolExecutionResult, ToolType, UnifiedNavigatorState
 from ..logging import get_workflow_logger, LLMInteraction
@@ -76,29 +77,29 @@ class TavilyClient:
             if include_domains:
                 payload["include_domains"] = include_domains
             
-            # Make API request
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            # Make API request on the pooled Tavily client
+            async with get_http_client_registry().checkout(TAVILY_HOST) as client:
                 response = await client.post(
                     f"{self.base_url}/search",
                     json=payload,
                     headers={"Content-Type": "application/json"}
                 )
-                
-                if response.status_code != 200:
-                    raise Exception(f"Tavily API error: {response.status_code} - {response.text}")
-                
-                result = response.json()
-                processing_time = (time.time() - start_time) * 1000
-                
-                self.logger.info(f"Tavily research completed in {processing_time:.1f}ms")
-                
-                return {
-                    "query": query,
-                    "answer": result.get("answer", ""),
-                    "results": result.get("results", []),
-                    "processing_time_ms": processing_time,
-                    "sources_count": len(result.get("results", []))
-                }
+            
+            if response.status_code != 200:
+                raise Exception(f"Tavily API error: {response.status_code} - {response.text}")
+            
+            result = response.json()
+            processing_time = (time.time() - start_time) * 1000
+            
+            self.logger.info(f"Tavily research completed in {processing_time:.1f}ms")
+            
+            return {
+                "query": query,
+                "answer": result.get("answer", ""),
+                "results": result.get("results", []),
+                "processing_time_ms": processing_time,
+                "sources_count": len(result.get("results", []))
+            }
                 
         except Exception as e:
             processing_time = (time.time() - start_time) * 1000
@@ -122,12 +123,19 @@ class AccessStrategyTool:
     strategies for maximizing insurance coverage and benefits.
     """
     
-    def __init__(self):
-        """Initialize the access strategy tool."""
+    def __init__(self, max_cache_size: int = 256):
+        """
+        Initialize the access strategy tool.
+        
+        Args:
+            max_cache_size: Maximum cached strategies (the tool may be shared
+                across requests, so the cache must stay bounded)
+        """
         self.logger = logger
         self.workflow_logger = get_workflow_logger()
         self.tavily_client = None
         self.strategy_cache: Dict[str, AccessStrategyResult] = {}
+        self.max_cache_size = max_cache_size
         
         # Try to initialize Tavily client
         try:
@@ -189,7 +197,9 @@ class AccessStrategyTool:
                 source="access_strategy"
             )
             
-            # Cache result
+            # Cache result, evicting the oldest entry when full
+            if len(self.strategy_cache) >= self.max_cache_size:
+                self.strategy_cache.pop(next(iter(self.strategy_cache)))
             self.strategy_cache[cache_key] = result
             
             self.logger.info(f"Access strategy generated in {processing_time:.1f}ms")
@@ -396,8 +406,14 @@ async def access_strategy_node(state: UnifiedNavigatorState) -> UnifiedNavigator
     logger.info("Starting access strategy generation")
     
     try:
-        # Initialize access strategy tool
-        strategy_tool = AccessStrategyTool()
+        # Reuse the process-wide tool when the navigator runtime is running
+        from ..runtime import get_navigator_runtime
+        runtime = get_navigator_runtime()
+        strategy_tool = (
+            runtime.access_strategy_tool
+            if runtime is not None and runtime.access_strategy_tool is not None
+            else AccessStrategyTool()
+        )
         
         # Generate strategy
         result = await strategy_tool.strategize(
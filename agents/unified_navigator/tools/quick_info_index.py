@@ -0,0 +1,489 @@
+"""
+Persistent BM25 index service for the Quick Info tool.
+
+Keeps one inverted index per user (postings lists with precomputed term
+frequencies and document lengths) built from upload_pipeline.document_chunks.
+Indexes live in a bounded LRU across requests and are refreshed when the
+upload worker finishes a document's embeddings stage, so QUICK_INFO lookups
+only touch the postings of the query terms.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import math
+import os
+import re
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Must match DOCUMENT_EMBEDDED_CHANNEL in backend/workers/enhanced_base_worker.py
+DOCUMENT_EMBEDDED_CHANNEL = "upload_pipeline_document_embedded"
+
+# Minimum seconds between attempts to re-listen after the connection drops
+RELISTEN_INTERVAL_SECONDS = 5.0
+
+_TOKEN_CLEANUP = re.compile(r'[^\w\s]')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Simple tokenization for BM25 scoring.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of lowercase tokens longer than two characters
+    """
+    # Remove punctuation and convert to lowercase
+    text = _TOKEN_CLEANUP.sub(' ', text.lower())
+    return [token for token in text.split() if len(token) > 2]
+
+
+class BM25Scorer:
+    """
+    BM25 scoring over an inverted index.
+
+    Documents are tokenized once when they are added; each term maps to a
+    postings list of (doc_index, term_frequency). Queries only walk the
+    postings of their own terms.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize BM25 scorer.
+
+        Args:
+            k1: Term frequency saturation parameter
+            b: Length normalization parameter
+        """
+        self.k1 = k1
+        self.b = b
+        self.corpus: List[Dict[str, Any]] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.doc_freqs: Dict[str, int] = {}
+        self.idf: Dict[str, float] = {}
+        self.doc_len: List[int] = []
+        self.avgdl: float = 0.0
+
+    def add_documents(self, documents: List[Dict[str, Any]]):
+        """
+        Replace the index contents with the given documents.
+
+        Args:
+            documents: List of document objects with 'content' field
+        """
+        self.corpus = []
+        self.postings = {}
+        self.doc_len = []
+        self.extend_documents(documents)
+
+    def extend_documents(self, documents: List[Dict[str, Any]]):
+        """
+        Incrementally add documents to the index.
+
+        Args:
+            documents: List of document objects with 'content' field
+        """
+        for doc in documents:
+            doc_index = len(self.corpus)
+            words = tokenize(doc.get('content', ''))
+            self.corpus.append(doc)
+            self.doc_len.append(len(words))
+            for word, tf in Counter(words).items():
+                self.postings.setdefault(word, []).append((doc_index, tf))
+        self._refresh_statistics()
+
+    def remove_documents(self, predicate: Callable[[Dict[str, Any]], bool]) -> int:
+        """
+        Remove documents matching predicate without re-tokenizing the rest.
+
+        Args:
+            predicate: Returns True for documents to remove
+
+        Returns:
+            Number of documents removed
+        """
+        remap: Dict[int, int] = {}
+        kept_corpus: List[Dict[str, Any]] = []
+        kept_len: List[int] = []
+        for old_index, doc in enumerate(self.corpus):
+            if predicate(doc):
+                continue
+            remap[old_index] = len(kept_corpus)
+            kept_corpus.append(doc)
+            kept_len.append(self.doc_len[old_index])
+
+        removed = len(self.corpus) - len(kept_corpus)
+        if removed == 0:
+            return 0
+
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for word, plist in self.postings.items():
+            kept = [(remap[i], tf) for i, tf in plist if i in remap]
+            if kept:
+                postings[word] = kept
+
+        self.corpus = kept_corpus
+        self.doc_len = kept_len
+        self.postings = postings
+        self._refresh_statistics()
+        return removed
+
+    def score_documents(self, query: str, top_k: int = 5) -> List[tuple]:
+        """
+        Score documents against a query using BM25.
+
+        Args:
+            query: Query string
+            top_k: Number of top results to return
+
+        Returns:
+            List of (score, doc_index, document) tuples for matching documents
+        """
+        if not self.corpus:
+            return []
+
+        scores: Dict[int, float] = {}
+        for word, query_tf in Counter(tokenize(query)).items():
+            plist = self.postings.get(word)
+            if not plist:
+                continue
+
+            idf_score = self.idf[word]
+            for doc_index, tf in plist:
+                # BM25 formula
+                norm = self.k1 * (1 - self.b + self.b * (self.doc_len[doc_index] / self.avgdl))
+                tf_component = (tf * (self.k1 + 1)) / (tf + norm)
+                scores[doc_index] = scores.get(doc_index, 0.0) + query_tf * idf_score * tf_component
+
+        top = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [(score, doc_index, self.corpus[doc_index]) for doc_index, score in top]
+
+    def _tokenize(self, text: str) -> List[str]:
+        """Tokenize text with the index tokenizer."""
+        return tokenize(text)
+
+    def _refresh_statistics(self):
+        """Recompute average length, document frequencies and IDF."""
+        N = len(self.corpus)
+        self.avgdl = sum(self.doc_len) / N if N else 0.0
+        self.doc_freqs = {word: len(plist) for word, plist in self.postings.items()}
+        # Non-negative IDF variant so terms present in most of a small
+        # per-user corpus still contribute to the score
+        self.idf = {
+            word: math.log(1 + (N - freq + 0.5) / (freq + 0.5))
+            for word, freq in self.doc_freqs.items()
+        }
+
+
+@dataclass
+class UserIndexEntry:
+    """Cached index for one user."""
+    user_id: str
+    scorer: BM25Scorer
+    built_at: float = field(default_factory=time.time)
+    generation: int = 0
+    document_ids: Set[str] = field(default_factory=set)
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.scorer.corpus)
+
+
+class QuickInfoIndexManager:
+    """
+    Long-lived manager of per-user BM25 indexes.
+
+    Indexes are built lazily from upload_pipeline.document_chunks on first
+    lookup, kept in a bounded LRU, rebuilt after max_age_seconds as a safety
+    net, and updated incrementally when a document finishes embedding. If
+    the LISTEN connection drops, the next lookup re-listens and drops the
+    cached indexes, since notifications sent meanwhile were lost.
+    """
+
+    def __init__(
+        self,
+        max_users: int = 256,
+        max_age_seconds: float = 900.0,
+        schema: Optional[str] = None
+    ):
+        """
+        Initialize the index manager.
+
+        Args:
+            max_users: Maximum number of user indexes held in memory
+            max_age_seconds: Rebuild indexes older than this on lookup
+            schema: Database schema holding documents and document_chunks
+        """
+        self.max_users = max_users
+        self.max_age_seconds = max_age_seconds
+        self.schema = schema or os.getenv("DATABASE_SCHEMA", "upload_pipeline")
+        self._entries: "OrderedDict[str, UserIndexEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Generations are unique across rebuilds so result caches keyed on
+        # them never serve results from an evicted or replaced index
+        self._generations = itertools.count(1)
+        self._listener_conn = None
+        self._listen_requested = False
+        self._relisten_at = 0.0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "builds": 0,
+            "incremental_updates": 0,
+            "evictions": 0,
+            "relistens": 0,
+            "build_time_ms_total": 0.0,
+        }
+
+    async def get_index(self, user_id: str) -> Optional[UserIndexEntry]:
+        """
+        Get the index for a user, building it from the database if needed.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            UserIndexEntry, or None if the index could not be built
+        """
+        await self._check_listener()
+
+        entry = self._entries.get(user_id)
+        if entry is not None and time.time() - entry.built_at < self.max_age_seconds:
+            self._entries.move_to_end(user_id)
+            self._stats["hits"] += 1
+            return entry
+
+        self._stats["misses"] += 1
+
+        # Coalesce concurrent builds for the same user
+        task = self._inflight.get(user_id)
+        if task is None:
+            task = asyncio.ensure_future(self._build_from_database(user_id))
+            self._inflight[user_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(user_id, None))
+
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            logger.error(f"Failed to build quick info index for user {user_id}: {e}")
+            # Serve the stale index (if any) rather than nothing
+            return entry
+
+    def put_documents(self, user_id: str, documents: List[Dict[str, Any]]) -> UserIndexEntry:
+        """
+        Install an index built from caller-supplied documents.
+
+        Args:
+            user_id: User identifier
+            documents: Document dicts with at least a 'content' field
+
+        Returns:
+            The new UserIndexEntry
+        """
+        scorer = BM25Scorer()
+        scorer.add_documents(documents)
+        entry = UserIndexEntry(
+            user_id=user_id,
+            scorer=scorer,
+            generation=next(self._generations),
+            document_ids={str(doc["document_id"]) for doc in documents if doc.get("document_id")}
+        )
+        self._store(entry)
+        return entry
+
+    async def on_document_embedded(self, user_id: str, document_id: str) -> None:
+        """
+        Fold a newly embedded document into a cached user index.
+
+        Users without a cached index are left alone; their index is built on
+        the next lookup.
+
+        Args:
+            user_id: Owner of the document
+            document_id: Document whose embeddings stage just completed
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return
+
+        document_id = str(document_id)
+        documents = await self._load_chunks(user_id, document_id=document_id)
+        entry.scorer.remove_documents(lambda doc: doc.get("document_id") == document_id)
+        entry.scorer.extend_documents(documents)
+        entry.document_ids.add(document_id)
+        entry.generation = next(self._generations)
+        self._stats["incremental_updates"] += 1
+        logger.info(
+            f"Quick info index for user {user_id} updated with {len(documents)} chunks "
+            f"from document {document_id} (generation {entry.generation})"
+        )
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached index."""
+        self._entries.pop(user_id, None)
+
+    async def start_listener(self) -> bool:
+        """
+        LISTEN for document-embedded notifications from the upload worker.
+
+        Returns:
+            True if the listener is active
+        """
+        self._listen_requested = True
+        if self._listener_conn is not None:
+            return True
+        try:
+            from agents.tooling.rag.database_manager import get_db_connection
+            conn = await get_db_connection()
+            await conn.add_listener(DOCUMENT_EMBEDDED_CHANNEL, self._on_notification)
+            self._listener_conn = conn
+            logger.info(f"Quick info index listening on channel {DOCUMENT_EMBEDDED_CHANNEL}")
+            return True
+        except Exception as e:
+            logger.warning(f"Quick info index listener not started, relying on max age refresh: {e}")
+            return False
+
+    async def stop_listener(self) -> None:
+        """Stop listening and return the connection to the pool."""
+        self._listen_requested = False
+        await self._close_listener()
+
+    async def _close_listener(self) -> None:
+        conn, self._listener_conn = self._listener_conn, None
+        if conn is None:
+            return
+        try:
+            from agents.tooling.rag.database_manager import release_db_connection
+            if not conn.is_closed():
+                await conn.remove_listener(DOCUMENT_EMBEDDED_CHANNEL, self._on_notification)
+            await release_db_connection(conn)
+        except Exception as e:
+            logger.warning(f"Error stopping quick info index listener: {e}")
+
+    async def _check_listener(self) -> None:
+        """Re-listen if the listener connection dropped (e.g. database restart)."""
+        if not self._listen_requested:
+            return
+        conn = self._listener_conn
+        if conn is not None and not conn.is_closed():
+            return
+        now = time.monotonic()
+        if now < self._relisten_at:
+            return
+        self._relisten_at = now + RELISTEN_INTERVAL_SECONDS
+
+        if conn is not None:
+            await self._close_listener()
+            # Updates notified while the connection was down were missed
+            self._entries.clear()
+            logger.warning("Quick info index listener connection closed; re-listening")
+        if await self.start_listener():
+            self._stats["relistens"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "cached_users": len(self._entries),
+            "max_users": self.max_users,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "listening": self._listener_conn is not None,
+        }
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        """asyncpg listener callback; payload is JSON {user_id, document_id}."""
+        try:
+            data = json.loads(payload)
+            user_id, document_id = data["user_id"], data["document_id"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed {channel} payload: {payload!r}")
+            return
+
+        task = asyncio.ensure_future(self.on_document_embedded(str(user_id), str(document_id)))
+        task.add_done_callback(self._log_update_failure)
+
+    @staticmethod
+    def _log_update_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Quick info incremental index update failed: {task.exception()}")
+
+    async def _build_from_database(self, user_id: str) -> UserIndexEntry:
+        """Build a user's index from all of their stored chunks."""
+        start_time = time.time()
+        documents = await self._load_chunks(user_id)
+        entry = self.put_documents(user_id, documents)
+
+        build_time = (time.time() - start_time) * 1000
+        self._stats["builds"] += 1
+        self._stats["build_time_ms_total"] += build_time
+        logger.info(f"Built quick info index for user {user_id}: {entry.chunk_count} chunks in {build_time:.1f}ms")
+        return entry
+
+    async def _load_chunks(self, user_id: str, document_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Load chunk rows for a user (optionally one document) as index documents."""
+        from agents.tooling.rag.database_manager import get_db_connection, release_db_connection
+
+        sql = f"""
+            SELECT dc.chunk_id, d.document_id, dc.chunk_ord, dc.text, d.filename
+            FROM {self.schema}.document_chunks dc
+            JOIN {self.schema}.documents d
+              ON dc.document_id = COALESCE(d.chunk_source_document_id, d.document_id)
+            WHERE d.user_id = $1
+        """
+        args: List[Any] = [user_id]
+        if document_id is not None:
+            sql += " AND d.document_id = $2::uuid"
+            args.append(document_id)
+        sql += " ORDER BY d.document_id, dc.chunk_ord"
+
+        conn = await get_db_connection()
+        try:
+            rows = await conn.fetch(sql, *args)
+        finally:
+            await release_db_connection(conn)
+
+        return [
+            {
+                'id': str(row["chunk_id"]),
+                'document_id': str(row["document_id"]),
+                'title': row["filename"] or 'Untitled',
+                'content': row["text"] or '',
+                'section': f"Chunk {row['chunk_ord'] + 1}",
+                'document_type': 'policy',
+                'user_id': user_id
+            }
+            for row in rows
+        ]
+
+    def _store(self, entry: UserIndexEntry) -> None:
+        """Insert an entry and evict least recently used users beyond max_users."""
+        self._entries[entry.user_id] = entry
+        self._entries.move_to_end(entry.user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+
+# Global index manager instance
+_index_manager: Optional[QuickInfoIndexManager] = None
+
+
+def get_quick_info_index_manager() -> QuickInfoIndexManager:
+    """Get or create the process-wide quick info index manager."""
+    global _index_manager
+    if _index_manager is None:
+        _index_manager = QuickInfoIndexManager(
+            max_users=int(os.getenv("QUICK_INFO_INDEX_MAX_USERS", "256")),
+            max_age_seconds=float(os.getenv("QUICK_INFO_INDEX_MAX_AGE_SECONDS", "900"))
+        )
+    return _index_manager
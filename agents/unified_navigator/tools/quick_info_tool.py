@@ -10,128 +10,19 @@ import asyncio
 import logging
 import time
 from typing import Any, Dict, List, Optional, Set
-import re
-from collections import Counter
-import math
 
 from ..models import QuickInfoResult, ToolExecutionResult, ToolType, UnifiedNavigatorState
 from ..logging import get_workflow_logger, WorkflowEvent, WorkflowStep
+from .quick_info_index import (
+    BM25Scorer,
+    QuickInfoIndexManager,
+    get_quick_info_index_manager,
+    tokenize,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class BM25Scorer:
-    """
-    BM25 scoring implementation for document ranking.
-    
-    Optimized for fast keyword matching in insurance documents.
-    """
-    
-    def __init__(self, k1: float = 1.2, b: float = 0.75):
-        """
-        Initialize BM25 scorer.
-        
-        Args:
-            k1: Term frequency saturation parameter
-            b: Length normalization parameter
-        """
-        self.k1 = k1
-        self.b = b
-        self.corpus: List[Dict[str, Any]] = []
-        self.doc_freqs: Dict[str, int] = {}
-        self.idf: Dict[str, float] = {}
-        self.doc_len: List[int] = []
-        self.avgdl: float = 0.0
-    
-    def add_documents(self, documents: List[Dict[str, Any]]):
-        """
-        Add documents to the BM25 index.
-        
-        Args:
-            documents: List of document objects with 'content' field
-        """
-        self.corpus = documents
-        self.doc_len = []
-        word_counts = Counter()
-        
-        # Process each document
-        for doc in documents:
-            content = doc.get('content', '')
-            words = self._tokenize(content)
-            self.doc_len.append(len(words))
-            
-            # Count word frequencies
-            unique_words = set(words)
-            for word in unique_words:
-                word_counts[word] += 1
-        
-        # Calculate average document length
-        self.avgdl = sum(self.doc_len) / len(self.doc_len) if self.doc_len else 0.0
-        
-        # Calculate IDF for each word
-        N = len(documents)
-        self.doc_freqs = dict(word_counts)
-        self.idf = {}
-        
-        for word, freq in word_counts.items():
-            self.idf[word] = math.log((N - freq + 0.5) / (freq + 0.5))
-    
-    def score_documents(self, query: str, top_k: int = 5) -> List[tuple]:
-        """
-        Score documents against a query using BM25.
-        
-        Args:
-            query: Query string
-            top_k: Number of top results to return
-            
-        Returns:
-            List of (score, doc_index, document) tuples
-        """
-        query_words = self._tokenize(query)
-        scores = []
-        
-        for i, doc in enumerate(self.corpus):
-            content = doc.get('content', '')
-            doc_words = self._tokenize(content)
-            doc_word_count = Counter(doc_words)
-            score = 0.0
-            
-            for word in query_words:
-                if word not in self.idf:
-                    continue
-                
-                tf = doc_word_count.get(word, 0)
-                if tf == 0:
-                    continue
-                
-                # BM25 formula
-                idf_score = self.idf[word]
-                tf_component = (tf * (self.k1 + 1)) / (tf + self.k1 * (1 - self.b + self.b * (self.doc_len[i] / self.avgdl)))
-                score += idf_score * tf_component
-            
-            scores.append((score, i, doc))
-        
-        # Sort by score descending and return top_k
-        scores.sort(key=lambda x: x[0], reverse=True)
-        return scores[:top_k]
-    
-    def _tokenize(self, text: str) -> List[str]:
-        """
-        Simple tokenization for BM25 scoring.
-        
-        Args:
-            text: Input text
-            
-        Returns:
-            List of lowercase tokens
-        """
-        # Remove punctuation and convert to lowercase
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        # Split and filter empty strings
-        tokens = [token for token in text.split() if token and len(token) > 2]
-        return tokens
-
-
 class QuickInfoTool:
     """
     Quick information retrieval tool using BM25 + Claude SDK.
@@ -140,20 +31,19 @@ class QuickInfoTool:
     and using efficient keyword search combined with targeted reading.
     """
     
-    def __init__(self, cache_size: int = 1000):
+    def __init__(self, cache_size: int = 1000, index_manager: Optional[QuickInfoIndexManager] = None):
         """
         Initialize the quick info tool.
         
         Args:
             cache_size: Maximum number of cached results
+            index_manager: Per-user index manager (defaults to the process-wide one)
         """
         self.logger = logger
         self.workflow_logger = get_workflow_logger()
-        self.bm25_scorer = BM25Scorer()
-        self.document_cache: Dict[str, Any] = {}
+        self.index_manager = index_manager or get_quick_info_index_manager()
         self.result_cache: Dict[str, QuickInfoResult] = {}
         self.cache_size = cache_size
-        self.is_indexed = False
         
         # Insurance-specific keywords for relevance boosting
         self.insurance_keywords = {
@@ -179,6 +69,7 @@ class QuickInfoTool:
             for doc in documents:
                 processed_doc = {
                     'id': doc.get('id'),
+                    'document_id': doc.get('document_id'),
                     'title': doc.get('title', 'Untitled'),
                     'content': doc.get('content', ''),
                     'section': doc.get('section', 'General'),
@@ -187,17 +78,14 @@ class QuickInfoTool:
                 }
                 processed_docs.append(processed_doc)
             
-            # Build BM25 index
-            self.bm25_scorer.add_documents(processed_docs)
-            self.is_indexed = True
+            # Build BM25 index in the shared manager
+            entry = self.index_manager.put_documents(user_id, processed_docs)
             
             processing_time = (time.time() - start_time) * 1000
             
-            self.logger.info(f"Indexed {len(processed_docs)} documents for user {user_id} in {processing_time:.1f}ms")
-            
-            # Cache documents by user
-            cache_key = f"docs_{user_id}"
-            self.document_cache[cache_key] = processed_docs
+            self.logger.info(
+                f"Indexed {entry.chunk_count} documents for user {user_id} in {processing_time:.1f}ms"
+            )
             
         except Exception as e:
             self.logger.error(f"Failed to index documents for user {user_id}: {e}")
@@ -218,35 +106,31 @@ class QuickInfoTool:
         start_time = time.time()
         
         try:
-            # Check cache first
-            cache_key = f"query_{user_id}_{hash(query)}"
+            # Load (or lazily build) the user's persistent index
+            index = await self.index_manager.get_index(user_id)
+            if index is None or index.chunk_count == 0:
+                # Return empty result if no documents indexed
+                return QuickInfoResult(
+                    query=query,
+                    relevant_sections=[],
+                    confidence_score=0.0,
+                    processing_time_ms=(time.time() - start_time) * 1000,
+                    source="quick_info"
+                )
+            
+            # Check cache first (keyed on index generation so updates invalidate it)
+            cache_key = f"query_{user_id}_{index.generation}_{hash(query)}"
             if cache_key in self.result_cache:
                 self.workflow_logger.log_cache_event(cache_key, hit=True, context="quick_info_query")
                 return self.result_cache[cache_key]
             
             self.workflow_logger.log_cache_event(cache_key, hit=False, context="quick_info_query")
             
-            # Ensure documents are indexed
-            if not self.is_indexed:
-                docs_cache_key = f"docs_{user_id}"
-                if docs_cache_key not in self.document_cache:
-                    # Return empty result if no documents indexed
-                    return QuickInfoResult(
-                        query=query,
-                        relevant_sections=[],
-                        confidence_score=0.0,
-                        processing_time_ms=(time.time() - start_time) * 1000,
-                        source="quick_info"
-                    )
-                
-                # Re-index from cache
-                await self.index_user_documents(user_id, self.document_cache[docs_cache_key])
-            
             # Boost query with insurance context
             enhanced_query = self._enhance_query(query)
             
             # Score documents using BM25
-            scored_docs = self.bm25_scorer.score_documents(enhanced_query, top_k=max_results * 2)
+            scored_docs = index.scorer.score_documents(enhanced_query, top_k=max_results * 2)
             
             # Process top results
             relevant_sections = []
@@ -336,8 +220,8 @@ class QuickInfoTool:
         Returns:
             List of matched keywords
         """
-        query_words = set(self.bm25_scorer._tokenize(query))
-        content_words = set(self.bm25_scorer._tokenize(content))
+        query_words = set(tokenize(query))
+        content_words = set(tokenize(content))
         matched = list(query_words.intersection(content_words))
         return matched[:10]  # Limit to top 10
     
@@ -359,7 +243,7 @@ class QuickInfoTool:
         base_confidence = min(len(sections) / 3.0, 1.0)
         
         # Boost for insurance keyword matches
-        query_words = set(self.bm25_scorer._tokenize(query))
+        query_words = set(tokenize(query))
         insurance_matches = len(query_words.intersection(self.insurance_keywords))
         insurance_boost = min(insurance_matches / 5.0, 0.3)
         
@@ -372,7 +256,6 @@ class QuickInfoTool:
     
     async def cleanup(self):
         """Clean up resources."""
-        self.document_cache.clear()
         self.result_cache.clear()
 
 
@@ -390,8 +273,15 @@ async def quick_info_node(state: UnifiedNavigatorState) -> UnifiedNavigatorState
     logger.info("Starting quick info search")
     
     try:
-        # Initialize quick info tool
-        quick_tool = QuickInfoTool()
+        # Reuse the process-wide tool when the navigator runtime is running;
+        # either way indexes persist in the shared index manager
+        from ..runtime import get_navigator_runtime
+        runtime = get_navigator_runtime()
+        quick_tool = (
+            runtime.quick_info_tool
+            if runtime is not None and runtime.quick_info_tool is not None
+            else QuickInfoTool()
+        )
         
         # Perform search
         result = await quick_tool.search(
@@ -12,9 +12,10 @@ import logging
 import os
 import time
 from typing import Any, Dict, List, Optional
-import httpx
 from datetime import datetime, timedelta
 
+from agents.shared.http_clients import BRAVE_SEARCH_HOST, get_http_client_registry
+
 from ..models import WebSearchResult, UnifiedNavigatorState
 
 
@@ -69,12 +70,6 @@ class WebSearchTool:
         if not self.api_key:
             self.logger.warning("BRAVE_API_KEY not found - web search will not work")
         
-        # Setup HTTP client with connection pooling
-        self.http_client = httpx.AsyncClient(
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
-            timeout=httpx.Timeout(5.0, connect=2.0)
-        )
-        
         # Insurance-specific search optimization
         self.insurance_modifiers = [
             "insurance", "healthcare", "medical", "coverage", "policy"
@@ -132,11 +127,12 @@ class WebSearchTool:
                 "X-Subscription-Token": self.api_key
             }
             
-            response = await self.http_client.get(
-                self.base_url,
-                params=params,
-                headers=headers
-            )
+            async with get_http_client_registry().checkout(BRAVE_SEARCH_HOST) as client:
+                response = await client.get(
+                    self.base_url,
+                    params=params,
+                    headers=headers
+                )
             
             if response.status_code != 200:
                 self.logger.error(f"Brave API error: {response.status_code} - {response.text}")
@@ -220,9 +216,8 @@ class WebSearchTool:
         return query
     
     async def cleanup(self):
-        """Clean up HTTP client resources."""
-        if self.http_client:
-            await self.http_client.aclose()
+        """Clean up resources (pooled clients belong to the HTTP client registry)."""
+        self.cache.cache.clear()
 
 
 # LangGraph node function
@@ -236,7 +231,11 @@ async def web_search_node(state: UnifiedNavigatorState) -> UnifiedNavigatorState
     Returns:
         Updated state with web search results
     """
-    web_search = WebSearchTool()
+    from ..runtime import get_navigator_runtime
+    
+    runtime = get_navigator_runtime()
+    shared_tool = runtime.web_search_tool if runtime is not None else None
+    web_search = shared_tool or WebSearchTool()
     
     try:
         if not state["tool_results"]:
@@ -282,4 +281,6 @@ async def web_search_node(state: UnifiedNavigatorState) -> UnifiedNavigatorState
         return state
         
     finally:
-        await web_search.cleanup()
\ No newline at end of file
+        # Shared tools keep their connection pool for the next request
+        if shared_tool is None:
+            await web_search.cleanup()
\ No newline at end of file
@@ -45,6 +45,19 @@ class UploadPipelineConfig(BaseSettings):
     max_uploads_per_day_per_user: int = 30
     max_polls_per_minute_per_job: int = 10
     
+    # Rate limit state: "memory" (per instance) or "postgres" (shared by all instances)
+    rate_limit_store: str = "memory"
+    
+    # Webhook payload debugging (off by default; sampled and size-capped when on)
+    webhook_debug_payloads: bool = False
+    webhook_debug_sample_rate: float = 0.01
+    webhook_debug_max_chars: int = 2000
+    
+    # Cross-user duplicates: "copy" chunks or "reference" the source's chunk set.
+    # Reference mode needs migration 20251023000000_shared_chunk_set_ownership:
+    # deleting an owner document hands its chunks to the oldest referrer.
+    document_duplication_chunk_mode: str = "copy"
+    
     # Chunking configuration
     chunker_name: str = "markdown-simple"
     chunker_version: str = "1"
@@ -92,6 +105,24 @@ class UploadPipelineConfig(BaseSettings):
             raise ValueError('SUPABASE_SERVICE_ROLE_KEY is required')
         return v
     
+    @field_validator('document_duplication_chunk_mode')
+    def validate_document_duplication_chunk_mode(cls, v):
+        if v not in ('copy', 'reference'):
+            raise ValueError('document_duplication_chunk_mode must be "copy" or "reference"')
+        return v
+    
+    @field_validator('rate_limit_store')
+    def validate_rate_limit_store(cls, v):
+        if v not in ('memory', 'postgres'):
+            raise ValueError('rate_limit_store must be "memory" or "postgres"')
+        return v
+    
+    @field_validator('webhook_debug_sample_rate')
+    def validate_webhook_debug_sample_rate(cls, v):
+        if not 0.0 <= v <= 1.0:
+            raise ValueError('webhook_debug_sample_rate must be between 0 and 1')
+        return v
+    
     @field_validator('max_file_size_bytes')
     def validate_max_file_size(cls, v):
         if v <= 0:
@@ -22,6 +22,13 @@ from ..utils.document_duplication import (
     check_user_has_document,
     duplicate_document_for_user
 )
+from ..utils.storage_stream import (
+    UploadTooLargeError,
+    delete_from_storage,
+    get_storage_credentials,
+    iter_upload_file,
+    stream_to_storage
+)
 
 logger = logging.getLogger(__name__)
 
@@ -147,7 +154,8 @@ async def upload_document(
                     source_document_id=cross_user_existing_document["document_id"],
                     target_user_id=str(current_user.user_id),
                     target_filename=request.filename,
-                    db_connection=db
+                    db_connection=db,
+                    chunk_mode=config.document_duplication_chunk_mode
                 )
                 
                 # Log duplication event
@@ -182,7 +190,8 @@ async def upload_document(
                     document_id=duplicated_document["document_id"],
                     user_id=str(current_user.user_id),
                     raw_path=duplicated_document["raw_path"],
-                    db=db
+                    db=db,
+                    chunk_source_document_id=duplicated_document["chunk_source_document_id"]
                 )
                 
                 return UploadResponse(
@@ -432,9 +441,16 @@ async def _create_upload_job_for_duplicate(
     document_id: str,
     user_id: str,
     raw_path: str,
-    db
+    db,
+    chunk_source_document_id: Optional[str] = None
 ) -> None:
-    """Create a new upload job for a duplicate document."""
+    """
+    Create a new upload job for a duplicate document.
+    
+    A reference-mode duplicate shares the chunk set of
+    chunk_source_document_id, which is already parsed and embedded, so its
+    job is created complete and never claimed by the worker.
+    """
     # Create job payload for duplicate
     payload = JobPayloadJobValidated(
         user_id=user_id,
@@ -457,12 +473,17 @@ async def _create_upload_job_for_duplicate(
     payload_dict["user_id"] = str(payload_dict["user_id"])
     payload_dict["document_id"] = str(payload_dict["document_id"])
     
+    if chunk_source_document_id:
+        status, state = "complete", "done"
+    else:
+        status, state = "uploaded", "queued"  # duplicate documents are already uploaded
+    
     await db.execute(
         query,
         job_id,
         document_id,
-        "uploaded",  # status - duplicate documents are already uploaded
-        "queued"  # state
+        status,
+        state
     )
 
 
@@ -626,14 +647,63 @@ async def _generate_signed_url(storage_path: str, ttl_seconds: int) -> str:
         raise
 
 
+async def _mark_uploaded_if_hash_matches(
+    conn,
+    bucket: str,
+    key: str,
+    file_sha256: str,
+    storage_url: Optional[str] = None,
+    service_role_key: Optional[str] = None
+) -> None:
+    """
+    Mark the document stored at bucket/key uploaded if its bytes hash as declared.
+    
+    The declared hash drives per-user and cross-user dedupe, so an object with
+    no document row or a mismatched hash is deleted from storage and rejected.
+    A document created without a hash takes the streamed one.
+    """
+    raw_path = f"{bucket}/{key}"
+    marked = await conn.fetchval("""
+        UPDATE upload_pipeline.documents
+        SET processing_status = 'uploaded',
+            file_sha256 = COALESCE(file_sha256, $2),
+            updated_at = now()
+        WHERE raw_path = $1 AND (file_sha256 IS NULL OR file_sha256 = $2)
+        RETURNING document_id
+    """, raw_path, file_sha256)
+    if marked is not None:
+        return
+    
+    document = await conn.fetchrow(
+        "SELECT file_sha256 FROM upload_pipeline.documents WHERE raw_path = $1",
+        raw_path
+    )
+    await delete_from_storage(
+        bucket, key, storage_url=storage_url, service_role_key=service_role_key
+    )
+    if document is None:
+        logger.warning(f"Upload rejected, no document for {raw_path} (sha256: {file_sha256})")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No document is registered for this upload path"
+        )
+    
+    logger.warning(
+        f"Uploaded content hash does not match declared hash - bucket: {bucket}, key: {key}, "
+        f"declared: {document['file_sha256']}, actual: {file_sha256}"
+    )
+    raise HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Uploaded content does not match the declared SHA-256"
+    )
+
+
 @router.post("/upload-file/{job_id}")
 async def upload_file_to_storage(
     job_id: str,
     file: UploadFile = File(...)
 ):
     """Handle direct file upload to storage for development."""
-    from config.database import get_supabase_service_client
-    
     try:
         # Get the job to find the storage path
         db = get_database()
@@ -657,9 +727,6 @@ async def upload_file_to_storage(
             
             raw_path = doc["raw_path"]
         
-        # Upload file to Supabase storage using service role
-        supabase = await get_supabase_service_client()
-        
         # Extract bucket and key from file path
         if raw_path.startswith("files/user/"):
             key = raw_path[6:]  # Remove "files/" prefix
@@ -667,24 +734,26 @@ async def upload_file_to_storage(
         else:
             raise ValueError(f"Invalid raw_path format: {raw_path}")
         
-        # Read file content
-        file_content = await file.read()
-        
-        # Upload to Supabase storage
-        response = supabase.storage.from_(bucket).upload(
+        # Stream the spooled upload to storage instead of reading it whole
+        upload = await stream_to_storage(
+            bucket,
             key,
-            file_content,
-            file_options={"content-type": file.content_type or "application/octet-stream"}
+            iter_upload_file(file),
+            content_type=file.content_type or "application/octet-stream",
+            max_bytes=get_config().max_file_size_bytes,
+            content_length=file.size,
+            upsert=False
         )
         
-        if response.get('error'):
+        if not upload.ok:
             raise HTTPException(
                 status_code=500, 
-                detail=f"Failed to upload file to storage: {response['error']}"
+                detail=f"Failed to upload file to storage: {upload.response_text}"
             )
         
         # Update job status to indicate file is uploaded
         async with db.get_connection() as conn:
+            await _mark_uploaded_if_hash_matches(conn, bucket, key, upload.file_sha256)
             await conn.execute(
                 "UPDATE upload_pipeline.upload_jobs SET status = 'uploaded', state = 'queued' WHERE job_id = $1",
                 job_id
@@ -694,6 +763,10 @@ async def upload_file_to_storage(
         
         return {"message": "File uploaded successfully", "path": raw_path}
         
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"File upload failed for job {job_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
@@ -718,80 +791,57 @@ async def upload_file_proxy(
     try:
         logger.info(f"File upload proxy request - bucket: {bucket}, key: {key}, user: {current_user.user_id}")
         
-        # Read file content from request body
-        file_content = await request.body()
         content_type = request.headers.get("content-type", "application/octet-stream")
+        content_length = request.headers.get("content-length")
         
-        # Upload to Supabase storage using service role key
-        import httpx
-        import os
+        storage_url, service_role_key = get_storage_credentials()
+        if not service_role_key:
+            raise HTTPException(status_code=500, detail="Storage service role key not configured")
         
-        # Load environment variables using the environment loader
-        from config.environment_loader import load_environment
-        environment = os.getenv("ENVIRONMENT", "development")
+        # Pipe the request body to storage through the shared client; the body
+        # is hashed and size-checked as it streams and never held in memory
+        upload = await stream_to_storage(
+            bucket,
+            key,
+            request.stream(),
+            content_type=content_type,
+            max_bytes=get_config().max_file_size_bytes,
+            content_length=int(content_length) if content_length else None,
+            storage_url=storage_url,
+            service_role_key=service_role_key
+        )
         
-        # Load environment variables based on deployment context
-        env_vars = load_environment()
+        logger.info(f"Storage response: {upload.status_code} ({upload.bytes_len} bytes)")
         
-        storage_url = os.getenv("SUPABASE_URL", "http://127.0.0.1:54321")
-        # Use development key for local development
-        if environment == "development":
-            service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-        else:
-            service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", os.getenv("SERVICE_ROLE_KEY", ""))
+        if not upload.ok:
+            logger.error(f"Storage upload failed - {upload.status_code}: {upload.response_text}")
+            raise HTTPException(
+                status_code=upload.status_code,
+                detail=f"Storage upload failed: {upload.response_text}"
+            )
         
-        # Debug environment variable loading
-        logger.info(f"Storage URL: {storage_url}")
-        logger.info(f"Service role key present: {bool(service_role_key and len(service_role_key) > 10)}")
+        logger.info(f"File uploaded successfully via proxy - bucket: {bucket}, key: {key}")
         
-        if not service_role_key:
-            raise HTTPException(status_code=500, detail="Storage service role key not configured")
-        
-        async with httpx.AsyncClient() as client:
-            # Debug the exact request being made
-            request_url = f"{storage_url}/storage/v1/object/{bucket}/{key}"
-            request_headers = {
-                "Content-Type": content_type,
-                "Authorization": f"Bearer {service_role_key}",
-                "apikey": service_role_key,
-                "x-upsert": "true"
-            }
-            
-            logger.info(f"Making storage request: POST {request_url}")
-            logger.info(f"Headers: {list(request_headers.keys())}")
-            logger.info(f"Content size: {len(file_content)} bytes")
-            
-            # Use POST method with x-upsert (works reliably with local Supabase)
-            response = await client.post(
-                request_url,
-                content=file_content,
-                headers=request_headers
+        # Only mark the document uploaded when the stored bytes match the hash
+        # the client declared at /upload
+        db = get_database()
+        async with db.get_connection() as conn:
+            await _mark_uploaded_if_hash_matches(
+                conn, bucket, key, upload.file_sha256,
+                storage_url=storage_url, service_role_key=service_role_key
             )
-            
-            logger.info(f"Storage response: {response.status_code}")
-            if response.status_code not in [200, 201]:
-                logger.error(f"Storage response body: {response.text}")
-            
-            if response.status_code in [200, 201]:
-                logger.info(f"File uploaded successfully via proxy - bucket: {bucket}, key: {key}")
-                
-                # Update document status to uploaded
-                db = get_database()
-                async with db.get_connection() as conn:
-                    await conn.execute("""
-                        UPDATE upload_pipeline.documents
-                        SET processing_status = 'uploaded', updated_at = now()
-                        WHERE raw_path = $1
-                    """, f"{bucket}/{key}")
-                
-                return {"status": "success", "message": "File uploaded successfully"}
-            else:
-                logger.error(f"Storage upload failed - {response.status_code}: {response.text}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Storage upload failed: {response.text}"
-                )
         
+        return {
+            "status": "success",
+            "message": "File uploaded successfully",
+            "bytes_len": upload.bytes_len,
+            "file_sha256": upload.file_sha256,
+            "sha256_verified": True
+        }
+        
+    except UploadTooLargeError as e:
+        logger.warning(f"File upload proxy rejected - bucket: {bucket}, key: {key}: {e}")
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -4,6 +4,7 @@ Phase 2: Core API endpoints and job queue system.
 """
 
 import logging
+import math
 import os
 from contextlib import asynccontextmanager
 from typing import Dict, Any
@@ -31,10 +32,11 @@ from starlette.requests import Request as StarletteRequest
 from .config import get_config
 from .database import get_database
 from .auth import get_current_user, User
-from .rate_limiter import RateLimiter
+from .rate_limiter import RateLimiter, PostgresRateLimitStore
 from .endpoints.upload import router as upload_router
 from .endpoints.jobs import router as jobs_router
 from .webhooks import router as webhooks_router
+from .utils.storage_stream import close_storage_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -61,14 +63,17 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             pass
         
         # Check rate limits
-        if not rate_limiter.check_rate_limit(request.url.path, user_id):
+        decision = await rate_limiter.check(request.url.path, user_id)
+        if not decision.allowed:
+            retry_after = math.ceil(decision.retry_after)
             return JSONResponse(
                 status_code=429,
                 content={
                     "error": "rate_limit_exceeded",
                     "message": "Rate limit exceeded. Please try again later.",
-                    "retry_after": rate_limiter.get_retry_after(request.url.path, user_id)
-                }
+                    "retry_after": retry_after
+                },
+                headers={"Retry-After": str(retry_after)}
             )
         
         response = await call_next(request)
@@ -111,8 +116,14 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Database connection failed during startup: {e}")
         logger.warning("API will start but database-dependent features may not work")
     
-    # Initialize rate limiter
-    rate_limiter.initialize()
+    # Initialize rate limiter (shared Postgres state only if the pool is up)
+    rate_limit_store = None
+    if get_config().rate_limit_store == "postgres":
+        if get_database().pool:
+            rate_limit_store = PostgresRateLimitStore(get_database())
+        else:
+            logger.warning("Database unavailable, rate limiting with in-memory state")
+    rate_limiter.initialize(rate_limit_store)
     
     logger.info("Upload pipeline API started successfully")
     
@@ -124,6 +135,9 @@ async def lifespan(app: FastAPI):
     # Close database connections
     await get_database().close()
     
+    # Close the pooled storage upload client
+    await close_storage_client()
+    
     logger.info("Upload pipeline API shutdown complete")
 
 
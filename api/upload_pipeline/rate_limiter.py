@@ -1,14 +1,30 @@
 """
 Rate limiting for the upload pipeline API.
+
+Limits are enforced with GCRA (the generic cell rate algorithm, equivalent to
+a token bucket). Each key stores a single float, its theoretical arrival time
+(TAT), so a check is O(1) in time and state no matter how many requests the
+window allows and there is no per-request history to clean up. State lives in
+a pluggable store: in-process memory for a single instance, or a Postgres
+table shared by every API instance. The GCRA engine and store interface live
+in utils.gcra and are shared with the agents' outbound API limiters.
 """
 
+import math
 import time
 import logging
-from typing import Dict, Optional, Tuple
-from collections import defaultdict, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from .config import get_config
+from .utils.gcra import (
+    TAT_EPSILON,
+    InMemoryRateLimitStore,
+    RateLimitStore,
+    gcra_decide,
+    gcra_remaining,
+    gcra_retry_after,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,240 +32,283 @@ logger = logging.getLogger(__name__)
 @dataclass
 class RateLimitConfig:
     """Configuration for rate limiting."""
-    
+
     max_requests: int
     window_seconds: int
     endpoint: str
 
+    @property
+    def emission_interval(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return self.window_seconds / self.max_requests
+
+    @property
+    def burst_offset(self) -> float:
+        """How far the TAT may run ahead of now (max_requests at once)."""
+        return self.emission_interval * self.max_requests
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    remaining: int
+    retry_after: float = 0.0
+
+
+class PostgresRateLimitStore(RateLimitStore):
+    """
+    Shared store backed by upload_pipeline.rate_limit_state.
+
+    An allowed request is a single upsert whose WHERE clause performs the GCRA
+    comparison, so concurrent API instances never both take the last slot.
+    Denied requests cost one extra primary key read to compute retry_after.
+    Like the in-memory store, every sweep_interval allowed requests this
+    instance deletes rows whose TAT has passed, so the table stays bounded by
+    the keys active within their window.
+    """
+
+    ACQUIRE_SQL = """
+        INSERT INTO upload_pipeline.rate_limit_state AS s (key, tat)
+        VALUES ($1, $2::float8 + $3::float8)
+        ON CONFLICT (key) DO UPDATE
+            SET tat = GREATEST(s.tat, $2::float8) + $3::float8
+            WHERE GREATEST(s.tat, $2::float8) + $3::float8 - $2::float8 <= $4::float8
+        RETURNING tat
+    """
+
+    def __init__(self, db, sweep_interval: int = 10000):
+        self.db = db
+        self.sweep_interval = sweep_interval
+        self._writes = 0
+
+    async def acquire(self, key: str, now: float, config: RateLimitConfig) -> Tuple[bool, float]:
+        async with self.db.get_connection() as conn:
+            tat = await conn.fetchval(
+                self.ACQUIRE_SQL, key, now, config.emission_interval,
+                config.burst_offset + TAT_EPSILON
+            )
+            if tat is None:
+                tat = await conn.fetchval(
+                    "SELECT tat FROM upload_pipeline.rate_limit_state WHERE key = $1", key
+                )
+                return False, max(tat or now, now)
+
+        self._writes += 1
+        if self._writes >= self.sweep_interval:
+            self._writes = 0
+            try:
+                await self.prune(now)
+            except Exception as e:
+                logger.warning(f"Rate limit state prune failed: {e}")
+        return True, tat
+
+    async def get_tat(self, key: str) -> Optional[float]:
+        return await self.db.fetchval(
+            "SELECT tat FROM upload_pipeline.rate_limit_state WHERE key = $1", key
+        )
+
+    async def prune(self, now: float) -> int:
+        status = await self.db.execute(
+            "DELETE FROM upload_pipeline.rate_limit_state WHERE tat <= $1", now
+        )
+        return int(status.split()[-1]) if status else 0
+
+
+def _path_segments(path: str) -> List[str]:
+    return [segment for segment in path.split("/") if segment]
+
 
 class RateLimiter:
     """Rate limiter for API endpoints."""
-    
-    def __init__(self):
+
+    def __init__(self, store: Optional[RateLimitStore] = None, clock: Callable[[], float] = time.time):
         self.config = get_config()
         self.rate_limits: Dict[str, RateLimitConfig] = {}
-        self.user_requests: Dict[str, deque] = defaultdict(lambda: deque())
-        self.endpoint_requests: Dict[str, deque] = defaultdict(lambda: deque())
+        # Segment trie over rate_limits paths; "{param}" segments match any value
+        self._routes: Dict[str, Any] = {}
+        self.store = store
+        self.clock = clock
         self.initialized = False
-    
-    def initialize(self):
-        """Initialize rate limit configurations."""
+
+    def initialize(self, store: Optional[RateLimitStore] = None):
+        """Initialize rate limit configurations and the state store."""
         # Upload rate limits per user
         self.rate_limits["/api/v2/upload"] = RateLimitConfig(
             max_requests=self.config.max_uploads_per_day_per_user,
             window_seconds=86400,  # 24 hours
             endpoint="upload"
         )
-        
+
         # Job status polling rate limits per job
         self.rate_limits["/api/v2/jobs/{job_id}"] = RateLimitConfig(
             max_requests=self.config.max_polls_per_minute_per_job,
             window_seconds=60,  # 1 minute
             endpoint="job_status"
         )
-        
+
         # General API rate limits
         self.rate_limits["/api/v2"] = RateLimitConfig(
             max_requests=1000,  # 1000 requests per hour
             window_seconds=3600,  # 1 hour
             endpoint="general"
         )
-        
+
+        self._compile_routes()
+
+        if store is not None:
+            self.store = store
+        if self.store is None:
+            self.store = InMemoryRateLimitStore()
+
         self.initialized = True
-        logger.info("Rate limiter initialized with configurations")
-    
-    def check_rate_limit(self, endpoint: str, user_id: Optional[str] = None) -> bool:
+        logger.info(f"Rate limiter initialized with {type(self.store).__name__}")
+
+    def set_rate_limit(self, path: str, config: RateLimitConfig):
+        """Add or replace the limit for a path template such as /api/v2/jobs/{job_id}."""
+        self.rate_limits[path] = config
+        self._compile_routes()
+
+    def _compile_routes(self):
+        """Build the segment trie _get_endpoint_config walks."""
+        self._routes = {}
+        for path in self.rate_limits:
+            node = self._routes
+            for segment in _path_segments(path):
+                key = "{}" if segment.startswith("{") and segment.endswith("}") else segment
+                node = node.setdefault("children", {}).setdefault(key, {})
+            node["path"] = path
+
+    def _get_endpoint_config(self, endpoint: str) -> Optional[RateLimitConfig]:
         """
-        Check if a request is within rate limits.
-        
+        Get the rate limit configuration for a request path.
+
+        The longest configured path that prefixes the request on segment
+        boundaries wins; a literal segment is preferred over a template one.
+        """
+        matched = None
+        nodes = [self._routes]
+        for segment in _path_segments(endpoint):
+            next_nodes = []
+            for node in nodes:
+                children = node.get("children", {})
+                for key in (segment, "{}"):
+                    if key in children:
+                        next_nodes.append(children[key])
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            matched = next((node["path"] for node in nodes if "path" in node), matched)
+
+        return self.rate_limits.get(matched) if matched else None
+
+    def _limit_keys(self, endpoint: str, user_id: Optional[str]) -> List[Tuple[str, RateLimitConfig]]:
+        """State keys a request counts against, in check order."""
+        endpoint_config = self._get_endpoint_config(endpoint)
+        if not endpoint_config:
+            return []
+
+        keys = [(f"endpoint:{endpoint}", endpoint_config)]
+        if user_id and endpoint_config.endpoint == "upload":
+            keys.append((f"user:{endpoint_config.endpoint}:{user_id}", endpoint_config))
+        return keys
+
+    async def check(self, endpoint: str, user_id: Optional[str] = None) -> RateLimitDecision:
+        """
+        Check a request against every applicable limit and consume a slot.
+
         Args:
             endpoint: API endpoint path
             user_id: Optional user ID for user-specific limits
-            
+
         Returns:
-            True if request is allowed, False if rate limited
+            The decision, including remaining requests and retry_after
         """
         if not self.initialized:
             logger.warning("Rate limiter not initialized, allowing request")
-            return True
-        
-        current_time = time.time()
-        
-        # Clean up old requests
-        self._cleanup_old_requests(current_time)
-        
-        # Check endpoint-specific rate limits
-        endpoint_config = self._get_endpoint_config(endpoint)
-        if endpoint_config:
-            if not self._check_endpoint_limit(endpoint, endpoint_config, current_time):
-                return False
-        
-        # Check user-specific rate limits
-        if user_id and endpoint_config and endpoint_config.endpoint == "upload":
-            if not self._check_user_limit(user_id, endpoint_config, current_time):
-                return False
-        
-        return True
-    
-    def get_retry_after(self, endpoint: str, user_id: Optional[str] = None) -> int:
+            return RateLimitDecision(allowed=True, remaining=0)
+
+        now = self.clock()
+        remaining = None
+        for key, config in self._limit_keys(endpoint, user_id):
+            try:
+                allowed, tat = await self.store.acquire(key, now, config)
+            except Exception as e:
+                # Fail open: a store outage must not take the API down
+                logger.warning(f"Rate limit store error for {key}, allowing request: {e}")
+                continue
+
+            if not allowed:
+                logger.warning(
+                    f"Rate limit exceeded for {key} "
+                    f"({config.max_requests} per {config.window_seconds}s)"
+                )
+                return RateLimitDecision(
+                    allowed=False,
+                    remaining=0,
+                    retry_after=gcra_retry_after(tat, now, config)
+                )
+
+            key_remaining = gcra_remaining(tat, now, config)
+            remaining = key_remaining if remaining is None else min(remaining, key_remaining)
+
+        return RateLimitDecision(allowed=True, remaining=remaining or 0)
+
+    async def check_rate_limit(self, endpoint: str, user_id: Optional[str] = None) -> bool:
+        """
+        Check if a request is within rate limits.
+
+        Args:
+            endpoint: API endpoint path
+            user_id: Optional user ID for user-specific limits
+
+        Returns:
+            True if request is allowed, False if rate limited
+        """
+        return (await self.check(endpoint, user_id)).allowed
+
+    async def get_retry_after(self, endpoint: str, user_id: Optional[str] = None) -> int:
         """
         Get retry-after time in seconds for rate-limited requests.
-        
+
         Args:
             endpoint: API endpoint path
             user_id: Optional user ID for user-specific limits
-            
+
         Returns:
             Seconds to wait before retrying
         """
-        current_time = time.time()
-        
-        # Check endpoint-specific limits
-        endpoint_config = self._get_endpoint_config(endpoint)
-        if endpoint_config:
-            retry_after = self._get_endpoint_retry_after(endpoint, endpoint_config, current_time)
-            if retry_after > 0:
-                return retry_after
-        
-        # Check user-specific limits
-        if user_id and endpoint_config and endpoint_config.endpoint == "upload":
-            retry_after = self._get_user_retry_after(user_id, endpoint_config, current_time)
-            if retry_after > 0:
-                return retry_after
-        
-        return 0
-    
-    def _get_endpoint_config(self, endpoint: str) -> Optional[RateLimitConfig]:
-        """Get rate limit configuration for an endpoint."""
-        # Find matching endpoint configuration
-        for path, config in self.rate_limits.items():
-            if endpoint.startswith(path):
-                return config
-        
-        return None
-    
-    def _check_endpoint_limit(self, endpoint: str, config: RateLimitConfig, current_time: float) -> bool:
-        """Check if endpoint rate limit is exceeded."""
-        requests = self.endpoint_requests[endpoint]
-        
-        # Remove old requests outside the window
-        while requests and current_time - requests[0] > config.window_seconds:
-            requests.popleft()
-        
-        # Check if limit exceeded
-        if len(requests) >= config.max_requests:
-            logger.warning(
-                "Endpoint rate limit exceeded",
-                endpoint=endpoint,
-                current_requests=len(requests),
-                max_requests=config.max_requests
-            )
-            return False
-        
-        # Add current request
-        requests.append(current_time)
-        return True
-    
-    def _check_user_limit(self, user_id: str, config: RateLimitConfig, current_time: float) -> bool:
-        """Check if user rate limit is exceeded."""
-        requests = self.user_requests[user_id]
-        
-        # Remove old requests outside the window
-        while requests and current_time - requests[0] > config.window_seconds:
-            requests.popleft()
-        
-        # Check if limit exceeded
-        if len(requests) >= config.max_requests:
-            logger.warning(
-                "User rate limit exceeded",
-                user_id=user_id,
-                endpoint=config.endpoint,
-                current_requests=len(requests),
-                max_requests=config.max_requests
-            )
-            return False
-        
-        # Add current request
-        requests.append(current_time)
-        return True
-    
-    def _get_endpoint_retry_after(self, endpoint: str, config: RateLimitConfig, current_time: float) -> int:
-        """Get retry-after time for endpoint rate limit."""
-        requests = self.endpoint_requests[endpoint]
-        
-        if len(requests) >= config.max_requests:
-            # Find when the oldest request will expire
-            oldest_request = requests[0]
-            return max(0, int(oldest_request + config.window_seconds - current_time))
-        
-        return 0
-    
-    def _get_user_retry_after(self, user_id: str, config: RateLimitConfig, current_time: float) -> int:
-        """Get retry-after time for user rate limit."""
-        requests = self.user_requests[user_id]
-        
-        if len(requests) >= config.max_requests:
-            # Find when the oldest request will expire
-            oldest_request = requests[0]
-            return max(0, int(oldest_request + config.window_seconds - current_time))
-        
-        return 0
-    
-    def _cleanup_old_requests(self, current_time: float):
-        """Clean up old requests to prevent memory leaks."""
-        # Clean up endpoint requests
-        for endpoint, requests in self.endpoint_requests.items():
-            config = self._get_endpoint_config(endpoint)
-            if config:
-                while requests and current_time - requests[0] > config.window_seconds:
-                    requests.popleft()
-        
-        # Clean up user requests
-        for user_id, requests in self.user_requests.items():
-            # Use upload rate limit config for user cleanup
-            config = self.rate_limits.get("/api/v2/upload")
-            if config:
-                while requests and current_time - requests[0] > config.window_seconds:
-                    requests.popleft()
-        
-        # Remove empty user entries
-        empty_users = [user_id for user_id, requests in self.user_requests.items() if not requests]
-        for user_id in empty_users:
-            del self.user_requests[user_id]
-        
-        # Remove empty endpoint entries
-        empty_endpoints = [endpoint for endpoint, requests in self.endpoint_requests.items() if not requests]
-        for endpoint in empty_endpoints:
-            del self.endpoint_requests[endpoint]
-    
-    def get_rate_limit_info(self, endpoint: str, user_id: Optional[str] = None) -> Dict[str, any]:
+        if not self.initialized:
+            return 0
+
+        now = self.clock()
+        retry_after = 0.0
+        for key, config in self._limit_keys(endpoint, user_id):
+            tat = await self.store.get_tat(key)
+            retry_after = max(retry_after, gcra_retry_after(tat, now, config))
+        return math.ceil(retry_after)
+
+    async def get_rate_limit_info(self, endpoint: str, user_id: Optional[str] = None) -> Dict[str, Any]:
         """Get current rate limit information for debugging."""
-        current_time = time.time()
+        now = self.clock()
         info = {
             "endpoint": endpoint,
             "user_id": user_id,
-            "current_time": current_time
+            "current_time": now
         }
-        
-        # Endpoint rate limit info
-        endpoint_config = self._get_endpoint_config(endpoint)
-        if endpoint_config:
-            requests = self.endpoint_requests[endpoint]
-            info["endpoint_limits"] = {
-                "max_requests": endpoint_config.max_requests,
-                "window_seconds": endpoint_config.window_seconds,
-                "current_requests": len(requests),
-                "remaining_requests": max(0, endpoint_config.max_requests - len(requests))
-            }
-        
-        # User rate limit info
-        if user_id and endpoint_config and endpoint_config.endpoint == "upload":
-            requests = self.user_requests[user_id]
-            info["user_limits"] = {
-                "max_requests": endpoint_config.max_requests,
-                "window_seconds": endpoint_config.window_seconds,
-                "current_requests": len(requests),
-                "remaining_requests": max(0, endpoint_config.max_requests - len(requests))
+        if not self.initialized:
+            return info
+
+        for key, config in self._limit_keys(endpoint, user_id):
+            tat = await self.store.get_tat(key)
+            remaining = gcra_remaining(tat, now, config)
+            info["user_limits" if key.startswith("user:") else "endpoint_limits"] = {
+                "max_requests": config.max_requests,
+                "window_seconds": config.window_seconds,
+                "current_requests": config.max_requests - remaining,
+                "remaining_requests": remaining,
+                "retry_after_seconds": math.ceil(gcra_retry_after(tat, now, config))
             }
-        
+
         return info
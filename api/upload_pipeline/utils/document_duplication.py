@@ -7,31 +7,57 @@ entries and preserving existing processing data.
 """
 
 import logging
-import uuid
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# How a duplicated document gets its chunks:
+# - copy: new chunk rows (and vectors) are created server-side for the document
+# - reference: the document shares the source's physical chunk set. The
+#   owner is the document whose id is on the chunk rows; when it is deleted
+#   a database trigger hands the chunks to the oldest referrer, and deleting
+#   shared chunk rows directly is rejected.
+CHUNK_MODE_COPY = "copy"
+CHUNK_MODE_REFERENCE = "reference"
+CHUNK_MODES = (CHUNK_MODE_COPY, CHUNK_MODE_REFERENCE)
+
+
+@asynccontextmanager
+async def _transaction(db_connection):
+    """Run on one connection in a transaction, acquiring it from a pool manager if needed."""
+    if hasattr(db_connection, "get_connection"):
+        async with db_connection.get_connection() as conn:
+            async with conn.transaction():
+                yield conn
+    else:
+        async with db_connection.transaction():
+            yield db_connection
+
 
 async def duplicate_document_for_user(
     source_document_id: str,
     target_user_id: str,
     target_filename: str,
-    db_connection
+    db_connection,
+    chunk_mode: str = CHUNK_MODE_COPY
 ) -> Dict[str, Any]:
     """
     Duplicate an existing document for a new user.
     
     This function creates a new document row for the target user with the same
     processing data as the source document, while preserving all document_chunks
-    relationships through proper document_id references.
+    relationships through proper document_id references. The document row and
+    its chunks are written in one transaction.
     
     Args:
         source_document_id: UUID of the source document to duplicate
         target_user_id: UUID of the user who will own the new document
         target_filename: Filename for the new document (may differ from source)
-        db_connection: Database connection for executing queries
+        db_connection: Database connection (or pool manager) for executing queries
+        chunk_mode: "copy" to copy chunks server-side, "reference" to share
+            the source document's chunk set
         
     Returns:
         Dictionary containing the new document information:
@@ -40,100 +66,127 @@ async def duplicate_document_for_user(
         - raw_path: Storage path for the raw document
         - parsed_path: Storage path for the parsed document (if exists)
         - processing_status: Current processing status
+        - chunk_source_document_id: Document whose chunks are shared (reference mode)
         - created_at: Timestamp when the document was created
         
     Raises:
-        ValueError: If source document doesn't exist or target user is invalid
+        ValueError: If chunk_mode is invalid
+        RuntimeError: If the source document doesn't exist
         RuntimeError: If document duplication fails
     """
+    if chunk_mode not in CHUNK_MODES:
+        raise ValueError(f"Invalid chunk_mode '{chunk_mode}', expected one of {CHUNK_MODES}")
+    
     try:
-        # First, verify the source document exists and get its data
-        source_query = """
-            SELECT 
-                document_id, user_id, filename, mime, bytes_len, file_sha256,
-                parsed_sha256, raw_path, parsed_path, processing_status,
-                created_at, updated_at
-            FROM upload_pipeline.documents 
-            WHERE document_id = $1
-        """
-        
-        source_doc = await db_connection.fetchrow(source_query, source_document_id)
-        if not source_doc:
-            raise ValueError(f"Source document {source_document_id} not found")
-        
-        # Generate new document ID for the target user
-        # Use deterministic UUID generation based on target user and content hash
-        from ..utils.upload_pipeline_utils import generate_document_id
-        new_document_id = generate_document_id(str(target_user_id), source_doc['file_sha256'])
-        
-        # Generate new storage paths for the target user using standardized functions
-        from ..utils.upload_pipeline_utils import generate_storage_path, generate_parsed_path
-        new_raw_path = generate_storage_path(
-            str(target_user_id),
-            str(new_document_id),
-            target_filename
-        )
-        
-        # Generate parsed path if source has one using standardized function
-        new_parsed_path = None
-        if source_doc['parsed_path']:
-            new_parsed_path = generate_parsed_path(str(target_user_id), str(new_document_id))
-        
-        # Create new document record with same processing data but new user
-        insert_query = """
-            INSERT INTO upload_pipeline.documents (
-                document_id, user_id, filename, mime, bytes_len, file_sha256,
-                parsed_sha256, raw_path, parsed_path, processing_status,
-                created_at, updated_at
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12
+        async with _transaction(db_connection) as conn:
+            return await _duplicate_document(
+                source_document_id, target_user_id, target_filename, conn, chunk_mode
             )
-            RETURNING document_id, filename, raw_path, parsed_path, processing_status, created_at
-        """
-        
-        now = datetime.utcnow()
-        new_doc = await db_connection.fetchrow(
-            insert_query,
-            new_document_id,           # $1: new document_id
-            target_user_id,            # $2: target user_id
-            target_filename,           # $3: new filename
-            source_doc['mime'],        # $4: same mime type
-            source_doc['bytes_len'],   # $5: same file size
-            source_doc['file_sha256'], # $6: same content hash
-            source_doc['parsed_sha256'], # $7: same parsed hash
-            new_raw_path,              # $8: new raw path
-            new_parsed_path,           # $9: new parsed path
-            source_doc['processing_status'], # $10: same processing status
-            now,                       # $11: new created_at
-            now                        # $12: new updated_at
+    except Exception as e:
+        logger.error(f"Failed to duplicate document {source_document_id} for user {target_user_id}: {str(e)}")
+        raise RuntimeError(f"Document duplication failed: {str(e)}")
+
+
+async def _duplicate_document(
+    source_document_id: str,
+    target_user_id: str,
+    target_filename: str,
+    db_connection,
+    chunk_mode: str
+) -> Dict[str, Any]:
+    """Create the target document and its chunks; runs inside the caller's transaction."""
+    # First, verify the source document exists and get its data
+    source_query = """
+        SELECT 
+            document_id, user_id, filename, mime, bytes_len, file_sha256,
+            parsed_sha256, raw_path, parsed_path, processing_status,
+            chunk_source_document_id, created_at, updated_at
+        FROM upload_pipeline.documents 
+        WHERE document_id = $1
+    """
+    
+    source_doc = await db_connection.fetchrow(source_query, source_document_id)
+    if not source_doc:
+        raise ValueError(f"Source document {source_document_id} not found")
+    
+    # Generate new document ID for the target user
+    # Use deterministic UUID generation based on target user and content hash
+    from ..utils.upload_pipeline_utils import generate_document_id
+    new_document_id = generate_document_id(str(target_user_id), source_doc['file_sha256'])
+    
+    # Generate new storage paths for the target user using standardized functions
+    from ..utils.upload_pipeline_utils import generate_storage_path, generate_parsed_path
+    new_raw_path = generate_storage_path(
+        str(target_user_id),
+        str(new_document_id),
+        target_filename
+    )
+    
+    # Generate parsed path if source has one using standardized function
+    new_parsed_path = None
+    if source_doc['parsed_path']:
+        new_parsed_path = generate_parsed_path(str(target_user_id), str(new_document_id))
+    
+    # In reference mode point at the document that physically owns the
+    # chunks (the source may itself be a reference)
+    chunk_source_document_id = None
+    if chunk_mode == CHUNK_MODE_REFERENCE:
+        chunk_source_document_id = source_doc['chunk_source_document_id'] or source_doc['document_id']
+    
+    # Create new document record with same processing data but new user
+    insert_query = """
+        INSERT INTO upload_pipeline.documents (
+            document_id, user_id, filename, mime, bytes_len, file_sha256,
+            parsed_sha256, raw_path, parsed_path, processing_status,
+            chunk_source_document_id, created_at, updated_at
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
         )
-        
+        RETURNING document_id, filename, raw_path, parsed_path, processing_status, created_at
+    """
+    
+    now = datetime.utcnow()
+    new_doc = await db_connection.fetchrow(
+        insert_query,
+        new_document_id,           # $1: new document_id
+        target_user_id,            # $2: target user_id
+        target_filename,           # $3: new filename
+        source_doc['mime'],        # $4: same mime type
+        source_doc['bytes_len'],   # $5: same file size
+        source_doc['file_sha256'], # $6: same content hash
+        source_doc['parsed_sha256'], # $7: same parsed hash
+        new_raw_path,              # $8: new raw path
+        new_parsed_path,           # $9: new parsed path
+        source_doc['processing_status'], # $10: same processing status
+        chunk_source_document_id,  # $11: shared chunk set (reference mode)
+        now,                       # $12: new created_at
+        now                        # $13: new updated_at
+    )
+    
+    if chunk_mode == CHUNK_MODE_COPY:
         # Copy all document chunks from source to new document
         await _copy_document_chunks(
-            source_document_id, 
+            source_doc['chunk_source_document_id'] or source_document_id,
             new_document_id, 
             target_user_id, 
             db_connection
         )
-        
-        logger.info(
-            f"Document duplicated successfully - "
-            f"source: {source_document_id}, target: {new_document_id}, "
-            f"user: {target_user_id}"
-        )
-        
-        return {
-            "document_id": new_doc["document_id"],
-            "filename": new_doc["filename"],
-            "raw_path": new_doc["raw_path"],
-            "parsed_path": new_doc["parsed_path"],
-            "processing_status": new_doc["processing_status"],
-            "created_at": new_doc["created_at"]
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to duplicate document {source_document_id} for user {target_user_id}: {str(e)}")
-        raise RuntimeError(f"Document duplication failed: {str(e)}")
+    
+    logger.info(
+        f"Document duplicated successfully - "
+        f"source: {source_document_id}, target: {new_document_id}, "
+        f"user: {target_user_id}, chunk_mode: {chunk_mode}"
+    )
+    
+    return {
+        "document_id": new_doc["document_id"],
+        "filename": new_doc["filename"],
+        "raw_path": new_doc["raw_path"],
+        "parsed_path": new_doc["parsed_path"],
+        "processing_status": new_doc["processing_status"],
+        "chunk_source_document_id": chunk_source_document_id,
+        "created_at": new_doc["created_at"]
+    }
 
 
 async def _copy_document_chunks(
@@ -147,6 +200,8 @@ async def _copy_document_chunks(
     
     This preserves the document_chunks relationships by creating new chunk records
     that reference the new document_id while maintaining all processing data.
+    The copy is a single INSERT ... SELECT with chunk ids generated in SQL, so
+    chunk text and embeddings never leave Postgres.
     
     Args:
         source_document_id: UUID of the source document
@@ -161,62 +216,29 @@ async def _copy_document_chunks(
         RuntimeError: If chunk copying fails
     """
     try:
-        # Get all chunks from source document
-        source_chunks_query = """
-            SELECT 
-                chunker_name, chunker_version, chunk_ord, text, chunk_sha,
+        copy_chunks_query = """
+            INSERT INTO upload_pipeline.document_chunks (
+                chunk_id, document_id, chunker_name, chunker_version, chunk_ord,
+                text, chunk_sha, tokens, section_path, section_title, page_start, page_end,
                 embed_model, embed_version, vector_dim, embedding,
                 embed_updated_at, created_at, updated_at
+            )
+            SELECT
+                gen_random_uuid(), $2, chunker_name, chunker_version, chunk_ord,
+                text, chunk_sha, tokens, section_path, section_title, page_start, page_end,
+                embed_model, embed_version, vector_dim, embedding,
+                embed_updated_at, now(), now()
             FROM upload_pipeline.document_chunks
             WHERE document_id = $1
-            ORDER BY chunk_ord
         """
         
-        source_chunks = await db_connection.fetch(source_chunks_query, source_document_id)
+        status = await db_connection.execute(copy_chunks_query, source_document_id, target_document_id)
+        chunks_copied = int(status.split()[-1])
         
-        if not source_chunks:
+        if chunks_copied == 0:
             logger.warning(f"No chunks found for source document {source_document_id}")
             return 0
         
-        # Copy each chunk to the new document
-        chunks_copied = 0
-        now = datetime.utcnow()
-        
-        for chunk in source_chunks:
-            # Generate new chunk ID
-            new_chunk_id = str(uuid.uuid4())
-            
-            # Insert new chunk record
-            insert_chunk_query = """
-                INSERT INTO upload_pipeline.document_chunks (
-                    chunk_id, document_id, chunker_name, chunker_version, chunk_ord,
-                    text, chunk_sha, embed_model, embed_version, vector_dim, embedding,
-                    embed_updated_at, created_at, updated_at
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14
-                )
-            """
-            
-            await db_connection.execute(
-                insert_chunk_query,
-                new_chunk_id,                    # $1: new chunk_id
-                target_document_id,              # $2: target document_id
-                chunk['chunker_name'],           # $3: same chunker_name
-                chunk['chunker_version'],        # $4: same chunker_version
-                chunk['chunk_ord'],              # $5: same chunk_ord
-                chunk['text'],                   # $6: same text
-                chunk['chunk_sha'],              # $7: same chunk_sha
-                chunk['embed_model'],            # $8: same embed_model
-                chunk['embed_version'],          # $9: same embed_version
-                chunk['vector_dim'],             # $10: same vector_dim
-                chunk['embedding'],              # $11: same embedding vector
-                chunk['embed_updated_at'],       # $12: same embed_updated_at
-                now,                             # $13: new created_at
-                now                              # $14: new updated_at
-            )
-            
-            chunks_copied += 1
-        
         logger.info(
             f"Copied {chunks_copied} chunks from document {source_document_id} "
             f"to document {target_document_id}"
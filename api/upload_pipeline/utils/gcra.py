@@ -0,0 +1,111 @@
+"""
+GCRA rate limiting engine shared by the API and agent rate limiters.
+
+GCRA (the generic cell rate algorithm) is equivalent to a token bucket but
+stores a single float per key, its theoretical arrival time (TAT). A limit is
+described by two numbers: the emission interval (seconds between requests at
+the sustained rate) and the burst offset (how far the TAT may run ahead of
+now). The decision functions accept any object with those two attributes.
+
+This module has no dependencies beyond the standard library so it can be
+imported by the upload pipeline service, which ships without the agents
+package, and by agents/shared/rate_limiting.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Slack for float rounding when comparing arrival times (seconds)
+TAT_EPSILON = 1e-6
+
+
+@dataclass
+class GCRALimit:
+    """A GCRA limit given directly as emission interval and burst offset."""
+
+    emission_interval: float
+    burst_offset: float
+
+
+def gcra_decide(tat: Optional[float], now: float, limit: Any) -> Tuple[bool, float]:
+    """
+    Apply one GCRA step.
+
+    Args:
+        tat: Stored theoretical arrival time, or None for a new key
+        now: Current time in seconds
+        limit: Limit to apply (anything with emission_interval and burst_offset)
+
+    Returns:
+        (allowed, tat) where tat is the new value if allowed, else unchanged
+    """
+    current = now if tat is None else max(tat, now)
+    new_tat = current + limit.emission_interval
+    if new_tat - now <= limit.burst_offset + TAT_EPSILON:
+        return True, new_tat
+    return False, current
+
+
+def gcra_remaining(tat: Optional[float], now: float, limit: Any) -> int:
+    """Requests that would be allowed right now for a stored TAT."""
+    current = now if tat is None else max(tat, now)
+    headroom = limit.burst_offset - (current - now)
+    return max(0, int(headroom / limit.emission_interval + TAT_EPSILON))
+
+
+def gcra_retry_after(tat: Optional[float], now: float, limit: Any) -> float:
+    """Seconds until the next request would be allowed."""
+    current = now if tat is None else max(tat, now)
+    return max(0.0, current + limit.emission_interval - limit.burst_offset - now)
+
+
+class RateLimitStore(ABC):
+    """Storage for per-key TAT values."""
+
+    @abstractmethod
+    async def acquire(self, key: str, now: float, limit: Any) -> Tuple[bool, float]:
+        """Atomically apply one GCRA step for key and return (allowed, tat)."""
+
+    @abstractmethod
+    async def get_tat(self, key: str) -> Optional[float]:
+        """Read the stored TAT for key without consuming anything."""
+
+    @abstractmethod
+    async def prune(self, now: float) -> int:
+        """Drop keys whose TAT has passed; they are equivalent to absent keys."""
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    Process-local store: one dict entry (key -> float) per active key.
+
+    Keys whose TAT is in the past carry no information, so every
+    sweep_interval writes the dict is swept for them. That keeps memory
+    bounded by the keys active within their window at an amortized O(1) cost.
+    """
+
+    def __init__(self, sweep_interval: int = 10000):
+        self.tats: Dict[str, float] = {}
+        self.sweep_interval = sweep_interval
+        self._writes = 0
+
+    async def acquire(self, key: str, now: float, limit: Any) -> Tuple[bool, float]:
+        # No await between read and write, so this is atomic on the event loop
+        allowed, tat = gcra_decide(self.tats.get(key), now, limit)
+        if allowed:
+            self.tats[key] = tat
+            self._writes += 1
+            if self._writes >= self.sweep_interval:
+                self._writes = 0
+                await self.prune(now)
+        return allowed, tat
+
+    async def get_tat(self, key: str) -> Optional[float]:
+        return self.tats.get(key)
+
+    async def prune(self, now: float) -> int:
+        expired = [key for key, tat in self.tats.items() if tat <= now]
+        for key in expired:
+            del self.tats[key]
+        return len(expired)
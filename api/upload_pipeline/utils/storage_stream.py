@@ -0,0 +1,224 @@
+"""
+Streaming uploads to Supabase storage.
+
+The upload endpoints used to read the whole document into memory and open a
+new httpx client per request. Here the body is forwarded to storage chunk by
+chunk through one pooled client, the SHA-256 is computed on the way through
+and the size limit is enforced as bytes arrive, so memory per upload is
+bounded by the chunk size rather than the file size.
+"""
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+_storage_client: Optional[httpx.AsyncClient] = None
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int, received_bytes: int):
+        self.max_bytes = max_bytes
+        self.received_bytes = received_bytes
+        super().__init__(f"Upload exceeds maximum allowed size of {max_bytes} bytes")
+
+
+@dataclass
+class StreamedUpload:
+    """Result of forwarding an upload to storage."""
+    status_code: int
+    response_text: str
+    bytes_len: int
+    file_sha256: str
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code in (200, 201)
+
+
+class HashingByteStream:
+    """
+    Async byte stream that hashes and counts chunks as they pass through.
+
+    Raises UploadTooLargeError as soon as more than max_bytes have been read,
+    which aborts the in-flight storage request.
+    """
+
+    def __init__(self, chunks: AsyncIterable[bytes], max_bytes: int):
+        self._chunks = chunks
+        self.max_bytes = max_bytes
+        self.bytes_len = 0
+        self._sha256 = hashlib.sha256()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.bytes_len += len(chunk)
+            if self.bytes_len > self.max_bytes:
+                raise UploadTooLargeError(self.max_bytes, self.bytes_len)
+            self._sha256.update(chunk)
+            yield chunk
+
+    @property
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+
+async def iter_upload_file(file, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield a FastAPI UploadFile in fixed-size chunks."""
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def get_storage_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled client used for storage uploads."""
+    global _storage_client
+    if _storage_client is None or _storage_client.is_closed:
+        _storage_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=10.0, read=120.0, write=120.0, pool=30.0),
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("STORAGE_MAX_CONNECTIONS", "50")),
+                max_keepalive_connections=int(os.getenv("STORAGE_MAX_KEEPALIVE_CONNECTIONS", "20"))
+            )
+        )
+    return _storage_client
+
+
+async def close_storage_client() -> None:
+    """Close and discard the process-wide storage client."""
+    global _storage_client
+    if _storage_client is not None:
+        await _storage_client.aclose()
+        _storage_client = None
+
+
+def get_storage_credentials() -> tuple:
+    """Return (storage_url, service_role_key) for the current environment."""
+    from config.environment_loader import load_environment
+
+    # Load environment variables based on deployment context
+    load_environment()
+    environment = os.getenv("ENVIRONMENT", "development")
+
+    storage_url = os.getenv("SUPABASE_URL", "http://127.0.0.1:54321")
+    # Use development key for local development
+    if environment == "development":
+        service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+    else:
+        service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", os.getenv("SERVICE_ROLE_KEY", ""))
+    return storage_url, service_role_key
+
+
+async def stream_to_storage(
+    bucket: str,
+    key: str,
+    chunks: AsyncIterable[bytes],
+    content_type: str,
+    max_bytes: int,
+    content_length: Optional[int] = None,
+    storage_url: Optional[str] = None,
+    service_role_key: Optional[str] = None,
+    upsert: bool = True,
+    client: Optional[httpx.AsyncClient] = None
+) -> StreamedUpload:
+    """
+    Stream an upload body to Supabase storage.
+
+    Args:
+        bucket: Storage bucket
+        key: Object key within the bucket
+        chunks: Async iterable of body chunks
+        content_type: Content type to store the object with
+        max_bytes: Maximum accepted size
+        content_length: Declared size, rejected up front when over the limit
+            and forwarded so storage does not need chunked transfer encoding
+        storage_url: Supabase URL (defaults to the environment)
+        service_role_key: Service role key (defaults to the environment)
+        upsert: Overwrite an existing object at the same key
+        client: HTTP client (defaults to the shared pooled client)
+
+    Returns:
+        StreamedUpload with the storage response, byte count and SHA-256
+
+    Raises:
+        UploadTooLargeError: If the declared or streamed size exceeds max_bytes
+    """
+    if content_length is not None and content_length > max_bytes:
+        raise UploadTooLargeError(max_bytes, content_length)
+
+    if storage_url is None or service_role_key is None:
+        default_url, default_key = get_storage_credentials()
+        storage_url = storage_url or default_url
+        service_role_key = service_role_key or default_key
+
+    headers = {
+        "Content-Type": content_type,
+        "Authorization": f"Bearer {service_role_key}",
+        "apikey": service_role_key,
+        "x-upsert": "true" if upsert else "false"
+    }
+    if content_length is not None:
+        headers["Content-Length"] = str(content_length)
+
+    stream = HashingByteStream(chunks, max_bytes)
+    # Use POST method (works reliably with local Supabase)
+    response = await (client or get_storage_client()).post(
+        f"{storage_url}/storage/v1/object/{bucket}/{key}",
+        content=stream,
+        headers=headers
+    )
+
+    return StreamedUpload(
+        status_code=response.status_code,
+        response_text=response.text,
+        bytes_len=stream.bytes_len,
+        file_sha256=stream.hexdigest
+    )
+
+
+async def delete_from_storage(
+    bucket: str,
+    key: str,
+    storage_url: Optional[str] = None,
+    service_role_key: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> bool:
+    """
+    Delete an object from Supabase storage.
+
+    Args:
+        bucket: Storage bucket
+        key: Object key within the bucket
+        storage_url: Supabase URL (defaults to the environment)
+        service_role_key: Service role key (defaults to the environment)
+        client: HTTP client (defaults to the shared pooled client)
+
+    Returns:
+        True if storage removed the object
+    """
+    if storage_url is None or service_role_key is None:
+        default_url, default_key = get_storage_credentials()
+        storage_url = storage_url or default_url
+        service_role_key = service_role_key or default_key
+
+    response = await (client or get_storage_client()).delete(
+        f"{storage_url}/storage/v1/object/{bucket}/{key}",
+        headers={"Authorization": f"Bearer {service_role_key}", "apikey": service_role_key}
+    )
+    if response.status_code not in (200, 204):
+        logger.warning(f"Storage delete failed - bucket: {bucket}, key: {key}, status: {response.status_code}")
+        return False
+    return True
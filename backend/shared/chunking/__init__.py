@@ -0,0 +1,13 @@
+from .markdown_chunker import (
+    CHUNKER_NAME,
+    CHUNKER_VERSION,
+    PAGE_MARKER_TEMPLATE,
+    Chunk,
+    MarkdownChunker,
+    TokenCounter,
+)
+
+__all__ = [
+    'CHUNKER_NAME', 'CHUNKER_VERSION', 'PAGE_MARKER_TEMPLATE',
+    'Chunk', 'MarkdownChunker', 'TokenCounter',
+]
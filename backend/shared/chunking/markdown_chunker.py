@@ -0,0 +1,244 @@
+"""
+Structure-aware, token-bounded markdown chunker.
+
+Parsed documents are split in a single pass over their lines:
+- a heading always starts a new chunk and updates the section path;
+- a chunk is closed before it would exceed max_tokens, and the next chunk
+  starts with up to overlap_tokens of trailing lines from the same section;
+- page markers (<!-- page N -->) are consumed to track each chunk's page range;
+- lines inside fenced code blocks are never treated as headings.
+
+Token counts are computed once per line while chunking and stored with the
+chunk, so retrieval can enforce token budgets without re-tokenizing.
+"""
+
+import io
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on the deployment image
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+CHUNKER_NAME = "markdown-structured"
+CHUNKER_VERSION = "1"
+
+# Encoding used by text-embedding-3-small
+TOKEN_ENCODING = "cl100k_base"
+
+# Written at the start of each page: requested from LlamaParse as page_prefix
+# and added by the webhook when it joins per-page results
+PAGE_MARKER_TEMPLATE = "<!-- page {page} -->"
+PAGE_MARKER_RE = re.compile(r"^\s*<!--\s*page\s+(\d+)\s*-->\s*$")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
+# Fallback when tiktoken or its encoding file is unavailable: ~4 characters
+# per token for English
+CHARS_PER_TOKEN = 4
+
+
+class TokenCounter:
+    """Counts tokens with tiktoken when available, else a character estimate."""
+
+    def __init__(self, encoding_name: str = TOKEN_ENCODING):
+        self.encoding = None
+        if tiktoken is None:
+            return
+        try:
+            # Downloads the BPE file on first use, which fails on offline hosts
+            self.encoding = tiktoken.get_encoding(encoding_name)
+        except Exception as e:
+            logger.warning(
+                f"tiktoken encoding {encoding_name} unavailable, estimating tokens from characters: {e}"
+            )
+
+    @property
+    def exact(self) -> bool:
+        return self.encoding is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.encoding is not None:
+            return len(self.encoding.encode_ordinary(text))
+        return -(-len(text) // CHARS_PER_TOKEN)
+
+    def split(self, text: str, max_tokens: int) -> List[Tuple[str, int]]:
+        """Split text that is longer than max_tokens into (piece, tokens) pairs."""
+        if self.encoding is not None:
+            tokens = self.encoding.encode_ordinary(text)
+            return [
+                (self.encoding.decode(tokens[i:i + max_tokens]), len(tokens[i:i + max_tokens]))
+                for i in range(0, len(tokens), max_tokens)
+            ]
+        step = max_tokens * CHARS_PER_TOKEN
+        return [(text[i:i + step], self.count(text[i:i + step])) for i in range(0, len(text), step)]
+
+
+@dataclass
+class Chunk:
+    """One chunk and the structure it was cut from."""
+    ord: int
+    text: str
+    tokens: int
+    section_path: List[int] = field(default_factory=list)
+    section_title: Optional[str] = None
+    page_start: Optional[int] = None
+    page_end: Optional[int] = None
+
+    def to_dict(self, chunker_name: str = CHUNKER_NAME, chunker_version: str = CHUNKER_VERSION) -> Dict[str, Any]:
+        """Row shape used by the worker's chunk insert."""
+        return {
+            "text": self.text,
+            "ord": self.ord,
+            "tokens": self.tokens,
+            "section_path": self.section_path,
+            "section_title": self.section_title,
+            "page_start": self.page_start,
+            "page_end": self.page_end,
+            "chunker_name": chunker_name,
+            "chunker_version": chunker_version,
+        }
+
+
+class MarkdownChunker:
+    """
+    Single-pass markdown chunker.
+
+    Args:
+        max_tokens: Upper bound on tokens per chunk
+        overlap_tokens: Tokens of trailing context repeated at the start of
+            the next chunk within the same section
+        counter: Token counter (defaults to cl100k_base)
+    """
+
+    def __init__(self, max_tokens: int = 512, overlap_tokens: int = 64, counter: Optional[TokenCounter] = None):
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError("overlap_tokens must be in [0, max_tokens)")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.counter = counter or TokenCounter()
+
+    def chunk(self, content: Union[str, Iterable[str]]) -> Iterator[Chunk]:
+        """
+        Yield chunks for a markdown document.
+
+        Args:
+            content: The whole document, or an iterable of lines (e.g. a file
+                object), which is consumed lazily
+        """
+        lines = io.StringIO(content) if isinstance(content, str) else content
+
+        # Current chunk: (line, tokens, page) entries
+        buffer: Deque[Tuple[str, int, Optional[int]]] = deque()
+        buffer_tokens = 0
+        has_body = False
+        ord_ = 0
+        page: Optional[int] = None
+        fence: Optional[str] = None
+        section_counts: List[int] = []
+        section_titles: List[str] = []
+
+        def emit() -> Chunk:
+            nonlocal ord_
+            text = "".join(line for line, _, _ in buffer).strip()
+            pages = [p for _, _, p in buffer if p is not None]
+            chunk = Chunk(
+                ord=ord_,
+                text=text,
+                tokens=buffer_tokens,
+                section_path=list(section_counts),
+                section_title=section_titles[-1] if section_titles else None,
+                page_start=min(pages) if pages else None,
+                page_end=max(pages) if pages else None,
+            )
+            ord_ += 1
+            return chunk
+
+        for line in lines:
+            if not line.endswith("\n"):
+                line += "\n"
+
+            marker = PAGE_MARKER_RE.match(line)
+            if marker:
+                page = int(marker.group(1))
+                continue
+
+            # Track fenced code so '#' comments in code are not headings
+            fence_match = FENCE_RE.match(line)
+            if fence_match:
+                marker_run = fence_match.group(1)
+                if fence is None:
+                    fence = marker_run
+                elif marker_run[0] == fence[0] and len(marker_run) >= len(fence) and not line[fence_match.end():].strip():
+                    fence = None
+
+            heading = HEADING_RE.match(line) if fence is None and not fence_match else None
+            if heading:
+                # Structure boundary: close the chunk, no overlap across sections
+                if has_body:
+                    yield emit()
+                buffer.clear()
+                buffer_tokens = 0
+                has_body = False
+
+                level = len(heading.group(1))
+                del section_counts[level:]
+                del section_titles[level - 1:]
+                section_counts.extend([0] * (level - len(section_counts)))
+                section_counts[level - 1] += 1
+                section_titles.append(heading.group(2))
+
+            tokens = self.counter.count(line)
+            pieces = self.counter.split(line, self.max_tokens) if tokens > self.max_tokens else [(line, tokens)]
+
+            for piece, piece_tokens in pieces:
+                if buffer and buffer_tokens + piece_tokens > self.max_tokens:
+                    if has_body:
+                        yield emit()
+                        buffer_tokens = self._keep_overlap(buffer, piece_tokens)
+                        has_body = False
+                    else:
+                        # Only a heading is buffered; drop it from the text
+                        # (it stays in section_title) rather than exceed the bound
+                        buffer.clear()
+                        buffer_tokens = 0
+
+                buffer.append((piece, piece_tokens, page))
+                buffer_tokens += piece_tokens
+                if piece.strip() and not heading:
+                    has_body = True
+
+            # A heading-only buffer is kept so the heading leads its section
+            if heading:
+                has_body = False
+
+        # A trailing heading with no body is dropped unless it is all there is
+        if has_body or (ord_ == 0 and "".join(line for line, _, _ in buffer).strip()):
+            yield emit()
+
+    def _keep_overlap(self, buffer: Deque[Tuple[str, int, Optional[int]]], incoming_tokens: int) -> int:
+        """Trim buffer to the trailing overlap that still leaves room for the next line."""
+        budget = min(self.overlap_tokens, self.max_tokens - incoming_tokens)
+        kept: List[Tuple[str, int, Optional[int]]] = []
+        kept_tokens = 0
+        while buffer and kept_tokens + buffer[-1][1] <= budget:
+            entry = buffer.pop()
+            kept.append(entry)
+            kept_tokens += entry[1]
+        buffer.clear()
+        buffer.extend(reversed(kept))
+        return kept_tokens
+
+    def chunk_document(self, content: Union[str, Iterable[str]]) -> List[Dict[str, Any]]:
+        """Chunk a document into the row dicts the worker stores."""
+        return [chunk.to_dict() for chunk in self.chunk(content)]
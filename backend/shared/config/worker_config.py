@@ -29,10 +29,35 @@ class WorkerConfig:
     max_retries: int = 3
     retry_base_delay: int = 3
     
+    # Job concurrency configuration (job_batch_size=1 keeps one job at a time)
+    job_batch_size: int = 1
+    parse_concurrency: int = 4
+    chunk_concurrency: int = 4
+    embed_concurrency: int = 2
+    shutdown_timeout: int = 30  # Seconds stop() waits for in-flight jobs
+    
+    # Job wakeup configuration (LISTEN/NOTIFY; polling becomes a fallback)
+    listen_for_jobs: bool = True
+    fallback_poll_interval: int = 30
+    
+    # Claim lease: a claimed job is skipped by other workers until it expires
+    claim_lease_seconds: int = 900
+    
+    # Fast lane: chain validation -> chunking -> embedding in-process
+    fast_lane: bool = False
+    
+    # Chunking: token-bounded chunks with overlap within a section
+    chunk_max_tokens: int = 512
+    chunk_overlap_tokens: int = 64
+    
     # Rate limiting configuration
     openai_requests_per_minute: int = 3500
-    openai_tokens_per_minute: int = 90000
+    openai_tokens_per_minute: int = 1_000_000  # OpenAI tier-1 embedding limit
     openai_max_batch_size: int = 256
+    openai_embedding_concurrency: int = 4
+    
+    # Reuse stored embeddings for chunks whose text was embedded before
+    embedding_reuse_enabled: bool = True
     
     # Circuit breaker configuration
     failure_threshold: int = 5
@@ -79,10 +104,31 @@ class WorkerConfig:
             max_retries=int(os.getenv("WORKER_MAX_RETRIES", "0")),  # Disable retries to match reference script
             retry_base_delay=int(os.getenv("WORKER_RETRY_BASE_DELAY", "3")),
             
+            # Job concurrency
+            job_batch_size=int(os.getenv("WORKER_JOB_BATCH_SIZE", "1")),
+            parse_concurrency=int(os.getenv("WORKER_PARSE_CONCURRENCY", "4")),
+            chunk_concurrency=int(os.getenv("WORKER_CHUNK_CONCURRENCY", "4")),
+            embed_concurrency=int(os.getenv("WORKER_EMBED_CONCURRENCY", "2")),
+            shutdown_timeout=int(os.getenv("WORKER_SHUTDOWN_TIMEOUT", "30")),
+            
+            # Job wakeup
+            listen_for_jobs=os.getenv("WORKER_LISTEN_FOR_JOBS", "true").lower() == "true",
+            fallback_poll_interval=int(os.getenv("WORKER_FALLBACK_POLL_INTERVAL", "30")),
+            claim_lease_seconds=int(os.getenv("WORKER_CLAIM_LEASE_SECONDS", "900")),
+            
+            # Fast lane
+            fast_lane=os.getenv("WORKER_FAST_LANE", "false").lower() == "true",
+            
+            # Chunking
+            chunk_max_tokens=int(os.getenv("CHUNK_MAX_TOKENS", "512")),
+            chunk_overlap_tokens=int(os.getenv("CHUNK_OVERLAP_TOKENS", "64")),
+            
             # Rate limiting
             openai_requests_per_minute=int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "3500")),
-            openai_tokens_per_minute=int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "90000")),
+            openai_tokens_per_minute=int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "1000000")),
             openai_max_batch_size=int(os.getenv("OPENAI_MAX_BATCH_SIZE", "256")),
+            openai_embedding_concurrency=int(os.getenv("OPENAI_EMBEDDING_CONCURRENCY", "4")),
+            embedding_reuse_enabled=os.getenv("EMBEDDING_REUSE_ENABLED", "true").lower() == "true",
             
             # Circuit breaker
             failure_threshold=int(os.getenv("WORKER_FAILURE_THRESHOLD", "5")),
@@ -113,9 +159,22 @@ class WorkerConfig:
             "poll_interval": self.poll_interval,
             "max_retries": self.max_retries,
             "retry_base_delay": self.retry_base_delay,
+            "job_batch_size": self.job_batch_size,
+            "parse_concurrency": self.parse_concurrency,
+            "chunk_concurrency": self.chunk_concurrency,
+            "embed_concurrency": self.embed_concurrency,
+            "shutdown_timeout": self.shutdown_timeout,
+            "listen_for_jobs": self.listen_for_jobs,
+            "fallback_poll_interval": self.fallback_poll_interval,
+            "claim_lease_seconds": self.claim_lease_seconds,
+            "fast_lane": self.fast_lane,
+            "chunk_max_tokens": self.chunk_max_tokens,
+            "chunk_overlap_tokens": self.chunk_overlap_tokens,
             "openai_requests_per_minute": self.openai_requests_per_minute,
             "openai_tokens_per_minute": self.openai_tokens_per_minute,
             "openai_max_batch_size": self.openai_max_batch_size,
+            "openai_embedding_concurrency": self.openai_embedding_concurrency,
+            "embedding_reuse_enabled": self.embedding_reuse_enabled,
             "failure_threshold": self.failure_threshold,
             "recovery_timeout": self.recovery_timeout,
             "log_level": self.log_level,
@@ -143,9 +202,34 @@ class WorkerConfig:
         if self.retry_base_delay <= 0:
             raise ValueError("retry_base_delay must be positive")
         
+        if self.claim_lease_seconds <= 0:
+            raise ValueError("claim_lease_seconds must be positive")
+        
+        if self.chunk_max_tokens <= 0:
+            raise ValueError("chunk_max_tokens must be positive")
+        
+        if not 0 <= self.chunk_overlap_tokens < self.chunk_max_tokens:
+            raise ValueError("chunk_overlap_tokens must be non-negative and less than chunk_max_tokens")
+        
+        if self.fallback_poll_interval <= 0:
+            raise ValueError("fallback_poll_interval must be positive")
+        
+        if self.job_batch_size <= 0:
+            raise ValueError("job_batch_size must be positive")
+        
+        for field in ("parse_concurrency", "chunk_concurrency", "embed_concurrency"):
+            if getattr(self, field) <= 0:
+                raise ValueError(f"{field} must be positive")
+        
+        if self.shutdown_timeout < 0:
+            raise ValueError("shutdown_timeout must be non-negative")
+        
         if self.openai_max_batch_size <= 0:
             raise ValueError("openai_max_batch_size must be positive")
         
+        if self.openai_embedding_concurrency <= 0:
+            raise ValueError("openai_embedding_concurrency must be positive")
+        
         return True
     
     def get_openai_config(self) -> Dict[str, Any]:
@@ -157,6 +241,7 @@ class WorkerConfig:
             "requests_per_minute": self.openai_requests_per_minute,
             "tokens_per_minute": self.openai_tokens_per_minute,
             "max_batch_size": self.openai_max_batch_size,
+            "embedding_concurrency": self.openai_embedding_concurrency,
             "failure_threshold": self.failure_threshold,
             "recovery_timeout": self.recovery_timeout
         }
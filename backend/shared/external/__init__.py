@@ -1,5 +1,5 @@
 from .llamaparse_real import RealLlamaParseService
 from .openai_client import OpenAIClient
+from .embedding_service import EmbeddingService, get_embedding_service
 
-__all__ = ['RealLlamaParseService', 'OpenAIClient']
-
+__all__ = ['RealLlamaParseService', 'OpenAIClient', 'EmbeddingService', 'get_embedding_service']
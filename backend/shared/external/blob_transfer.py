@@ -0,0 +1,218 @@
+"""
+Streaming blob transfer from storage into a multipart upload.
+
+Documents sent to LlamaParse used to be downloaded whole into memory and
+re-posted through a fresh client. transfer_blob streams the storage GET
+response straight into the multipart request body instead, so only one chunk
+of the document is held at a time and both legs reuse pooled connections.
+"""
+
+import hashlib
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+
+# Bytes of the document kept for logging (e.g. the %PDF- header check)
+HEAD_BYTES = 64
+
+# Characters percent-encoded in multipart parameter values (HTML5 form
+# encoding, as httpx does for files=): quotes and control characters other
+# than ESC would otherwise break the part headers
+_PARAM_ESCAPE_RE = re.compile(r'["\x00-\x1a\x1c-\x1f]')
+
+
+def _quote_param(value: Any) -> str:
+    """Escape a Content-Disposition parameter value for use inside quotes."""
+    return _PARAM_ESCAPE_RE.sub(
+        lambda match: f"%{ord(match.group(0)):02X}",
+        str(value).replace("\\", "\\\\")
+    )
+
+
+class BlobSourceError(Exception):
+    """Raised when the source blob cannot be read before any bytes are sent."""
+
+
+@dataclass
+class BlobTransferStats:
+    """Per-document transfer metrics."""
+    bytes: int = 0
+    source_ttfb_ms: Optional[float] = None
+    transfer_seconds: float = 0.0
+    sha256: Optional[str] = None
+    head: bytes = field(default=b"", repr=False)
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.transfer_seconds if self.transfer_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bytes": self.bytes,
+            "source_ttfb_ms": round(self.source_ttfb_ms, 2) if self.source_ttfb_ms is not None else None,
+            "transfer_seconds": round(self.transfer_seconds, 3),
+            "bytes_per_second": round(self.bytes_per_second, 1),
+            "sha256": self.sha256,
+        }
+
+
+class MultipartStream:
+    """
+    multipart/form-data body that streams one file part.
+
+    Plain fields are encoded up front; the file part is yielded chunk by chunk
+    from an async iterable. When the file length is known the total
+    Content-Length is computed so no chunked transfer encoding is needed.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Any],
+        file_field: str,
+        filename: str,
+        content_type: str,
+        chunks: AsyncIterable[bytes],
+        file_length: Optional[int] = None,
+        stats: Optional[BlobTransferStats] = None
+    ):
+        self.boundary = uuid.uuid4().hex
+        self._chunks = chunks
+        self.stats = stats or BlobTransferStats()
+        self._sha256 = hashlib.sha256()
+
+        parts = []
+        for name, value in fields.items():
+            if value is None:
+                continue
+            parts.append(
+                f'--{self.boundary}\r\n'
+                f'Content-Disposition: form-data; name="{_quote_param(name)}"\r\n\r\n'
+                f'{value}\r\n'
+            )
+        parts.append(
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{_quote_param(file_field)}"; '
+            f'filename="{_quote_param(filename)}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        )
+        self._prefix = "".join(parts).encode("utf-8")
+        self._suffix = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self.file_length = file_length
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self) -> Optional[int]:
+        if self.file_length is None:
+            return None
+        return len(self._prefix) + self.file_length + len(self._suffix)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": self.content_type}
+        if self.content_length is not None:
+            headers["Content-Length"] = str(self.content_length)
+        return headers
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._prefix
+        async for chunk in self._chunks:
+            if not chunk:
+                continue
+            if len(self.stats.head) < HEAD_BYTES:
+                self.stats.head += chunk[:HEAD_BYTES - len(self.stats.head)]
+            self.stats.bytes += len(chunk)
+            self._sha256.update(chunk)
+            yield chunk
+        self.stats.sha256 = self._sha256.hexdigest()
+        yield self._suffix
+
+
+async def transfer_blob(
+    source_client: httpx.AsyncClient,
+    source_url: str,
+    dest_client: httpx.AsyncClient,
+    dest_url: str,
+    fields: Dict[str, Any],
+    filename: str,
+    content_type: str = "application/pdf",
+    file_field: str = "file",
+    source_headers: Optional[Dict[str, str]] = None,
+    dest_headers: Optional[Dict[str, str]] = None,
+    timeout: Any = httpx.USE_CLIENT_DEFAULT
+) -> Tuple[httpx.Response, BlobTransferStats]:
+    """
+    Stream a blob from source_url into a multipart POST to dest_url.
+
+    Args:
+        source_client: Pooled client for the storage GET
+        source_url: URL of the blob
+        dest_client: Pooled client for the upload
+        dest_url: Multipart upload endpoint
+        fields: Plain form fields sent before the file part
+        filename: Filename for the file part
+        content_type: Content type of the file part
+        file_field: Form field name of the file part
+        source_headers: Extra headers for the storage GET
+        dest_headers: Extra headers for the upload
+        timeout: Timeout override for the upload
+
+    Returns:
+        The upload response (body read) and transfer metrics
+
+    Raises:
+        BlobSourceError: If the blob cannot be fetched or is empty; nothing
+            has been sent to dest_url in that case
+    """
+    stats = BlobTransferStats()
+    start = time.perf_counter()
+
+    try:
+        source = await source_client.send(
+            source_client.build_request("GET", source_url, headers=source_headers),
+            stream=True
+        )
+    except httpx.HTTPError as e:
+        raise BlobSourceError(f"Failed to fetch {source_url}: {e}") from e
+
+    try:
+        if source.status_code != 200:
+            await source.aread()
+            raise BlobSourceError(
+                f"Storage returned {source.status_code} for {source_url}: {source.text[:200]}"
+            )
+
+        # aiter_bytes decodes any content-encoding, so the upstream length
+        # only matches the bytes sent when the blob is not encoded
+        content_length = source.headers.get("content-length")
+        content_encoding = source.headers.get("content-encoding", "identity").strip().lower()
+        file_length = int(content_length) if content_length and content_encoding == "identity" else None
+        if file_length == 0:
+            raise BlobSourceError(f"Blob is empty: {source_url}")
+
+        async def timed_chunks() -> AsyncIterator[bytes]:
+            async for chunk in source.aiter_bytes():
+                if stats.source_ttfb_ms is None:
+                    stats.source_ttfb_ms = (time.perf_counter() - start) * 1000
+                yield chunk
+
+        body = MultipartStream(
+            fields, file_field, filename, content_type, timed_chunks(),
+            file_length=file_length, stats=stats
+        )
+        response = await dest_client.post(
+            dest_url,
+            content=body,
+            headers={**(dest_headers or {}), **body.headers()},
+            timeout=timeout
+        )
+    finally:
+        await source.aclose()
+
+    stats.transfer_seconds = time.perf_counter() - start
+    return response, stats
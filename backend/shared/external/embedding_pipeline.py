@@ -0,0 +1,426 @@
+"""
+Pipelined embedding engine with adaptive rate control.
+
+Embedding batches used to run strictly in sequence: call OpenAI, validate,
+write to Postgres, sleep, repeat. The pipeline keeps several API calls in
+flight under an adaptive token bucket and overlaps them with validation and
+write-back through bounded queues, so the API is never idle while a batch is
+being stored.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """Parse OpenAI reset headers such as '1s', '6m0s' or '250ms' into seconds."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_SECONDS[unit] for amount, unit in parts)
+
+
+class AdaptiveRateLimiter:
+    """
+    Request and token buckets that adapt to upstream feedback.
+
+    Capacity starts at the configured limits and is refreshed from the
+    x-ratelimit-* response headers when present. A 429 halves the effective
+    rate and pauses all callers until Retry-After (or the reset header)
+    elapses; each success then restores a small share of the rate
+    (additive increase, multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 3000,
+        tokens_per_minute: float = 1_000_000,
+        min_rate_fraction: float = 0.05,
+        recovery_step: float = 0.05
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Configured request limit
+            tokens_per_minute: Configured token limit
+            min_rate_fraction: Floor for the rate after repeated 429s
+            recovery_step: Rate fraction restored per successful response
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._configured_limits = (requests_per_minute, tokens_per_minute)
+        self.min_rate_fraction = min_rate_fraction
+        self.recovery_step = recovery_step
+
+        self.rate_fraction = 1.0
+        self._request_tokens = float(requests_per_minute)
+        self._token_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.rate_limited_count = 0
+        self.wait_seconds_total = 0.0
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request and `tokens` tokens are available, then take them."""
+        # A single request larger than the bucket would never fit; cap it
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._request_tokens >= 1 and self._token_tokens >= tokens:
+                        self._request_tokens -= 1
+                        self._token_tokens -= tokens
+                        return
+                    request_wait = (1 - self._request_tokens) / self._request_rate if self._request_tokens < 1 else 0.0
+                    token_wait = (tokens - self._token_tokens) / self._token_rate if self._token_tokens < tokens else 0.0
+                    wait = max(request_wait, token_wait, 0.001)
+                self.wait_seconds_total += wait
+                await asyncio.sleep(wait)
+
+    def configure(self, requests_per_minute: float, tokens_per_minute: float) -> None:
+        """
+        Apply new configured limits.
+
+        Repeating the current configuration is a no-op, so limits refreshed
+        from response headers are not reset by callers that pass the same
+        config on every run.
+        """
+        limits = (float(requests_per_minute), float(tokens_per_minute))
+        if limits == self._configured_limits:
+            return
+        self._configured_limits = limits
+        self.requests_per_minute, self.tokens_per_minute = limits
+        self._request_tokens = min(self._request_tokens, self.requests_per_minute)
+        self._token_tokens = min(self._token_tokens, self.tokens_per_minute)
+
+    def observe_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Feed an upstream response back into the limiter.
+
+        Args:
+            status_code: HTTP status of the response
+            headers: Response headers (case-insensitive mapping preferred)
+        """
+        limit_requests = _header_float(headers, "x-ratelimit-limit-requests")
+        limit_tokens = _header_float(headers, "x-ratelimit-limit-tokens")
+        if limit_requests:
+            self.requests_per_minute = limit_requests
+        if limit_tokens:
+            self.tokens_per_minute = limit_tokens
+
+        # Never believe we have more headroom than the server reports
+        remaining_requests = _header_float(headers, "x-ratelimit-remaining-requests")
+        remaining_tokens = _header_float(headers, "x-ratelimit-remaining-tokens")
+        if remaining_requests is not None:
+            self._request_tokens = min(self._request_tokens, remaining_requests)
+        if remaining_tokens is not None:
+            self._token_tokens = min(self._token_tokens, remaining_tokens)
+
+        if status_code == 429:
+            self.rate_limited_count += 1
+            self.rate_fraction = max(self.min_rate_fraction, self.rate_fraction / 2)
+            retry_after = (
+                _header_float(headers, "retry-after")
+                or parse_reset_duration(_header(headers, "x-ratelimit-reset-requests"))
+                or parse_reset_duration(_header(headers, "x-ratelimit-reset-tokens"))
+                or 1.0
+            )
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._request_tokens = min(self._request_tokens, 0.0)
+            logger.warning(
+                f"Embedding API rate limited; pausing {retry_after:.2f}s, "
+                f"rate now {self.rate_fraction:.0%} of {self.requests_per_minute:.0f} req/min"
+            )
+        elif 200 <= status_code < 300 and self.rate_fraction < 1.0:
+            self.rate_fraction = min(1.0, self.rate_fraction + self.recovery_step)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "rate_fraction": self.rate_fraction,
+            "rate_limited_count": self.rate_limited_count,
+            "wait_seconds_total": round(self.wait_seconds_total, 3),
+        }
+
+    @property
+    def _request_rate(self) -> float:
+        return self.requests_per_minute * self.rate_fraction / 60.0
+
+    @property
+    def _token_rate(self) -> float:
+        return self.tokens_per_minute * self.rate_fraction / 60.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_tokens = min(
+            self.requests_per_minute * self.rate_fraction,
+            self._request_tokens + elapsed * self._request_rate
+        )
+        self._token_tokens = min(
+            self.tokens_per_minute * self.rate_fraction,
+            self._token_tokens + elapsed * self._token_rate
+        )
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.title())
+    return value
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = _header(headers, name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def estimate_tokens(texts: Sequence[str]) -> int:
+    """Rough token estimate for rate limiting (1 token ≈ 4 characters)."""
+    return sum(math.ceil(len(text) / 4) for text in texts)
+
+
+@dataclass
+class EmbeddingPipelineStats:
+    """Throughput and stage timing for one pipeline run."""
+    chunks: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    embed_seconds: float = 0.0
+    write_seconds: float = 0.0
+    peak_inflight: int = 0
+    limiter: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "chunks_per_second": round(self.chunks_per_second, 1),
+            "embed_seconds": round(self.embed_seconds, 3),
+            "write_seconds": round(self.write_seconds, 3),
+            "peak_inflight": self.peak_inflight,
+            "limiter": self.limiter,
+        }
+
+
+# embed(texts) -> embeddings; sink(batch_index, items, embeddings) validates and stores
+EmbedFunc = Callable[[List[str]], Awaitable[List[List[float]]]]
+SinkFunc = Callable[[int, List[Any], List[List[float]]], Awaitable[None]]
+
+
+class EmbeddingPipeline:
+    """
+    Runs embedding batches concurrently and overlaps them with write-back.
+
+    Batches flow producer -> embed workers (bounded by `concurrency` and the
+    rate limiter) -> bounded write queue -> writer. A failure in any stage
+    cancels the rest and is re-raised to the caller.
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFunc,
+        sink: SinkFunc,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        batch_size: int = 256,
+        concurrency: int = 4,
+        write_queue_size: Optional[int] = None,
+        text_getter: Callable[[Any], str] = lambda item: item["text"],
+        max_batch_tokens: Optional[int] = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            embed: Coroutine returning one embedding per input text
+            sink: Coroutine that validates and stores one embedded batch
+            limiter: Rate limiter shared with other callers of the API
+            batch_size: Items per embedding request
+            concurrency: Embedding requests in flight at once
+            write_queue_size: Embedded batches allowed to wait for the writer
+            text_getter: Extracts the text to embed from an item
+            max_batch_tokens: Estimated tokens allowed per request; defaults
+                to the limiter's tokens per minute shared across the
+                concurrent requests
+        """
+        self.embed = embed
+        self.sink = sink
+        self.limiter = limiter or get_openai_rate_limiter()
+        self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
+        self.write_queue_size = write_queue_size or self.concurrency
+        self.text_getter = text_getter
+        self.max_batch_tokens = max_batch_tokens
+
+    async def run(self, items: Sequence[Any]) -> EmbeddingPipelineStats:
+        """Embed and store all items; returns throughput statistics."""
+        stats = EmbeddingPipelineStats(chunks=len(items))
+        start = time.perf_counter()
+
+        batch_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.write_queue_size)
+        inflight = 0
+
+        async def produce():
+            for index, batch in enumerate(self._batches(items)):
+                await batch_queue.put((index, batch))
+            for _ in range(self.concurrency):
+                await batch_queue.put(None)
+
+        async def embed_worker():
+            nonlocal inflight
+            while True:
+                job = await batch_queue.get()
+                if job is None:
+                    return
+                index, batch = job
+                texts = [self.text_getter(item) for item in batch]
+                await self.limiter.acquire(estimate_tokens(texts))
+                inflight += 1
+                stats.peak_inflight = max(stats.peak_inflight, inflight)
+                call_start = time.perf_counter()
+                try:
+                    embeddings = await self.embed(texts)
+                finally:
+                    inflight -= 1
+                    stats.embed_seconds += time.perf_counter() - call_start
+                if len(embeddings) != len(batch):
+                    raise RuntimeError(
+                        f"Embedding count mismatch in batch {index}: expected {len(batch)}, got {len(embeddings)}"
+                    )
+                await write_queue.put((index, batch, embeddings))
+
+        async def writer():
+            while True:
+                job = await write_queue.get()
+                if job is None:
+                    return
+                index, batch, embeddings = job
+                write_start = time.perf_counter()
+                await self.sink(index, batch, embeddings)
+                stats.write_seconds += time.perf_counter() - write_start
+                stats.batches += 1
+
+        async def embed_stage():
+            workers = [asyncio.create_task(embed_worker()) for _ in range(self.concurrency)]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # gather does not cancel siblings; stop them before re-raising
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+            await write_queue.put(None)
+
+        tasks = [
+            asyncio.create_task(produce()),
+            asyncio.create_task(embed_stage()),
+            asyncio.create_task(writer()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            stats.elapsed_seconds = time.perf_counter() - start
+            stats.limiter = self.limiter.get_stats()
+
+        return stats
+
+    def _batches(self, items: Sequence[Any]) -> Iterator[List[Any]]:
+        """
+        Split items into batches of at most batch_size items and the token budget.
+
+        A batch larger than the limiter's token bucket would drain it in one
+        request and stall the next one for a full minute, so batches are also
+        cut at a share of the per-minute token limit.
+        """
+        max_tokens = self.max_batch_tokens or max(
+            1, int(self.limiter.tokens_per_minute / self.concurrency)
+        )
+        batch: List[Any] = []
+        batch_tokens = 0
+        for item in items:
+            item_tokens = estimate_tokens([self.text_getter(item)])
+            if batch and (len(batch) >= self.batch_size or batch_tokens + item_tokens > max_tokens):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(item)
+            batch_tokens += item_tokens
+        if batch:
+            yield batch
+
+
+# Global limiter for OpenAI embedding traffic in this process
+_openai_rate_limiter: Optional[AdaptiveRateLimiter] = None
+
+
+def get_openai_rate_limiter(
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None
+) -> AdaptiveRateLimiter:
+    """
+    Get the process-wide adaptive limiter for OpenAI embedding requests.
+
+    Args:
+        requests_per_minute: Configured request limit (e.g.
+            WorkerConfig.openai_requests_per_minute); OPENAI_EMBEDDING_RPM
+            is used when omitted
+        tokens_per_minute: Configured token limit; OPENAI_EMBEDDING_TPM is
+            used when omitted
+    """
+    global _openai_rate_limiter
+    limits = (
+        float(requests_per_minute or os.getenv("OPENAI_EMBEDDING_RPM", "3000")),
+        float(tokens_per_minute or os.getenv("OPENAI_EMBEDDING_TPM", "1000000"))
+    )
+    if _openai_rate_limiter is None:
+        _openai_rate_limiter = AdaptiveRateLimiter(*limits)
+    elif requests_per_minute or tokens_per_minute:
+        _openai_rate_limiter.configure(*limits)
+    return _openai_rate_limiter
+
+
+async def observe_openai_response(response) -> None:
+    """httpx response hook that feeds OpenAI rate-limit feedback to the global limiter."""
+    if response.request.url.path.endswith("/embeddings"):
+        get_openai_rate_limiter().observe_response(response.status_code, response.headers)
@@ -0,0 +1,489 @@
+"""
+Process-wide OpenAI embedding service.
+
+This module provides a shared embedding service with a keep-alive connection
+pool, coalescing of identical in-flight requests, and a bounded LRU/TTL cache
+keyed on normalized text and model. An optional SQLite tier lets cached
+embeddings survive process restarts.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from .embedding_pipeline import observe_openai_response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds
+_SQLITE_MAX_PARAMS = 900
+
+# Fetches embeddings for a list of texts; used to route cache misses through
+# callers that have their own retry and error handling (e.g. the worker)
+EmbeddingFetcher = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys: NFKC and collapsed whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def embedding_cache_key(text: str, model: str) -> str:
+    """Cache key for a text/model pair."""
+    payload = f"{model}\x00{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+@dataclass
+class EmbeddingLookup:
+    """Result of a single embedding lookup."""
+    embedding: List[float]
+    cache_hit: bool
+    coalesced: bool
+    latency_ms: float
+
+
+@dataclass
+class EmbeddingServiceStats:
+    """Counters for cache effectiveness and upstream latency."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    api_calls: int = 0
+    api_texts: int = 0
+    api_errors: int = 0
+    api_latency_ms_total: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "api_calls": self.api_calls,
+            "api_texts": self.api_texts,
+            "api_errors": self.api_errors,
+            "avg_api_latency_ms": (
+                self.api_latency_ms_total / self.api_calls if self.api_calls else 0.0
+            ),
+        }
+
+
+class _DiskEmbeddingCache:
+    """SQLite-backed persistent tier; all calls run in a worker thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, embedding BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = asyncio.Lock()
+
+    async def get_many(self, keys: List[str], ttl_seconds: float) -> Dict[str, array]:
+        """Read fresh embeddings for keys in one thread hop; absent keys are omitted."""
+        if not keys:
+            return {}
+        async with self._lock:
+            rows = await asyncio.to_thread(self._get_many, keys)
+        cutoff = time.time() - ttl_seconds
+        return {
+            key: array("f", blob)
+            for key, blob, created_at in rows
+            if created_at >= cutoff
+        }
+
+    async def put_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        """Write embeddings in one thread hop and one commit."""
+        if not embeddings:
+            return
+        now = time.time()
+        rows = [
+            (key, model, array("f", embedding).tobytes(), now)
+            for key, embedding in embeddings.items()
+        ]
+        async with self._lock:
+            await asyncio.to_thread(self._put_many, rows)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _get_many(self, keys: List[str]) -> List[Tuple[str, bytes, float]]:
+        rows = []
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(keys), _SQLITE_MAX_PARAMS):
+            batch = keys[i:i + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(self._conn.execute(
+                f"SELECT key, embedding, created_at FROM embeddings WHERE key IN ({placeholders})",
+                batch
+            ).fetchall())
+        return rows
+
+    def _put_many(self, rows: List[Tuple[str, str, bytes, float]]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, model, embedding, created_at) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        self._conn.commit()
+
+
+class EmbeddingService:
+    """
+    Shared embedding service for RAG queries and the upload worker.
+
+    Lookups check the in-memory LRU, then the optional disk tier. Misses for
+    the same key are coalesced onto one upstream request, and batch misses
+    are sent in as few API calls as the batch size allows.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        base_url: str = "https://api.openai.com",
+        max_entries: int = 2048,
+        ttl_seconds: float = 3600.0,
+        disk_cache_path: Optional[str] = None,
+        max_batch_size: int = 256,
+        timeout_seconds: float = 60.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10
+    ):
+        """
+        Initialize the embedding service.
+
+        Args:
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            model: Default embedding model
+            base_url: OpenAI API base URL
+            max_entries: Maximum embeddings held in memory
+            ttl_seconds: Age after which cached embeddings are refreshed
+            disk_cache_path: Optional SQLite file for the persistent tier
+            max_batch_size: Maximum texts per embeddings request
+            timeout_seconds: Upstream request timeout
+            max_connections: Connection pool size
+            max_keepalive_connections: Idle connections kept warm
+        """
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_batch_size = max_batch_size
+        self.timeout_seconds = timeout_seconds
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=60.0
+        )
+        self.stats = EmbeddingServiceStats()
+
+        # float32 arrays: ~6KB per 1536-d vector instead of ~49KB as a list of floats
+        self._cache: "OrderedDict[str, Tuple[float, array]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._disk: Optional[_DiskEmbeddingCache] = None
+        if disk_cache_path:
+            try:
+                self._disk = _DiskEmbeddingCache(disk_cache_path)
+            except Exception as e:
+                logger.warning(f"Embedding disk cache disabled ({disk_cache_path}): {e}")
+
+    async def lookup(self, text: str, model: Optional[str] = None) -> EmbeddingLookup:
+        """
+        Embed a single text, reporting whether it was served from cache.
+
+        Args:
+            text: Text to embed
+            model: Embedding model (defaults to the service model)
+
+        Returns:
+            EmbeddingLookup with the embedding and cache/latency details
+        """
+        if not text or not text.strip():
+            raise ValueError("Empty text cannot be embedded")
+
+        start = time.perf_counter()
+        key = embedding_cache_key(text, model or self.model)
+        sources: Dict[str, str] = {}
+        resolved = await self._resolve({key: text}, model or self.model, None, sources)
+        return EmbeddingLookup(
+            embedding=resolved[key],
+            cache_hit=sources[key] == "cache",
+            coalesced=sources[key] == "coalesced",
+            latency_ms=(time.perf_counter() - start) * 1000
+        )
+
+    async def embed(self, text: str, model: Optional[str] = None) -> List[float]:
+        """Embed a single text."""
+        return (await self.lookup(text, model)).embedding
+
+    async def embed_batch(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        fetcher: Optional[EmbeddingFetcher] = None
+    ) -> List[List[float]]:
+        """
+        Embed a list of texts, only sending uncached unique texts upstream.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (defaults to the service model)
+            fetcher: Optional callable used for cache misses instead of the
+                pooled client; must return one embedding per input text
+
+        Returns:
+            Embeddings aligned with texts
+        """
+        model = model or self.model
+        keys = [embedding_cache_key(text, model) for text in texts]
+        resolved = await self._resolve(dict(zip(keys, texts)), model, fetcher)
+        return [resolved[key] for key in keys]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache and upstream counters."""
+        return {
+            **self.stats.to_dict(),
+            "cached_entries": len(self._cache),
+            "max_entries": self.max_entries,
+            "inflight": len(self._inflight),
+            "disk_tier": self._disk is not None,
+        }
+
+    async def close(self) -> None:
+        """Close the pooled client and the disk tier."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    async def _resolve(
+        self,
+        texts_by_key: Dict[str, str],
+        model: str,
+        fetcher: Optional[EmbeddingFetcher],
+        sources: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[float]]:
+        sources = {} if sources is None else sources
+        resolved: Dict[str, List[float]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        claimed: Dict[str, asyncio.Future] = {}
+        loop = asyncio.get_running_loop()
+
+        # Classify without yielding so concurrent callers see each other's claims
+        for key in texts_by_key:
+            cached = self._get_memory(key)
+            if cached is not None:
+                resolved[key] = cached
+                sources[key] = "cache"
+            elif key in self._inflight:
+                self.stats.coalesced += 1
+                waiting[key] = self._inflight[key]
+                sources[key] = "coalesced"
+            else:
+                claimed[key] = loop.create_future()
+        self._inflight.update(claimed)
+
+        if claimed:
+            try:
+                misses = {}
+                disk_hits = await self._get_disk_many(list(claimed))
+                for key, future in claimed.items():
+                    cached = disk_hits.get(key)
+                    if cached is not None:
+                        resolved[key] = cached
+                        sources[key] = "cache"
+                        future.set_result(cached)
+                    else:
+                        self.stats.misses += 1
+                        misses[key] = texts_by_key[key]
+                        sources[key] = "api"
+                if misses:
+                    resolved.update(await self._fetch_misses(misses, claimed, model, fetcher))
+            except BaseException as e:
+                for future in claimed.values():
+                    if future.done():
+                        continue
+                    if isinstance(e, Exception):
+                        future.set_exception(e)
+                        # Mark retrieved so failures nobody awaited are not logged
+                        future.exception()
+                    else:
+                        future.cancel()
+                raise
+            finally:
+                for key, future in claimed.items():
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+
+        for key, future in waiting.items():
+            resolved[key] = await asyncio.shield(future)
+        return resolved
+
+    def _get_memory(self, key: str) -> Optional[List[float]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, embedding = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        self.stats.hits += 1
+        return embedding.tolist()
+
+    async def _get_disk_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if self._disk is None:
+            return {}
+        try:
+            found = await self._disk.get_many(keys, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Embedding disk cache read failed: {e}")
+            return {}
+        results = {}
+        for key, embedding in found.items():
+            self._store_memory(key, embedding)
+            results[key] = embedding.tolist()
+        self.stats.hits += len(found)
+        self.stats.disk_hits += len(found)
+        return results
+
+    def _store_memory(self, key: str, embedding) -> None:
+        if not isinstance(embedding, array):
+            embedding = array("f", embedding)
+        self._cache[key] = (time.monotonic(), embedding)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def _fetch_misses(
+        self,
+        misses: Dict[str, str],
+        futures: Dict[str, asyncio.Future],
+        model: str,
+        fetcher: Optional[EmbeddingFetcher]
+    ) -> Dict[str, List[float]]:
+        keys = list(misses)
+        results: Dict[str, List[float]] = {}
+        for i in range(0, len(keys), self.max_batch_size):
+            batch_keys = keys[i:i + self.max_batch_size]
+            embeddings = await self._request([misses[key] for key in batch_keys], model, fetcher)
+            batch = dict(zip(batch_keys, embeddings))
+            for key, embedding in batch.items():
+                results[key] = embedding
+                self._store_memory(key, embedding)
+                futures[key].set_result(embedding)
+            if self._disk is not None:
+                try:
+                    await self._disk.put_many(model, batch)
+                except Exception as e:
+                    logger.warning(f"Embedding disk cache write failed: {e}")
+        return results
+
+    async def _request(
+        self,
+        texts: List[str],
+        model: str,
+        fetcher: Optional[EmbeddingFetcher]
+    ) -> List[List[float]]:
+        start = time.perf_counter()
+        try:
+            if fetcher is not None:
+                embeddings = await fetcher(texts)
+            else:
+                embeddings = await self._post_embeddings(texts, model)
+            if len(embeddings) != len(texts):
+                raise RuntimeError(
+                    f"Embedding count mismatch: expected {len(texts)}, got {len(embeddings)}"
+                )
+            return embeddings
+        except Exception:
+            self.stats.api_errors += 1
+            raise
+        finally:
+            self.stats.api_calls += 1
+            self.stats.api_texts += len(texts)
+            self.stats.api_latency_ms_total += (time.perf_counter() - start) * 1000
+
+    async def _post_embeddings(self, texts: List[str], model: str) -> List[List[float]]:
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY is required for embedding generation")
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout_seconds,
+                limits=self.limits,
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.api_key}"
+                },
+                event_hooks={"response": [observe_openai_response]}
+            )
+
+        response = await self._client.post(
+            "/v1/embeddings",
+            json={"model": model, "input": texts, "encoding_format": "float"}
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"OpenAI API error: {response.status_code} - {response.text}")
+
+        data = sorted(response.json()["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+
+
+# Global embedding service instance
+_embedding_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get the process-wide embedding service, configured from the environment."""
+    global _embedding_service
+    if _embedding_service is None:
+        _embedding_service = EmbeddingService(
+            model=os.getenv("OPENAI_EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL),
+            max_entries=int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "2048")),
+            ttl_seconds=float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "3600")),
+            disk_cache_path=os.getenv("EMBEDDING_CACHE_DISK_PATH") or None
+        )
+    return _embedding_service
+
+
+async def close_embedding_service() -> None:
+    """Close and discard the process-wide embedding service."""
+    global _embedding_service
+    if _embedding_service is not None:
+        await _embedding_service.close()
+        _embedding_service = None
@@ -7,9 +7,13 @@ It follows best practices for error logging and service failure handling.
 
 import asyncio
 import logging
+import re
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
+import httpx
+
 from .error_handler import (
     WorkerErrorHandler, 
     ErrorContext, 
@@ -18,9 +22,37 @@ from .error_handler import (
     create_correlation_id,
     create_error_context
 )
-from .service_router import ServiceRouter, ServiceMode
+from .service_router import ServiceRouter, ServiceMode, ServiceUnavailableError
 from ..logging.structured_logger import StructuredLogger
 
+# "HTTP 502", "API error: 503", "server error: 500" in wrapped service errors
+_SERVER_ERROR_MESSAGE = re.compile(r"(?:http|error:?)\s*5\d\d\b|server error")
+
+
+def _is_health_failure(error: BaseException) -> bool:
+    """
+    Whether a failed call says the service itself is unhealthy.
+
+    Transport errors, timeouts and 5xx responses do. Rate limits, other 4xx,
+    bad input and validation errors mean the service answered, so they must
+    not push it towards unhealthy. The services wrap httpx errors in
+    ServiceExecutionError, so the cause chain and message are checked too.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (httpx.TransportError, TimeoutError, ConnectionError, ServiceUnavailableError)):
+            return True
+        if isinstance(current, httpx.HTTPStatusError):
+            return current.response.status_code >= 500
+        status_code = getattr(current, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code >= 500
+        current = current.__cause__ or current.__context__
+    message = str(error).lower()
+    return "timed out" in message or bool(_SERVER_ERROR_MESSAGE.search(message))
+
 
 class EnhancedServiceClient:
     """
@@ -353,8 +385,15 @@ class EnhancedServiceClient:
         for attempt in range(self.retry_config["max_retries"] + 1):
             try:
                 # Call the service function
+                start_time = time.perf_counter()
                 result = await service_func(*args, **kwargs)
                 
+                # Real call outcomes keep the router's health registry fresh
+                # without a separate probe
+                self.service_router.record_call_result(
+                    service_name, True, response_time_ms=(time.perf_counter() - start_time) * 1000
+                )
+                
                 if attempt > 0:
                     self.logger.info(
                         f"Service call succeeded on attempt {attempt + 1}",
@@ -368,6 +407,11 @@ class EnhancedServiceClient:
             except Exception as e:
                 last_exception = e
                 
+                # Only outages count against health; a service that answered
+                # with a client error or rate limit is still up
+                if _is_health_failure(e):
+                    self.service_router.record_call_result(service_name, False, error=str(e))
+                
                 # Log the attempt
                 self.logger.warning(
                     f"Service call failed on attempt {attempt + 1}",
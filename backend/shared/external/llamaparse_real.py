@@ -17,6 +17,8 @@ from urllib.parse import urljoin
 import httpx
 from pydantic import BaseModel, Field
 
+from ..chunking.markdown_chunker import PAGE_MARKER_TEMPLATE
+from .blob_transfer import BlobSourceError, BlobTransferStats, MultipartStream, transfer_blob
 from .service_router import ServiceInterface, ServiceHealth, ServiceUnavailableError, ServiceExecutionError
 from ..exceptions import UserFacingError
 
@@ -37,6 +39,7 @@ class LlamaParseParseResponse(BaseModel):
     status: str = Field(..., description="Parse job status")
     message: Optional[str] = Field(None, description="Additional message")
     correlation_id: Optional[str] = Field(None, description="Correlation ID for tracking")
+    transfer_metrics: Optional[Dict[str, Any]] = Field(None, description="Storage to LlamaParse transfer metrics")
 
 
 class LlamaParseWebhookPayload(BaseModel):
@@ -58,7 +61,9 @@ class RealLlamaParseService(ServiceInterface):
         webhook_secret: Optional[str] = None,
         rate_limit_per_minute: int = 60,
         timeout_seconds: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        storage_client: Optional[httpx.AsyncClient] = None,
+        upload_timeout_seconds: int = 300
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
@@ -66,6 +71,7 @@ class RealLlamaParseService(ServiceInterface):
         self.rate_limit_per_minute = rate_limit_per_minute
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
+        self.upload_timeout_seconds = upload_timeout_seconds
         
         # Rate limiting state
         self.request_times: List[datetime] = []
@@ -78,9 +84,12 @@ class RealLlamaParseService(ServiceInterface):
             last_error=None
         )
         
-        # HTTP client
+        # HTTP clients; documents are streamed from storage over a long-lived
+        # client (a shared one may be injected, e.g. StorageManager.client)
         self.client = None
         self._setup_client()
+        self.storage_client = storage_client
+        self._owns_storage_client = storage_client is None
         
         # Disable background polling to prevent concurrent API calls
         self._enable_background_polling = False
@@ -191,7 +200,19 @@ class RealLlamaParseService(ServiceInterface):
         try:
             import os
             
-            # Download file from storage first, with local fallback
+            # Simple form data (no extra fields)
+            data = {
+                'parsingInstructions': 'Extract the complete text content from this PDF document exactly as it appears. Do not summarize, analyze, or modify the content. Return the raw text with all details, numbers, and specific information preserved.',
+                'result_type': 'markdown',
+                # Mark page starts so chunks can carry page ranges
+                'page_prefix': PAGE_MARKER_TEMPLATE.format(page="{pageNumber}") + "\n"
+            }
+            upload_url = f"{self.base_url}/api/parsing/upload"
+            filename = 'test.pdf'
+            
+            logger.info(f"Submitting document for parsing (streamed from storage)")
+            
+            # Stream the file from storage into the upload, with local fallback
             try:
                 # Parse the storage path to get bucket and key
                 if file_path.startswith('files/'):
@@ -200,98 +221,62 @@ class RealLlamaParseService(ServiceInterface):
                 else:
                     raise ServiceExecutionError(f"Invalid file path format: {file_path}")
                 
-                # Get the file directly from storage using simple HTTP request
                 storage_url = os.getenv("SUPABASE_URL")
                 if not storage_url:
                     raise ServiceExecutionError("SUPABASE_URL environment variable is required")
                 
-                service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", os.getenv("SERVICE_ROLE_KEY", ""))
-                if not service_role_key:
-                    raise ServiceExecutionError("SUPABASE_SERVICE_ROLE_KEY environment variable not set")
-                
-                async with httpx.AsyncClient() as storage_client:
-                    response = await storage_client.get(
-                        f"{storage_url}/storage/v1/object/{bucket}/{key}",
-                        headers={"Authorization": f"Bearer {service_role_key}"}
-                    )
-                    response.raise_for_status()
-                    file_content = response.content
+                response, transfer_stats = await transfer_blob(
+                    self._get_storage_client(),
+                    f"{storage_url}/storage/v1/object/{bucket}/{key}",
+                    self.client,
+                    upload_url,
+                    fields=data,
+                    filename=filename,
+                    timeout=self.upload_timeout_seconds
+                )
                 
-                if not file_content:
-                    raise ServiceExecutionError(f"Downloaded file is empty: {file_path}")
-                    
-                logger.info(f"Downloaded file from storage: {file_path} ({len(file_content)} bytes)")
-                    
-            except Exception as e:
+            except (BlobSourceError, ServiceExecutionError) as e:
                 # Fallback: Try to read from local filesystem if storage fails
                 logger.warning(f"Storage download failed, attempting local fallback: {str(e)}")
                 local_path = "examples/simulated_insurance_document.pdf"
                 if not os.path.exists(local_path):
                     raise ServiceExecutionError(f"Local fallback file not found: {local_path}")
                 
-                with open(local_path, 'rb') as f:
-                    file_content = f.read()
-                
-                logger.info(f"Using local fallback file: {local_path} ({len(file_content)} bytes)")
-            
-            # Prepare multipart form data exactly like reference script
-            filename = 'test.pdf'
-            files = {
-                'file': (filename, file_content, 'application/pdf')
-            }
-            
-            # Simple form data (no extra fields)
-            data = {
-                'parsingInstructions': 'Extract the complete text content from this PDF document exactly as it appears. Do not summarize, analyze, or modify the content. Return the raw text with all details, numbers, and specific information preserved.',
-                'result_type': 'markdown'
-            }
-            
-            # Simple headers (no extra headers)
-            headers = {
-                'Authorization': f'Bearer {self.api_key}'
-            }
+                logger.info(f"Using local fallback file: {local_path}")
+                response, transfer_stats = await self._upload_local_file(local_path, upload_url, data, filename)
             
-            logger.info(f"Submitting document for parsing (simplified approach)")
-            logger.info(f"DEBUG: About to make HTTP POST to {self.base_url}/api/parsing/upload")
+            transfer_metrics = transfer_stats.to_dict()
+            logger.info(f"Streamed {file_path} to LlamaParse: {transfer_metrics}")
+            logger.info(f"DEBUG: HTTP POST response: {response.status_code}")
             
-            # Simple HTTP client (like reference script)
-            async with httpx.AsyncClient(timeout=300) as simple_client:
-                logger.info(f"DEBUG: Making HTTP POST request...")
-                response = await simple_client.post(
-                    f"{self.base_url}/api/parsing/upload",
-                    files=files,
-                    data=data,
-                    headers=headers
-                )
-                logger.info(f"DEBUG: HTTP POST response: {response.status_code}")
+            if response.status_code == 200:
+                response_data = response.json()
+                parse_job_id = response_data.get("id", "")
+                status = response_data.get("status", "PENDING").lower()
                 
-                if response.status_code == 200:
-                    response_data = response.json()
-                    parse_job_id = response_data.get("id", "")
-                    status = response_data.get("status", "PENDING").lower()
-                    
-                    logger.info(f"LlamaParse job submitted successfully: {parse_job_id}")
-                    
-                    return LlamaParseParseResponse(
-                        parse_job_id=parse_job_id,
-                        status=status,
-                        message="Submitted successfully",
-                        correlation_id=correlation_id
-                    )
-                
-                elif response.status_code == 429:
-                    logger.warning(f"LlamaParse rate limited: {response.status_code}")
-                    raise UserFacingError(
-                        "Document processing service is currently busy. Please try again in a few minutes.",
-                        error_code="LLAMAPARSE_RATE_LIMIT_ERROR"
-                    )
-                else:
-                    logger.error(f"LlamaParse API error: {response.status_code} - {response.text}")
-                    raise UserFacingError(
-                        "Document processing failed. Please try again later.",
-                        error_code="LLAMAPARSE_API_ERROR"
-                    )
+                logger.info(f"LlamaParse job submitted successfully: {parse_job_id}")
                 
+                return LlamaParseParseResponse(
+                    parse_job_id=parse_job_id,
+                    status=status,
+                    message="Submitted successfully",
+                    correlation_id=correlation_id,
+                    transfer_metrics=transfer_metrics
+                )
+            
+            elif response.status_code == 429:
+                logger.warning(f"LlamaParse rate limited: {response.status_code}")
+                raise UserFacingError(
+                    "Document processing service is currently busy. Please try again in a few minutes.",
+                    error_code="LLAMAPARSE_RATE_LIMIT_ERROR"
+                )
+            else:
+                logger.error(f"LlamaParse API error: {response.status_code} - {response.text}")
+                raise UserFacingError(
+                    "Document processing failed. Please try again later.",
+                    error_code="LLAMAPARSE_API_ERROR"
+                )
+            
         except UserFacingError:
             raise  # Re-raise user-facing errors as-is
         except Exception as e:
@@ -301,6 +286,45 @@ class RealLlamaParseService(ServiceInterface):
                 error_code="LLAMAPARSE_UNEXPECTED_ERROR"
             )
     
+    def _get_storage_client(self) -> httpx.AsyncClient:
+        """Get the long-lived client used to stream documents from storage."""
+        if self.storage_client is None or self.storage_client.is_closed:
+            import os
+            service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", os.getenv("SERVICE_ROLE_KEY", ""))
+            if not service_role_key:
+                raise ServiceExecutionError("SUPABASE_SERVICE_ROLE_KEY environment variable not set")
+            self.storage_client = httpx.AsyncClient(
+                headers={"Authorization": f"Bearer {service_role_key}"},
+                timeout=httpx.Timeout(self.upload_timeout_seconds, connect=10.0),
+                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+            )
+            self._owns_storage_client = True
+        return self.storage_client
+    
+    async def _upload_local_file(
+        self, local_path: str, upload_url: str, data: Dict[str, Any], filename: str
+    ):
+        """Stream a local file to LlamaParse (fallback when storage is unavailable)."""
+        import os
+        import time
+        
+        async def file_chunks():
+            with open(local_path, 'rb') as f:
+                while chunk := f.read(256 * 1024):
+                    yield chunk
+        
+        stats = BlobTransferStats()
+        body = MultipartStream(
+            data, "file", filename, "application/pdf", file_chunks(),
+            file_length=os.path.getsize(local_path), stats=stats
+        )
+        start = time.perf_counter()
+        response = await self.client.post(
+            upload_url, content=body, headers=body.headers(), timeout=self.upload_timeout_seconds
+        )
+        stats.transfer_seconds = time.perf_counter() - start
+        return response, stats
+    
     async def get_parse_status(self, parse_job_id: str) -> Dict[str, Any]:
         """
         Get the status of a parse job.
@@ -705,6 +729,8 @@ class RealLlamaParseService(ServiceInterface):
         """Close the service and cleanup resources."""
         if self.client:
             await self.client.aclose()
+        if self.storage_client and self._owns_storage_client:
+            await self.storage_client.aclose()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Union
 import httpx
 from pydantic import BaseModel, Field
 
+from .embedding_pipeline import observe_openai_response
 from .service_router import ServiceInterface, ServiceHealth, ServiceUnavailableError, ServiceExecutionError
 
 logger = logging.getLogger(__name__)
@@ -94,7 +95,9 @@ class RealOpenAIService(ServiceInterface):
         self.client = httpx.AsyncClient(
             headers=headers,
             timeout=httpx.Timeout(self.timeout_seconds),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            # Feed 429s and x-ratelimit-* headers to the shared adaptive limiter
+            event_hooks={"response": [observe_openai_response]}
         )
     
     async def is_available(self) -> bool:
@@ -8,6 +8,7 @@ external services, enabling cost-controlled testing and development flexibility.
 import asyncio
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -248,7 +249,21 @@ class ServiceRouter:
         
         self.services: Dict[str, Dict[str, ServiceInterface]] = {}
         self.health_cache: Dict[str, ServiceHealth] = {}
-        self.health_check_interval = 30  # seconds
+        self.health_check_interval = config.get("health_check_interval", 30)  # seconds
+        
+        # get_service trusts cached health up to this age; older entries are
+        # re-probed inline, so selection is never based on badly stale data
+        self.health_max_staleness = config.get("health_max_staleness", 3 * self.health_check_interval)
+        # Consecutive failed real calls before a service is marked unhealthy
+        self.passive_failure_threshold = config.get("passive_failure_threshold", 3)
+        self.health_stats = {
+            "lookups": 0,
+            "cache_hits": 0,
+            "inline_probes": 0,
+            "background_probes": 0,
+            "probe_ms_total": 0.0,
+            "passive_updates": 0,
+        }
         
         # Health monitoring setup (but don't start yet)
         self._health_monitor_task = None
@@ -258,8 +273,10 @@ class ServiceRouter:
         if config:
             self._auto_register_services(config)
         
-        # Note: Health monitoring will be started explicitly when needed
-        # Don't start it during initialization to avoid blocking
+        # Background refresh keeps the health cache warm for get_service; it
+        # needs a running event loop and is otherwise started on demand
+        if start_health_monitoring:
+            self._start_health_monitoring()
     
     def _validate_production_config(self) -> None:
         """Validate production environment configuration to prevent mock fallbacks."""
@@ -294,7 +311,8 @@ class ServiceRouter:
                     base_url=llamaparse_config["api_url"],
                     rate_limit_per_minute=llamaparse_config.get("requests_per_minute", 60),
                     timeout_seconds=llamaparse_config.get("timeout_seconds", 30),
-                    max_retries=llamaparse_config.get("max_retries", 3)
+                    max_retries=llamaparse_config.get("max_retries", 3),
+                    storage_client=llamaparse_config.get("storage_client")
                 )
                 self.register_service("llamaparse", mock_llamaparse, real_llamaparse)
             
@@ -362,7 +380,7 @@ class ServiceRouter:
             return mock_service
         
         elif self.mode == ServiceMode.REAL:
-            if await real_service.is_available():
+            if await self._is_real_service_healthy(service_name):
                 return real_service
             elif self.fallback_enabled:
                 # Check if we're in production - if so, don't fallback to mock
@@ -384,7 +402,7 @@ class ServiceRouter:
         
         elif self.mode == ServiceMode.HYBRID:
             # Try real service first, fallback to mock if unavailable
-            if await real_service.is_available():
+            if await self._is_real_service_healthy(service_name):
                 return real_service
             else:
                 # Check if we're in production - if so, don't fallback to mock
@@ -405,6 +423,87 @@ class ServiceRouter:
         # Should never reach here
         raise ValueError(f"Invalid service mode: {self.mode}")
     
+    async def _is_real_service_healthy(self, service_name: str) -> bool:
+        """
+        Answer from the health cache when it is fresh enough.
+        
+        The cache is refreshed by the background monitor and by real call
+        results, so the common case is a dict lookup. A missing or stale entry
+        is probed inline once.
+        """
+        self.health_stats["lookups"] += 1
+        health = self.health_cache.get(service_name)
+        if health is not None:
+            age = (datetime.utcnow() - health.last_check).total_seconds()
+            if age <= self.health_max_staleness:
+                self.health_stats["cache_hits"] += 1
+                return health.is_healthy
+        
+        self.health_stats["inline_probes"] += 1
+        health = await self._probe_service(service_name)
+        return health.is_healthy
+    
+    async def _probe_service(self, service_name: str) -> ServiceHealth:
+        """Run a health check and record its cost."""
+        start = time.perf_counter()
+        try:
+            return await self.check_service_health(service_name)
+        finally:
+            self.health_stats["probe_ms_total"] += (time.perf_counter() - start) * 1000
+    
+    def record_call_result(self, service_name: str, success: bool,
+                           response_time_ms: Optional[float] = None, error: Optional[str] = None) -> None:
+        """
+        Passively update health from a real service call.
+        
+        A success marks the service healthy immediately. Failures only mark it
+        unhealthy after passive_failure_threshold in a row, so one bad request
+        does not switch every caller to the fallback.
+        """
+        self.health_stats["passive_updates"] += 1
+        health = self.health_cache.get(service_name)
+        if health is None:
+            health = self.health_cache[service_name] = ServiceHealth(
+                is_healthy=True, last_check=datetime.utcnow()
+            )
+        
+        health.last_check = datetime.utcnow()
+        if success:
+            health.is_healthy = True
+            health.error_count = 0
+            health.last_error = None
+            if response_time_ms is not None:
+                health.response_time_ms = response_time_ms
+        else:
+            health.error_count += 1
+            health.last_error = error
+            if health.error_count >= self.passive_failure_threshold:
+                health.is_healthy = False
+    
+    def get_health_registry_stats(self) -> Dict[str, Any]:
+        """Health cache metrics, including the probe time avoided by cache hits."""
+        stats = self.health_stats
+        probes = stats["inline_probes"] + stats["background_probes"]
+        avg_probe_ms = stats["probe_ms_total"] / probes if probes else 0.0
+        now = datetime.utcnow()
+        return {
+            **stats,
+            "probe_ms_total": round(stats["probe_ms_total"], 2),
+            "avg_probe_ms": round(avg_probe_ms, 2),
+            "estimated_probe_ms_saved": round(stats["cache_hits"] * avg_probe_ms, 2),
+            "hit_rate": stats["cache_hits"] / stats["lookups"] if stats["lookups"] else 0.0,
+            "health_check_interval": self.health_check_interval,
+            "health_max_staleness": self.health_max_staleness,
+            "services": {
+                name: {
+                    "is_healthy": health.is_healthy,
+                    "age_seconds": round((now - health.last_check).total_seconds(), 1),
+                    "error_count": health.error_count,
+                }
+                for name, health in self.health_cache.items()
+            },
+        }
+    
     async def execute_service(self, service_name: str, *args, **kwargs) -> Any:
         """
         Execute a service operation with automatic service selection and retry logic.
@@ -426,6 +525,7 @@ class ServiceRouter:
         retry_delay = 1  # seconds
         
         for attempt in range(max_retries + 1):
+            service = None
             try:
                 service = await self.get_service(service_name)
                 
@@ -433,8 +533,10 @@ class ServiceRouter:
                 result = await service.execute(*args, **kwargs)
                 execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
                 
-                # Update health metrics
-                self._update_health_metrics(service_name, True, execution_time)
+                # Update health metrics (the health cache describes the real
+                # service, so mock fallback results are not recorded)
+                if service is self.services[service_name]['real']:
+                    self.record_call_result(service_name, True, execution_time)
                 
                 return result
                 
@@ -459,7 +561,8 @@ class ServiceRouter:
                     raise
             except Exception as e:
                 # Update health metrics
-                self._update_health_metrics(service_name, False, None, str(e))
+                if service is not None and service is self.services[service_name]['real']:
+                    self.record_call_result(service_name, False, error=str(e))
                 
                 # Check if this is the last attempt
                 if attempt == max_retries:
@@ -499,22 +602,31 @@ class ServiceRouter:
             real_service = self.services[service_name]['real']
             # Check if service is available first
             if not await real_service.is_available():
-                return ServiceHealth(
+                health = ServiceHealth(
                     is_healthy=False, 
                     last_check=datetime.utcnow(),
                     last_error="Service unavailable"
                 )
-            
-            health = await real_service.get_health()
-            self.health_cache[service_name] = health
-            return health
+            else:
+                health = await real_service.get_health()
         except Exception as e:
             logger.error(f"Health check failed for {service_name}: {e}")
-            return ServiceHealth(
+            health = ServiceHealth(
                 is_healthy=False, 
                 last_check=datetime.utcnow(),
                 last_error=str(e)
             )
+        
+        # Services may return their own cached health; the registry tracks
+        # when this router last confirmed it
+        self.health_cache[service_name] = ServiceHealth(
+            is_healthy=health.is_healthy,
+            last_check=datetime.utcnow(),
+            response_time_ms=health.response_time_ms,
+            error_count=health.error_count,
+            last_error=health.last_error
+        )
+        return health
     
     async def get_all_services_health(self) -> Dict[str, ServiceHealth]:
         """Get health status for all registered services."""
@@ -523,29 +635,6 @@ class ServiceRouter:
             health_status[service_name] = await self.check_service_health(service_name)
         return health_status
     
-    def _update_health_metrics(self, service_name: str, success: bool, 
-                              response_time_ms: Optional[float], error: Optional[str] = None) -> None:
-        """Update health metrics for a service."""
-        if service_name not in self.health_cache:
-            self.health_cache[service_name] = ServiceHealth(
-                is_healthy=True, 
-                last_check=datetime.utcnow()
-            )
-        
-        health = self.health_cache[service_name]
-        health.last_check = datetime.utcnow()
-        
-        if success:
-            health.is_healthy = True
-            health.error_count = 0
-            health.last_error = None
-            if response_time_ms is not None:
-                health.response_time_ms = response_time_ms
-        else:
-            health.is_healthy = False
-            health.error_count += 1
-            health.last_error = error
-    
     def _start_health_monitoring(self) -> None:
         """Start background health monitoring task."""
         if self._health_monitoring_started:
@@ -576,7 +665,8 @@ class ServiceRouter:
         """Monitor health of all services."""
         for service_name in self.services:
             try:
-                await self.check_service_health(service_name)
+                self.health_stats["background_probes"] += 1
+                await self._probe_service(service_name)
             except Exception as e:
                 logger.error(f"Health monitoring failed for {service_name}: {e}")
     
@@ -652,6 +742,7 @@ class ServiceRouter:
                 "healthy_services": healthy_services,
                 "total_services": total_services,
                 "services": all_health,
+                "registry": self.get_health_registry_stats(),
                 "timestamp": datetime.utcnow().isoformat()
             }
             
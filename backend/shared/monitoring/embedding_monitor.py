@@ -12,7 +12,12 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import json
 
-from ..validation.embedding_validator import EmbeddingValidator, EmbeddingValidationResult, EmbeddingIssueType
+from ..validation.embedding_validator import (
+    EmbeddingBatchValidation,
+    EmbeddingIssueType,
+    EmbeddingValidationResult,
+    EmbeddingValidator,
+)
 
 
 @dataclass
@@ -25,6 +30,7 @@ class EmbeddingQualityMetrics:
     invalid_dimension_embeddings: int = 0
     extreme_value_embeddings: int = 0
     suspicious_pattern_embeddings: int = 0
+    duplicate_vector_embeddings: int = 0
     last_updated: datetime = field(default_factory=datetime.utcnow)
     quality_score: float = 1.0  # 0.0 to 1.0
     alerts_sent: int = 0
@@ -40,7 +46,9 @@ class EmbeddingQualityMetrics:
         critical_penalty = (critical_issues / self.total_embeddings_processed) * 0.8
         
         # Warning issues (extreme values, patterns) lightly penalize score
-        warning_issues = self.extreme_value_embeddings + self.suspicious_pattern_embeddings
+        warning_issues = (
+            self.extreme_value_embeddings + self.suspicious_pattern_embeddings + self.duplicate_vector_embeddings
+        )
         warning_penalty = (warning_issues / self.total_embeddings_processed) * 0.2
         
         self.quality_score = max(0.0, 1.0 - critical_penalty - warning_penalty)
@@ -172,23 +180,74 @@ class EmbeddingQualityMonitor:
         
         return results, batch_summary
     
+    async def validate_array(
+        self,
+        embeddings,
+        source_info: Optional[Dict[str, Any]] = None,
+        keys: Optional[List[Any]] = None,
+        raise_on_critical: bool = True
+    ) -> EmbeddingBatchValidation:
+        """
+        Validate a whole batch with vectorized checks and per-row verdicts.
+        
+        Metrics are updated from verdict counts; full results are only built
+        for rows that failed, which are logged, alerted and kept in
+        recent_results like single-embedding validations.
+        
+        Args:
+            embeddings: (N, dim) array or list of N vectors
+            source_info: Context about the batch; each failed row's context
+                also gets its batch_index
+            keys: Optional per-row keys for duplicate-vector detection
+            raise_on_critical: Whether to raise for the first critical row
+            
+        Returns:
+            EmbeddingBatchValidation with one verdict per row
+            
+        Raises:
+            Exception: If a critical issue is detected and raise_on_critical=True
+        """
+        validation = self.validator.validate_array(embeddings, keys=keys)
+        batch_summary = validation.summary()
+        self._update_metrics_from_counts(batch_summary["issue_breakdown"])
+        
+        first_critical = None
+        for row in validation.invalid_rows():
+            row_source_info = dict(source_info or {}, batch_index=row)
+            result = validation.result(row, row_source_info)
+            self.recent_results.append(result)
+            if result.severity == "critical":
+                await self._handle_critical_issue(result, row_source_info)
+                if first_critical is None:
+                    first_critical = (result, row_source_info)
+            else:
+                await self._handle_warning_issue(result, row_source_info)
+        if len(self.recent_results) > self.max_recent_results:
+            self.recent_results = self.recent_results[-self.max_recent_results:]
+        
+        await self._check_batch_alerts_from_summary(len(validation), batch_summary, source_info)
+        
+        if first_critical and raise_on_critical:
+            error = self.validator.create_error_from_validation_result(*first_critical)
+            if error and isinstance(error, Exception):
+                raise error
+        
+        return validation
+    
     def _update_metrics_from_result(self, result: EmbeddingValidationResult):
         """Update metrics based on validation result"""
-        self.metrics.total_embeddings_processed += 1
-        
-        if result.is_valid:
-            self.metrics.valid_embeddings += 1
-        else:
-            if result.issue_type == EmbeddingIssueType.ALL_ZEROS:
-                self.metrics.zero_embeddings += 1
-            elif result.issue_type == EmbeddingIssueType.MOSTLY_ZEROS:
-                self.metrics.mostly_zero_embeddings += 1
-            elif result.issue_type == EmbeddingIssueType.INVALID_DIMENSIONS:
-                self.metrics.invalid_dimension_embeddings += 1
-            elif result.issue_type == EmbeddingIssueType.EXTREME_VALUES:
-                self.metrics.extreme_value_embeddings += 1
-            elif result.issue_type == EmbeddingIssueType.SUSPICIOUS_PATTERN:
-                self.metrics.suspicious_pattern_embeddings += 1
+        self._update_metrics_from_counts({result.issue_type: 1})
+    
+    def _update_metrics_from_counts(self, counts: Dict[EmbeddingIssueType, int]):
+        """Update metrics from a count of embeddings per issue type"""
+        self.metrics.total_embeddings_processed += sum(counts.values())
+        self.metrics.valid_embeddings += counts.get(EmbeddingIssueType.VALID, 0)
+        self.metrics.zero_embeddings += counts.get(EmbeddingIssueType.ALL_ZEROS, 0)
+        self.metrics.mostly_zero_embeddings += counts.get(EmbeddingIssueType.MOSTLY_ZEROS, 0)
+        self.metrics.invalid_dimension_embeddings += counts.get(EmbeddingIssueType.INVALID_DIMENSIONS, 0)
+        self.metrics.extreme_value_embeddings += counts.get(EmbeddingIssueType.EXTREME_VALUES, 0)
+        self.metrics.suspicious_pattern_embeddings += counts.get(EmbeddingIssueType.SUSPICIOUS_PATTERN, 0)
+        self.metrics.duplicate_vector_embeddings += counts.get(EmbeddingIssueType.DUPLICATE_VECTOR, 0)
         
         self.metrics.last_updated = datetime.utcnow()
         self.metrics.update_quality_score()
@@ -236,8 +295,15 @@ class EmbeddingQualityMonitor:
         source_info: Optional[Dict[str, Any]]
     ):
         """Check if batch-level alerts should be sent"""
-        total_embeddings = len(results)
-        
+        await self._check_batch_alerts_from_summary(len(results), batch_summary, source_info)
+    
+    async def _check_batch_alerts_from_summary(
+        self,
+        total_embeddings: int,
+        batch_summary: Dict[str, Any],
+        source_info: Optional[Dict[str, Any]]
+    ):
+        """Check batch-level alert thresholds for a batch of total_embeddings"""
         # Skip if batch is too small
         if total_embeddings < self.alert_thresholds["batch_size_threshold"]:
             return
@@ -330,6 +396,7 @@ class EmbeddingQualityMonitor:
             "invalid_dimension_count": self.metrics.invalid_dimension_embeddings,
             "extreme_value_count": self.metrics.extreme_value_embeddings,
             "suspicious_pattern_count": self.metrics.suspicious_pattern_embeddings,
+            "duplicate_vector_count": self.metrics.duplicate_vector_embeddings,
             "quality_score": self.metrics.quality_score,
             "alerts_sent": self.metrics.alerts_sent,
             "last_updated": self.metrics.last_updated.isoformat()
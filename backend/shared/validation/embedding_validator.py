@@ -7,9 +7,9 @@ zero embeddings, invalid embeddings, and other quality issues.
 
 import logging
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
@@ -23,6 +23,7 @@ class EmbeddingIssueType(Enum):
     INFINITE_VALUES = "infinite_values"
     INSUFFICIENT_VARIANCE = "insufficient_variance"
     SUSPICIOUS_PATTERN = "suspicious_pattern"
+    DUPLICATE_VECTOR = "duplicate_vector"
     VALID = "valid"
 
 
@@ -38,6 +39,211 @@ class EmbeddingValidationResult:
     recommendations: List[str]
 
 
+# Severity, confidence and recommendations for each verdict
+_ISSUE_PROFILES: Dict[EmbeddingIssueType, Tuple[str, float, List[str]]] = {
+    EmbeddingIssueType.INVALID_DIMENSIONS: ("critical", 1.0, [
+        "Check embedding model configuration", "Verify OpenAI API response"
+    ]),
+    EmbeddingIssueType.NAN_VALUES: ("critical", 1.0, [
+        "Check embedding generation API", "Verify input text quality"
+    ]),
+    EmbeddingIssueType.INFINITE_VALUES: ("critical", 1.0, [
+        "Check embedding generation API", "Verify input text quality"
+    ]),
+    EmbeddingIssueType.ALL_ZEROS: ("critical", 1.0, [
+        "Check if OpenAI API key is valid",
+        "Verify input text is not empty",
+        "Check for API rate limiting",
+        "Ensure embedding model is properly configured"
+    ]),
+    EmbeddingIssueType.MOSTLY_ZEROS: ("critical", 0.9, [
+        "Check embedding generation API health",
+        "Verify input text quality and length",
+        "Check for partial API failures"
+    ]),
+    EmbeddingIssueType.EXTREME_VALUES: ("warning", 0.7, [
+        "Check input text for unusual content",
+        "Verify embedding model behavior",
+        "Consider normalizing embeddings"
+    ]),
+    EmbeddingIssueType.INSUFFICIENT_VARIANCE: ("warning", 0.8, [
+        "Check if mock embeddings are being generated",
+        "Verify real API is being used",
+        "Check embedding generation configuration"
+    ]),
+    EmbeddingIssueType.SUSPICIOUS_PATTERN: ("warning", 0.6, [
+        "Check embedding generation algorithm",
+        "Verify input text diversity",
+        "Check for algorithmic bias"
+    ]),
+    EmbeddingIssueType.DUPLICATE_VECTOR: ("warning", 0.6, [
+        "Check that the API response order matches the request",
+        "Check for cached or mock embeddings"
+    ]),
+    EmbeddingIssueType.VALID: ("info", 1.0, []),
+}
+
+# Compact per-row verdict codes used by EmbeddingBatchValidation
+_ISSUE_TYPES = list(EmbeddingIssueType)
+_ISSUE_CODES = {issue_type: code for code, issue_type in enumerate(_ISSUE_TYPES)}
+_VALID_CODE = _ISSUE_CODES[EmbeddingIssueType.VALID]
+_CRITICAL_CODES = [_ISSUE_CODES[t] for t, (severity, _, _) in _ISSUE_PROFILES.items() if severity == "critical"]
+
+
+@dataclass
+class EmbeddingBatchValidation:
+    """
+    Per-row verdicts and metrics for a validated batch.
+    
+    Metrics are NumPy arrays with one entry per row. Full
+    EmbeddingValidationResult objects are only built on request (result()),
+    so valid rows cost nothing beyond the array math.
+    """
+    issue_codes: np.ndarray
+    expected_dimension: int
+    dimensions: np.ndarray
+    zero_fraction: np.ndarray
+    nan_count: np.ndarray
+    inf_count: np.ndarray
+    max_abs_value: np.ndarray
+    min_value: np.ndarray
+    max_value: np.ndarray
+    variance: np.ndarray
+    norm: np.ndarray
+    unique_values: np.ndarray
+    repetition_fraction: np.ndarray
+    duplicate_of: np.ndarray
+    conversion_errors: Dict[int, str] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.issue_codes)
+    
+    @property
+    def is_valid(self) -> np.ndarray:
+        """Boolean verdict per row."""
+        return self.issue_codes == _VALID_CODE
+    
+    @property
+    def is_critical(self) -> np.ndarray:
+        """Rows with a critical issue."""
+        return np.isin(self.issue_codes, _CRITICAL_CODES)
+    
+    @property
+    def issue_types(self) -> List[EmbeddingIssueType]:
+        """Verdict per row."""
+        return [_ISSUE_TYPES[code] for code in self.issue_codes]
+    
+    def invalid_rows(self) -> List[int]:
+        """Indices of rows that failed validation."""
+        return np.flatnonzero(~self.is_valid).tolist()
+    
+    def result(self, row: int, source_info: Optional[Dict[str, Any]] = None) -> EmbeddingValidationResult:
+        """Build the full validation result for one row."""
+        issue_type = _ISSUE_TYPES[self.issue_codes[row]]
+        severity, confidence, recommendations = _ISSUE_PROFILES[issue_type]
+        details, metrics = self._describe(row, issue_type, source_info)
+        return EmbeddingValidationResult(
+            is_valid=issue_type == EmbeddingIssueType.VALID,
+            issue_type=issue_type,
+            severity=severity,
+            confidence=confidence,
+            details=details,
+            metrics=metrics,
+            recommendations=list(recommendations)
+        )
+    
+    def summary(self) -> Dict[str, Any]:
+        """Batch summary in the shape returned by EmbeddingValidator.validate_batch."""
+        counts = np.bincount(self.issue_codes, minlength=len(_ISSUE_TYPES))
+        total_embeddings = len(self)
+        critical_issues = int(self.is_critical.sum())
+        warning_issues = int(total_embeddings - counts[_VALID_CODE] - critical_issues)
+        return {
+            "total_embeddings": total_embeddings,
+            "valid_embeddings": int(counts[_VALID_CODE]),
+            "critical_issues": critical_issues,
+            "warning_issues": warning_issues,
+            "duplicate_vectors": int((self.duplicate_of >= 0).sum()),
+            "issue_breakdown": {issue_type: int(counts[code]) for code, issue_type in enumerate(_ISSUE_TYPES)},
+            "validation_timestamp": datetime.utcnow().isoformat(),
+            "batch_health_score": (total_embeddings - critical_issues) / total_embeddings if total_embeddings > 0 else 0.0
+        }
+    
+    def _describe(
+        self,
+        row: int,
+        issue_type: EmbeddingIssueType,
+        source_info: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        source_info = source_info if source_info is not None else {}
+        zero_fraction = float(self.zero_fraction[row])
+        max_abs_value = float(self.max_abs_value[row])
+        
+        if issue_type == EmbeddingIssueType.INVALID_DIMENSIONS:
+            if row in self.conversion_errors:
+                error = self.conversion_errors[row]
+                return f"Cannot convert embedding to numeric array: {error}", {"error": error}
+            actual = int(self.dimensions[row])
+            return (
+                f"Wrong dimension: {actual} (expected {self.expected_dimension})",
+                {"actual_dimension": actual, "expected_dimension": self.expected_dimension}
+            )
+        if issue_type == EmbeddingIssueType.NAN_VALUES:
+            return "Embedding contains NaN values", {"nan_count": int(self.nan_count[row])}
+        if issue_type == EmbeddingIssueType.INFINITE_VALUES:
+            return "Embedding contains infinite values", {"inf_count": int(self.inf_count[row])}
+        if issue_type == EmbeddingIssueType.ALL_ZEROS:
+            return "All embedding values are zero", {
+                "zero_fraction": zero_fraction,
+                "max_abs_value": max_abs_value,
+                "source_info": source_info
+            }
+        if issue_type == EmbeddingIssueType.MOSTLY_ZEROS:
+            return f"{zero_fraction*100:.1f}% of embedding values are zero", {
+                "zero_fraction": zero_fraction,
+                "non_zero_count": int(round((1 - zero_fraction) * self.expected_dimension)),
+                "max_abs_value": max_abs_value,
+                "source_info": source_info
+            }
+        if issue_type == EmbeddingIssueType.EXTREME_VALUES:
+            return f"Extreme values detected (max: {max_abs_value:.3f})", {
+                "max_abs_value": max_abs_value,
+                "min_value": float(self.min_value[row]),
+                "max_value": float(self.max_value[row]),
+                "source_info": source_info
+            }
+        if issue_type == EmbeddingIssueType.INSUFFICIENT_VARIANCE:
+            variance = float(self.variance[row])
+            return f"Very low variance ({variance:.2e}) suggests mock embedding", {
+                "variance": variance,
+                "std_dev": float(np.sqrt(variance)),
+                "source_info": source_info
+            }
+        if issue_type == EmbeddingIssueType.SUSPICIOUS_PATTERN:
+            repetition_fraction = float(self.repetition_fraction[row])
+            return f"High repetition ({repetition_fraction*100:.1f}%) suggests pattern generation", {
+                "unique_values": int(self.unique_values[row]),
+                "total_values": self.expected_dimension,
+                "repetition_fraction": repetition_fraction,
+                "source_info": source_info
+            }
+        if issue_type == EmbeddingIssueType.DUPLICATE_VECTOR:
+            return f"Embedding is identical to row {int(self.duplicate_of[row])} for different input", {
+                "duplicate_of": int(self.duplicate_of[row]),
+                "norm": float(self.norm[row]),
+                "source_info": source_info
+            }
+        return "Embedding appears valid", {
+            "dimension": self.expected_dimension,
+            "zero_fraction": zero_fraction,
+            "variance": float(self.variance[row]),
+            "max_abs_value": max_abs_value,
+            "norm": float(self.norm[row]),
+            "unique_values": int(self.unique_values[row]),
+            "source_info": source_info
+        }
+
+
 class EmbeddingValidator:
     """
     Comprehensive embedding validator with issue detection and classification.
@@ -79,185 +285,99 @@ class EmbeddingValidator:
         Returns:
             EmbeddingValidationResult with validation details
         """
-        if source_info is None:
-            source_info = {}
-        
-        # Convert to numpy array for analysis
-        try:
-            arr = np.array(embedding, dtype=float)
-        except (ValueError, TypeError) as e:
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.INVALID_DIMENSIONS,
-                severity="critical",
-                confidence=1.0,
-                details=f"Cannot convert embedding to numeric array: {str(e)}",
-                metrics={"error": str(e)},
-                recommendations=["Check embedding generation process", "Verify data types"]
-            )
+        return self.validate_array([embedding]).result(0, source_info)
+    
+    def validate_array(
+        self,
+        embeddings: Union[np.ndarray, Sequence[Sequence[float]]],
+        keys: Optional[Sequence[Any]] = None
+    ) -> "EmbeddingBatchValidation":
+        """
+        Validate a batch of embeddings with whole-array NumPy operations.
         
-        # Check dimensions
-        if len(arr) != self.expected_dimension:
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.INVALID_DIMENSIONS,
-                severity="critical",
-                confidence=1.0,
-                details=f"Wrong dimension: {len(arr)} (expected {self.expected_dimension})",
-                metrics={"actual_dimension": len(arr), "expected_dimension": self.expected_dimension},
-                recommendations=["Check embedding model configuration", "Verify OpenAI API response"]
-            )
+        All statistics (zero fraction, NaN/inf counts, norm, variance, value
+        repetition, duplicate vectors) are computed for the (N, dim) array at
+        once and each row gets the verdict validate_embedding would give it.
         
-        # Check for NaN or infinite values
-        if np.any(np.isnan(arr)):
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.NAN_VALUES,
-                severity="critical",
-                confidence=1.0,
-                details="Embedding contains NaN values",
-                metrics={"nan_count": np.sum(np.isnan(arr))},
-                recommendations=["Check embedding generation API", "Verify input text quality"]
-            )
+        Args:
+            embeddings: (N, dim) array or list of N vectors
+            keys: Optional per-row keys (e.g. chunk text hashes). A row equal
+                to an earlier row with a different key is flagged as a
+                duplicate vector; rows with the same key may legitimately match.
+            
+        Returns:
+            EmbeddingBatchValidation with per-row verdicts and metrics
+        """
+        rows = len(embeddings)
+        arr, dimension_ok, conversion_errors = self._to_array(embeddings)
         
-        if np.any(np.isinf(arr)):
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.INFINITE_VALUES,
-                severity="critical",
-                confidence=1.0,
-                details="Embedding contains infinite values",
-                metrics={"inf_count": np.sum(np.isinf(arr))},
-                recommendations=["Check embedding generation API", "Verify input text quality"]
-            )
+        # NaN/inf are counted, then zeroed so the remaining statistics stay finite
+        finite = np.isfinite(arr)
+        if finite.all():
+            nan_count = inf_count = np.zeros(rows, dtype=int)
+            safe = arr
+        else:
+            nan_count = np.isnan(arr).sum(axis=1)
+            inf_count = (~finite).sum(axis=1) - nan_count
+            safe = np.where(finite, arr, 0.0)
         
-        # Check for all zeros
-        zero_mask = np.abs(arr) < self.thresholds["zero_tolerance"]
-        zero_fraction = np.mean(zero_mask)
+        absolute = np.abs(safe)
+        zero_fraction = (absolute < self.thresholds["zero_tolerance"]).mean(axis=1)
+        max_abs = absolute.max(axis=1)
+        min_value = safe.min(axis=1)
+        max_value = safe.max(axis=1)
         
-        if zero_fraction == 1.0:
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.ALL_ZEROS,
-                severity="critical",
-                confidence=1.0,
-                details="All embedding values are zero",
-                metrics={
-                    "zero_fraction": zero_fraction,
-                    "max_abs_value": float(np.max(np.abs(arr))),
-                    "source_info": source_info
-                },
-                recommendations=[
-                    "Check if OpenAI API key is valid",
-                    "Verify input text is not empty",
-                    "Check for API rate limiting",
-                    "Ensure embedding model is properly configured"
-                ]
-            )
+        # Variance and norm from the first two moments in one pass each
+        sum_squares = np.einsum("ij,ij->i", safe, safe)
+        mean = safe.mean(axis=1)
+        variance = np.maximum(sum_squares / self.expected_dimension - mean * mean, 0.0)
+        norm = np.sqrt(sum_squares)
         
-        # Check for mostly zeros
-        if zero_fraction > self.thresholds["mostly_zeros_threshold"]:
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.MOSTLY_ZEROS,
-                severity="critical",
-                confidence=0.9,
-                details=f"{zero_fraction*100:.1f}% of embedding values are zero",
-                metrics={
-                    "zero_fraction": zero_fraction,
-                    "non_zero_count": int(np.sum(~zero_mask)),
-                    "max_abs_value": float(np.max(np.abs(arr))),
-                    "source_info": source_info
-                },
-                recommendations=[
-                    "Check embedding generation API health",
-                    "Verify input text quality and length",
-                    "Check for partial API failures"
-                ]
-            )
+        # Distinct values per row: sort each row and count value changes
+        ordered = np.sort(safe, axis=1)
+        unique_values = 1 + (ordered[:, 1:] != ordered[:, :-1]).sum(axis=1)
+        repetition_fraction = 1.0 - unique_values / self.expected_dimension
         
-        # Check for extreme values
-        max_abs_value = np.max(np.abs(arr))
-        if max_abs_value > self.thresholds["extreme_value_threshold"]:
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.EXTREME_VALUES,
-                severity="warning",
-                confidence=0.7,
-                details=f"Extreme values detected (max: {max_abs_value:.3f})",
-                metrics={
-                    "max_abs_value": float(max_abs_value),
-                    "min_value": float(np.min(arr)),
-                    "max_value": float(np.max(arr)),
-                    "source_info": source_info
-                },
-                recommendations=[
-                    "Check input text for unusual content",
-                    "Verify embedding model behavior",
-                    "Consider normalizing embeddings"
-                ]
-            )
+        duplicate_of = self._find_duplicates(safe, dimension_ok)
         
-        # Check variance (insufficient variance suggests mock/fake embeddings)
-        variance = np.var(arr)
-        if variance < self.thresholds["min_variance_threshold"]:
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.INSUFFICIENT_VARIANCE,
-                severity="warning",
-                confidence=0.8,
-                details=f"Very low variance ({variance:.2e}) suggests mock embedding",
-                metrics={
-                    "variance": float(variance),
-                    "std_dev": float(np.std(arr)),
-                    "source_info": source_info
-                },
-                recommendations=[
-                    "Check if mock embeddings are being generated",
-                    "Verify real API is being used",
-                    "Check embedding generation configuration"
-                ]
-            )
+        issue_types = np.full(rows, _VALID_CODE, dtype=np.intp)
+        # Later assignments must not override earlier (more severe) verdicts,
+        # so checks are applied from least to most severe
+        if keys is not None:
+            duplicate_rows = np.flatnonzero(duplicate_of >= 0)
+            for row in duplicate_rows:
+                if keys[row] != keys[duplicate_of[row]]:
+                    issue_types[row] = _ISSUE_CODES[EmbeddingIssueType.DUPLICATE_VECTOR]
+        issue_types[repetition_fraction > self.thresholds["max_repetition_threshold"]] = _ISSUE_CODES[EmbeddingIssueType.SUSPICIOUS_PATTERN]
+        issue_types[variance < self.thresholds["min_variance_threshold"]] = _ISSUE_CODES[EmbeddingIssueType.INSUFFICIENT_VARIANCE]
+        issue_types[max_abs > self.thresholds["extreme_value_threshold"]] = _ISSUE_CODES[EmbeddingIssueType.EXTREME_VALUES]
+        issue_types[zero_fraction > self.thresholds["mostly_zeros_threshold"]] = _ISSUE_CODES[EmbeddingIssueType.MOSTLY_ZEROS]
+        issue_types[zero_fraction == 1.0] = _ISSUE_CODES[EmbeddingIssueType.ALL_ZEROS]
+        issue_types[inf_count > 0] = _ISSUE_CODES[EmbeddingIssueType.INFINITE_VALUES]
+        issue_types[nan_count > 0] = _ISSUE_CODES[EmbeddingIssueType.NAN_VALUES]
+        issue_types[~dimension_ok] = _ISSUE_CODES[EmbeddingIssueType.INVALID_DIMENSIONS]
         
-        # Check for suspicious patterns (too many repeated values)
-        unique_values = len(np.unique(arr))
-        repetition_fraction = 1.0 - (unique_values / len(arr))
-        if repetition_fraction > self.thresholds["max_repetition_threshold"]:
-            return EmbeddingValidationResult(
-                is_valid=False,
-                issue_type=EmbeddingIssueType.SUSPICIOUS_PATTERN,
-                severity="warning",
-                confidence=0.6,
-                details=f"High repetition ({repetition_fraction*100:.1f}%) suggests pattern generation",
-                metrics={
-                    "unique_values": unique_values,
-                    "total_values": len(arr),
-                    "repetition_fraction": repetition_fraction,
-                    "source_info": source_info
-                },
-                recommendations=[
-                    "Check embedding generation algorithm",
-                    "Verify input text diversity",
-                    "Check for algorithmic bias"
-                ]
-            )
+        if dimension_ok.all():
+            dimensions = np.full(rows, self.expected_dimension, dtype=int)
+        else:
+            dimensions = np.array([self._row_length(embedding) for embedding in embeddings], dtype=int)
         
-        # If we get here, the embedding appears valid
-        return EmbeddingValidationResult(
-            is_valid=True,
-            issue_type=EmbeddingIssueType.VALID,
-            severity="info",
-            confidence=1.0,
-            details="Embedding appears valid",
-            metrics={
-                "dimension": len(arr),
-                "zero_fraction": float(zero_fraction),
-                "variance": float(variance),
-                "max_abs_value": float(max_abs_value),
-                "unique_values": unique_values,
-                "source_info": source_info
-            },
-            recommendations=[]
+        return EmbeddingBatchValidation(
+            issue_codes=issue_types,
+            expected_dimension=self.expected_dimension,
+            dimensions=dimensions,
+            zero_fraction=zero_fraction,
+            nan_count=nan_count,
+            inf_count=inf_count,
+            max_abs_value=max_abs,
+            min_value=min_value,
+            max_value=max_value,
+            variance=variance,
+            norm=norm,
+            unique_values=unique_values,
+            repetition_fraction=repetition_fraction,
+            duplicate_of=duplicate_of,
+            conversion_errors=conversion_errors
         )
     
     def validate_batch(
@@ -275,33 +395,77 @@ class EmbeddingValidator:
         Returns:
             Tuple of (individual results, batch summary)
         """
+        validation = self.validate_array(embeddings)
         results = []
-        issue_counts = {issue_type: 0 for issue_type in EmbeddingIssueType}
-        
-        for i, embedding in enumerate(embeddings):
+        for i in range(len(validation)):
             individual_source_info = (source_info or {}).copy()
             individual_source_info["batch_index"] = i
-            
-            result = self.validate_embedding(embedding, individual_source_info)
-            results.append(result)
-            issue_counts[result.issue_type] += 1
+            results.append(validation.result(i, individual_source_info))
         
-        # Generate batch summary
-        total_embeddings = len(embeddings)
-        critical_issues = sum(1 for r in results if r.severity == "critical")
-        warning_issues = sum(1 for r in results if r.severity == "warning")
+        return results, validation.summary()
+    
+    def _to_array(self, embeddings) -> Tuple[np.ndarray, np.ndarray, Dict[int, str]]:
+        """
+        Stack embeddings into an (N, expected_dimension) float array.
         
-        batch_summary = {
-            "total_embeddings": total_embeddings,
-            "valid_embeddings": issue_counts[EmbeddingIssueType.VALID],
-            "critical_issues": critical_issues,
-            "warning_issues": warning_issues,
-            "issue_breakdown": dict(issue_counts),
-            "validation_timestamp": datetime.utcnow().isoformat(),
-            "batch_health_score": (total_embeddings - critical_issues) / total_embeddings if total_embeddings > 0 else 0.0
-        }
+        Rows with the wrong length or non-numeric values are zero-filled and
+        marked in the returned dimension mask.
+        """
+        if isinstance(embeddings, np.ndarray) and embeddings.ndim == 2 and np.issubdtype(embeddings.dtype, np.floating):
+            if embeddings.shape[1] == self.expected_dimension:
+                return embeddings, np.ones(len(embeddings), dtype=bool), {}
+        try:
+            arr = np.asarray(embeddings, dtype=float)
+            if arr.ndim == 2 and arr.shape[1] == self.expected_dimension:
+                return arr, np.ones(len(arr), dtype=bool), {}
+        except (ValueError, TypeError):
+            pass
         
-        return results, batch_summary
+        # Ragged or malformed batch: convert row by row
+        arr = np.zeros((len(embeddings), self.expected_dimension), dtype=float)
+        dimension_ok = np.zeros(len(embeddings), dtype=bool)
+        conversion_errors: Dict[int, str] = {}
+        for i, embedding in enumerate(embeddings):
+            try:
+                row = np.asarray(embedding, dtype=float)
+            except (ValueError, TypeError) as e:
+                conversion_errors[i] = str(e)
+                continue
+            if row.ndim == 1 and len(row) == self.expected_dimension:
+                arr[i] = row
+                dimension_ok[i] = True
+        return arr, dimension_ok, conversion_errors
+    
+    @staticmethod
+    def _row_length(embedding) -> int:
+        try:
+            return len(embedding)
+        except TypeError:
+            return 0
+    
+    @staticmethod
+    def _find_duplicates(arr: np.ndarray, dimension_ok: np.ndarray) -> np.ndarray:
+        """
+        Index of the first earlier identical row for each row, or -1.
+        
+        Rows are bucketed by the exact values of a few sampled columns and
+        only rows in the same bucket are compared element by element.
+        """
+        duplicate_of = np.full(len(arr), -1, dtype=int)
+        if len(arr) < 2:
+            return duplicate_of
+        columns = np.linspace(0, arr.shape[1] - 1, num=min(8, arr.shape[1]), dtype=int)
+        buckets: Dict[bytes, List[int]] = {}
+        for row, fingerprint in enumerate(np.ascontiguousarray(arr[:, columns])):
+            candidates = buckets.setdefault(fingerprint.tobytes(), [])
+            if dimension_ok[row]:
+                for candidate in candidates:
+                    if np.array_equal(arr[candidate], arr[row]):
+                        duplicate_of[row] = candidate
+                        break
+                else:
+                    candidates.append(row)
+        return duplicate_of
     
     def create_error_from_validation_result(
         self, 
@@ -17,14 +17,22 @@ import hashlib
 import json
 import os
 from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import traceback
+import time
+
+import httpx
 
 from core.database import DatabaseManager
+from core.vector_codec import format_vector_text
 from .database_config import create_database_config
 from backend.shared.storage.storage_manager import StorageManager
 from backend.shared.storage.mock_storage import MockStorageManager
 from backend.shared.external import RealLlamaParseService, OpenAIClient
+from backend.shared.external.blob_transfer import BlobSourceError, transfer_blob
+from backend.shared.chunking.markdown_chunker import CHUNKER_NAME, PAGE_MARKER_TEMPLATE, MarkdownChunker
+from backend.shared.external.embedding_service import get_embedding_service, close_embedding_service
+from backend.shared.external.embedding_pipeline import EmbeddingPipeline, estimate_tokens, get_openai_rate_limiter
 from backend.shared.external.service_router import ServiceRouter, ServiceMode, ServiceUnavailableError, ServiceExecutionError
 from backend.shared.exceptions import UserFacingError
 from backend.shared.logging import StructuredLogger
@@ -42,6 +50,42 @@ from config.configuration_manager import get_config_manager
 
 logger = logging.getLogger(__name__)
 
+# Notified once a document's embeddings are stored; the API process listens on
+# this channel to refresh per-user quick info indexes
+# (agents/unified_navigator/tools/quick_info_index.py)
+DOCUMENT_EMBEDDED_CHANNEL = "upload_pipeline_document_embedded"
+
+# Notified by a trigger on upload_jobs inserts and status changes
+# (supabase/migrations/20251017000000_upload_job_notify.sql)
+JOB_READY_CHANNEL = "upload_pipeline_job_ready"
+JOB_READY_TRIGGER = "trg_upload_jobs_notify_status"
+
+# Fast lane: status a stage starts from -> status it checkpoints on success.
+# A fast-lane job keeps running while its checkpoint is in this map.
+FAST_LANE_NEXT_STATUS = {
+    "parsed": "parse_validated",
+    "parse_validated": "chunks_stored",
+    "chunking": "chunks_stored",
+    "chunks_stored": "embeddings_stored",
+    "embedding_queued": "embeddings_stored",
+    "embedding_in_progress": "embeddings_stored",
+    "embeddings_stored": "complete",
+}
+
+# Pipeline stage for each status the worker claims; concurrent job mode caps
+# the number of running jobs per stage
+JOB_STAGES = {
+    "uploaded": "parse",
+    "parse_queued": "parse",
+    "parsed": "parse",
+    "parse_validated": "chunk",
+    "chunking": "chunk",
+    "chunks_stored": "embed",
+    "embedding_queued": "embed",
+    "embedding_in_progress": "embed",
+    "embeddings_stored": "finalize",
+}
+
 
 class EnhancedBaseWorker:
     """
@@ -69,12 +113,52 @@ class EnhancedBaseWorker:
         self.storage = None
         self.service_router = None
         self.enhanced_service_client = None
+        self.llamaparse_client = None
         
         # Processing configuration from config
         self.poll_interval = config.poll_interval
         self.max_retries = config.max_retries
         self.retry_base_delay = config.retry_base_delay
         
+        # Concurrent job mode: claim up to job_batch_size jobs per poll
+        self.job_batch_size = config.job_batch_size
+        self.stage_limits = {
+            "parse": config.parse_concurrency,
+            "chunk": config.chunk_concurrency,
+            "embed": config.embed_concurrency,
+            "finalize": config.job_batch_size,
+        }
+        self.active_jobs: Dict[Any, asyncio.Task] = {}
+        self.active_stage_counts: Dict[str, int] = {stage: 0 for stage in self.stage_limits}
+        # Stage slot each running job holds (None while waiting for the next one)
+        self._job_stage_slots: Dict[Any, Optional[str]] = {}
+        self._stage_slot_freed = asyncio.Event()
+        self.shutdown_timeout = config.shutdown_timeout
+        self._loop_stopped = asyncio.Event()
+        self._loop_stopped.set()
+        
+        # Job wakeup: poll as soon as a job is created or changes status
+        self.listen_for_jobs = config.listen_for_jobs
+        self.fallback_poll_interval = config.fallback_poll_interval
+        self._job_ready = asyncio.Event()
+        self._listener_conn = None
+        self.wakeup_stats = {"notifications": 0, "notified_polls": 0, "fallback_polls": 0}
+        
+        # Claimed jobs carry a lease in progress.claim until they are released
+        self.claim_lease_seconds = config.claim_lease_seconds
+        
+        # Fast lane: carry parsed content and chunks between stages in memory
+        self.fast_lane = config.fast_lane
+        
+        # Content-addressed embedding reuse (upload_pipeline.embedding_store)
+        self.embedding_reuse_enabled = config.embedding_reuse_enabled
+        
+        # Structure-aware chunker; token counts are stored with each chunk
+        self.chunker = MarkdownChunker(
+            max_tokens=config.chunk_max_tokens,
+            overlap_tokens=config.chunk_overlap_tokens
+        )
+        
         # Circuit breaker state
         self.circuit_open = False
         self.failure_count = 0
@@ -103,7 +187,7 @@ class EnhancedBaseWorker:
             
             # Initialize database
             db_config = create_database_config()
-            self.db = DatabaseManager(db_config)
+            self.db = DatabaseManager(db_config, binary_vectors=True)
             await self.db.initialize()
             
             # Initialize storage
@@ -143,7 +227,9 @@ class EnhancedBaseWorker:
                     "fallback_enabled": os.getenv("ENVIRONMENT", "development") != "production",
                     "llamaparse_config": {
                         "api_key": self.config.llamaparse_api_key,
-                        "api_url": self.config.llamaparse_api_url
+                        "api_url": self.config.llamaparse_api_url,
+                        # Stream documents to LlamaParse over the pooled storage client
+                        "storage_client": getattr(self.storage, "client", None)
                     },
                     "openai_config": {
                         "api_key": self.config.openai_api_key,
@@ -199,7 +285,11 @@ class EnhancedBaseWorker:
                 await self.initialize()
             
             self.running = True
-            await self.process_jobs_continuously()
+            self._loop_stopped.clear()
+            try:
+                await self.process_jobs_continuously()
+            finally:
+                self._loop_stopped.set()
             
         except Exception as e:
             error = self.error_handler.create_error(
@@ -229,11 +319,24 @@ class EnhancedBaseWorker:
             )
             
             self.running = False
+            # Wake the loop so it sees running=False without waiting out a poll
+            self._job_ready.set()
+            
+            # In-flight jobs still hold the pool and service clients
+            await self._drain_jobs(correlation_id)
+            
+            await self._stop_job_listener()
             
             # Close database connections
             if self.db:
                 await self.db.close()
             
+            await close_embedding_service()
+            
+            if self.llamaparse_client:
+                await self.llamaparse_client.aclose()
+                self.llamaparse_client = None
+            
             self.logger.info(
                 "Enhanced BaseWorker stopped successfully",
                 correlation_id=correlation_id,
@@ -252,6 +355,42 @@ class EnhancedBaseWorker:
             self.error_handler.log_error(error)
             raise
     
+    async def _drain_jobs(self, correlation_id: str):
+        """
+        Wait up to shutdown_timeout for the job loop and in-flight jobs to finish.
+        
+        Jobs still running after that are cancelled, so stop() never closes
+        shared resources under a job that is mid-stage.
+        """
+        async def _idle():
+            await self._loop_stopped.wait()
+            while self.active_jobs:
+                await asyncio.gather(*self.active_jobs.values(), return_exceptions=True)
+        
+        if self._loop_stopped.is_set() and not self.active_jobs:
+            return
+        
+        self.logger.info(
+            "Waiting for in-flight jobs before shutdown",
+            correlation_id=correlation_id,
+            worker_id=self.worker_id,
+            active_jobs=len(self.active_jobs),
+            shutdown_timeout=self.shutdown_timeout
+        )
+        try:
+            await asyncio.wait_for(_idle(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            remaining = list(self.active_jobs.values())
+            self.logger.warning(
+                "In-flight jobs did not finish before shutdown timeout, cancelling",
+                correlation_id=correlation_id,
+                worker_id=self.worker_id,
+                active_jobs=len(remaining)
+            )
+            for task in remaining:
+                task.cancel()
+            await asyncio.gather(*remaining, return_exceptions=True)
+    
     async def process_jobs_continuously(self):
         """Main worker loop with enhanced error handling"""
         correlation_id = create_correlation_id()
@@ -263,9 +402,16 @@ class EnhancedBaseWorker:
         self.logger.info(
             "Starting job processing loop",
             correlation_id=correlation_id,
-            worker_id=self.worker_id
+            worker_id=self.worker_id,
+            job_batch_size=self.job_batch_size
         )
         
+        await self._start_job_listener()
+        
+        if self.job_batch_size > 1:
+            await self._process_jobs_concurrently(correlation_id, context)
+            return
+        
         loop_count = 0
         while self.running:
             try:
@@ -274,10 +420,69 @@ class EnhancedBaseWorker:
                 # Get next job
                 job = await self._get_next_job()
                 if job:
-                    await self._process_single_job_with_monitoring(job)
+                    await self._process_job(job)
                 else:
-                    # No jobs available, wait before next poll
-                    await asyncio.sleep(self.poll_interval)
+                    # No jobs available, wait for a notification or the next poll
+                    await self._wait_for_jobs()
+                    
+            except asyncio.CancelledError:
+                self.logger.info(
+                    "Worker loop cancelled",
+                    correlation_id=correlation_id,
+                    worker_id=self.worker_id
+                )
+                break
+            except Exception as e:
+                error = self.error_handler.create_error(
+                    error_code="JOB_PROCESSING_LOOP_ERROR",
+                    error_message="Error in job processing loop",
+                    severity=ErrorSeverity.ERROR,
+                    category=ErrorCategory.PROCESSING_ERROR,
+                    context=context,
+                    original_exception=e
+                )
+                self.error_handler.log_error(error)
+                await asyncio.sleep(10)  # Wait before retrying
+        
+        self.logger.info(
+            "Job processing loop stopped",
+            correlation_id=correlation_id,
+            worker_id=self.worker_id
+        )
+    
+    async def _process_jobs_concurrently(self, correlation_id: str, context):
+        """
+        Concurrent worker loop: claim up to job_batch_size jobs per poll.
+        
+        Only statuses whose stage has a free slot are claimed, so a slow
+        LlamaParse or embedding job no longer blocks documents at other stages.
+        The loop polls again as soon as any running job finishes.
+        """
+        while self.running:
+            try:
+                free_slots = self.job_batch_size - len(self.active_jobs)
+                claimed = []
+                if free_slots > 0:
+                    # parse_queued jobs only wait on the LlamaParse webhook, and
+                    # re-claiming them every time a slot frees would spin
+                    statuses = [
+                        status for status, stage in JOB_STAGES.items()
+                        if status != "parse_queued"
+                        and self.active_stage_counts[stage] < self.stage_limits[stage]
+                    ]
+                    if statuses:
+                        jobs = await self._get_next_jobs(
+                            free_slots, statuses=statuses, exclude_job_ids=list(self.active_jobs)
+                        )
+                        claimed = [job for job in jobs if self._start_job(job)]
+                        for job in jobs:
+                            if job not in claimed:
+                                await self._release_claim_lease(job["job_id"])
+                
+                if self.active_jobs or not claimed:
+                    # Poll again when a slot frees up, a job is notified, or
+                    # the poll interval elapses
+                    await self._wait_for_jobs(list(self.active_jobs.values()))
                     
             except asyncio.CancelledError:
                 self.logger.info(
@@ -298,14 +503,183 @@ class EnhancedBaseWorker:
                 self.error_handler.log_error(error)
                 await asyncio.sleep(10)  # Wait before retrying
         
+        # Let in-flight jobs reach their next checkpoint before returning
+        if self.active_jobs:
+            self.logger.info(
+                "Waiting for in-flight jobs to finish",
+                correlation_id=correlation_id,
+                worker_id=self.worker_id,
+                active_jobs=len(self.active_jobs)
+            )
+            await asyncio.gather(*self.active_jobs.values(), return_exceptions=True)
+        
         self.logger.info(
             "Job processing loop stopped",
             correlation_id=correlation_id,
             worker_id=self.worker_id
         )
     
+    async def _start_job_listener(self) -> bool:
+        """
+        LISTEN for job notifications on a dedicated pooled connection.
+        
+        Returns:
+            True if the listener is active; otherwise the worker keeps
+            polling every poll_interval
+        """
+        if not self.listen_for_jobs or self._listener_conn is not None:
+            return self._listener_conn is not None
+        
+        conn = None
+        try:
+            conn = await self.db.pool.acquire()
+            has_trigger = await conn.fetchval(
+                "SELECT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = $1)", JOB_READY_TRIGGER
+            )
+            if not has_trigger:
+                await self.db.pool.release(conn)
+                self.logger.warning(
+                    "Upload job notify trigger not installed, polling for jobs",
+                    worker_id=self.worker_id,
+                    poll_interval=self.poll_interval
+                )
+                return False
+            
+            await conn.add_listener(JOB_READY_CHANNEL, self._on_job_ready)
+            self._listener_conn = conn
+            self.logger.info(
+                "Listening for upload job notifications",
+                worker_id=self.worker_id,
+                channel=JOB_READY_CHANNEL,
+                fallback_poll_interval=self.fallback_poll_interval
+            )
+            return True
+        except Exception as e:
+            if conn is not None:
+                await self.db.pool.release(conn)
+            self.logger.warning(
+                "Job listener not started, polling for jobs",
+                worker_id=self.worker_id,
+                error=str(e)
+            )
+            return False
+    
+    async def _stop_job_listener(self):
+        """Stop listening and return the connection to the pool."""
+        conn, self._listener_conn = self._listener_conn, None
+        if conn is None:
+            return
+        try:
+            if not conn.is_closed():
+                await conn.remove_listener(JOB_READY_CHANNEL, self._on_job_ready)
+            await self.db.pool.release(conn)
+        except Exception as e:
+            self.logger.warning("Error stopping job listener", worker_id=self.worker_id, error=str(e))
+    
+    def _on_job_ready(self, connection, pid, channel, payload):
+        """asyncpg listener callback; payload is JSON {job_id, status}."""
+        self.wakeup_stats["notifications"] += 1
+        self._job_ready.set()
+    
+    async def _wait_for_jobs(self, active_tasks: Optional[List[asyncio.Task]] = None):
+        """
+        Wait until a job is notified, a running job finishes, or the poll
+        interval elapses. While listening, the interval is only a fallback.
+        """
+        if self._listener_conn is not None and self._listener_conn.is_closed():
+            # Listener connection dropped (e.g. database restart); re-listen
+            await self._stop_job_listener()
+            await self._start_job_listener()
+        
+        timeout = self.fallback_poll_interval if self._listener_conn is not None else self.poll_interval
+        ready = asyncio.ensure_future(self._job_ready.wait())
+        try:
+            done, _ = await asyncio.wait(
+                [ready, *(active_tasks or [])],
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            ready.cancel()
+        
+        if ready in done:
+            self.wakeup_stats["notified_polls"] += 1
+        elif not done:
+            self.wakeup_stats["fallback_polls"] += 1
+        # Any notification so far is covered by the poll that follows
+        self._job_ready.clear()
+    
+    def _start_job(self, job: Dict[str, Any]) -> bool:
+        """Start a claimed job as a task if its stage has a free slot."""
+        stage = JOB_STAGES[job["status"]]
+        if self.active_stage_counts[stage] >= self.stage_limits[stage]:
+            # Not locked beyond the claim query; it is picked up on a later poll
+            return False
+        
+        self.active_stage_counts[stage] += 1
+        self._job_stage_slots[job["job_id"]] = stage
+        task = asyncio.create_task(self._process_job(job))
+        self.active_jobs[job["job_id"]] = task
+        
+        def _finished(done: asyncio.Task):
+            self._release_stage_slot(job["job_id"])
+            self._job_stage_slots.pop(job["job_id"], None)
+            self.active_jobs.pop(job["job_id"], None)
+            # Failures are already logged and recorded on the job
+            if not done.cancelled():
+                done.exception()
+        
+        task.add_done_callback(_finished)
+        return True
+    
+    def _release_stage_slot(self, job_id):
+        """Give back the stage slot a running job holds, if any."""
+        stage = self._job_stage_slots.get(job_id)
+        if stage is None:
+            return
+        self.active_stage_counts[stage] -= 1
+        self._job_stage_slots[job_id] = None
+        self._stage_slot_freed.set()
+    
+    async def _move_stage_slot(self, job_id, stage: str):
+        """
+        Move a running job into a slot for `stage`, waiting while that stage is full.
+        
+        Jobs run inline (job_batch_size=1) hold no slots and return at once.
+        """
+        if job_id not in self._job_stage_slots or self._job_stage_slots[job_id] == stage:
+            return
+        self._release_stage_slot(job_id)
+        while self.active_stage_counts[stage] >= self.stage_limits[stage]:
+            self._stage_slot_freed.clear()
+            await self._stage_slot_freed.wait()
+        self.active_stage_counts[stage] += 1
+        self._job_stage_slots[job_id] = stage
+    
     async def _get_next_job(self) -> Optional[Dict[str, Any]]:
         """Get next job from queue with proper error handling"""
+        jobs = await self._get_next_jobs(1)
+        return jobs[0] if jobs else None
+    
+    async def _get_next_jobs(
+        self,
+        limit: int,
+        statuses: Optional[List[str]] = None,
+        exclude_job_ids: Optional[List[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Claim up to `limit` jobs in status-priority order.
+        
+        The claim stamps a lease (worker_id, claimed_until) in progress.claim
+        in the same statement, so other workers skip the job until it is
+        released or the lease expires; the row lock alone ends with the
+        claim query.
+        
+        Args:
+            limit: Maximum number of jobs to return
+            statuses: Claimable statuses (defaults to every stage in JOB_STAGES)
+            exclude_job_ids: Jobs this worker is already running
+        """
         correlation_id = create_correlation_id()
         context = create_error_context(
             correlation_id=correlation_id,
@@ -314,50 +688,69 @@ class EnhancedBaseWorker:
         
         try:
             async with self.db.get_connection() as conn:
-                job = await conn.fetchrow("""
+                jobs = await conn.fetch("""
                     WITH next_job AS (
-                        SELECT uj.job_id, uj.document_id, d.user_id, uj.status, uj.state,
-                               uj.progress, uj.retry_count, uj.last_error, uj.created_at,
-                               d.raw_path as storage_path, d.mime as mime_type
+                        SELECT uj.job_id,
+                               CASE uj.status
+                                   WHEN 'parsed' THEN 1
+                                   WHEN 'parse_validated' THEN 2
+                                   WHEN 'chunking' THEN 3
+                                   WHEN 'chunks_stored' THEN 4
+                                   WHEN 'embedding_queued' THEN 5
+                                   WHEN 'embedding_in_progress' THEN 6
+                                   WHEN 'embeddings_stored' THEN 7
+                                   WHEN 'uploaded' THEN 8
+                                   WHEN 'parse_queued' THEN 9
+                                   WHEN 'complete' THEN 10
+                                   WHEN 'duplicate' THEN 11
+                                   ELSE 12
+                               END AS claim_priority
                         FROM upload_pipeline.upload_jobs uj
                         JOIN upload_pipeline.documents d ON uj.document_id = d.document_id
-                        WHERE uj.status IN (
-                            'uploaded', 'parse_queued', 'parsed', 'parse_validated', 
-                            'chunking', 'chunks_stored', 'embedding_queued', 'embedding_in_progress', 'embeddings_stored'
+                        WHERE uj.status = ANY($1::text[])
+                        AND NOT (uj.job_id = ANY($2::uuid[]))
+                        AND (
+                            uj.progress->'claim' IS NULL
+                            OR (uj.progress->'claim'->>'claimed_until')::timestamptz <= now()
                         )
                         AND (
                             uj.last_error IS NULL 
                             OR (uj.last_error->>'retry_at')::timestamp <= now()
                             OR (uj.last_error->>'retry_at') IS NULL
                         )
-                        ORDER BY 
-                            CASE uj.status
-                                WHEN 'parsed' THEN 1
-                                WHEN 'parse_validated' THEN 2
-                                WHEN 'chunking' THEN 3
-                                WHEN 'chunks_stored' THEN 4
-                                WHEN 'embedding_queued' THEN 5
-                                WHEN 'embedding_in_progress' THEN 6
-                                WHEN 'embeddings_stored' THEN 7
-                                WHEN 'uploaded' THEN 8
-                                WHEN 'parse_queued' THEN 9
-                                WHEN 'complete' THEN 10
-                                WHEN 'duplicate' THEN 11
-                                ELSE 12
-                            END,
-                            uj.created_at
-                        FOR UPDATE SKIP LOCKED
-                        LIMIT 1
+                        ORDER BY claim_priority, uj.created_at
+                        FOR UPDATE OF uj SKIP LOCKED
+                        LIMIT $3
+                    ),
+                    claimed AS (
+                        UPDATE upload_pipeline.upload_jobs uj
+                        SET progress = coalesce(uj.progress, '{}'::jsonb) || jsonb_build_object(
+                            'claim', jsonb_build_object(
+                                'worker_id', $4::text,
+                                'claimed_until', now() + make_interval(secs => $5)
+                            )
+                        )
+                        FROM next_job, upload_pipeline.documents d
+                        WHERE uj.job_id = next_job.job_id
+                        AND d.document_id = uj.document_id
+                        RETURNING uj.job_id, uj.document_id, d.user_id, uj.status, uj.state,
+                                  uj.progress, uj.retry_count, uj.last_error, uj.created_at,
+                                  d.raw_path as storage_path, d.mime as mime_type,
+                                  next_job.claim_priority
                     )
-                    SELECT * FROM next_job
-                """)
+                    SELECT job_id, document_id, user_id, status, state, progress,
+                           retry_count, last_error, created_at, storage_path, mime_type
+                    FROM claimed
+                    ORDER BY claim_priority, created_at
+                """, statuses or list(JOB_STAGES), exclude_job_ids or [], limit,
+                    self.worker_id, float(self.claim_lease_seconds))
                 
-                if job:
+                claimed = []
+                for job in jobs:
                     job_dict = dict(job)
-                    job_dict["correlation_id"] = correlation_id
-                    return job_dict
-                
-                return None
+                    job_dict["correlation_id"] = correlation_id if len(jobs) == 1 else create_correlation_id()
+                    claimed.append(job_dict)
+                return claimed
                 
         except Exception as e:
             error = self.error_handler.create_error(
@@ -371,8 +764,116 @@ class EnhancedBaseWorker:
             self.error_handler.log_error(error)
             raise
     
-    async def _process_single_job_with_monitoring(self, job: Dict[str, Any]):
-        """Process a single job with comprehensive error handling"""
+    async def _process_job(self, job: Dict[str, Any]):
+        """
+        Process a claimed job, chaining stages in-process when the fast lane is on.
+        
+        The claim lease is released afterwards so the job's next stage can be
+        claimed by any worker.
+        """
+        try:
+            if self.fast_lane and job["status"] in FAST_LANE_NEXT_STATUS:
+                return await self._process_job_fast_lane(job)
+            return await self._process_single_job_with_monitoring(job)
+        finally:
+            await self._release_claim_lease(job["job_id"])
+    
+    async def _process_job_fast_lane(self, job: Dict[str, Any]) -> bool:
+        """
+        Run a job through consecutive stages without going back to the queue.
+        
+        Each stage still writes its status checkpoint, so a crash resumes from
+        the last completed stage. Parsed content and chunks are handed to the
+        next stage on the job dict instead of being re-read from storage and
+        document_chunks. The claim lease is renewed before each stage, which
+        keeps other workers from claiming the job between checkpoints; it
+        expires on its own if this worker dies, and the chain stops if the
+        lease is lost. In concurrent
+        mode the job moves to the next stage's slot before running it, so
+        stage_limits still cap each stage.
+        """
+        job_id = job["job_id"]
+        correlation_id = job.get("correlation_id") or create_correlation_id()
+        
+        if not await self._renew_claim_lease(job_id):
+            self.logger.info(
+                "Job is leased by another worker, skipping",
+                correlation_id=correlation_id,
+                job_id=str(job_id)
+            )
+            return False
+        
+        start_status = job["status"]
+        stages = 0
+        try:
+            while await self._process_single_job_with_monitoring(job):
+                stages += 1
+                job["status"] = FAST_LANE_NEXT_STATUS[job["status"]]
+                if job["status"] not in FAST_LANE_NEXT_STATUS or not self.running:
+                    break
+                await self._move_stage_slot(job_id, JOB_STAGES[job["status"]])
+                if not await self._renew_claim_lease(job_id):
+                    self.logger.warning(
+                        "Claim lease lost, leaving the job to the queue",
+                        correlation_id=correlation_id,
+                        job_id=str(job_id),
+                        status=job["status"]
+                    )
+                    break
+            return stages > 0
+        finally:
+            job.pop("parsed_content", None)
+            job.pop("chunks", None)
+            self.logger.info(
+                "Fast lane finished",
+                correlation_id=correlation_id,
+                job_id=str(job_id),
+                start_status=start_status,
+                end_status=job["status"],
+                stages=stages
+            )
+    
+    async def _renew_claim_lease(self, job_id) -> bool:
+        """Take or extend this worker's claim lease; False if another worker holds it."""
+        async with self.db.get_connection() as conn:
+            leased = await conn.fetchval("""
+                UPDATE upload_pipeline.upload_jobs
+                SET progress = coalesce(progress, '{}'::jsonb) || jsonb_build_object(
+                    'claim', jsonb_build_object(
+                        'worker_id', $2::text,
+                        'claimed_until', now() + make_interval(secs => $3)
+                    )
+                )
+                WHERE job_id = $1
+                AND (
+                    progress->'claim' IS NULL
+                    OR progress->'claim'->>'worker_id' = $2
+                    OR (progress->'claim'->>'claimed_until')::timestamptz <= now()
+                )
+                RETURNING job_id
+            """, job_id, self.worker_id, float(self.claim_lease_seconds))
+        return leased is not None
+    
+    async def _release_claim_lease(self, job_id):
+        """Drop this worker's claim lease so the job is claimable again."""
+        try:
+            async with self.db.get_connection() as conn:
+                await conn.execute("""
+                    UPDATE upload_pipeline.upload_jobs
+                    SET progress = progress - 'claim'
+                    WHERE job_id = $1 AND progress->'claim'->>'worker_id' = $2
+                """, job_id, self.worker_id)
+        except Exception as e:
+            # The lease expires on its own
+            self.logger.warning("Failed to release claim lease", job_id=str(job_id), error=str(e))
+    
+    async def _process_single_job_with_monitoring(self, job: Dict[str, Any]) -> bool:
+        """
+        Process a single job with comprehensive error handling.
+        
+        Returns:
+            True if the stage completed, False if a user-facing error was handled
+        """
         job_id = job["job_id"]
         status = job["status"]
         correlation_id = job.get("correlation_id") or create_correlation_id()
@@ -440,7 +941,8 @@ class EnhancedBaseWorker:
                     "Job completed successfully",
                     correlation_id=correlation_id,
                     job_id=str(job_id),
-                    status=status
+                    status=status,
+                    upload_to_ready_seconds=self._seconds_since(job.get("created_at"))
                 )
             elif status in ["complete", "duplicate"]:
                 # Job is already complete or duplicate, skip processing
@@ -469,6 +971,7 @@ class EnhancedBaseWorker:
                 job_id=str(job_id),
                 processing_time_seconds=processing_time
             )
+            return True
             
         except UserFacingError as e:
             duration = (datetime.utcnow() - start_time).total_seconds()
@@ -488,6 +991,7 @@ class EnhancedBaseWorker:
             
             # Handle error - retry or mark as failed
             await self._handle_processing_error_enhanced(job, e, correlation_id)
+            return False
         except Exception as e:
             error = self.error_handler.create_error(
                 error_code=f"JOB_PROCESSING_FAILED_{status.upper()}",
@@ -913,6 +1417,10 @@ class EnhancedBaseWorker:
             if not parsed_content or len(parsed_content.strip()) == 0:
                 raise ValueError("Parsed content is empty")
             
+            if self.fast_lane:
+                # Handed to the chunking stage instead of downloading it again
+                job["parsed_content"] = parsed_content
+            
             # Validate content quality
             if len(parsed_content) < 100:
                 self.logger.warning(
@@ -974,66 +1482,67 @@ class EnhancedBaseWorker:
                 user_id=user_id
                 )
             
-            # Get parsed content
-            async with self.db.get_connection() as conn:
-                doc_info = await conn.fetchrow("""
-                    SELECT raw_path, parsed_path, parsed_sha256 
-                    FROM upload_pipeline.documents 
-                    WHERE document_id = $1
-                """, document_id)
-            
-                if not doc_info:
-                    raise ValueError(f"No document found for document_id {document_id}")
-                
-                # Use raw_path for reading the original file
-                file_path = doc_info["raw_path"]
-                if not file_path:
-                    raise ValueError(f"No raw_path found for document {document_id}")
-            
-            # Read actual file content from blob storage
-            self.logger.info(f"Reading file from storage: {file_path}")
-            
-            # Extract bucket and key from file_path
-            if file_path.startswith("files/user/"):
-                key = file_path[6:]  # Remove "files/" prefix
-                bucket = "files"
-            else:
-                raise ValueError(f"Invalid file_path format: {file_path}")
-            
-            # Read parsed content from storage (not raw file)
-            try:
-                # Get parsed content path from database
+            # Fast lane hands over the content read by the validation stage
+            parsed_content = job.get("parsed_content")
+            if parsed_content is None:
+                # Get parsed content
                 async with self.db.get_connection() as conn:
-                    parsed_info = await conn.fetchrow("""
-                        SELECT parsed_path FROM upload_pipeline.documents 
+                    doc_info = await conn.fetchrow("""
+                        SELECT raw_path, parsed_path, parsed_sha256 
+                        FROM upload_pipeline.documents 
                         WHERE document_id = $1
                     """, document_id)
+            
+                    if not doc_info:
+                        raise ValueError(f"No document found for document_id {document_id}")
+                
+                    # Use raw_path for reading the original file
+                    file_path = doc_info["raw_path"]
+                    if not file_path:
+                        raise ValueError(f"No raw_path found for document {document_id}")
+            
+                # Read actual file content from blob storage
+                self.logger.info(f"Reading file from storage: {file_path}")
+            
+                # Extract bucket and key from file_path
+                if file_path.startswith("files/user/"):
+                    key = file_path[6:]  # Remove "files/" prefix
+                    bucket = "files"
+                else:
+                    raise ValueError(f"Invalid file_path format: {file_path}")
+            
+                # Read parsed content from storage (not raw file)
+                try:
+                    # Get parsed content path from database
+                    async with self.db.get_connection() as conn:
+                        parsed_info = await conn.fetchrow("""
+                            SELECT parsed_path FROM upload_pipeline.documents 
+                            WHERE document_id = $1
+                        """, document_id)
                     
-                    if not parsed_info or not parsed_info["parsed_path"]:
-                        raise ValueError(f"No parsed content found for document {document_id}")
+                        if not parsed_info or not parsed_info["parsed_path"]:
+                            raise ValueError(f"No parsed content found for document {document_id}")
                     
-                    parsed_path = parsed_info["parsed_path"]
+                        parsed_path = parsed_info["parsed_path"]
                 
-                # Read parsed content from storage
-                parsed_content = await self.storage.read_blob(parsed_path)
+                    # Read parsed content from storage
+                    parsed_content = await self.storage.read_blob(parsed_path)
                 
-                if not parsed_content or len(parsed_content.strip()) == 0:
-                    raise ValueError("Parsed content is empty or not found")
+                    if not parsed_content or len(parsed_content.strip()) == 0:
+                        raise ValueError("Parsed content is empty or not found")
                 
-                self.logger.info(f"Successfully read {len(parsed_content)} characters of parsed content from storage")
+                    self.logger.info(f"Successfully read {len(parsed_content)} characters of parsed content from storage")
                     
-            except Exception as e:
-                self.logger.error(f"Failed to read parsed content from storage: {str(e)}")
-                raise ValueError(f"Cannot proceed with chunking - parsed content not available: {str(e)}")
+                except Exception as e:
+                    self.logger.error(f"Failed to read parsed content from storage: {str(e)}")
+                    raise ValueError(f"Cannot proceed with chunking - parsed content not available: {str(e)}")
             
             if not parsed_content or len(parsed_content.strip()) == 0:
                 raise ValueError("Parsed content is empty")
             
-            # Generate chunks (simplified chunking for now)
-            chunks = await self._generate_chunks(parsed_content, "1")
+            chunks = await self._generate_chunks(parsed_content)
             
             # Store chunks in database
-            import hashlib
             async with self.db.get_connection() as conn:
                 # Get configuration for duplicate chunk check
                 config_manager = get_config_manager()
@@ -1041,13 +1550,34 @@ class EnhancedBaseWorker:
                 
                 # Initialize existing_chunks for logging purposes
                 existing_chunks = 0
+                inserted_chunks = 0
+                insert_seconds = 0.0
+                
+                # Documents duplicated in reference mode share another
+                # document's chunk set and never get chunks of their own
+                chunk_source_id = await conn.fetchval("""
+                    SELECT chunk_source_document_id FROM upload_pipeline.documents
+                    WHERE document_id = $1
+                """, document_id)
                 
-                if duplicate_check_enabled:
+                if chunk_source_id is not None:
+                    existing_chunks = await conn.fetchval("""
+                        SELECT COUNT(*) FROM upload_pipeline.document_chunks 
+                        WHERE document_id = $1
+                    """, chunk_source_id)
+                    self.logger.info(
+                        f"Document {document_id} shares chunks of document {chunk_source_id}, skipping chunk insert",
+                        correlation_id=correlation_id,
+                        job_id=str(job_id),
+                        document_id=str(document_id),
+                        existing_chunks=existing_chunks
+                    )
+                elif duplicate_check_enabled:
                     # Check if chunks already exist for this document
                     existing_chunks = await conn.fetchval("""
                         SELECT COUNT(*) FROM upload_pipeline.document_chunks 
                         WHERE document_id = $1 AND chunker_name = $2
-                    """, document_id, chunks[0]["chunker_name"] if chunks else "markdown-simple")
+                    """, document_id, CHUNKER_NAME)
                     
                     if existing_chunks > 0:
                         self.logger.info(
@@ -1057,76 +1587,53 @@ class EnhancedBaseWorker:
                             document_id=str(document_id),
                             existing_chunks=existing_chunks
                         )
-                        # Chunks already exist, continue to next stage without error
-                    else:
-                        # Insert chunks only if they don't exist
-                        for i, chunk in enumerate(chunks):
-                            chunk_id = str(uuid.uuid4())
-                            chunk_sha = hashlib.sha256(chunk["text"].encode('utf-8')).hexdigest()
-                            try:
-                                await conn.execute("""
-                                    INSERT INTO upload_pipeline.document_chunks 
-                                    (chunk_id, document_id, chunker_name, chunker_version, chunk_ord, text, chunk_sha, 
-                                     embed_model, embed_version, vector_dim, embedding, created_at, updated_at)
-                                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, now(), now())
-                                """, chunk_id, document_id, chunk["chunker_name"], chunk["chunker_version"], 
-                                    i, chunk["text"], chunk_sha, "text-embedding-3-small", "1", 1536, 
-                                    "[" + ",".join(["0.0"] * 1536) + "]")  # Placeholder embedding vector as string
-                            except Exception as e:
-                                if "duplicate key value violates unique constraint" in str(e):
-                                    self.logger.info(
-                                        f"Chunk {i} already exists for document {document_id}, skipping",
-                                        correlation_id=correlation_id,
-                                        job_id=str(job_id),
-                                        document_id=str(document_id),
-                                        chunk_ord=i
-                                    )
-                                    continue  # Skip this chunk and continue with the next one
-                                else:
-                                    raise  # Re-raise if it's a different error
                 else:
-                    # Duplicate check disabled - insert chunks without checking
                     self.logger.info(
                         f"Duplicate chunk check disabled - inserting chunks for document {document_id}",
                         correlation_id=correlation_id,
                         job_id=str(job_id),
                         document_id=str(document_id)
                     )
+                
+                async with conn.transaction():
+                    if existing_chunks == 0 and chunks and chunk_source_id is None:
+                        insert_start = time.perf_counter()
+                        inserted_chunks = await self._bulk_insert_chunks(conn, document_id, chunks)
+                        insert_seconds = time.perf_counter() - insert_start
+                        
+                        if inserted_chunks < len(chunks):
+                            self.logger.info(
+                                f"{len(chunks) - inserted_chunks} chunks already existed for document {document_id}, skipped",
+                                correlation_id=correlation_id,
+                                job_id=str(job_id),
+                                document_id=str(document_id),
+                                skipped_chunks=len(chunks) - inserted_chunks
+                            )
                     
-                    for i, chunk in enumerate(chunks):
-                        chunk_id = str(uuid.uuid4())
-                        chunk_sha = hashlib.sha256(chunk["text"].encode('utf-8')).hexdigest()
-                        try:
-                            await conn.execute("""
-                                INSERT INTO upload_pipeline.document_chunks 
-                                (chunk_id, document_id, chunker_name, chunker_version, chunk_ord, text, chunk_sha, 
-                                 embed_model, embed_version, vector_dim, embedding, created_at, updated_at)
-                                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, now(), now())
-                            """, chunk_id, document_id, chunk["chunker_name"], chunk["chunker_version"], 
-                                i, chunk["text"], chunk_sha, "text-embedding-3-small", "1", 1536, 
-                                "[" + ",".join(["0.0"] * 1536) + "]")  # Placeholder embedding vector as string
-                        except Exception as e:
-                            # When duplicate check is disabled, we still need to handle constraint violations
-                            # but we'll log them as warnings instead of skipping
-                            if "duplicate key value violates unique constraint" in str(e):
-                                self.logger.warning(
-                                    f"Duplicate chunk constraint violation for document {document_id}, chunk {i} - this should not happen with duplicate check disabled",
-                                    correlation_id=correlation_id,
-                                    job_id=str(job_id),
-                                    document_id=str(document_id),
-                                    chunk_ord=i
-                                )
-                                # Still continue to avoid pipeline failure
-                                continue
-                            else:
-                                raise  # Re-raise if it's a different error
+                    rows_per_second = inserted_chunks / insert_seconds if insert_seconds > 0 else 0.0
+                    chunk_metrics = {
+                        "chunk_count": len(chunks),
+                        "inserted_chunks": inserted_chunks,
+                        "insert_ms": round(insert_seconds * 1000, 2),
+                        "rows_per_second": round(rows_per_second, 1)
+                    }
+                    
+                    # Update job status to chunks_stored (whether chunks were inserted or already existed)
+                    await conn.execute("""
+                        UPDATE upload_pipeline.upload_jobs
+                        SET status = 'chunks_stored',
+                            progress = coalesce(progress, '{}'::jsonb) || jsonb_build_object('chunking', $2::jsonb),
+                            updated_at = now()
+                        WHERE job_id = $1
+                    """, job_id, json.dumps(chunk_metrics))
                 
-                # Update job status to chunks_stored (whether chunks were inserted or already existed)
-                await conn.execute("""
-                    UPDATE upload_pipeline.upload_jobs
-                    SET status = 'chunks_stored', updated_at = now()
-                    WHERE job_id = $1
-                """, job_id)
+                if self.fast_lane and existing_chunks == 0 and inserted_chunks == len(chunks):
+                    # Every chunk was written with the ids assigned here, so the
+                    # embedding stage can use this list instead of re-reading it
+                    job["chunks"] = [
+                        {"chunk_id": chunk["chunk_id"], "text": chunk["text"], "tokens": chunk["tokens"]}
+                        for chunk in chunks
+                    ]
                 
                 self.logger.info(
                     f"Chunking stage completed for document {document_id}",
@@ -1134,7 +1641,7 @@ class EnhancedBaseWorker:
                     job_id=str(job_id),
                     document_id=str(document_id),
                     existing_chunks=existing_chunks,
-                    chunk_count=len(chunks)
+                    **chunk_metrics
                 )
         
         except Exception as e:
@@ -1149,6 +1656,77 @@ class EnhancedBaseWorker:
             self.error_handler.log_error(error)
             raise
     
+    async def _bulk_insert_chunks(self, conn, document_id, chunks: List[Dict[str, Any]]) -> int:
+        """
+        Insert all chunks for a document in one COPY plus one set-based insert.
+        
+        Rows are copied into a transaction-scoped staging table, then moved into
+        document_chunks with ON CONFLICT DO NOTHING so re-runs are idempotent.
+        Embeddings are left NULL until the embedding stage fills them in.
+        Each chunk dict gets its generated chunk_id. Must be called inside a
+        transaction.
+        
+        Returns:
+            Number of chunks actually inserted
+        """
+        await conn.execute("""
+            CREATE TEMP TABLE chunk_staging (
+                chunk_id uuid,
+                document_id uuid,
+                chunker_name text,
+                chunker_version text,
+                chunk_ord int,
+                text text,
+                chunk_sha text,
+                tokens int,
+                section_path int[],
+                section_title text,
+                page_start int,
+                page_end int
+            ) ON COMMIT DROP
+        """)
+        
+        records = [
+            (
+                chunk.setdefault("chunk_id", uuid.uuid4()),
+                document_id,
+                chunk["chunker_name"],
+                chunk["chunker_version"],
+                i,
+                chunk["text"],
+                hashlib.sha256(chunk["text"].encode("utf-8")).hexdigest(),
+                chunk.get("tokens"),
+                chunk.get("section_path"),
+                chunk.get("section_title"),
+                chunk.get("page_start"),
+                chunk.get("page_end")
+            )
+            for i, chunk in enumerate(chunks)
+        ]
+        await conn.copy_records_to_table(
+            "chunk_staging",
+            records=records,
+            columns=[
+                "chunk_id", "document_id", "chunker_name", "chunker_version", "chunk_ord", "text", "chunk_sha",
+                "tokens", "section_path", "section_title", "page_start", "page_end"
+            ]
+        )
+        
+        result = await conn.execute("""
+            INSERT INTO upload_pipeline.document_chunks 
+            (chunk_id, document_id, chunker_name, chunker_version, chunk_ord, text, chunk_sha, 
+             tokens, section_path, section_title, page_start, page_end,
+             embed_model, embed_version, vector_dim, embedding, created_at, updated_at)
+            SELECT chunk_id, document_id, chunker_name, chunker_version, chunk_ord, text, chunk_sha,
+                   tokens, section_path, section_title, page_start, page_end,
+                   'text-embedding-3-small', '1', 1536, NULL, now(), now()
+            FROM chunk_staging
+            ORDER BY chunk_ord
+            ON CONFLICT (document_id, chunker_name, chunker_version, chunk_ord) DO NOTHING
+        """)
+        # Command tag is "INSERT 0 <rows>"
+        return int(result.split()[-1])
+    
     async def _process_embeddings_real(self, job: Dict[str, Any], correlation_id: str):
         """Process embeddings using real OpenAI service with batch processing"""
         job_id = job["job_id"]
@@ -1173,170 +1751,147 @@ class EnhancedBaseWorker:
                 user_id=user_id
             )
             
-            # Get chunks from database
-            async with self.db.get_connection() as conn:
-                chunks = await conn.fetch("""
-                    SELECT chunk_id, text 
-                    FROM upload_pipeline.document_chunks 
-                    WHERE document_id = $1
-                    ORDER BY chunk_ord
-                """, document_id)
-                
-                if not chunks:
-                    raise ValueError(f"No chunks found for document {document_id}")
-                
-                chunk_texts = [chunk["text"] for chunk in chunks]
-                total_chunks = len(chunk_texts)
+            # Get chunks from database (or from the chunking stage in the fast lane)
+            chunks = job.get("chunks")
+            if chunks is None:
+                async with self.db.get_connection() as conn:
+                    chunks = await conn.fetch("""
+                        SELECT dc.chunk_id, dc.text, dc.tokens
+                        FROM upload_pipeline.document_chunks dc
+                        JOIN upload_pipeline.documents d
+                          ON dc.document_id = COALESCE(d.chunk_source_document_id, d.document_id)
+                        WHERE d.document_id = $1
+                        ORDER BY dc.chunk_ord
+                    """, document_id)
             
-            # Process embeddings in batches to avoid OpenAI batch size limits
-            batch_size = 256  # OpenAI's maximum batch size
-            all_embeddings = []
+            if not chunks:
+                raise ValueError(f"No chunks found for document {document_id}")
             
-            # Initialize embedding quality monitor
-            try:
-                from backend.shared.validation.embedding_validator import EmbeddingValidator
-                from backend.shared.monitoring.embedding_monitor import EmbeddingQualityMonitor
-                
-                validator = EmbeddingValidator()
-                monitor = EmbeddingQualityMonitor(validator=validator)
-                
-                self.logger.info("Embedding quality monitoring enabled")
-            except ImportError:
-                validator = None
-                monitor = None
-                self.logger.warning("Embedding quality monitoring not available - validation modules not found")
+            total_chunks = len(chunks)
+            
+            # Chunks whose text was already embedded (by any document) are
+            # filled in from the embedding store; only misses go to OpenAI
+            reused: Dict[str, Optional[int]] = {}
+            if self.embedding_reuse_enabled:
+                async with self.db.get_connection() as conn:
+                    reused = await self._reuse_stored_embeddings(conn, document_id)
+            misses = [chunk for chunk in chunks if str(chunk["chunk_id"]) not in reused]
+            reuse_stats = self._embedding_reuse_stats(chunks, reused)
             
             self.logger.info(
-                f"Processing {total_chunks} chunks in batches of {batch_size}",
+                "Embedding store lookup completed",
                 correlation_id=correlation_id,
                 job_id=str(job_id),
                 document_id=str(document_id),
-                total_chunks=total_chunks,
-                batch_size=batch_size
+                **reuse_stats
             )
             
-            for i in range(0, total_chunks, batch_size):
-                batch_end = min(i + batch_size, total_chunks)
-                batch_texts = chunk_texts[i:batch_end]
-                batch_chunks = chunks[i:batch_end]
+            all_embeddings = []
+            pipeline_stats = None
+            if misses:
+                # Process embeddings in batches to avoid OpenAI batch size limits
+                batch_size = 256  # OpenAI's maximum batch size
+                
+                # Initialize embedding quality monitor
+                try:
+                    from backend.shared.validation.embedding_validator import EmbeddingValidator
+                    from backend.shared.monitoring.embedding_monitor import EmbeddingQualityMonitor
+                    
+                    validator = EmbeddingValidator()
+                    monitor = EmbeddingQualityMonitor(validator=validator)
+                    
+                    self.logger.info("Embedding quality monitoring enabled")
+                except ImportError:
+                    validator = None
+                    monitor = None
+                    self.logger.warning("Embedding quality monitoring not available - validation modules not found")
                 
+                total_batches = (len(misses) + batch_size - 1) // batch_size
                 self.logger.info(
-                    f"Processing batch {i//batch_size + 1}/{(total_chunks + batch_size - 1)//batch_size} "
-                    f"(chunks {i+1}-{batch_end})",
+                    f"Processing {len(misses)} chunks in batches of {batch_size}",
                     correlation_id=correlation_id,
                     job_id=str(job_id),
                     document_id=str(document_id),
-                    batch_start=i+1,
-                    batch_end=batch_end,
-                    batch_size=len(batch_texts)
+                    total_chunks=len(misses),
+                    batch_size=batch_size,
+                    concurrency=self.config.openai_embedding_concurrency
                 )
                 
-                # Call OpenAI service for this batch
-                batch_embeddings = await self.enhanced_service_client.call_openai_service(
-                    texts=batch_texts,
-                    user_id=user_id,
-                    job_id=str(job_id),
-                    document_id=str(document_id),
-                    correlation_id=correlation_id
-                )
+                # Embed through the shared service so repeated texts (boilerplate
+                # sections, re-uploads) are served from cache; misses still go
+                # through the enhanced client for retries and error handling
+                async def fetch_embeddings(texts: List[str]) -> List[List[float]]:
+                    return await self.enhanced_service_client.call_openai_service(
+                        texts=texts,
+                        user_id=user_id,
+                        job_id=str(job_id),
+                        document_id=str(document_id),
+                        correlation_id=correlation_id
+                    )
                 
-                # Validate and store embeddings for this batch
-                async with self.db.get_connection() as conn:
-                    for chunk_idx, (chunk, embedding) in enumerate(zip(batch_chunks, batch_embeddings)):
-                        # Validate embedding quality if monitor is available
-                        if monitor:
-                            try:
-                                source_info = {
-                                    "user_id": user_id,
-                                    "job_id": str(job_id),
-                                    "document_id": str(document_id),
-                                    "chunk_id": str(chunk["chunk_id"]),
-                                    "batch_index": i // batch_size,
-                                    "chunk_index_in_batch": chunk_idx,
-                                    "correlation_id": correlation_id,
-                                    "text_length": len(chunk.get("text", "")),
-                                    "text_preview": chunk.get("text", "")[:100]
-                                }
-                                
-                                # Validate embedding - this will raise an exception for critical issues
-                                validation_result = await monitor.validate_embedding(
-                                    embedding, 
-                                    source_info, 
-                                    raise_on_critical=True
-                                )
-                                
-                                # Log validation success with quality metrics
-                                if validation_result.is_valid:
-                                    self.logger.debug(
-                                        f"Embedding validation successful for chunk {chunk['chunk_id']}",
-                                        extra={
-                                            "chunk_id": str(chunk["chunk_id"]),
-                                            "validation_metrics": validation_result.metrics,
-                                            "correlation_id": correlation_id
-                                        }
-                                    )
-                                
-                            except Exception as validation_error:
-                                # Critical embedding validation failure
-                                self.logger.error(
-                                    f"CRITICAL_EMBEDDING_VALIDATION_FAILURE: {str(validation_error)}",
-                                    extra={
-                                        "chunk_id": str(chunk["chunk_id"]),
-                                        "embedding_preview": embedding[:5] if len(embedding) >= 5 else embedding,
-                                        "embedding_stats": {
-                                            "length": len(embedding),
-                                            "min_value": min(embedding) if embedding else None,
-                                            "max_value": max(embedding) if embedding else None,
-                                            "zero_count": sum(1 for x in embedding if abs(x) < 1e-10) if embedding else None
-                                        },
-                                        "source_info": source_info,
-                                        "correlation_id": correlation_id,
-                                        "error": str(validation_error)
-                                    }
-                                )
-                                
-                                # For critical issues like zero embeddings, fail the entire job
-                                if "ZERO_EMBEDDING_DETECTED" in str(validation_error) or "MOSTLY_ZERO_EMBEDDING_DETECTED" in str(validation_error):
-                                    raise RuntimeError(
-                                        f"Critical embedding quality failure: {str(validation_error)}. "
-                                        f"Job {job_id} cannot proceed with invalid embeddings."
-                                    )
-                                else:
-                                    # For less critical issues, log but continue
-                                    self.logger.warning(f"Embedding validation warning for chunk {chunk['chunk_id']}: {str(validation_error)}")
-                        
-                        # Convert embedding list to string format for PostgreSQL vector type
-                        embedding_str = "[" + ",".join([str(x) for x in embedding]) + "]"
-                        
-                        # Store embedding in database
-                        await conn.execute("""
-                            UPDATE upload_pipeline.document_chunks 
-                            SET embedding = $1, updated_at = now()
-                            WHERE chunk_id = $2
-                        """, embedding_str, chunk["chunk_id"])
+                async def embed_texts(texts: List[str]) -> List[List[float]]:
+                    return await get_embedding_service().embed_batch(texts, fetcher=fetch_embeddings)
                 
-                all_embeddings.extend(batch_embeddings)
+                async def store_batch(batch_index: int, batch_chunks: List[Any], batch_embeddings: List[List[float]]):
+                    # Validate the whole batch at once if the monitor is available
+                    if monitor:
+                        await self._validate_embedding_batch(
+                            monitor, batch_index, batch_chunks, batch_embeddings,
+                            {
+                                "user_id": user_id,
+                                "job_id": str(job_id),
+                                "document_id": str(document_id),
+                                "correlation_id": correlation_id
+                            }
+                        )
+                    
+                    # Write the whole batch in one statement and record it for reuse
+                    batch_chunk_ids = [chunk["chunk_id"] for chunk in batch_chunks]
+                    async with self.db.get_connection() as conn:
+                        async with conn.transaction():
+                            await self._write_embeddings(conn, batch_chunk_ids, batch_embeddings)
+                            if self.embedding_reuse_enabled:
+                                await self._store_reusable_embeddings(conn, batch_chunk_ids)
+                    
+                    all_embeddings.extend(batch_embeddings)
+                    
+                    self.logger.info(
+                        f"Batch {batch_index + 1}/{total_batches} processed successfully",
+                        correlation_id=correlation_id,
+                        job_id=str(job_id),
+                        document_id=str(document_id),
+                        batch_embeddings=len(batch_embeddings),
+                        total_processed=len(all_embeddings)
+                    )
                 
-                self.logger.info(
-                    f"Batch {i//batch_size + 1} processed successfully",
-                    correlation_id=correlation_id,
-                    job_id=str(job_id),
-                    document_id=str(document_id),
-                    batch_embeddings=len(batch_embeddings),
-                    total_processed=len(all_embeddings)
+                # Several embedding requests stay in flight under the shared adaptive
+                # rate limiter while completed batches are validated and written
+                pipeline = EmbeddingPipeline(
+                    embed=embed_texts,
+                    sink=store_batch,
+                    limiter=get_openai_rate_limiter(
+                        self.config.openai_requests_per_minute,
+                        self.config.openai_tokens_per_minute
+                    ),
+                    batch_size=batch_size,
+                    concurrency=self.config.openai_embedding_concurrency
                 )
-                
-                # Add small delay between batches to respect rate limits
-                if i + batch_size < total_chunks:
-                    await asyncio.sleep(0.1)  # 100ms delay between batches
+                pipeline_stats = await pipeline.run(misses)
             
             # Update job status
             async with self.db.get_connection() as conn:
                 await conn.execute("""
                     UPDATE upload_pipeline.upload_jobs
-                    SET status = 'embeddings_stored', updated_at = now()
+                    SET status = 'embeddings_stored',
+                        progress = coalesce(progress, '{}'::jsonb) || jsonb_build_object('embedding_reuse', $2::jsonb),
+                        updated_at = now()
                     WHERE job_id = $1
-                """, job_id)
+                """, job_id, json.dumps(reuse_stats))
+                await conn.execute(
+                    "SELECT pg_notify($1, $2)",
+                    DOCUMENT_EMBEDDED_CHANNEL,
+                    json.dumps({"user_id": str(user_id), "document_id": str(document_id)})
+                )
                 
             self.logger.info(
                 "Embeddings processing completed successfully",
@@ -1344,7 +1899,10 @@ class EnhancedBaseWorker:
                 job_id=str(job_id), 
                 document_id=str(document_id),
                 embedding_count=len(all_embeddings),
-                total_chunks=total_chunks
+                total_chunks=total_chunks,
+                embedding_reuse=reuse_stats,
+                embedding_cache=get_embedding_service().get_stats(),
+                pipeline=pipeline_stats.to_dict() if pipeline_stats else None
             )
             
         except Exception as e:
@@ -1359,17 +1917,141 @@ class EnhancedBaseWorker:
             self.error_handler.log_error(error)
             raise
     
-    def _generate_chunks(self, content: str, document_id: str) -> List[str]:
-        """Generate chunks from content (simplified implementation)"""
-        # Simple chunking by paragraphs
-        paragraphs = content.split('\n\n')
-        chunks = []
+    async def _validate_embedding_batch(
+        self,
+        monitor,
+        batch_index: int,
+        batch_chunks: List[Any],
+        batch_embeddings: List[List[float]],
+        source_info: Dict[str, Any]
+    ) -> None:
+        """
+        Validate one embedded batch with vectorized checks.
+        
+        Zero or mostly-zero embeddings fail the job; other issues are logged
+        per chunk and the batch is still written. Identical vectors for
+        different chunk texts are reported as duplicates.
+        
+        Raises:
+            RuntimeError: If any embedding in the batch is (mostly) zero
+        """
+        from backend.shared.validation.embedding_validator import EmbeddingIssueType
         
-        for paragraph in paragraphs:
-            if paragraph.strip():
-                chunks.append(paragraph.strip())
+        validation = await monitor.validate_array(
+            batch_embeddings,
+            dict(source_info, batch_index=batch_index),
+            keys=[chunk["text"] for chunk in batch_chunks],
+            raise_on_critical=False
+        )
+        
+        for row in validation.invalid_rows():
+            chunk = batch_chunks[row]
+            result = validation.result(row)
+            if result.issue_type in (EmbeddingIssueType.ALL_ZEROS, EmbeddingIssueType.MOSTLY_ZEROS):
+                self.logger.error(
+                    f"CRITICAL_EMBEDDING_VALIDATION_FAILURE: {result.details}",
+                    chunk_id=str(chunk["chunk_id"]),
+                    issue_type=result.issue_type.value,
+                    validation_metrics=result.metrics,
+                    text_preview=chunk.get("text", "")[:100],
+                    **source_info
+                )
+                raise RuntimeError(
+                    f"Critical embedding quality failure: ZERO_EMBEDDING_DETECTED: {result.details}. "
+                    f"Job {source_info['job_id']} cannot proceed with invalid embeddings."
+                )
+            self.logger.warning(
+                f"Embedding validation warning for chunk {chunk['chunk_id']}: {result.details}",
+                issue_type=result.issue_type.value,
+                severity=result.severity,
+                correlation_id=source_info["correlation_id"]
+            )
+        
+        self.logger.debug(
+            f"Embedding batch {batch_index + 1} validated",
+            valid_embeddings=int(validation.is_valid.sum()),
+            total_embeddings=len(validation),
+            correlation_id=source_info["correlation_id"]
+        )
+    
+    async def _write_embeddings(self, conn, chunk_ids: List[Any], embeddings: List[List[float]]) -> None:
+        """
+        Write a batch of embeddings with a single UPDATE ... FROM unnest(...).
+        
+        Vectors are sent in pgvector's binary format when the worker pool has
+        the codec registered, otherwise as text.
+        """
+        if self.db.vector_codec_enabled:
+            vectors = embeddings
+        else:
+            vectors = [format_vector_text(embedding) for embedding in embeddings]
         
-        return chunks
+        await conn.execute("""
+            UPDATE upload_pipeline.document_chunks AS dc
+            SET embedding = u.embedding, embed_updated_at = now(), updated_at = now()
+            FROM unnest($1::uuid[], $2::vector[]) AS u(chunk_id, embedding)
+            WHERE dc.chunk_id = u.chunk_id
+        """, chunk_ids, vectors)
+    
+    async def _reuse_stored_embeddings(self, conn, document_id) -> Dict[str, Optional[int]]:
+        """
+        Fill a document's chunk embeddings from the embedding store in one statement.
+        
+        Chunks are matched on (chunk_sha, embed_model, embed_version), so text
+        embedded for any earlier document is reused without leaving Postgres.
+        
+        Returns:
+            Token counts of the reused chunks keyed by chunk_id (as str)
+        """
+        rows = await conn.fetch("""
+            UPDATE upload_pipeline.document_chunks AS dc
+            SET embedding = es.embedding, embed_updated_at = now(), updated_at = now()
+            FROM upload_pipeline.documents d, upload_pipeline.embedding_store es
+            WHERE d.document_id = $1
+              AND dc.document_id = COALESCE(d.chunk_source_document_id, d.document_id)
+              AND es.chunk_sha = dc.chunk_sha
+              AND es.embed_model = dc.embed_model
+              AND es.embed_version = dc.embed_version
+            RETURNING dc.chunk_id, dc.tokens
+        """, document_id)
+        return {str(row["chunk_id"]): row["tokens"] for row in rows}
+    
+    async def _store_reusable_embeddings(self, conn, chunk_ids: List[Any]) -> None:
+        """Record freshly written chunk embeddings in the embedding store."""
+        await conn.execute("""
+            INSERT INTO upload_pipeline.embedding_store (chunk_sha, embed_model, embed_version, embedding)
+            SELECT chunk_sha, embed_model, embed_version, embedding
+            FROM upload_pipeline.document_chunks
+            WHERE chunk_id = ANY($1::uuid[]) AND embedding IS NOT NULL
+            ON CONFLICT (chunk_sha, embed_model, embed_version) DO NOTHING
+        """, chunk_ids)
+    
+    @staticmethod
+    def _embedding_reuse_stats(chunks: List[Any], reused: Dict[str, Optional[int]]) -> Dict[str, Any]:
+        """Hit rate and API tokens saved for one document's embedding lookup."""
+        tokens_saved = 0
+        for chunk in chunks:
+            chunk_id = str(chunk["chunk_id"])
+            if chunk_id in reused:
+                # Chunks stored before token counts were recorded are estimated
+                tokens = reused[chunk_id]
+                tokens_saved += tokens if tokens is not None else estimate_tokens([chunk["text"]])
+        return {
+            "chunks": len(chunks),
+            "reused_chunks": len(reused),
+            "embedded_chunks": len(chunks) - len(reused),
+            "hit_rate": round(len(reused) / len(chunks), 4) if chunks else 0.0,
+            "tokens_saved": tokens_saved
+        }
+    
+    @staticmethod
+    def _seconds_since(timestamp: Optional[datetime]) -> Optional[float]:
+        """Seconds elapsed since a (naive UTC or aware) timestamp."""
+        if timestamp is None:
+            return None
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return round((datetime.now(timezone.utc) - timestamp).total_seconds(), 3)
     
     async def _update_job_state(self, job_id: str, state: str, correlation_id: str, error_message: Optional[str] = None):
         """Update job status in database"""
@@ -1391,52 +2073,25 @@ class EnhancedBaseWorker:
             self.logger.error("Error getting final metrics", error=str(e))
             return {"error": str(e)}
     
-    async def _generate_chunks(self, content: str, chunker_version: str) -> List[Dict[str, Any]]:
-        """Generate chunks from content using specified chunker"""
+    async def _generate_chunks(self, content: str) -> List[Dict[str, Any]]:
+        """
+        Split parsed markdown into token-bounded chunks with section and page metadata.
+        
+        Chunking is CPU-bound on large documents, so it runs in a thread to
+        keep other jobs on this worker moving.
+        """
         try:
-            # Simple markdown chunking for now
-            # This can be enhanced with more sophisticated chunking strategies
-            lines = content.split('\n')
-            chunks = []
-            current_chunk = []
-            chunk_ord = 0
-            
-            for line in lines:
-                current_chunk.append(line)
-                
-                # Create chunk on headers or after certain number of lines
-                if (line.startswith('#') and current_chunk) or len(current_chunk) >= 10:
-                    if current_chunk:
-                        chunk_text = '\n'.join(current_chunk).strip()
-                        if chunk_text:
-                            chunks.append({
-                                "text": chunk_text,
-                                "ord": chunk_ord,
-                                "chunker_name": "markdown-simple",
-                                "chunker_version": chunker_version,
-                                "meta": {
-                                    "line_count": len(current_chunk),
-                                    "chunk_type": "markdown"
-                                }
-                            })
-                            chunk_ord += 1
-                        current_chunk = []
-            
-            # Add remaining content as final chunk
-            if current_chunk:
-                chunk_text = '\n'.join(current_chunk).strip()
-                if chunk_text:
-                    chunks.append({
-                        "text": chunk_text,
-                        "ord": chunk_ord,
-                        "chunker_name": "markdown-simple",
-                        "chunker_version": chunker_version,
-                        "meta": {
-                            "line_count": len(current_chunk),
-                            "chunk_type": "markdown"
-                        }
-                    })
+            start = time.perf_counter()
+            chunks = await asyncio.to_thread(self.chunker.chunk_document, content)
+            elapsed = time.perf_counter() - start
             
+            self.logger.info(
+                "Chunks generated",
+                chunk_count=len(chunks),
+                total_tokens=sum(chunk["tokens"] for chunk in chunks),
+                chunk_ms=round(elapsed * 1000, 2),
+                mb_per_second=round(len(content) / elapsed / (1024 * 1024), 2) if elapsed > 0 else None
+            )
             return chunks
             
         except Exception as e:
@@ -1517,19 +2172,27 @@ class EnhancedBaseWorker:
             # Mark job as permanently failed
             await self._update_job_state(job["job_id"], "failed_parse", correlation_id, f"Non-retryable error: {error_type}: {error_message}")
     
+    def _get_llamaparse_client(self) -> httpx.AsyncClient:
+        """Get the worker's long-lived client for LlamaParse uploads."""
+        if self.llamaparse_client is None or self.llamaparse_client.is_closed:
+            self.llamaparse_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(300.0, connect=10.0),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+            )
+        return self.llamaparse_client
+    
     async def _direct_llamaparse_call(self, file_path: str, job_id: str, document_id: str, correlation_id: str, document_filename: str, webhook_url: str) -> Dict[str, Any]:
         """
         Direct LlamaParse API call bypassing all service layers.
         Matches the reference script implementation exactly.
         """
-        import httpx
         import os
         
+        transfer_stats = None
         try:
             # Get API configuration
             LLAMAPARSE_API_KEY = os.getenv("LLAMAPARSE_API_KEY")
             LLAMAPARSE_BASE_URL = os.getenv("LLAMAPARSE_BASE_URL", "https://api.cloud.llamaindex.ai")
-            import hashlib
             
             # Use StorageManager for consistent authentication with API service
             try:
@@ -1609,14 +2272,6 @@ class EnhancedBaseWorker:
                         file_path=file_path
                     )
                 
-                # Use StorageManager to download file (consistent with API service authentication)
-                # For binary files (PDFs), we need to read as bytes, not text
-                file_content = await self.storage.read_blob_bytes(file_path)
-                if not file_content:
-                    raise Exception("Downloaded file is empty")
-                    
-                self.logger.info(f"Downloaded file from storage using StorageManager: {len(file_content)} bytes")
-                    
             except Exception as e:
                 # Storage download failed - cannot proceed without file
                 self.logger.error(f"Storage download failed, cannot process document: {str(e)}")
@@ -1625,195 +2280,214 @@ class EnhancedBaseWorker:
                     error_code="STORAGE_ACCESS_ERROR"
                 )
             
-            # Make direct API call exactly like reference script (fresh client, no custom config)
-            async with httpx.AsyncClient(timeout=300) as client:
-                # Prepare multipart form data for file upload
-                files = {
-                    'file': (document_filename, file_content, 'application/pdf')
-                }
-                
-                # Prepare form data (primitive types only for multipart)
-                form_data = {
-                    'parsingInstructions': 'Extract the complete text content from this PDF document exactly as it appears. Do not summarize, analyze, or modify the content. Return the raw text with all details, numbers, and specific information preserved.',
-                    'result_type': 'markdown',
-                    'webhook_url': webhook_url  # Use simple webhook_url parameter
-                }
-                
-                headers = {
-                    'Authorization': f'Bearer {LLAMAPARSE_API_KEY}'
-                }
-                
-                # FM-027: Comprehensive LlamaParse request logging
-                self.logger.info(
-                    "FM-027: LlamaParse request preparation",
-                    correlation_id=correlation_id,
-                    job_id=job_id,
-                    document_id=document_id,
-                    file_path=file_path,
-                    document_filename=document_filename,
-                    file_content_size=len(file_content),
-                    file_content_type="application/pdf",
-                    webhook_url=webhook_url,
-                    llamaparse_base_url=LLAMAPARSE_BASE_URL,
-                    llamaparse_endpoint=f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
-                    form_data=form_data,
-                    headers=headers,
-                    api_key_present=bool(LLAMAPARSE_API_KEY),
-                    api_key_length=len(LLAMAPARSE_API_KEY) if LLAMAPARSE_API_KEY else 0
+            # Prepare form data (primitive types only for multipart)
+            form_data = {
+                'parsingInstructions': 'Extract the complete text content from this PDF document exactly as it appears. Do not summarize, analyze, or modify the content. Return the raw text with all details, numbers, and specific information preserved.',
+                'result_type': 'markdown',
+                # Mark page starts so chunks can carry page ranges
+                'page_prefix': PAGE_MARKER_TEMPLATE.format(page="{pageNumber}") + "\n",
+                'webhook_url': webhook_url  # Use simple webhook_url parameter
+            }
+            
+            headers = {
+                'Authorization': f'Bearer {LLAMAPARSE_API_KEY}'
+            }
+            
+            # FM-027: Comprehensive LlamaParse request logging
+            self.logger.info(
+                "FM-027: LlamaParse request preparation",
+                correlation_id=correlation_id,
+                job_id=job_id,
+                document_id=document_id,
+                file_path=file_path,
+                document_filename=document_filename,
+                file_content_type="application/pdf",
+                webhook_url=webhook_url,
+                llamaparse_base_url=LLAMAPARSE_BASE_URL,
+                llamaparse_endpoint=f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
+                form_data=form_data,
+                headers=headers,
+                api_key_present=bool(LLAMAPARSE_API_KEY),
+                api_key_length=len(LLAMAPARSE_API_KEY) if LLAMAPARSE_API_KEY else 0
+            )
+            
+            self.logger.info(f"Making direct LlamaParse API call for job {job_id}")
+            self.logger.info(f"LlamaParse API form_data: {form_data}")
+            
+            # Stream the document from storage straight into the upload body over
+            # pooled connections (StorageManager.client and the worker's
+            # LlamaParse client) instead of buffering it
+            try:
+                response, transfer_stats = await transfer_blob(
+                    self.storage.client,
+                    f"{self.storage.base_url}/storage/v1/object/{bucket}/{key}",
+                    self._get_llamaparse_client(),
+                    f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
+                    fields=form_data,
+                    filename=document_filename,
+                    dest_headers=headers
                 )
+            except BlobSourceError as e:
+                # Storage download failed - cannot proceed without file
+                self.logger.error(f"Storage download failed, cannot process document: {str(e)}")
+                raise UserFacingError(
+                    "Document file is not accessible for processing. Please try uploading again.",
+                    error_code="STORAGE_ACCESS_ERROR"
+                )
+            
+            # FM-027: Log file content details for debugging
+            self.logger.info(
+                "FM-027: File content analysis",
+                correlation_id=correlation_id,
+                job_id=job_id,
+                file_content_preview=transfer_stats.head,
+                file_content_hex_preview=transfer_stats.head[:20].hex(),
+                is_pdf_header=transfer_stats.head.startswith(b'%PDF-'),
+                file_content_checksum=transfer_stats.sha256
+            )
+            
+            self.logger.info(
+                "Streamed document to LlamaParse",
+                correlation_id=correlation_id,
+                job_id=job_id,
+                **transfer_stats.to_dict()
+            )
+            
+            # FM-027: Comprehensive LlamaParse response logging
+            self.logger.info(
+                "FM-027: LlamaParse API response received",
+                correlation_id=correlation_id,
+                job_id=job_id,
+                response_status_code=response.status_code,
+                response_headers=dict(response.headers),
+                response_content_type=response.headers.get('content-type'),
+                response_content_length=response.headers.get('content-length'),
+                response_text=response.text[:500] if response.text else None,
+                response_json=response.json() if response.headers.get('content-type', '').startswith('application/json') else None
+            )
+            
+            self.logger.info(f"LlamaParse API response: {response.status_code}")
+            
+            if response.status_code == 200:
+                result = response.json()
+                parse_job_id = result.get("id", "")
                 
-                # FM-027: Log file content details for debugging
+                # FM-027: Log successful LlamaParse submission details
                 self.logger.info(
-                    "FM-027: File content analysis",
+                    "FM-027: LlamaParse job submitted successfully",
                     correlation_id=correlation_id,
                     job_id=job_id,
-                    file_content_preview=file_content[:100] if file_content else None,
-                    file_content_hex_preview=file_content[:20].hex() if file_content else None,
-                    is_pdf_header=file_content.startswith(b'%PDF-') if file_content else False,
-                    file_content_checksum=hashlib.sha256(file_content).hexdigest() if file_content else None
+                    parse_job_id=parse_job_id,
+                    llamaparse_response=result,
+                    webhook_url=webhook_url
                 )
                 
-                self.logger.info(f"Making direct LlamaParse API call for job {job_id}")
-                self.logger.info(f"LlamaParse API form_data: {form_data}")
+                self.logger.info(f"LlamaParse job submitted successfully: {parse_job_id}")
                 
-                response = await client.post(
-                    f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
-                    files=files,
-                    data=form_data,
-                    headers=headers
-                )
+                # Update job status to parse_queued (waiting for webhook completion)
+                # and keep the transfer metrics with the job
+                async with self.db.get_connection() as conn:
+                    await conn.execute("""
+                        UPDATE upload_pipeline.upload_jobs
+                        SET status = 'parse_queued', state = 'queued',
+                            progress = COALESCE(progress, '{}'::jsonb) || jsonb_build_object('parse_transfer', $2::jsonb),
+                            updated_at = now()
+                        WHERE job_id = $1
+                    """, job_id, json.dumps(transfer_stats.to_dict()))
                 
-                # FM-027: Comprehensive LlamaParse response logging
-                self.logger.info(
-                    "FM-027: LlamaParse API response received",
-                    correlation_id=correlation_id,
+                self.logger.info(f"Job status updated to parse_queued, waiting for webhook completion")
+                
+                return {
+                    "parse_job_id": parse_job_id,
+                    "status": "submitted",
+                    "message": "Direct API call successful",
+                    "transfer_metrics": transfer_stats.to_dict()
+                }
+            elif response.status_code == 429:
+                self.logger.error(
+                    f"LlamaParse rate limited: {response.status_code}",
                     job_id=job_id,
-                    response_status_code=response.status_code,
-                    response_headers=dict(response.headers),
-                    response_content_type=response.headers.get('content-type'),
-                    response_content_length=response.headers.get('content-length'),
-                    response_text=response.text[:500] if response.text else None,
-                    response_json=response.json() if response.headers.get('content-type', '').startswith('application/json') else None
+                    document_id=document_id,
+                    api_status_code=response.status_code,
+                    api_response_body=response.text,
+                    api_response_headers=dict(response.headers)
+                )
+                # Rate limit errors are retryable
+                raise ServiceUnavailableError(
+                    "Document processing service is currently busy. Please try again in a few minutes.",
+                    error_code="LLAMAPARSE_RATE_LIMIT_ERROR"
+                )
+            else:
+                # Enhanced error logging with full context
+                self.logger.error(
+                    f"LlamaParse API error: {response.status_code} - {response.text}",
+                    job_id=job_id,
+                    document_id=document_id,
+                    api_status_code=response.status_code,
+                    api_response_body=response.text,
+                    api_response_headers=dict(response.headers),
+                    request_url=f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
+                    request_headers=headers,
+                    form_data_keys=list(form_data.keys()),
+                    file_size=transfer_stats.bytes,
+                    document_filename=document_filename,
+                    webhook_url=webhook_url
                 )
                 
-                self.logger.info(f"LlamaParse API response: {response.status_code}")
+                # Store detailed error context in database
+                error_context = {
+                    "api_status_code": response.status_code,
+                    "api_response_body": response.text,
+                    "api_response_headers": dict(response.headers),
+                    "request_url": f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
+                    "file_size": transfer_stats.bytes,
+                    "document_filename": document_filename,
+                    "webhook_url": webhook_url,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "correlation_id": correlation_id
+                }
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    parse_job_id = result.get("id", "")
-                    
-                    # FM-027: Log successful LlamaParse submission details
-                    self.logger.info(
-                        "FM-027: LlamaParse job submitted successfully",
-                        correlation_id=correlation_id,
-                        job_id=job_id,
-                        parse_job_id=parse_job_id,
-                        llamaparse_response=result,
-                        webhook_url=webhook_url
+                # Classify error as retryable or non-retryable
+                if response.status_code in [500, 502, 503, 504]:
+                    # Server errors are retryable
+                    self.logger.warning(f"LlamaParse server error {response.status_code}, marking as retryable")
+                    raise ServiceUnavailableError(
+                        "Document processing service is temporarily unavailable. Please try again later.",
+                        error_code="LLAMAPARSE_SERVER_ERROR"
                     )
+                elif response.status_code in [400, 401, 403, 422]:
+                    # Client errors are non-retryable
+                    self.logger.error(f"LlamaParse client error {response.status_code}, marking as non-retryable")
                     
-                    self.logger.info(f"LlamaParse job submitted successfully: {parse_job_id}")
-                    
-                    # Update job status to parse_queued (waiting for webhook completion)
+                    # Update job with detailed error context
                     async with self.db.get_connection() as conn:
                         await conn.execute("""
                             UPDATE upload_pipeline.upload_jobs
-                            SET status = 'parse_queued', state = 'queued', updated_at = now()
-                            WHERE job_id = $1
-                        """, job_id)
+                            SET status = 'failed_parse', last_error = $1, updated_at = now()
+                            WHERE job_id = $2
+                        """, json.dumps(error_context), job_id)
                     
-                    self.logger.info(f"Job status updated to parse_queued, waiting for webhook completion")
-                    
-                    return {
-                        "parse_job_id": parse_job_id,
-                        "status": "submitted",
-                        "message": "Direct API call successful"
-                    }
-                elif response.status_code == 429:
-                    self.logger.error(
-                        f"LlamaParse rate limited: {response.status_code}",
-                        job_id=job_id,
-                        document_id=document_id,
-                        api_status_code=response.status_code,
-                        api_response_body=response.text,
-                        api_response_headers=dict(response.headers)
-                    )
-                    # Rate limit errors are retryable
-                    raise ServiceUnavailableError(
-                        "Document processing service is currently busy. Please try again in a few minutes.",
-                        error_code="LLAMAPARSE_RATE_LIMIT_ERROR"
+                    raise UserFacingError(
+                        "Document processing failed due to an invalid request. Please check your document and try again.",
+                        error_code="LLAMAPARSE_CLIENT_ERROR"
                     )
                 else:
-                    # Enhanced error logging with full context
-                    self.logger.error(
-                        f"LlamaParse API error: {response.status_code} - {response.text}",
-                        job_id=job_id,
-                        document_id=document_id,
-                        api_status_code=response.status_code,
-                        api_response_body=response.text,
-                        api_response_headers=dict(response.headers),
-                        request_url=f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
-                        request_headers=headers,
-                        form_data_keys=list(form_data.keys()),
-                        file_size=len(file_content),
-                        document_filename=document_filename,
-                        webhook_url=webhook_url
-                    )
-                    
-                    # Store detailed error context in database
-                    error_context = {
-                        "api_status_code": response.status_code,
-                        "api_response_body": response.text,
-                        "api_response_headers": dict(response.headers),
-                        "request_url": f'{LLAMAPARSE_BASE_URL}/api/parsing/upload',
-                        "file_size": len(file_content),
-                        "document_filename": document_filename,
-                        "webhook_url": webhook_url,
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "correlation_id": correlation_id
-                    }
+                    # Unknown errors are non-retryable
+                    self.logger.error(f"LlamaParse unknown error {response.status_code}, marking as non-retryable")
                     
-                    # Classify error as retryable or non-retryable
-                    if response.status_code in [500, 502, 503, 504]:
-                        # Server errors are retryable
-                        self.logger.warning(f"LlamaParse server error {response.status_code}, marking as retryable")
-                        raise ServiceUnavailableError(
-                            "Document processing service is temporarily unavailable. Please try again later.",
-                            error_code="LLAMAPARSE_SERVER_ERROR"
-                        )
-                    elif response.status_code in [400, 401, 403, 422]:
-                        # Client errors are non-retryable
-                        self.logger.error(f"LlamaParse client error {response.status_code}, marking as non-retryable")
-                        
-                        # Update job with detailed error context
-                        async with self.db.get_connection() as conn:
-                            await conn.execute("""
-                                UPDATE upload_pipeline.upload_jobs
-                                SET status = 'failed_parse', last_error = $1, updated_at = now()
-                                WHERE job_id = $2
-                            """, json.dumps(error_context), job_id)
-                        
-                        raise UserFacingError(
-                            "Document processing failed due to an invalid request. Please check your document and try again.",
-                            error_code="LLAMAPARSE_CLIENT_ERROR"
-                        )
-                    else:
-                        # Unknown errors are non-retryable
-                        self.logger.error(f"LlamaParse unknown error {response.status_code}, marking as non-retryable")
-                        
-                        # Update job with detailed error context
-                        async with self.db.get_connection() as conn:
-                            await conn.execute("""
-                                UPDATE upload_pipeline.upload_jobs
-                                SET status = 'failed_parse', last_error = $1, updated_at = now()
-                                WHERE job_id = $2
-                            """, json.dumps(error_context), job_id)
-                        
-                        raise UserFacingError(
-                            "Document processing failed. Please try again later.",
-                            error_code="LLAMAPARSE_API_ERROR"
-                        )
+                    # Update job with detailed error context
+                    async with self.db.get_connection() as conn:
+                        await conn.execute("""
+                            UPDATE upload_pipeline.upload_jobs
+                            SET status = 'failed_parse', last_error = $1, updated_at = now()
+                            WHERE job_id = $2
+                        """, json.dumps(error_context), job_id)
                     
+                    raise UserFacingError(
+                        "Document processing failed. Please try again later.",
+                        error_code="LLAMAPARSE_API_ERROR"
+                    )
+                
         except UserFacingError:
             raise  # Re-raise user-facing errors
         except Exception as e:
@@ -1824,7 +2498,7 @@ class EnhancedBaseWorker:
                 document_id=document_id,
                 exception_type=type(e).__name__,
                 exception_message=str(e),
-                file_size=len(file_content) if 'file_content' in locals() else 0,
+                file_size=transfer_stats.bytes if transfer_stats else 0,
                 document_filename=document_filename,
                 webhook_url=webhook_url,
                 correlation_id=correlation_id,
@@ -1835,7 +2509,7 @@ class EnhancedBaseWorker:
             error_context = {
                 "exception_type": type(e).__name__,
                 "exception_message": str(e),
-                "file_size": len(file_content) if 'file_content' in locals() else 0,
+                "file_size": transfer_stats.bytes if transfer_stats else 0,
                 "document_filename": document_filename,
                 "webhook_url": webhook_url,
                 "timestamp": datetime.utcnow().isoformat(),
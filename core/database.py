@@ -55,8 +55,15 @@ class DatabaseManager:
     resolving import management issues.
     """
     
-    def __init__(self, config: DatabaseConfig):
+    def __init__(self, config: DatabaseConfig, binary_vectors: bool = False):
         self.config = config
+        # Register the binary pgvector codec on every pooled connection; vector
+        # columns then take and return lists of floats instead of text.
+        # Support is decided once before the pool opens, so every connection
+        # in the pool agrees with vector_codec_enabled.
+        self.binary_vectors = binary_vectors
+        self.vector_codec_enabled = False
+        self._vector_schema: Optional[str] = None
         self.pool: Optional[Pool] = None
         self._health_check_task: Optional[asyncio.Task] = None
         self._is_initialized = False
@@ -82,6 +89,9 @@ class DatabaseManager:
             logger.info(f"Connection string: {self.config.connection_string[:50]}...")
             logger.info(f"Host: {self.config.host}, Port: {self.config.port}")
             
+            if self.binary_vectors:
+                await self._detect_vector_codec(ssl_config)
+            
             # Use the standard connection string approach for all connections
             # This avoids the complex pooler logic that was causing SCRAM authentication issues
             self.pool = await create_pool(
@@ -91,7 +101,8 @@ class DatabaseManager:
                 command_timeout=self.config.command_timeout,
                 statement_cache_size=0,  # Fix pgbouncer prepared statement issue
                 ssl=ssl_config,
-                setup=self._setup_connection
+                setup=self._setup_connection,
+                init=self._init_connection if self.vector_codec_enabled else None
             )
             
             self._is_initialized = True
@@ -188,6 +199,38 @@ class DatabaseManager:
             "your-staging-project" in self.config.host  # Supabase project ID pattern
         )
     
+    async def _detect_vector_codec(self, ssl_config: Any) -> None:
+        """Decide once, on a throwaway connection, whether pooled connections get the vector codec."""
+        from .vector_codec import find_vector_schema
+        try:
+            conn = await asyncpg.connect(
+                self.config.connection_string,
+                ssl=ssl_config,
+                statement_cache_size=0,
+                timeout=self.config.command_timeout
+            )
+            try:
+                self._vector_schema = await find_vector_schema(conn)
+            finally:
+                await conn.close()
+        except Exception as e:
+            logger.warning(f"Binary vector codec detection failed, using text vectors: {e}")
+            self._vector_schema = None
+        
+        self.vector_codec_enabled = self._vector_schema is not None
+        if not self.vector_codec_enabled:
+            logger.warning("pgvector type not found; vectors will use text encoding")
+    
+    async def _init_connection(self, conn: Connection) -> None:
+        """
+        Initialize a newly opened connection (runs once per connection).
+        
+        A connection that cannot take the codec raises here, so the pool never
+        hands out a connection that disagrees with vector_codec_enabled.
+        """
+        from .vector_codec import register_vector_codec
+        await register_vector_codec(conn, self._vector_schema)
+    
     async def _setup_connection(self, conn: Connection) -> None:
         """Set up a new database connection."""
         # Set timezone
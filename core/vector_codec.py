@@ -0,0 +1,80 @@
+"""
+Binary asyncpg codec for the pgvector ``vector`` type.
+
+Without a codec asyncpg exchanges vectors as text, so every embedding has to
+be formatted as ``"[0.1,0.2,...]"`` on the way in. The binary wire format is
+a 2-byte dimension, 2 unused bytes and ``dim`` big-endian float32 values,
+which packs in C via ``struct`` with no float formatting.
+"""
+
+import logging
+import struct
+from typing import List, Optional, Sequence, Union
+
+from asyncpg import Connection
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">HH")
+
+
+def encode_vector(value: Union[Sequence[float], str]) -> bytes:
+    """Encode a sequence of floats (or pgvector text) to pgvector binary format."""
+    if isinstance(value, str):
+        value = [float(x) for x in value.strip("[]").split(",") if x]
+    dim = len(value)
+    return _HEADER.pack(dim, 0) + struct.pack(f">{dim}f", *value)
+
+
+def decode_vector(data: bytes) -> List[float]:
+    """Decode pgvector binary format to a list of floats."""
+    dim, _ = _HEADER.unpack_from(data)
+    return list(struct.unpack_from(f">{dim}f", data, _HEADER.size))
+
+
+def format_vector_text(value: Sequence[float]) -> str:
+    """Format a vector as pgvector text (used when the binary codec is unavailable)."""
+    return "[" + ",".join(str(float(x)) for x in value) + "]"
+
+
+async def find_vector_schema(conn: Connection) -> Optional[str]:
+    """
+    Return the schema of the pgvector ``vector`` type, or None if it is missing.
+
+    The extension may live in ``public`` or ``extensions`` (Supabase), so the
+    type's schema is looked up rather than assumed.
+    """
+    return await conn.fetchval("""
+        SELECT n.nspname
+        FROM pg_type t
+        JOIN pg_namespace n ON n.oid = t.typnamespace
+        WHERE t.typname = 'vector'
+        LIMIT 1
+    """)
+
+
+async def register_vector_codec(conn: Connection, schema: Optional[str] = None) -> bool:
+    """
+    Register the binary vector codec on a connection.
+
+    Args:
+        conn: Connection to register the codec on
+        schema: Schema of the vector type; looked up when not given
+
+    Returns:
+        True if the codec was registered, False if the vector type is missing
+    """
+    if schema is None:
+        schema = await find_vector_schema(conn)
+    if schema is None:
+        logger.warning("pgvector type not found; vectors will use text encoding")
+        return False
+
+    await conn.set_type_codec(
+        "vector",
+        schema=schema,
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary"
+    )
+    return True
@@ -173,6 +173,18 @@ async def shutdown_event():
         if service_manager:
             await service_manager.shutdown_all_services()
         
+        # Close the shared embedding client and its disk tier
+        from backend.shared.external.embedding_service import close_embedding_service
+        await close_embedding_service()
+        
+        # Close the pooled storage upload client
+        from api.upload_pipeline.utils.storage_stream import close_storage_client
+        await close_storage_client()
+        
+        # Close pooled upstream clients (LLM, search) used by the navigator
+        from agents.shared.http_clients import close_http_client_registry
+        await close_http_client_registry()
+        
         # Shutdown core system
         await close_system()
         logger.info("System shutdown completed")
@@ -364,6 +376,16 @@ async def health_check(request: Request):
                 "services": services_health,
                 "version": "3.0.0"
             }
+            
+            navigator_runtime = service_manager.get_service("navigator_runtime")
+            if navigator_runtime:
+                result["navigator_runtime"] = navigator_runtime.get_metrics()
+            
+            from backend.shared.external.embedding_service import get_embedding_service
+            result["embedding_service"] = get_embedding_service().get_stats()
+            
+            from agents.shared.http_clients import get_http_client_registry
+            result["http_clients"] = get_http_client_registry().get_stats()
         else:
             # Fallback to basic health check using core database manager
             db_status = "unavailable"
@@ -479,6 +501,26 @@ async def _register_core_services(service_manager, config_manager):
             init_func=init_storage_service
         )
         
+        # Register the app-lifetime navigator runtime (shared agent, clients and tools)
+        async def init_navigator_runtime():
+            from agents.unified_navigator.runtime import NavigatorRuntime
+            return await NavigatorRuntime().start()
+        
+        async def health_check_navigator_runtime(instance):
+            return await instance.health_check()
+        
+        async def shutdown_navigator_runtime(instance):
+            if instance:
+                await instance.shutdown()
+        
+        service_manager.register_service(
+            name="navigator_runtime",
+            service_type=type(None),
+            init_func=init_navigator_runtime,
+            health_check=health_check_navigator_runtime,
+            shutdown_func=shutdown_navigator_runtime
+        )
+        
         logger.info("Core services registered successfully")
         
     except Exception as e:
@@ -1010,11 +1052,6 @@ async def chat_with_agent(
                 detail="Chat service temporarily unavailable - import error"
             )
         
-        # Create unified navigator agent instance
-        # Use mock mode for development unless explicitly using real APIs
-        use_mock = os.getenv("USE_MOCK_NAVIGATOR", "false").lower() == "true"
-        navigator_agent = UnifiedNavigatorAgent(use_mock=use_mock)
-        
         # Get user ID from authentication
         user_id = current_user.get("id")
         if not user_id:
@@ -1037,12 +1074,22 @@ async def chat_with_agent(
             conversation_history=conversation_history,
         )
         
+        # Use the process-wide navigator runtime; fall back to a per-request
+        # agent only if the runtime failed to start
+        navigator_runtime = service_manager.get_service("navigator_runtime")
+        fallback_agent = None
+        if navigator_runtime is None:
+            logger.warning("Navigator runtime not available, creating per-request agent")
+            # Use mock mode for development unless explicitly using real APIs
+            use_mock = os.getenv("USE_MOCK_NAVIGATOR", "false").lower() == "true"
+            navigator_runtime = fallback_agent = UnifiedNavigatorAgent(use_mock=use_mock)
+        
         # Process message through the unified navigator
         try:
             logger.info("Starting unified navigator processing...")
             # Add timeout to prevent indefinite hanging
             response = await asyncio.wait_for(
-                navigator_agent.execute(navigator_input),
+                navigator_runtime.execute(navigator_input),
                 timeout=120.0  # 120 second timeout for entire processing
             )
             logger.info("Unified navigator processing completed successfully")
@@ -1082,6 +1129,9 @@ async def chat_with_agent(
                 "next_steps": ["Please try rephrasing your question", "Contact support if the issue persists"],
                 "sources": ["system"]
             }
+        finally:
+            if fallback_agent is not None:
+                await fallback_agent.aclose()
         
         # Handle UnifiedNavigatorOutput response
         if response.success:
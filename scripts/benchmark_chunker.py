@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Chunker Benchmark
+
+Compares the previous worker chunker (a new chunk at each heading or every
+10 lines, with no token accounting) against the structure-aware chunker in
+backend.shared.chunking.markdown_chunker on a synthetic multi-page policy
+document.
+
+For each document size it reports throughput in MB/s, the number of chunks
+and the chunk token distribution. Token counts use tiktoken (cl100k_base)
+when it is installed, else the chunker's character estimate; the legacy
+chunks are counted afterwards with the same counter so the distributions are
+comparable.
+
+Usage:
+    python scripts/benchmark_chunker.py --sizes-mb 1 10 50 --max-tokens 512 --overlap-tokens 64
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SECTION = """## {n}. Covered Services
+
+Your plan covers medically necessary services from in-network providers. Prior
+authorization is required for inpatient stays, advanced imaging and specialty drugs.
+
+| Service | In-network | Out-of-network |
+|---------|------------|----------------|
+| Primary care visit | $20 copay | 40% coinsurance |
+| Specialist visit | $40 copay | 40% coinsurance |
+| Emergency room | $250 copay | $250 copay |
+
+### {n}.1 Exclusions
+
+Cosmetic procedures, experimental treatments and services received outside the
+United States are not covered except for emergencies. {filler}
+
+"""
+
+
+def legacy_chunks(content: str) -> List[Dict[str, Any]]:
+    """The previous worker chunker."""
+    lines = content.split('\n')
+    chunks = []
+    current_chunk = []
+
+    for line in lines:
+        current_chunk.append(line)
+        if (line.startswith('#') and current_chunk) or len(current_chunk) >= 10:
+            chunk_text = '\n'.join(current_chunk).strip()
+            if chunk_text:
+                chunks.append({"text": chunk_text, "ord": len(chunks)})
+            current_chunk = []
+
+    if current_chunk:
+        chunk_text = '\n'.join(current_chunk).strip()
+        if chunk_text:
+            chunks.append({"text": chunk_text, "ord": len(chunks)})
+    return chunks
+
+
+def make_document(size_bytes: int) -> str:
+    """A policy document of about size_bytes, with page markers every few sections."""
+    from backend.shared.chunking.markdown_chunker import PAGE_MARKER_TEMPLATE
+
+    parts = []
+    written = 0
+    n = 0
+    while written < size_bytes:
+        if n % 3 == 0:
+            parts.append(PAGE_MARKER_TEMPLATE.format(page=n // 3 + 1) + "\n")
+        # Every fifth section has one long paragraph that needs splitting
+        filler = "Additional limitations apply. " * (200 if n % 5 == 0 else 2)
+        section = SECTION.format(n=n + 1, filler=filler)
+        parts.append(section)
+        written += len(section)
+        n += 1
+    return "# Summary of Benefits and Coverage\n\n" + "".join(parts)
+
+
+def token_stats(counts: List[int], max_tokens: int) -> Dict[str, Any]:
+    return {
+        "chunks": len(counts),
+        "median_tokens": statistics.median(counts) if counts else 0,
+        "max_tokens": max(counts) if counts else 0,
+        "over_bound": sum(1 for count in counts if count > max_tokens),
+    }
+
+
+class ChunkerBenchmark:
+    """Times both chunkers over documents of each size."""
+
+    def __init__(self, sizes_mb: List[float], max_tokens: int, overlap_tokens: int, iterations: int):
+        self.sizes_mb = sizes_mb
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.iterations = iterations
+
+    def _time(self, fn, content: str) -> Dict[str, Any]:
+        elapsed = []
+        result = None
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            result = fn(content)
+            elapsed.append(time.perf_counter() - start)
+        best = min(elapsed)
+        return {
+            "seconds": round(best, 3),
+            "mb_per_second": round(len(content) / best / (1024 * 1024), 2),
+            "result": result,
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        from backend.shared.chunking.markdown_chunker import MarkdownChunker, TokenCounter
+
+        counter = TokenCounter()
+        chunker = MarkdownChunker(self.max_tokens, self.overlap_tokens, counter=counter)
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "exact_tokens": counter.exact,
+            "max_tokens": self.max_tokens,
+            "overlap_tokens": self.overlap_tokens,
+            "sizes": {},
+        }
+
+        for size_mb in self.sizes_mb:
+            content = make_document(int(size_mb * 1024 * 1024))
+            logger.info(f"⏱️ {size_mb}MB document...")
+
+            legacy = self._time(legacy_chunks, content)
+            legacy_counts = [counter.count(chunk["text"]) for chunk in legacy.pop("result")]
+            legacy.update(token_stats(legacy_counts, self.max_tokens))
+
+            structured = self._time(chunker.chunk_document, content)
+            structured_counts = [chunk["tokens"] for chunk in structured.pop("result")]
+            structured.update(token_stats(structured_counts, self.max_tokens))
+
+            level = {"bytes": len(content), "legacy": legacy, "structured": structured}
+            logger.info(f"  {level}")
+            results["sizes"][f"{size_mb}MB"] = level
+
+        return results
+
+
+async def main():
+    """Run the chunker benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--max-tokens", type=int, default=512)
+    parser.add_argument("--overlap-tokens", type=int, default=64)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    benchmark = ChunkerBenchmark(args.sizes_mb, args.max_tokens, args.overlap_tokens, args.iterations)
+    results = await benchmark.run()
+
+    results_file = f"chunker_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
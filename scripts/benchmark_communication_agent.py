@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Communication Agent Concurrency Benchmark
+
+Measures event-loop stalls and latency when many CommunicationAgent
+enhancements run concurrently, comparing the previous path against the
+native async one:
+
+    legacy - production telemetry via psutil.cpu_percent(interval=1) on the
+             event loop, then a new ThreadPoolExecutor(max_workers=1) per
+             request running a blocking LLM call
+    async  - CommunicationAgent.enhance_response with an async LLM client;
+             telemetry comes from the background resource sampler
+
+Both paths use a mock LLM with the same latency, so no API key is needed.
+Event-loop lag is sampled by a heartbeat task that should wake every 5ms;
+"max_loop_stall_ms" is the longest it was kept waiting beyond that. For the
+async path the benchmark also reports time to first streamed chunk.
+
+Usage:
+    python scripts/benchmark_communication_agent.py --concurrency 1 10 25 --llm-latency 0.5
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 0.005
+RESPONSE_CHUNKS = ["Great news! ", "Your plan covers ", "80% of in-network costs ", "after your deductible."]
+
+
+class MockAsyncLLM:
+    """Async LLM that streams a fixed response over `latency` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def stream(self, prompt: str):
+        for chunk in RESPONSE_CHUNKS:
+            await asyncio.sleep(self.latency / len(RESPONSE_CHUNKS))
+            yield chunk
+
+    async def complete(self, prompt: str) -> str:
+        return "".join([chunk async for chunk in self.stream(prompt)])
+
+
+def make_request():
+    from agents.patient_navigator.output_processing.types import AgentOutput, CommunicationRequest
+
+    return CommunicationRequest(agent_outputs=[
+        AgentOutput(
+            agent_id="benefits_analyzer",
+            content="Your plan covers 80% of in-network costs after $500 deductible.",
+            metadata={"coverage_type": "medical"}
+        )
+    ])
+
+
+async def legacy_enhance(agent, request, latency: float, cpu_interval: float) -> str:
+    """The previous enhance_response LLM path, with a blocking mock LLM."""
+    import psutil
+
+    formatted_input = agent._format_agent_outputs(request)
+    agent.format_prompt(formatted_input, user_context=request.user_context)
+    psutil.virtual_memory()
+    psutil.cpu_percent(interval=cpu_interval)
+
+    def llm_call():
+        time.sleep(latency)
+        return "".join(RESPONSE_CHUNKS)
+
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="comm_agent") as executor:
+        return await asyncio.wait_for(loop.run_in_executor(executor, llm_call), timeout=60.0)
+
+
+class CommunicationAgentBenchmark:
+    """Runs both paths at each concurrency level while watching the event loop."""
+
+    def __init__(self, concurrency_levels: List[int], llm_latency: float, legacy_cpu_interval: float):
+        self.concurrency_levels = concurrency_levels
+        self.llm_latency = llm_latency
+        self.legacy_cpu_interval = legacy_cpu_interval
+
+    async def _measure(self, make_call, concurrency: int) -> Dict[str, Any]:
+        stalls: List[float] = []
+
+        async def heartbeat():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(HEARTBEAT_SECONDS)
+                now = time.perf_counter()
+                stalls.append(max(0.0, now - last - HEARTBEAT_SECONDS))
+                last = now
+
+        async def timed():
+            start = time.perf_counter()
+            first_chunk = await make_call()
+            return time.perf_counter() - start, first_chunk
+
+        ticker = asyncio.create_task(heartbeat())
+        start = time.perf_counter()
+        results = await asyncio.gather(*[timed() for _ in range(concurrency)])
+        wall = time.perf_counter() - start
+        ticker.cancel()
+
+        latencies = sorted(latency for latency, _ in results)
+        level = {
+            "wall_seconds": round(wall, 3),
+            "p50_latency_ms": round(statistics.median(latencies) * 1000, 1),
+            "max_latency_ms": round(latencies[-1] * 1000, 1),
+            "max_loop_stall_ms": round(max(stalls, default=0.0) * 1000, 1),
+            "requests_per_second": round(concurrency / wall, 1),
+        }
+        first_chunks = [first for _, first in results if first is not None]
+        if first_chunks:
+            level["p50_first_chunk_ms"] = round(statistics.median(first_chunks) * 1000, 1)
+        return level
+
+    async def run(self) -> Dict[str, Any]:
+        from agents.patient_navigator.output_processing.agent import CommunicationAgent
+        from agents.shared.monitoring.resource_sampler import get_resource_sampler
+
+        # Agent logging is very chatty; keep it out of the timings
+        logging.getLogger("agent.output_communication").setLevel(logging.WARNING)
+        os.environ["ENVIRONMENT"] = "production"
+        get_resource_sampler().start()
+
+        mock_llm = MockAsyncLLM(self.llm_latency)
+        legacy_agent = CommunicationAgent(llm_client=lambda prompt: "".join(RESPONSE_CHUNKS))
+        async_agent = CommunicationAgent(async_llm_client=mock_llm)
+        request = make_request()
+
+        async def legacy_call():
+            await legacy_enhance(legacy_agent, request, self.llm_latency, self.legacy_cpu_interval)
+
+        async def async_call():
+            await async_agent.enhance_response(request)
+
+        async def stream_call():
+            start = time.perf_counter()
+            first_chunk = None
+            async for _ in async_agent.stream_response(request):
+                if first_chunk is None:
+                    first_chunk = time.perf_counter() - start
+            return first_chunk
+
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "llm_latency_seconds": self.llm_latency,
+            "legacy_cpu_interval_seconds": self.legacy_cpu_interval,
+            "concurrency": {},
+        }
+
+        for concurrency in self.concurrency_levels:
+            logger.info(f"⏱️ {concurrency} concurrent requests...")
+            level = {
+                "legacy": await self._measure(legacy_call, concurrency),
+                "async": await self._measure(async_call, concurrency),
+                "async_streaming": await self._measure(stream_call, concurrency),
+            }
+            logger.info(f"  {level}")
+            results["concurrency"][str(concurrency)] = level
+
+        return results
+
+
+async def main():
+    """Run the communication agent benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 25])
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Mock LLM latency in seconds")
+    parser.add_argument(
+        "--legacy-cpu-interval", type=float, default=1.0,
+        help="psutil.cpu_percent interval used by the legacy production path"
+    )
+    args = parser.parse_args()
+
+    benchmark = CommunicationAgentBenchmark(args.concurrency, args.llm_latency, args.legacy_cpu_interval)
+    results = await benchmark.run()
+
+    results_file = f"communication_agent_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
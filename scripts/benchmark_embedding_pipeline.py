@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Embedding Pipeline Benchmark
+
+Compares the previous sequential embedding loop in the upload worker (one
+batch at a time with a fixed 100ms sleep between batches) against the
+pipelined engine in backend.shared.external.embedding_pipeline.
+
+Requests go to an in-process mock of the OpenAI embeddings endpoint with
+configurable latency and a requests-per-minute budget. The mock returns 429
+with Retry-After and x-ratelimit-* headers when the budget is exceeded, so
+the adaptive limiter is exercised through the same httpx response hook the
+real services use.
+
+Usage:
+    python scripts/benchmark_embedding_pipeline.py --chunks 2048 --latency-ms 300 --rpm 600
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.shared.external.embedding_pipeline import AdaptiveRateLimiter, EmbeddingPipeline
+from backend.shared.external import embedding_pipeline
+from backend.shared.external.embedding_service import EmbeddingService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 256
+EMBEDDING_DIM = 1536
+
+
+class MockEmbeddingServer:
+    """Minimal OpenAI-compatible /v1/embeddings endpoint with a request budget."""
+
+    def __init__(self, latency_ms: float, requests_per_minute: int):
+        self.latency = latency_ms / 1000
+        self.requests_per_minute = requests_per_minute
+        self.window_start = time.monotonic()
+        self.window_requests = 0
+        self.requests = 0
+        self.rejected = 0
+        self.runner = None
+        self.base_url = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests += 1
+
+        # Fixed one-second window of requests_per_minute / 60
+        now = time.monotonic()
+        if now - self.window_start >= 1.0:
+            self.window_start = now
+            self.window_requests = 0
+        per_second = max(1, self.requests_per_minute // 60)
+        reset = max(0.0, 1.0 - (now - self.window_start))
+        headers = {
+            "x-ratelimit-limit-requests": str(self.requests_per_minute),
+            "x-ratelimit-remaining-requests": str(max(0, per_second - self.window_requests - 1)),
+            "x-ratelimit-reset-requests": f"{int(reset * 1000)}ms",
+        }
+        if self.window_requests >= per_second:
+            self.rejected += 1
+            headers["retry-after"] = f"{reset:.3f}"
+            return web.json_response({"error": {"message": "Rate limit reached"}}, status=429, headers=headers)
+        self.window_requests += 1
+
+        await asyncio.sleep(self.latency)
+        data = [
+            {"object": "embedding", "index": i, "embedding": [0.001 * (i + 1)] * EMBEDDING_DIM}
+            for i in range(len(payload["input"]))
+        ]
+        return web.json_response({"object": "list", "data": data, "model": payload["model"]}, headers=headers)
+
+    async def start(self):
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/v1/embeddings", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+
+
+class EmbeddingPipelineBenchmark:
+    """Runs the sequential loop and the pipeline against the mock server."""
+
+    def __init__(self, server: MockEmbeddingServer, chunks: int):
+        self.server = server
+        self.items = [{"text": f"benchmark chunk {i} " + "lorem ipsum " * 40} for i in range(chunks)]
+
+    def _service(self) -> EmbeddingService:
+        # Caching disabled in effect: every chunk text is unique
+        return EmbeddingService(api_key="benchmark", base_url=self.server.base_url, max_entries=1)
+
+    async def _embed_with_retry(self, service: EmbeddingService, texts: List[str]) -> List[List[float]]:
+        # Stand-in for the enhanced client's retry loop, which the worker keeps
+        while True:
+            try:
+                return await service.embed_batch(texts)
+            except Exception as e:
+                if "429" not in str(e):
+                    raise
+                await asyncio.sleep(0.25)
+
+    async def run_sequential(self) -> Dict[str, Any]:
+        """Previous path: one batch at a time plus a 100ms pause."""
+        service = self._service()
+        start_requests, start_rejected = self.server.requests, self.server.rejected
+        start = time.perf_counter()
+        try:
+            for i in range(0, len(self.items), BATCH_SIZE):
+                texts = [item["text"] for item in self.items[i:i + BATCH_SIZE]]
+                await self._embed_with_retry(service, texts)
+                if i + BATCH_SIZE < len(self.items):
+                    await asyncio.sleep(0.1)
+        finally:
+            await service.close()
+        elapsed = time.perf_counter() - start
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "chunks_per_second": round(len(self.items) / elapsed, 1),
+            "requests": self.server.requests - start_requests,
+            "rejected_429": self.server.rejected - start_rejected,
+        }
+
+    async def run_pipelined(self, concurrency: int) -> Dict[str, Any]:
+        """New path: concurrent batches under the adaptive limiter."""
+        service = self._service()
+        # Fresh limiter per run; the httpx hook feeds the module-level instance
+        limiter = AdaptiveRateLimiter(requests_per_minute=self.server.requests_per_minute)
+        embedding_pipeline._openai_rate_limiter = limiter
+        start_requests, start_rejected = self.server.requests, self.server.rejected
+
+        async def sink(index, batch, embeddings):
+            pass
+
+        pipeline = EmbeddingPipeline(
+            embed=lambda texts: self._embed_with_retry(service, texts),
+            sink=sink,
+            limiter=limiter,
+            batch_size=BATCH_SIZE,
+            concurrency=concurrency
+        )
+        try:
+            stats = await pipeline.run(self.items)
+        finally:
+            await service.close()
+        result = stats.to_dict()
+        result.update({
+            "requests": self.server.requests - start_requests,
+            "rejected_429": self.server.rejected - start_rejected,
+        })
+        return result
+
+
+async def main():
+    """Run the embedding pipeline benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=2048)
+    parser.add_argument("--latency-ms", type=float, default=300)
+    parser.add_argument("--rpm", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    server = MockEmbeddingServer(args.latency_ms, args.rpm)
+    await server.start()
+    benchmark = EmbeddingPipelineBenchmark(server, args.chunks)
+
+    results: Dict[str, Any] = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "chunks": args.chunks,
+        "batch_size": BATCH_SIZE,
+        "latency_ms": args.latency_ms,
+        "mock_rpm": args.rpm,
+        "pipelined": {},
+    }
+    try:
+        logger.info("⏱️ Running sequential baseline...")
+        results["sequential"] = await benchmark.run_sequential()
+        logger.info(f"  sequential: {results['sequential']}")
+
+        for concurrency in args.concurrency:
+            logger.info(f"⏱️ Running pipeline at concurrency {concurrency}...")
+            result = await benchmark.run_pipelined(concurrency)
+            result["speedup"] = round(result["chunks_per_second"] / results["sequential"]["chunks_per_second"], 2)
+            results["pipelined"][str(concurrency)] = result
+            logger.info(f"  concurrency {concurrency}: {result}")
+    finally:
+        await server.stop()
+
+    results_file = f"embedding_pipeline_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Embedding Validation Benchmark
+
+Compares the previous per-vector validation path (one NumPy conversion and a
+chain of whole-vector checks per embedding, called once per chunk from the
+worker's write loop) against EmbeddingValidator.validate_array, which checks
+an (N, 1536) batch with whole-array operations.
+
+Two levels are measured:
+    validator  - the bare checks: legacy per-vector function vs validate_array
+    monitor    - the worker's path: EmbeddingQualityMonitor.validate_embedding
+                 awaited once per chunk with its source_info (legacy checks
+                 plugged into the validator) vs one monitor.validate_array call
+
+Embeddings are passed as lists of floats, as the worker receives them from
+the OpenAI client, so conversion cost is included in both paths. A few
+invalid rows (zeros, NaN) are mixed into each batch; critical rows are
+reported, not raised, in both paths.
+
+Usage:
+    python scripts/benchmark_embedding_validation.py --batch-sizes 1 256 2048 --iterations 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DIMENSION = 1536
+
+
+def legacy_validate(arr_like: List[float]) -> str:
+    """The previous per-vector checks, in their original order."""
+    arr = np.array(arr_like, dtype=float)
+    if len(arr) != DIMENSION:
+        return "invalid_dimensions"
+    if np.any(np.isnan(arr)):
+        return "nan_values"
+    if np.any(np.isinf(arr)):
+        return "infinite_values"
+    zero_fraction = np.mean(np.abs(arr) < 1e-10)
+    if zero_fraction == 1.0:
+        return "all_zeros"
+    if zero_fraction > 0.95:
+        return "mostly_zeros"
+    if np.max(np.abs(arr)) > 10.0:
+        return "extreme_values"
+    if np.var(arr) < 1e-6:
+        return "insufficient_variance"
+    if 1.0 - len(np.unique(arr)) / len(arr) > 0.8:
+        return "suspicious_pattern"
+    return "valid"
+
+
+def make_legacy_validator():
+    """EmbeddingValidator whose per-vector path runs the legacy checks."""
+    from backend.shared.validation.embedding_validator import (
+        EmbeddingIssueType, EmbeddingValidationResult, EmbeddingValidator,
+    )
+
+    class LegacyValidator(EmbeddingValidator):
+        def validate_embedding(self, embedding, source_info=None):
+            verdict = EmbeddingIssueType(legacy_validate(embedding))
+            return EmbeddingValidationResult(
+                is_valid=verdict == EmbeddingIssueType.VALID,
+                issue_type=verdict,
+                severity="info" if verdict == EmbeddingIssueType.VALID else "warning",
+                confidence=1.0,
+                details=verdict.value,
+                metrics={"source_info": source_info or {}},
+                recommendations=[]
+            )
+
+    return LegacyValidator()
+
+
+def make_batch(size: int, seed: int = 0) -> List[List[float]]:
+    rng = np.random.default_rng(seed)
+    batch = rng.normal(0, 0.03, size=(size, DIMENSION)).tolist()
+    # Sprinkle in invalid rows so both paths exercise their failure branches
+    for row in range(0, size, 97):
+        batch[row] = [0.0] * DIMENSION
+    for row in range(50, size, 211):
+        batch[row][random.Random(row).randrange(DIMENSION)] = float("nan")
+    return batch
+
+
+class EmbeddingValidationBenchmark:
+    """Times both validation paths at each batch size."""
+
+    def __init__(self, batch_sizes: List[int], iterations: int):
+        self.batch_sizes = batch_sizes
+        self.iterations = iterations
+
+    async def _time(self, fn, batch) -> Dict[str, Any]:
+        async def call():
+            result = fn(batch)
+            if asyncio.iscoroutine(result):
+                await result
+
+        await call()  # warm up
+        timings = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            await call()
+            timings.append(time.perf_counter() - start)
+        median = statistics.median(timings)
+        return {
+            "median_ms": round(median * 1000, 3),
+            "vectors_per_second": round(len(batch) / median),
+        }
+
+    @staticmethod
+    def _compare(per_vector: Dict[str, Any], vectorized: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "per_vector": per_vector,
+            "vectorized": vectorized,
+            "speedup": round(per_vector["median_ms"] / vectorized["median_ms"], 1),
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        from backend.shared.monitoring.embedding_monitor import EmbeddingQualityMonitor
+        from backend.shared.validation.embedding_validator import EmbeddingValidator
+
+        # Monitor logging would dominate both paths; keep it out of the numbers
+        logging.getLogger("embedding_monitor").setLevel(logging.CRITICAL)
+        validator = EmbeddingValidator()
+        legacy_monitor = EmbeddingQualityMonitor(validator=make_legacy_validator())
+        batch_monitor = EmbeddingQualityMonitor(validator=validator)
+        source_info = {"user_id": "bench", "job_id": "bench", "document_id": "bench", "correlation_id": "bench"}
+
+        async def legacy_monitor_path(batch):
+            for index, embedding in enumerate(batch):
+                await legacy_monitor.validate_embedding(
+                    embedding,
+                    dict(source_info, chunk_index_in_batch=index, text_length=100, text_preview="chunk text"),
+                    raise_on_critical=False
+                )
+
+        async def batch_monitor_path(batch):
+            await batch_monitor.validate_array(batch, source_info, raise_on_critical=False)
+
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "iterations": self.iterations,
+            "batch_sizes": {},
+        }
+
+        for size in self.batch_sizes:
+            batch = make_batch(size)
+            logger.info(f"⏱️ batch of {size}...")
+
+            legacy_verdicts = [legacy_validate(embedding) for embedding in batch]
+            batch_verdicts = [issue.value for issue in validator.validate_array(batch).issue_types]
+            if legacy_verdicts != batch_verdicts:
+                raise RuntimeError(f"Verdicts differ for batch of {size}")
+
+            level = {
+                "invalid_rows": sum(verdict != "valid" for verdict in legacy_verdicts),
+                "validator": self._compare(
+                    await self._time(lambda b: [legacy_validate(embedding) for embedding in b], batch),
+                    await self._time(validator.validate_array, batch)
+                ),
+                "monitor": self._compare(
+                    await self._time(legacy_monitor_path, batch),
+                    await self._time(batch_monitor_path, batch)
+                ),
+            }
+            logger.info(f"  {level}")
+            results["batch_sizes"][str(size)] = level
+
+        return results
+
+
+async def main():
+    """Run the embedding validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 256, 2048])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    benchmark = EmbeddingValidationBenchmark(args.batch_sizes, args.iterations)
+    results = await benchmark.run()
+
+    results_file = f"embedding_validation_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
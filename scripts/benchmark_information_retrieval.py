@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Information Retrieval Agent Benchmark
+
+Measures end-to-end InformationRetrievalAgent.retrieve_information latency
+with the previous self-consistency loop against the concurrent variant
+engine:
+
+    legacy     - variants generated one after another, each awaited with its
+                 own 15s timeout; consistency scored with pairwise
+                 difflib.SequenceMatcher
+    concurrent - variants fanned out under the shared concurrency cap with
+                 early stop once completed variants are consistent; consistency
+                 scored from one character-shingle similarity matrix
+
+RAG retrieval is stubbed and the LLM is a mock with log-normally distributed
+latency, so no API key or database is needed. Two response sets are used:
+"consistent" (paraphrases, which allow early stop) and "divergent" (which
+never do). A separate section times calculate_consistency alone on longer
+responses.
+
+Usage:
+    python scripts/benchmark_information_retrieval.py --queries 20 --concurrency 5 --llm-latency 0.4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESPONSE_SETS = {
+    "consistent": [
+        "Physician services: your plan covers outpatient visits. Primary care visits have a $25 copay and specialist visits a $40 copay. Some specialists need a referral and prior authorization may be required for in-office procedures.",
+        "Physician services: outpatient visits are covered by your plan. You pay a $25 copay for primary care and a $40 copay for specialists. A referral may be needed for specialists and some in-office procedures need prior authorization.",
+        "Physician services: your plan covers outpatient physician visits with a $25 primary care copay and a $40 specialist copay. Specialists may need a referral, and prior authorization can be required for procedures in the office.",
+    ],
+    "divergent": [
+        "Physician services: primary care visits have a $25 copay.",
+        "Specialists: visits require a $40 copay and may need prior authorization.",
+        "Prescriptions: generic and brand name medications are covered in four tiers.",
+    ],
+}
+
+
+def legacy_pairwise_similarity(response1: str, response2: str) -> float:
+    """The previous SelfConsistencyChecker._calculate_pairwise_similarity."""
+    return SequenceMatcher(None, response1.lower(), response2.lower()).ratio()
+
+
+def build_legacy_agent_class():
+    """InformationRetrievalAgent with the previous sequential variant loop."""
+    from agents.patient_navigator.information_retrieval.agent import InformationRetrievalAgent
+    from agents.patient_navigator.shared.consistency import SelfConsistencyChecker
+
+    class LegacyConsistencyChecker(SelfConsistencyChecker):
+        def calculate_consistency(self, responses: List[str]) -> float:
+            if len(responses) < 2:
+                return 1.0
+            similarities = [
+                legacy_pairwise_similarity(responses[i], responses[j])
+                for i in range(len(responses))
+                for j in range(i + 1, len(responses))
+            ]
+            return sum(similarities) / len(similarities)
+
+    class LegacyInformationRetrievalAgent(InformationRetrievalAgent):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.consistency_checker = LegacyConsistencyChecker()
+
+        async def _generate_response_variants(self, chunks, user_query, expert_query):
+            document_context = self._prepare_document_context(chunks)
+            variants = []
+            for i in range(3):
+                prompt = self._create_variant_prompt(user_query, expert_query, document_context, variant_num=i + 1)
+                try:
+                    response = await asyncio.wait_for(self._call_llm(prompt), timeout=15.0)
+                except Exception:
+                    continue
+                cleaned = self._clean_response_variant(response)
+                if cleaned:
+                    variants.append(cleaned)
+            return variants or ["Unable to generate response due to processing error."]
+
+    return LegacyInformationRetrievalAgent
+
+
+class InformationRetrievalBenchmark:
+    """Runs retrieve_information through both variant engines."""
+
+    def __init__(self, queries: int, concurrency: int, llm_latency: float, seed: int):
+        self.queries = queries
+        self.concurrency = concurrency
+        self.llm_latency = llm_latency
+        self.seed = seed
+
+    def _make_llm(self, responses: List[str], rng: random.Random):
+        async def mock_llm(prompt: str) -> str:
+            # Log-normal latency around the median gives a realistic slow tail
+            await asyncio.sleep(self.llm_latency * rng.lognormvariate(0.0, 0.4))
+            if "response variant" in prompt:
+                return rng.choice(responses)
+            return "outpatient physician services benefit coverage and cost-sharing"
+        return mock_llm
+
+    async def _run_agent(self, agent, responses: List[str]) -> Dict[str, Any]:
+        from agents.patient_navigator.information_retrieval.models import InformationRetrievalInput
+        from agents.tooling.rag.core import ChunkWithContext
+
+        chunks = [
+            ChunkWithContext(
+                id=f"chunk_{i}", doc_id="doc_1", chunk_index=i,
+                content=response, section_title="Benefits", page_start=1, page_end=1,
+                similarity=0.8, tokens=60
+            )
+            for i, response in enumerate(responses)
+        ]
+
+        async def retrieve_chunks(expert_query, user_id):
+            return chunks
+
+        rng = random.Random(self.seed)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        latencies: List[float] = []
+
+        async def one_query(i: int):
+            async with semaphore:
+                start = time.perf_counter()
+                await agent.retrieve_information(InformationRetrievalInput(
+                    user_query="What does my insurance cover for doctor visits?",
+                    user_id=f"bench_user_{i}"
+                ))
+                latencies.append(time.perf_counter() - start)
+
+        with patch.object(agent, "_call_llm", side_effect=self._make_llm(responses, rng)), \
+             patch.object(agent, "_retrieve_chunks", side_effect=retrieve_chunks):
+            start = time.perf_counter()
+            await asyncio.gather(*[one_query(i) for i in range(self.queries)])
+            wall = time.perf_counter() - start
+
+        latencies.sort()
+        return {
+            "wall_seconds": round(wall, 3),
+            "p50_latency_ms": round(statistics.median(latencies) * 1000, 1),
+            "p95_latency_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 1),
+            "max_latency_ms": round(latencies[-1] * 1000, 1),
+        }
+
+    def _consistency_timings(self) -> Dict[str, Any]:
+        from agents.patient_navigator.shared.consistency import SelfConsistencyChecker
+
+        checker = SelfConsistencyChecker()
+        rng = random.Random(self.seed)
+        words = " ".join(RESPONSE_SETS["consistent"] + RESPONSE_SETS["divergent"]).split()
+        timings = {}
+        for length in (500, 2000, 4000):
+            responses = []
+            for _ in range(5):
+                text = ""
+                while len(text) < length:
+                    text += rng.choice(words) + " "
+                responses.append(text)
+
+            start = time.perf_counter()
+            pairs = [
+                legacy_pairwise_similarity(responses[i], responses[j])
+                for i in range(len(responses)) for j in range(i + 1, len(responses))
+            ]
+            legacy_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            checker.calculate_consistency(responses)
+            shingle_ms = (time.perf_counter() - start) * 1000
+
+            timings[str(length)] = {
+                "sequence_matcher_ms": round(legacy_ms, 2),
+                "shingle_matrix_ms": round(shingle_ms, 2),
+                "pairs": len(pairs),
+            }
+            logger.info(f"📏 5 variants x {length} chars: SequenceMatcher {legacy_ms:.1f}ms, shingle matrix {shingle_ms:.1f}ms")
+        return timings
+
+    async def run(self) -> Dict[str, Any]:
+        from agents.patient_navigator.information_retrieval.agent import InformationRetrievalAgent
+
+        # Per-step agent logging would dominate the timings
+        logging.getLogger().setLevel(logging.WARNING)
+        logger.setLevel(logging.INFO)
+
+        legacy_agent = build_legacy_agent_class()(use_mock=True)
+        concurrent_agent = InformationRetrievalAgent(use_mock=True)
+
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "queries": self.queries,
+            "concurrency": self.concurrency,
+            "llm_latency_seconds": self.llm_latency,
+            "end_to_end": {},
+        }
+
+        for name, responses in RESPONSE_SETS.items():
+            logger.info(f"⏱️ {name} responses: {self.queries} queries, {self.concurrency} concurrent...")
+            level = {
+                "legacy": await self._run_agent(legacy_agent, responses),
+                "concurrent": await self._run_agent(concurrent_agent, responses),
+            }
+            level["p50_speedup"] = round(level["legacy"]["p50_latency_ms"] / level["concurrent"]["p50_latency_ms"], 2)
+            logger.info(f"  {level}")
+            results["end_to_end"][name] = level
+
+        results["consistency_scoring"] = self._consistency_timings()
+        return results
+
+
+async def main():
+    """Run the information retrieval benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5, help="Queries in flight at once")
+    parser.add_argument("--llm-latency", type=float, default=0.4, help="Median mock LLM latency in seconds")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    benchmark = InformationRetrievalBenchmark(args.queries, args.concurrency, args.llm_latency, args.seed)
+    results = await benchmark.run()
+
+    results_file = f"information_retrieval_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
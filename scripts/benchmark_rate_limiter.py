@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Benchmark
+
+Compares the previous upload pipeline rate limiter (a deque of request
+timestamps per key, with every key walked for cleanup on each check) against
+the GCRA limiter in api.upload_pipeline.rate_limiter with the in-memory store
+(one float per key).
+
+For each key count it reports checks per second with requests spread over all
+keys, and the memory retained per 100k keys (tracemalloc) after each key has
+made a few requests.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py --keys 1000 10000 100000 --checks 200000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 3600
+MAX_REQUESTS = 1000
+# The previous limiter walks every key per check; cap its run so large key
+# counts finish in reasonable time and extrapolate from the rate
+LEGACY_MAX_CHECKS = 500
+
+
+class LegacyRateLimiter:
+    """The previous algorithm: timestamp deques plus a full cleanup walk per check."""
+
+    def __init__(self):
+        self.requests: Dict[str, deque] = defaultdict(deque)
+
+    def check(self, key: str, now: float) -> bool:
+        for requests in self.requests.values():
+            while requests and now - requests[0] > WINDOW_SECONDS:
+                requests.popleft()
+        empty = [k for k, requests in self.requests.items() if not requests]
+        for k in empty:
+            del self.requests[k]
+
+        requests = self.requests[key]
+        while requests and now - requests[0] > WINDOW_SECONDS:
+            requests.popleft()
+        if len(requests) >= MAX_REQUESTS:
+            return False
+        requests.append(now)
+        return True
+
+
+def make_gcra_limiter():
+    from api.upload_pipeline.rate_limiter import InMemoryRateLimitStore, RateLimitConfig, RateLimiter
+
+    limiter = RateLimiter(clock=time.time)
+    limiter.initialize(InMemoryRateLimitStore())
+    limiter.rate_limits = {
+        "/api/v2": RateLimitConfig(max_requests=MAX_REQUESTS, window_seconds=WINDOW_SECONDS, endpoint="general")
+    }
+    return limiter
+
+
+class RateLimiterBenchmark:
+    """Measures throughput and memory of both limiters at several key counts."""
+
+    def __init__(self, key_counts: List[int], checks: int, requests_per_key: int):
+        self.key_counts = key_counts
+        self.checks = checks
+        self.requests_per_key = requests_per_key
+
+    @staticmethod
+    def _paths(key_count: int) -> List[str]:
+        return [f"/api/v2/jobs/{i}" for i in range(key_count)]
+
+    def _legacy_throughput(self, paths: List[str]) -> Dict[str, Any]:
+        limiter = LegacyRateLimiter()
+        now = time.time()
+        # Seed directly; seeding through check() would be quadratic
+        for path in paths:
+            limiter.requests[path].append(now)
+
+        checks = min(self.checks, LEGACY_MAX_CHECKS)
+        sample = random.choices(paths, k=checks)
+        start = time.perf_counter()
+        for path in sample:
+            limiter.check(path, now)
+        elapsed = time.perf_counter() - start
+        return {"checks": checks, "checks_per_second": round(checks / elapsed)}
+
+    async def _gcra_throughput(self, paths: List[str]) -> Dict[str, Any]:
+        limiter = make_gcra_limiter()
+        for path in paths:
+            await limiter.check(path)
+
+        sample = random.choices(paths, k=self.checks)
+        start = time.perf_counter()
+        for path in sample:
+            await limiter.check(path)
+        elapsed = time.perf_counter() - start
+        return {"checks": self.checks, "checks_per_second": round(self.checks / elapsed)}
+
+    def _legacy_memory(self, paths: List[str]) -> int:
+        # Fill the deques directly; the cleanup walk would make this quadratic
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        state: Dict[str, deque] = defaultdict(deque)
+        now = time.time()
+        for path in paths:
+            for i in range(self.requests_per_key):
+                state[path].append(now + i)
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        return retained
+
+    async def _gcra_memory(self, paths: List[str]) -> int:
+        limiter = make_gcra_limiter()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for path in paths:
+            for _ in range(self.requests_per_key):
+                await limiter.check(path)
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        return retained
+
+    async def run(self) -> Dict[str, Any]:
+        logging.getLogger("api.upload_pipeline.rate_limiter").setLevel(logging.ERROR)
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "requests_per_key": self.requests_per_key,
+            "levels": {},
+        }
+
+        for key_count in self.key_counts:
+            paths = self._paths(key_count)
+            logger.info(f"⏱️ {key_count} keys...")
+
+            legacy = self._legacy_throughput(paths)
+            gcra = await self._gcra_throughput(paths)
+
+            scale = 100_000 / key_count
+            legacy["bytes_per_100k_keys"] = round(self._legacy_memory(paths) * scale)
+            gcra["bytes_per_100k_keys"] = round(await self._gcra_memory(paths) * scale)
+
+            level = {
+                "legacy": legacy,
+                "gcra": gcra,
+                "speedup": round(gcra["checks_per_second"] / legacy["checks_per_second"], 1),
+            }
+            logger.info(f"  {level}")
+            results["levels"][str(key_count)] = level
+
+        return results
+
+
+async def main():
+    """Run the rate limiter benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--checks", type=int, default=200000)
+    parser.add_argument("--requests-per-key", type=int, default=10)
+    args = parser.parse_args()
+
+    benchmark = RateLimiterBenchmark(args.keys, args.checks, args.requests_per_key)
+    results = await benchmark.run()
+
+    results_file = f"rate_limiter_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
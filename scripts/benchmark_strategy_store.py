@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Strategy Store Concurrency Benchmark
+
+Measures strategy storage and retrieval latency under concurrent load,
+comparing the previous DatabaseIntegration path against StrategyStore:
+
+    legacy - synchronous supabase-py calls made directly inside the async
+             methods: eight blocking round trips per strategy stored, and a
+             100-row constraint query plus an RPC per retrieval, with a new
+             embedding client (and connection handshake) per embedding
+    store  - StrategyStore on an asyncpg-style pool: one transaction of four
+             statements per batch, one filtered similarity query per
+             retrieval, and a shared warm embedding client
+
+The database and embedding API are simulated with fixed round-trip latencies
+(blocking sleeps for the sync client, awaited sleeps for the pool), so no
+database or API key is needed. Event-loop lag is sampled by a heartbeat task
+that should wake every 5ms; "max_loop_stall_ms" is the longest it was kept
+waiting beyond that.
+
+Usage:
+    python scripts/benchmark_strategy_store.py --retrievals 50 --batches 10 --db-latency 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 0.005
+STRATEGIES_PER_BATCH = 4
+POOL_MAX_SIZE = 20  # DatabasePoolManager default
+
+
+class BlockingSupabaseClient:
+    """Stand-in for the sync supabase-py client: every execute() blocks for one round trip."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.round_trips = 0
+
+    def execute(self) -> List[Dict[str, Any]]:
+        self.round_trips += 1
+        time.sleep(self.latency)
+        return []
+
+
+class SimulatedConnection:
+    """asyncpg-style connection whose statements each await one round trip."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def transaction(self):
+        conn = self
+
+        class _Transaction:
+            async def __aenter__(self):
+                await asyncio.sleep(conn.latency)  # BEGIN
+
+            async def __aexit__(self, *exc):
+                await asyncio.sleep(conn.latency)  # COMMIT / ROLLBACK
+                return False
+
+        return _Transaction()
+
+    async def fetch(self, sql: str, *args):
+        await asyncio.sleep(self.latency)
+        if "RETURNING" in sql:
+            return [{"id": uuid.UUID(value) if "strategies_buffer" not in sql else uuid.uuid4()} for value in args[0]]
+        return []
+
+    async def execute(self, sql: str, *args):
+        await asyncio.sleep(self.latency)
+
+
+class SimulatedPool:
+    """asyncpg-style pool bounded like the shared DatabasePoolManager pool."""
+
+    def __init__(self, latency: float, max_size: int = POOL_MAX_SIZE):
+        self.semaphore = asyncio.Semaphore(max_size)
+        self.latency = latency
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                await pool.semaphore.acquire()
+                return SimulatedConnection(pool.latency)
+
+            async def __aexit__(self, *exc):
+                pool.semaphore.release()
+                return False
+
+        return _Acquire()
+
+
+class SimulatedEmbeddingService:
+    """Warm, shared embedding client: one API round trip per request."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def embed(self, text: str) -> List[float]:
+        await asyncio.sleep(self.latency)
+        return [0.1] * 1536
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(self.latency)
+        return [[0.1] * 1536 for _ in texts]
+
+
+class LegacyStrategyDatabase:
+    """The previous DatabaseIntegration call pattern against a blocking client."""
+
+    def __init__(self, db_latency: float, embed_latency: float, handshake_latency: float):
+        self.client = BlockingSupabaseClient(db_latency)
+        self.embed_latency = embed_latency
+        self.handshake_latency = handshake_latency
+
+    async def _fresh_client_embedding(self) -> List[float]:
+        # A new LLMIntegration per embedding pays for its own connection
+        await asyncio.sleep(self.handshake_latency + self.embed_latency)
+        return [0.1] * 1536
+
+    async def store(self, strategies) -> None:
+        for _ in strategies:
+            self.client.execute()                  # insert strategies_buffer
+            self.client.execute()                  # select existing by content_hash
+            self.client.execute()                  # insert strategies
+            self.client.execute()                  # update strategies_buffer
+            await self._fresh_client_embedding()
+            self.client.execute()                  # insert strategy_vector_buffer
+            self.client.execute()                  # select strategy_vector_buffer
+            self.client.execute()                  # insert strategy_vectors
+            self.client.execute()                  # update strategy_vector_buffer
+
+    async def retrieve(self, plan_constraints: Dict[str, Any]) -> None:
+        self.client.execute()                      # select * limit 100
+        await self._fresh_client_embedding()
+        self.client.execute()                      # rpc match_strategy_vectors
+
+
+def make_strategies(batch: int):
+    from agents.patient_navigator.strategy.types import PlanConstraints, Strategy, StrategyScores
+
+    return [
+        Strategy(
+            id=str(uuid.uuid4()),
+            title=f"Strategy {batch}-{i}",
+            category="speed-optimized",
+            approach="Book a specialist directly",
+            rationale="Fastest path to care",
+            actionable_steps=["Call the specialist", "Confirm coverage"],
+            plan_constraints=PlanConstraints(
+                copay=25, deductible=1000, network_providers=["Kaiser"],
+                geographic_scope="Northern California", specialty_access=["Cardiology"]
+            ),
+            llm_scores=StrategyScores(speed=0.9, cost=0.6, effort=0.7),
+            content_hash=f"hash-{batch}-{i}",
+            validation_status="approved",
+            created_at=datetime.now()
+        )
+        for i in range(STRATEGIES_PER_BATCH)
+    ]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        "p50_latency_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_latency_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 1),
+        "max_latency_ms": round(latencies[-1] * 1000, 1),
+    }
+
+
+class StrategyStoreBenchmark:
+    """Runs a mixed store/retrieve workload through both paths while watching the event loop."""
+
+    def __init__(self, retrievals: int, batches: int, db_latency: float, embed_latency: float, handshake_latency: float):
+        self.retrievals = retrievals
+        self.batches = batches
+        self.db_latency = db_latency
+        self.embed_latency = embed_latency
+        self.handshake_latency = handshake_latency
+
+    async def _measure(self, store, retrieve) -> Dict[str, Any]:
+        stalls: List[float] = []
+        store_latencies: List[float] = []
+        retrieve_latencies: List[float] = []
+        constraints = {"specialty_access": ["Cardiology"], "geographic_scope": "Northern California"}
+
+        async def heartbeat():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(HEARTBEAT_SECONDS)
+                now = time.perf_counter()
+                stalls.append(max(0.0, now - last - HEARTBEAT_SECONDS))
+                last = now
+
+        async def timed_store(batch: int):
+            strategies = make_strategies(batch)
+            start = time.perf_counter()
+            await store(strategies)
+            store_latencies.append(time.perf_counter() - start)
+
+        async def timed_retrieve():
+            start = time.perf_counter()
+            await retrieve(constraints)
+            retrieve_latencies.append(time.perf_counter() - start)
+
+        ticker = asyncio.create_task(heartbeat())
+        await asyncio.sleep(HEARTBEAT_SECONDS * 2)
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[timed_store(batch) for batch in range(self.batches)],
+            *[timed_retrieve() for _ in range(self.retrievals)]
+        )
+        wall = time.perf_counter() - start
+        ticker.cancel()
+
+        return {
+            "wall_seconds": round(wall, 3),
+            "store_batch": summarize(store_latencies),
+            "retrieve": summarize(retrieve_latencies),
+            "max_loop_stall_ms": round(max(stalls, default=0.0) * 1000, 1),
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        from agents.patient_navigator.strategy.workflow.strategy_store import StrategyStore
+
+        logging.getLogger("agents.patient_navigator.strategy.workflow.strategy_store").setLevel(logging.WARNING)
+
+        legacy = LegacyStrategyDatabase(self.db_latency, self.embed_latency, self.handshake_latency)
+        store = StrategyStore(
+            pool=SimulatedPool(self.db_latency),
+            embedding_service=SimulatedEmbeddingService(self.embed_latency)
+        )
+
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "retrievals": self.retrievals,
+            "batches": self.batches,
+            "strategies_per_batch": STRATEGIES_PER_BATCH,
+            "db_latency_seconds": self.db_latency,
+            "embed_latency_seconds": self.embed_latency,
+            "handshake_latency_seconds": self.handshake_latency,
+        }
+
+        logger.info(f"⏱️ legacy: {self.batches} batches + {self.retrievals} retrievals concurrently...")
+        results["legacy"] = await self._measure(legacy.store, legacy.retrieve)
+        results["legacy"]["blocking_round_trips"] = legacy.client.round_trips
+        logger.info(f"  {results['legacy']}")
+
+        logger.info(f"⏱️ store: {self.batches} batches + {self.retrievals} retrievals concurrently...")
+        results["store"] = await self._measure(store.store_strategies, store.search_strategies)
+        logger.info(f"  {results['store']}")
+
+        results["retrieve_p95_speedup"] = round(
+            results["legacy"]["retrieve"]["p95_latency_ms"] / results["store"]["retrieve"]["p95_latency_ms"], 2
+        )
+        return results
+
+
+async def main():
+    """Run the strategy store benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--retrievals", type=int, default=50, help="Concurrent retrievals")
+    parser.add_argument("--batches", type=int, default=10, help=f"Concurrent {STRATEGIES_PER_BATCH}-strategy store batches")
+    parser.add_argument("--db-latency", type=float, default=0.01, help="Database round trip in seconds")
+    parser.add_argument("--embed-latency", type=float, default=0.1, help="Embedding API round trip in seconds")
+    parser.add_argument("--handshake-latency", type=float, default=0.05, help="Connection setup for a new embedding client")
+    args = parser.parse_args()
+
+    benchmark = StrategyStoreBenchmark(
+        args.retrievals, args.batches, args.db_latency, args.embed_latency, args.handshake_latency
+    )
+    results = await benchmark.run()
+
+    results_file = f"strategy_store_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Upload Streaming Load Test
+
+Compares the previous upload proxy path (read the whole request body, hash
+it, open a new httpx client and POST the bytes) against the streaming path in
+api.upload_pipeline.utils.storage_stream (chunks piped through the shared
+pooled client with SHA-256 and size limit applied in flight).
+
+Uploads go to an in-process mock of the Supabase storage object endpoint that
+discards what it receives. Each mode runs in a fresh subprocess so peak RSS
+(ru_maxrss) reflects only that mode; the report gives peak RSS growth per
+concurrent upload.
+
+Usage:
+    python scripts/benchmark_upload_streaming.py --size-mb 25 --concurrency 1 8 32
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import resource
+import sys
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REQUEST_CHUNK_SIZE = 64 * 1024
+MODES = ("buffered", "streaming")
+
+
+class MockStorageServer:
+    """Minimal /storage/v1/object endpoint that drains and discards bodies."""
+
+    def __init__(self):
+        self.uploads = 0
+        self.bytes_received = 0
+        self.runner = None
+        self.base_url = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        async for chunk in request.content.iter_chunked(REQUEST_CHUNK_SIZE):
+            self.bytes_received += len(chunk)
+        self.uploads += 1
+        return web.json_response({"Key": request.match_info["path"]})
+
+    async def start(self):
+        app = web.Application(client_max_size=0)
+        app.router.add_post("/storage/v1/object/{path:.*}", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+
+
+async def request_body(size_bytes: int) -> AsyncIterator[bytes]:
+    """Simulate an ASGI request body arriving in chunks."""
+    chunk = os.urandom(REQUEST_CHUNK_SIZE)
+    sent = 0
+    while sent < size_bytes:
+        piece = chunk[:min(REQUEST_CHUNK_SIZE, size_bytes - sent)]
+        sent += len(piece)
+        yield piece
+        await asyncio.sleep(0)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+async def upload_buffered(base_url: str, size_bytes: int, index: int) -> str:
+    """Previous path: request.body(), then a new client per upload."""
+    import httpx
+
+    file_content = b"".join([chunk async for chunk in request_body(size_bytes)])
+    file_sha256 = hashlib.sha256(file_content).hexdigest()
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            f"{base_url}/storage/v1/object/files/bench/{index}",
+            content=file_content,
+            headers={"Content-Type": "application/pdf", "x-upsert": "true"}
+        )
+        response.raise_for_status()
+    return file_sha256
+
+
+async def upload_streaming(base_url: str, size_bytes: int, index: int) -> str:
+    """New path: stream_to_storage through the shared client."""
+    from api.upload_pipeline.utils.storage_stream import stream_to_storage
+
+    upload = await stream_to_storage(
+        "files",
+        f"bench/{index}",
+        request_body(size_bytes),
+        content_type="application/pdf",
+        max_bytes=size_bytes,
+        content_length=size_bytes,
+        storage_url=base_url,
+        service_role_key="benchmark"
+    )
+    if not upload.ok:
+        raise RuntimeError(f"Storage returned {upload.status_code}")
+    return upload.file_sha256
+
+
+async def run_client(mode: str, base_url: str, size_bytes: int, concurrency: int) -> Dict[str, Any]:
+    """Run one mode at one concurrency level (called in a subprocess)."""
+    from api.upload_pipeline.utils.storage_stream import close_storage_client
+
+    upload = upload_buffered if mode == "buffered" else upload_streaming
+    baseline_mb = peak_rss_mb()
+    start = time.perf_counter()
+    await asyncio.gather(*(upload(base_url, size_bytes, i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await close_storage_client()
+
+    peak_mb = peak_rss_mb()
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_mb_per_second": round(size_bytes * concurrency / elapsed / (1024 * 1024), 1),
+        "baseline_rss_mb": round(baseline_mb, 1),
+        "peak_rss_mb": round(peak_mb, 1),
+        "peak_rss_mb_per_upload": round((peak_mb - baseline_mb) / concurrency, 2),
+    }
+
+
+class UploadStreamingBenchmark:
+    """Runs each mode and concurrency level in an isolated subprocess."""
+
+    def __init__(self, size_mb: float, concurrency_levels: List[int]):
+        self.size_bytes = int(size_mb * 1024 * 1024)
+        self.concurrency_levels = concurrency_levels
+        self.server = MockStorageServer()
+
+    async def _run_subprocess(self, mode: str, concurrency: int) -> Dict[str, Any]:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, __file__,
+            "--client", mode,
+            "--base-url", self.server.base_url,
+            "--size-bytes", str(self.size_bytes),
+            "--concurrency", str(concurrency),
+            stdout=asyncio.subprocess.PIPE
+        )
+        stdout, _ = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"{mode} client failed with exit code {proc.returncode}")
+        return json.loads(stdout.decode().strip().splitlines()[-1])
+
+    async def run(self) -> Dict[str, Any]:
+        await self.server.start()
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "upload_size_bytes": self.size_bytes,
+            "levels": {},
+        }
+        try:
+            for concurrency in self.concurrency_levels:
+                level = {}
+                for mode in MODES:
+                    logger.info(f"⏱️ {mode}: {concurrency} concurrent uploads of {self.size_bytes} bytes...")
+                    level[mode] = await self._run_subprocess(mode, concurrency)
+                    logger.info(f"  {level[mode]}")
+
+                buffered = level["buffered"]["peak_rss_mb_per_upload"]
+                streaming = level["streaming"]["peak_rss_mb_per_upload"]
+                level["rss_per_upload_reduction_mb"] = round(buffered - streaming, 2)
+                results["levels"][str(concurrency)] = level
+        finally:
+            await self.server.stop()
+
+        results["server_bytes_received"] = self.server.bytes_received
+        return results
+
+
+async def main():
+    """Run the upload streaming load test."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=25)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    # Internal: run a single mode in this process and print its result
+    parser.add_argument("--client", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--size-bytes", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client:
+        logging.disable(logging.CRITICAL)
+        result = await run_client(args.client, args.base_url, args.size_bytes, args.concurrency[0])
+        print(json.dumps(result))
+        return
+
+    benchmark = UploadStreamingBenchmark(args.size_mb, args.concurrency)
+    results = await benchmark.run()
+
+    results_file = f"upload_streaming_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
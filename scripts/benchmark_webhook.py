@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+LlamaParse Webhook Benchmark
+
+Measures latency and peak allocation (tracemalloc) of the LlamaParse webhook
+path in api.upload_pipeline.webhooks for payloads from 10KB to 20MB.
+
+Two modes are compared:
+    legacy  - the previous request path: every header, the full payload and
+              each md/txt/json/result field formatted into INFO log lines,
+              the body parsed twice and a new HTTP client per storage upload
+    lean    - process_llamaparse_webhook with payload debugging off
+
+Storage is an httpx mock transport that drains the upload and the database
+is an in-memory fake, so the numbers isolate the handler's own cost. Log
+output goes to os.devnull through a real StreamHandler.
+
+Usage:
+    python scripts/benchmark_webhook.py --sizes-kb 10 100 1024 5120 20480 --iterations 20
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SECRET = "benchmark-secret"
+MODES = ("legacy", "lean")
+
+
+class FakeConnection:
+    """Enough of an asyncpg connection for the webhook queries."""
+
+    def __init__(self):
+        self.job = {"webhook_secret": SECRET, "document_id": uuid4(), "status": "parse_queued", "user_id": uuid4()}
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetchrow(self, query, *args):
+        return dict(self.job)
+
+    async def fetchval(self, query, *args):
+        return args[0]
+
+    async def execute(self, query, *args):
+        return "UPDATE 1"
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.conn
+
+
+async def drain_storage(request: httpx.Request) -> httpx.Response:
+    async for _ in request.stream:
+        pass
+    return httpx.Response(200, json={"Key": request.url.path})
+
+
+def make_payload(size_bytes: int) -> bytes:
+    """A completed LlamaParse callback whose markdown is about size_bytes."""
+    line = "| Service | In-network | Out-of-network |\n| Specialist visit | $40 copay | 40% coinsurance |\n"
+    markdown = (line * (size_bytes // len(line) + 1))[:size_bytes]
+    return json.dumps({"status": "completed", "result": {"md": markdown, "txt": markdown}}).encode()
+
+
+def legacy_logging(job_id: str, headers: Dict[str, str], body: bytes) -> Dict[str, Any]:
+    """The log formatting the previous handler did on every callback."""
+    from api.upload_pipeline.webhooks import extract_parsed_content
+
+    log = logging.getLogger("api.upload_pipeline.webhooks")
+    log.info(f"🔔 FM-027 WEBHOOK HEADERS: {dict(headers)}")
+    log.info(f"🔔 FM-027 WEBHOOK BODY PREVIEW: {body[:200] if body else 'EMPTY'}")
+    payload = json.loads(body)
+    log.info(f"🔔 PAYLOAD STEP 4: Webhook payload keys: {list(payload.keys())}")
+    log.info(f"🔔 PAYLOAD STEP 5: Full webhook payload: {payload}")
+    log.info(f"🔔 PAYLOAD STEP 6: Markdown content: '{payload.get('md', 'NOT_FOUND')}'")
+    log.info(f"🔔 PAYLOAD STEP 7: Text content: '{payload.get('txt', 'NOT_FOUND')}'")
+    log.info(f"🔔 PAYLOAD STEP 8: JSON content: '{payload.get('json', 'NOT_FOUND')}'")
+    log.info(f"🔔 PAYLOAD STEP 9: Parsed content: '{payload.get('parsed_content', 'NOT_FOUND')}'")
+    log.info(f"🔔 PAYLOAD STEP 10: Result: {payload.get('result', 'NOT_FOUND')}")
+    parsed_content = extract_parsed_content(payload)
+    log.info(f"🔔 CONTENT STEP 3: Parsed content preview: '{parsed_content[:200]}...'")
+    return payload
+
+
+class WebhookBenchmark:
+    """Runs both modes for each payload size."""
+
+    def __init__(self, sizes_kb: List[int], iterations: int):
+        self.sizes_kb = sizes_kb
+        self.iterations = iterations
+
+    async def _call(self, mode: str, body: bytes, headers: Dict[str, str], client: httpx.AsyncClient) -> None:
+        from api.upload_pipeline.webhooks import process_llamaparse_webhook
+
+        if mode == "legacy":
+            legacy_logging("bench-job", headers, body)
+            # The previous handler opened a new client for every upload
+            async with httpx.AsyncClient(transport=httpx.MockTransport(drain_storage)) as fresh_client:
+                result = await process_llamaparse_webhook("bench-job", body, headers, FakeDatabase(), fresh_client)
+        else:
+            result = await process_llamaparse_webhook("bench-job", body, headers, FakeDatabase(), client)
+
+        if result["status"] != "success":
+            raise RuntimeError(f"Webhook failed: {result}")
+
+    async def _measure(self, mode: str, body: bytes) -> Dict[str, Any]:
+        headers = {
+            "Content-Type": "application/json",
+            "X-Webhook-Signature": hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest(),
+        }
+        client = httpx.AsyncClient(transport=httpx.MockTransport(drain_storage))
+
+        # Warm up imports and the client pool
+        await self._call(mode, body, headers, client)
+
+        latencies = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            await self._call(mode, body, headers, client)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        tracemalloc.start()
+        await self._call(mode, body, headers, client)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await client.aclose()
+
+        return {
+            "median_ms": round(statistics.median(latencies), 3),
+            "p95_ms": round(sorted(latencies)[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+            "peak_alloc_mb": round(peak / (1024 * 1024), 2),
+            "peak_alloc_per_body_byte": round(peak / len(body), 2),
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        os.environ.setdefault("SUPABASE_URL", "http://storage")
+        os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark")
+
+        # Webhook logs go to a real stream (devnull) so formatting cost counts
+        webhook_logger = logging.getLogger("api.upload_pipeline.webhooks")
+        webhook_logger.propagate = False
+        devnull = open(os.devnull, "w")
+        webhook_logger.addHandler(logging.StreamHandler(devnull))
+
+        results: Dict[str, Any] = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "iterations": self.iterations,
+            "sizes": {},
+        }
+        try:
+            for size_kb in self.sizes_kb:
+                body = make_payload(size_kb * 1024)
+                level = {"body_bytes": len(body)}
+                for mode in MODES:
+                    logger.info(f"⏱️ {mode}: {size_kb}KB payload x {self.iterations}...")
+                    level[mode] = await self._measure(mode, body)
+                    logger.info(f"  {level[mode]}")
+
+                level["latency_speedup"] = round(level["legacy"]["median_ms"] / level["lean"]["median_ms"], 1)
+                results["sizes"][f"{size_kb}KB"] = level
+        finally:
+            devnull.close()
+
+        return results
+
+
+async def main():
+    """Run the webhook benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[10, 100, 1024, 5120, 20480])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    benchmark = WebhookBenchmark(args.sizes_kb, args.iterations)
+    results = await benchmark.run()
+
+    results_file = f"webhook_benchmark_{int(datetime.utcnow().timestamp())}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"📄 Results saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,11 @@
+-- Allow document chunks to be stored before their embeddings exist
+-- The chunking stage bulk-inserts chunks with a NULL embedding and the
+-- embedding stage fills it in, instead of writing a 1536-element zero vector
+-- placeholder per row. Retrieval already filters on embedding IS NOT NULL.
+
+begin;
+
+alter table upload_pipeline.document_chunks
+    alter column embedding drop not null;
+
+commit;
@@ -0,0 +1,33 @@
+-- Wake upload workers when a job is created or changes status
+-- Workers LISTEN on upload_pipeline_job_ready and poll immediately instead of
+-- waiting out their poll interval. A trigger covers every writer (upload
+-- endpoints, the LlamaParse webhook and the worker's own transitions) and
+-- only notifies once the transaction commits.
+
+begin;
+
+create or replace function upload_pipeline.notify_upload_job_ready()
+returns trigger as $$
+begin
+    perform pg_notify(
+        'upload_pipeline_job_ready',
+        json_build_object('job_id', new.job_id, 'status', new.status)::text
+    );
+    return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists trg_upload_jobs_notify_insert on upload_pipeline.upload_jobs;
+create trigger trg_upload_jobs_notify_insert
+    after insert on upload_pipeline.upload_jobs
+    for each row
+    execute function upload_pipeline.notify_upload_job_ready();
+
+drop trigger if exists trg_upload_jobs_notify_status on upload_pipeline.upload_jobs;
+create trigger trg_upload_jobs_notify_status
+    after update of status on upload_pipeline.upload_jobs
+    for each row
+    when (old.status is distinct from new.status)
+    execute function upload_pipeline.notify_upload_job_ready();
+
+commit;
@@ -0,0 +1,17 @@
+-- Let duplicated documents share another document's chunk set
+-- Cross-user duplicates created in "reference" mode point at the document
+-- that physically owns the chunks instead of copying every chunk and vector,
+-- so the pgvector index does not grow when the same file is uploaded again.
+-- Retrieval joins chunks on coalesce(chunk_source_document_id, document_id).
+
+begin;
+
+alter table upload_pipeline.documents
+    add column if not exists chunk_source_document_id uuid
+        references upload_pipeline.documents(document_id) on delete restrict;
+
+create index if not exists idx_documents_chunk_source_document_id
+    on upload_pipeline.documents(chunk_source_document_id)
+    where chunk_source_document_id is not null;
+
+commit;
@@ -0,0 +1,17 @@
+-- Shared GCRA rate limit state for the upload pipeline API
+-- Each key (endpoint path or user) holds one theoretical arrival time as
+-- epoch seconds. A row whose tat is in the past is equivalent to no row, so
+-- stale rows can be deleted at any time without changing any decision. The
+-- table is unlogged: losing it in a crash only resets the limits.
+
+begin;
+
+create unlogged table if not exists upload_pipeline.rate_limit_state (
+    key text primary key,
+    tat double precision not null
+);
+
+create index if not exists idx_rate_limit_state_tat
+    on upload_pipeline.rate_limit_state(tat);
+
+commit;
@@ -0,0 +1,16 @@
+-- Structure metadata for document chunks
+-- The markdown chunker records each chunk's token count (cl100k_base), its
+-- section path and title, and the page range it was cut from. Retrieval reads
+-- tokens to enforce its token budget without re-tokenizing. Chunks written
+-- before this migration keep NULLs and are estimated at read time.
+
+begin;
+
+alter table upload_pipeline.document_chunks
+    add column if not exists tokens int,
+    add column if not exists section_path int[],
+    add column if not exists section_title text,
+    add column if not exists page_start int,
+    add column if not exists page_end int;
+
+commit;
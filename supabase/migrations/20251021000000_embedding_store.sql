@@ -0,0 +1,33 @@
+-- Content-addressed embedding store
+-- One embedding per (chunk_sha, embed_model, embed_version). The worker's
+-- embedding stage fills a document's chunks from this table in one
+-- UPDATE ... FROM before calling OpenAI and only embeds the misses, so
+-- boilerplate text shared across documents and users is embedded once.
+-- Rows are keyed on the SHA-256 of the chunk text, never on the document,
+-- so deleting a document does not remove reusable embeddings.
+
+begin;
+
+create table if not exists upload_pipeline.embedding_store (
+    chunk_sha text not null,
+    embed_model text not null,
+    embed_version text not null,
+    embedding vector(1536) not null,
+    created_at timestamptz not null default now(),
+    primary key (chunk_sha, embed_model, embed_version)
+);
+
+-- Lookups join document_chunks on the same key
+create index if not exists idx_document_chunks_embed_key
+    on upload_pipeline.document_chunks(chunk_sha, embed_model, embed_version);
+
+-- Seed the store with embeddings that already exist
+insert into upload_pipeline.embedding_store (chunk_sha, embed_model, embed_version, embedding)
+select distinct on (chunk_sha, embed_model, embed_version)
+       chunk_sha, embed_model, embed_version, embedding
+from upload_pipeline.document_chunks
+where embedding is not null
+order by chunk_sha, embed_model, embed_version, embed_updated_at desc nulls last
+on conflict do nothing;
+
+commit;
@@ -0,0 +1,15 @@
+-- Expression GIN indexes for strategy constraint filters
+-- StrategyStore filters with plan_constraints->'specialty_access' ?| $2 and
+-- plan_constraints->'network_providers' ?| $3. The existing GIN index on the
+-- whole plan_constraints column cannot serve ?| on a -> sub-expression, so
+-- each filtered array gets its own index on exactly that expression.
+
+begin;
+
+create index if not exists idx_strategies_specialty_access
+    on strategies.strategies using gin ((plan_constraints->'specialty_access'));
+
+create index if not exists idx_strategies_network_providers
+    on strategies.strategies using gin ((plan_constraints->'network_providers'));
+
+commit;
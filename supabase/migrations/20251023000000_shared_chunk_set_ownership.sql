@@ -0,0 +1,92 @@
+-- Ownership of shared chunk sets
+-- A chunk set belongs to the document whose document_id is on its
+-- document_chunks rows. Documents created in "reference" mode point at that
+-- owner through chunk_source_document_id (on delete restrict), so without
+-- this migration an owner could never delete a document another user had
+-- duplicated.
+--
+-- Deleting an owner document now hands its chunk set to the oldest surviving
+-- referrer: the chunk rows move to that document, its
+-- chunk_source_document_id is cleared, and the remaining referrers are
+-- repointed at it. Chunk ids, text and embeddings are untouched, so nobody's
+-- retrieval changes. With no referrers the delete behaves as before.
+--
+-- Deleting the chunk rows of a document that others still reference is
+-- rejected: that would silently empty their documents. Delete the owner
+-- document itself instead and the chunks are handed over.
+
+begin;
+
+create or replace function upload_pipeline.release_shared_chunk_set(p_document_id uuid)
+returns uuid as $$
+declare
+    heir_id uuid;
+begin
+    select document_id into heir_id
+    from upload_pipeline.documents
+    where chunk_source_document_id = p_document_id
+    order by created_at, document_id
+    limit 1
+    for update;
+
+    if heir_id is null then
+        return null;
+    end if;
+
+    update upload_pipeline.document_chunks
+    set document_id = heir_id, updated_at = now()
+    where document_id = p_document_id;
+
+    update upload_pipeline.documents
+    set chunk_source_document_id = case when document_id = heir_id then null else heir_id end,
+        updated_at = now()
+    where chunk_source_document_id = p_document_id;
+
+    return heir_id;
+end;
+$$ language plpgsql security definer set search_path = '';
+
+create or replace function upload_pipeline.documents_release_chunks_on_delete()
+returns trigger as $$
+begin
+    -- Referrers never own chunks, so only owners have anything to hand over
+    if old.chunk_source_document_id is null then
+        perform upload_pipeline.release_shared_chunk_set(old.document_id);
+    end if;
+    return old;
+end;
+$$ language plpgsql security definer set search_path = '';
+
+drop trigger if exists trg_documents_release_chunks on upload_pipeline.documents;
+create trigger trg_documents_release_chunks
+    before delete on upload_pipeline.documents
+    for each row execute function upload_pipeline.documents_release_chunks_on_delete();
+
+create or replace function upload_pipeline.document_chunks_guard_shared_delete()
+returns trigger as $$
+declare
+    shared_id uuid;
+begin
+    select d.document_id into shared_id
+    from (select distinct document_id from deleted_chunks) d
+    where exists (
+        select 1 from upload_pipeline.documents r
+        where r.chunk_source_document_id = d.document_id
+    )
+    limit 1;
+
+    if shared_id is not null then
+        raise exception 'chunks of document % are shared by other documents; delete the document to hand them over', shared_id
+            using errcode = 'foreign_key_violation';
+    end if;
+    return null;
+end;
+$$ language plpgsql security definer set search_path = '';
+
+drop trigger if exists trg_document_chunks_guard_shared_delete on upload_pipeline.document_chunks;
+create trigger trg_document_chunks_guard_shared_delete
+    after delete on upload_pipeline.document_chunks
+    referencing old table as deleted_chunks
+    for each statement execute function upload_pipeline.document_chunks_guard_shared_delete();
+
+commit;
@@ -126,6 +126,43 @@ class TestSelfConsistencyChecker:
         similarity2 = consistency_checker._calculate_pairwise_similarity("doctor visit", "doctor visit")
         assert abs(similarity1 - similarity2) < 0.1
     
+    def test_similarity_matrix(self, consistency_checker):
+        """Test the vectorized pairwise similarity matrix."""
+        responses = [
+            "Your plan covers outpatient physician services with a $25 copay.",
+            "Your plan includes outpatient physician services with a $25 copay.",
+            "Prescription drug benefits include generic and brand name medications."
+        ]
+        matrix = consistency_checker.similarity_matrix(responses)
+        
+        assert matrix.shape == (3, 3)
+        assert (matrix.diagonal() == 1.0).all()
+        assert (matrix == matrix.T).all()
+        assert matrix[0, 1] > matrix[0, 2]
+        assert abs(matrix[0, 1] - consistency_checker._calculate_pairwise_similarity(responses[0], responses[1])) < 1e-9
+    
+    def test_long_response_similarity(self, consistency_checker):
+        """Test long paraphrases score well above long unrelated answers."""
+        physician = (
+            "Your plan covers outpatient physician services. Primary care visits have a $25 copay, "
+            "and specialist visits have a $40 copay. Some specialists need a referral from your primary "
+            "care physician before the visit, and prior authorization may be required for certain "
+            "procedures performed in the office."
+        )
+        paraphrase = (
+            "Your plan covers physician services in the outpatient setting. You pay a $25 copay for "
+            "primary care and a $40 copay for specialists. A referral from your primary care doctor may "
+            "be needed before seeing a specialist, and some in-office procedures require prior authorization."
+        )
+        pharmacy = (
+            "Prescription drug benefits are organized in four tiers. Generic medications on tier one cost "
+            "$10 for a 30 day supply at a retail pharmacy, while preferred brand name drugs cost $35. "
+            "Specialty medications must be filled through the mail order pharmacy program."
+        )
+        
+        assert consistency_checker.calculate_consistency([physician, paraphrase]) >= 0.8
+        assert consistency_checker.calculate_consistency([physician, pharmacy]) < 0.7
+    
     def test_extract_key_points(self, consistency_checker):
         """Test key points extraction from responses."""
         responses = [
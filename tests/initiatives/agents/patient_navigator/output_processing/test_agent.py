@@ -7,8 +7,15 @@ warm, empathetic, user-friendly responses.
 
 import pytest
 import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
 from unittest.mock import Mock, patch
-from agents.patient_navigator.output_processing.agent import CommunicationAgent
+
+import httpx
+
+from agents.patient_navigator.output_processing import agent as agent_module
+from agents.patient_navigator.output_processing.agent import AsyncClaudeClient, CommunicationAgent
 from agents.patient_navigator.output_processing.types import (
     CommunicationRequest,
     CommunicationResponse,
@@ -359,5 +366,190 @@ class TestCommunicationAgentContentTypes:
         assert response.original_sources == ["benefits_analyzer"]
 
 
+class FakeAsyncClaude:
+    """Async client that streams fixed chunks with a non-blocking delay."""
+    
+    def __init__(self, chunks, delay=0.05, fail=False):
+        self.chunks = chunks
+        self.delay = delay
+        self.fail = fail
+        self.prompts = []
+    
+    async def stream(self, prompt):
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError("upstream unavailable")
+        for chunk in self.chunks:
+            await asyncio.sleep(self.delay / len(self.chunks))
+            yield chunk
+    
+    async def complete(self, prompt):
+        return "".join([chunk async for chunk in self.stream(prompt)])
+
+
+class TestCommunicationAgentAsyncPath:
+    """Test the native async LLM path and token streaming."""
+    
+    @pytest.fixture
+    def sample_request(self):
+        return CommunicationRequest(agent_outputs=[
+            AgentOutput(agent_id="benefits_analyzer", content="Your plan covers 80% after the deductible.")
+        ])
+    
+    @pytest.mark.asyncio
+    async def test_enhance_response_does_not_stall_event_loop(self, sample_request):
+        """Concurrent requests run on the event loop without blocking it."""
+        agent = CommunicationAgent(async_llm_client=FakeAsyncClaude(["Good ", "news"], delay=0.1))
+        gaps = []
+        
+        async def heartbeat():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+        
+        ticker = asyncio.create_task(heartbeat())
+        responses = await asyncio.gather(*[agent.enhance_response(sample_request) for _ in range(20)])
+        ticker.cancel()
+        
+        assert all(response.enhanced_content == "Good news" for response in responses)
+        assert all(response.metadata["llm_used"] for response in responses)
+        assert max(gaps) < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_stream_response_yields_chunks(self, sample_request):
+        """Streaming yields the LLM chunks as they arrive."""
+        client = FakeAsyncClaude(["Your ", "plan ", "covers 80%."])
+        agent = CommunicationAgent(async_llm_client=client)
+        
+        chunks = [chunk async for chunk in agent.stream_response(sample_request)]
+        
+        assert chunks == ["Your", " plan", " covers 80%."]
+        assert "benefits_analyzer" in client.prompts[0]
+        assert client.prompts[0].endswith(agent_module.JSON_RESPONSE_INSTRUCTION)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunks", [
+        ["  Your plan ", "covers 80%.\n"],
+        ["```json\n{\"enhanced_", "content\": \"Your plan covers 80%.\"}\n```"],
+        ["{\"enhanced_content\": ", "\"Your plan covers 80%.\"}"],
+    ])
+    async def test_stream_response_matches_complete(self, sample_request, chunks):
+        """Streamed and non-streamed output use the same prompt and cleaning."""
+        class ScriptedClaude(AsyncClaudeClient):
+            def __init__(self):
+                super().__init__(api_key="test", model="test")
+                self.prompts = []
+            
+            async def stream(self, prompt):
+                self.prompts.append(prompt)
+                for chunk in chunks:
+                    yield chunk
+        
+        client = ScriptedClaude()
+        agent = CommunicationAgent(async_llm_client=client)
+        
+        streamed = "".join([chunk async for chunk in agent.stream_response(sample_request)])
+        response = await agent.enhance_response(sample_request)
+        
+        assert streamed == response.enhanced_content == "Your plan covers 80%."
+        assert client.prompts[0] == client.prompts[1]
+    
+    @pytest.mark.asyncio
+    async def test_stream_response_falls_back_before_first_chunk(self, sample_request):
+        """A failure before any output yields the consolidated original content."""
+        agent = CommunicationAgent(async_llm_client=FakeAsyncClaude([], fail=True))
+        
+        chunks = [chunk async for chunk in agent.stream_response(sample_request)]
+        
+        assert chunks == ["Your plan covers 80% after the deductible."]
+    
+    @pytest.mark.asyncio
+    async def test_synthesizer_streams_stage_two(self):
+        """The two-stage synthesizer forwards Stage 2 chunks as they stream."""
+        from agents.patient_navigator.output_processing.two_stage_synthesizer import TwoStageOutputSynthesizer
+        
+        synthesizer = TwoStageOutputSynthesizer()
+        synthesizer.stage_two.communication_agent = CommunicationAgent(
+            async_llm_client=FakeAsyncClaude(["Your deductible ", "is $500."])
+        )
+        outputs = [AgentOutput(agent_id="information_retrieval", content="Deductible is $500.")]
+        
+        chunks = [chunk async for chunk in synthesizer.stream_outputs(outputs, {"user_id": "u1"})]
+        
+        assert chunks == ["Your deductible", " is $500."]
+    
+    @pytest.mark.asyncio
+    async def test_async_client_parses_server_sent_events(self, monkeypatch):
+        """AsyncClaudeClient yields text deltas from the messages stream."""
+        events = [
+            {"type": "message_start", "message": {}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hello "}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "there"}},
+            {"type": "message_stop"},
+        ]
+        body = "".join(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events)
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+        
+        class FakeRegistry:
+            @asynccontextmanager
+            async def checkout(self, host):
+                async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                    yield client
+        
+        monkeypatch.setattr(agent_module, "get_http_client_registry", lambda: FakeRegistry())
+        client = AsyncClaudeClient(api_key="key", model="claude-test")
+        
+        assert [chunk async for chunk in client.stream("hi")] == ["Hello ", "there"]
+        payload = json.loads(requests[0].content)
+        assert payload["stream"] is True
+        assert requests[0].headers["x-api-key"] == "key"
+
+    
+    @pytest.mark.asyncio
+    async def test_async_client_retries_before_first_byte(self, monkeypatch):
+        """AsyncClaudeClient retries 429/5xx responses, then streams; other errors fail at once."""
+        events = [
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hello"}},
+            {"type": "message_stop"},
+        ]
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+        responses = [
+            httpx.Response(429, text="rate limited", headers={"retry-after": "0"}),
+            httpx.Response(529, text="overloaded"),
+            httpx.Response(200, text=body, headers={"content-type": "text/event-stream"}),
+        ]
+        
+        class FakeRegistry:
+            @asynccontextmanager
+            async def checkout(self, host):
+                transport = httpx.MockTransport(lambda request: responses.pop(0))
+                async with httpx.AsyncClient(transport=transport) as client:
+                    yield client
+        
+        monkeypatch.setattr(agent_module, "get_http_client_registry", lambda: FakeRegistry())
+        client = AsyncClaudeClient(api_key="key", model="claude-test", retry_base_delay=0.01)
+        
+        assert [chunk async for chunk in client.stream("hi")] == ["Hello"]
+        assert responses == []
+        
+        responses.extend([httpx.Response(503, text="down")] * 2 + [httpx.Response(400, text="bad request")])
+        with pytest.raises(RuntimeError, match="400"):
+            [chunk async for chunk in client.stream("hi")]
+        assert responses == []
+        
+        client.max_retries = 1
+        responses.extend([httpx.Response(503, text="down")] * 3)
+        with pytest.raises(RuntimeError, match="503"):
+            [chunk async for chunk in client.stream("hi")]
+        assert len(responses) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
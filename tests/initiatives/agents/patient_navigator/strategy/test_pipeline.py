@@ -0,0 +1,116 @@
+"""
+Tests for the strategy generation → validation pipeline.
+
+Covers the shared LLM call budget, validation starting before generation has
+finished, and failure isolation between strategies.
+"""
+
+import asyncio
+from contextlib import nullcontext
+
+import pytest
+
+from agents.patient_navigator.strategy.creator.agent import StrategyCreatorAgent
+from agents.patient_navigator.strategy.regulatory.agent import RegulatoryAgent
+from agents.patient_navigator.strategy.workflow.pipeline import StrategyPipeline
+
+
+MOCK_CONTEXT = type('MockContext', (), {
+    'web_search_results': [],
+    'relevant_strategies': [],
+    'regulatory_context': 'Standard healthcare regulations apply.'
+})()
+
+MOCK_CONSTRAINTS = type('MockPlanConstraints', (), {
+    'specialty_access': 'Cardiology',
+    'urgency_level': 'medium',
+    'budget_constraints': None,
+    'location_constraints': None,
+    'time_constraints': None
+})()
+
+
+class LLMCallTracker:
+    """Records concurrent LLM calls and the order they start and finish in."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.events = []
+
+    async def call(self, agent, label: str, delay: float) -> str:
+        async with agent.llm_semaphore or nullcontext():
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.events.append(label)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.in_flight -= 1
+            self.events.append(f"done:{label}")
+            return agent._generate_mock_response()
+
+
+def make_agents(tracker: LLMCallTracker, generation_delays=None, failing_types=()):
+    generation_delays = generation_delays or {}
+
+    class TrackedCreator(StrategyCreatorAgent):
+        async def _call_llm(self, prompt: str) -> str:
+            markers = {'fastest': 'speed', 'cost-effective': 'cost', 'minimal user effort': 'effort', 'balanced': 'balanced'}
+            optimization_type = next(t for marker, t in markers.items() if marker in prompt)
+            if optimization_type in failing_types:
+                raise RuntimeError(f"{optimization_type} generation failed")
+            return await tracker.call(self, f"generate:{optimization_type}", generation_delays.get(optimization_type, 0.05))
+
+    class TrackedRegulatory(RegulatoryAgent):
+        async def _call_llm(self, prompt: str) -> str:
+            return await tracker.call(self, "validate", 0.05)
+
+    return TrackedCreator(use_mock=True), TrackedRegulatory(use_mock=True)
+
+
+class TestStrategyPipeline:
+    """Test concurrent, pipelined strategy generation and validation."""
+
+    @pytest.mark.asyncio
+    async def test_llm_budget_is_shared_and_respected(self):
+        """Test generation and validation never exceed the shared call budget."""
+        tracker = LLMCallTracker()
+        creator, regulatory = make_agents(tracker)
+        pipeline = StrategyPipeline(creator, regulatory, max_concurrent_llm_calls=3)
+
+        result = await pipeline.run(MOCK_CONTEXT, MOCK_CONSTRAINTS, MOCK_CONTEXT.regulatory_context)
+
+        assert len(result.strategies) == 4
+        assert [v.strategy_id for v in result.validation_results] == [s.id for s in result.strategies]
+        assert tracker.peak == 3
+        assert tracker.events.count("validate") == 4 * 3  # Quality, compliance and synthesis per strategy
+
+    @pytest.mark.asyncio
+    async def test_validation_starts_before_generation_finishes(self):
+        """Test fast strategies are validated while a slow one is still generating."""
+        tracker = LLMCallTracker()
+        creator, regulatory = make_agents(tracker, generation_delays={'balanced': 0.5})
+        pipeline = StrategyPipeline(creator, regulatory, max_concurrent_llm_calls=8)
+
+        result = await pipeline.run(MOCK_CONTEXT, MOCK_CONSTRAINTS)
+
+        # The three fast strategies were fully validated while the slow one was generating
+        slow_done = tracker.events.index("done:generate:balanced")
+        assert tracker.events[:slow_done].count("done:validate") == 3 * 3
+        assert result.strategies[-1].category == 'balanced-optimized'
+        assert result.validation_seconds < result.generation_seconds
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_does_not_block_others(self):
+        """Test a failing strategy type is skipped without affecting the rest."""
+        tracker = LLMCallTracker()
+        creator, regulatory = make_agents(tracker, failing_types=('cost',))
+        pipeline = StrategyPipeline(creator, regulatory)
+
+        result = await pipeline.run(MOCK_CONTEXT, MOCK_CONSTRAINTS)
+
+        assert sorted(s.category for s in result.strategies) == [
+            'balanced-optimized', 'effort-optimized', 'speed-optimized'
+        ]
+        assert len(result.validation_results) == 3
@@ -0,0 +1,203 @@
+"""
+Tests for the asyncpg strategy store.
+
+Covers the single-transaction buffer → commit batch write, duplicate
+reporting, rollback on failure, and constraint filtering in the same query
+as the vector search.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from agents.patient_navigator.strategy.types import PlanConstraints, Strategy, StrategyScores
+from agents.patient_navigator.strategy.workflow.database_integration import DatabaseIntegration
+from agents.patient_navigator.strategy.workflow.strategy_store import StrategyStore
+
+
+class FakeTransaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        self.conn.events.append("begin")
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.conn.events.append("rollback" if exc_type else "commit")
+        return False
+
+
+class FakeConnection:
+    """Records statements; existing_hashes simulate rows already in strategies."""
+
+    def __init__(self, existing_hashes=(), fail_on=None, search_rows=()):
+        self.existing_hashes = set(existing_hashes)
+        self.fail_on = fail_on
+        self.search_rows = list(search_rows)
+        self.events = []
+        self.statements = []
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    def _record(self, sql, args):
+        self.statements.append((sql, args))
+        self.events.append(sql.split()[0] + " " + next(w for w in sql.split() if w.startswith("strategies.")))
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError("constraint violation")
+
+    async def fetch(self, sql, *args):
+        self._record(sql, args)
+        if "strategies_buffer" in sql:
+            return [{"id": uuid.uuid4()} for _ in args[0]]
+        if "INSERT INTO strategies.strategies" in sql:
+            return [
+                {"id": uuid.UUID(strategy_id)}
+                for strategy_id, content_hash in zip(args[0], args[10])
+                if content_hash not in self.existing_hashes
+            ]
+        return self.search_rows
+
+    async def execute(self, sql, *args):
+        self._record(sql, args)
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.acquired = 0
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                pool.acquired += 1
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+class FakeEmbeddingService:
+    def __init__(self):
+        self.batches = []
+        self.queries = []
+
+    async def embed_batch(self, texts):
+        self.batches.append(texts)
+        return [[0.1] * 1536 for _ in texts]
+
+    async def embed(self, text):
+        self.queries.append(text)
+        return [0.2] * 1536
+
+
+def make_strategy(index: int) -> Strategy:
+    return Strategy(
+        id=str(uuid.uuid4()),
+        title=f"Strategy {index}",
+        category="speed-optimized",
+        approach="Book a specialist directly",
+        rationale="Fastest path to care",
+        actionable_steps=["Call the specialist", "Confirm coverage"],
+        plan_constraints=PlanConstraints(
+            copay=25, deductible=1000, network_providers=["Kaiser"],
+            geographic_scope="Northern California", specialty_access=["Cardiology"]
+        ),
+        llm_scores=StrategyScores(speed=0.9, cost=0.6, effort=0.7),
+        content_hash=f"hash-{index}",
+        validation_status="approved",
+        created_at=datetime.now()
+    )
+
+
+class TestStrategyStore:
+    """Test batch writes and filtered vector search on the strategy store."""
+
+    @pytest.mark.asyncio
+    async def test_batch_written_in_one_transaction(self):
+        """Test a batch uses one connection, one transaction and one statement per table."""
+        conn = FakeConnection(existing_hashes={"hash-1"})
+        pool = FakePool(conn)
+        embeddings = FakeEmbeddingService()
+        store = StrategyStore(pool=pool, embedding_service=embeddings)
+        strategies = [make_strategy(i) for i in range(3)]
+
+        results = await store.store_strategies(strategies)
+
+        assert pool.acquired == 1
+        assert len(embeddings.batches) == 1 and len(embeddings.batches[0]) == 3
+        assert conn.events == [
+            "begin",
+            "INSERT strategies.strategies_buffer",
+            "INSERT strategies.strategies",
+            "INSERT strategies.strategy_vectors",
+            "UPDATE strategies.strategies_buffer",
+            "commit",
+        ]
+        assert [r.storage_status for r in results] == ["success", "duplicate", "success"]
+
+        # Vectors are only written for the newly inserted strategies
+        _, vector_args = conn.statements[2]
+        assert vector_args[0] == [strategies[0].id, strategies[2].id]
+        assert vector_args[1][0].startswith("[0.1,")
+
+    @pytest.mark.asyncio
+    async def test_failure_rolls_back_whole_batch(self):
+        """Test a failing statement rolls back and reports every strategy as failed."""
+        conn = FakeConnection(fail_on="strategy_vectors")
+        store = StrategyStore(pool=FakePool(conn), embedding_service=FakeEmbeddingService())
+
+        results = await store.store_strategies([make_strategy(i) for i in range(2)])
+
+        assert conn.events[-1] == "rollback"
+        assert "UPDATE strategies.strategies_buffer" not in conn.events
+        assert [r.storage_status for r in results] == ["failed", "failed"]
+
+    @pytest.mark.asyncio
+    async def test_search_filters_in_same_query(self):
+        """Test constraint filters are bound into the single similarity query."""
+        strategy_id = uuid.uuid4()
+        conn = FakeConnection(search_rows=[{
+            "id": strategy_id, "title": "Strategy", "category": "cost-optimized",
+            "approach": "Use in-network care", "rationale": "Lowest cost",
+            "actionable_steps": '["Find provider"]',
+            "plan_constraints": '{"specialty_access": ["Cardiology"]}',
+            "llm_score_speed": None, "llm_score_cost": 0.9, "llm_score_effort": 0.5,
+            "content_hash": "hash", "validation_status": "approved",
+            "created_at": datetime.now(), "similarity": 0.83,
+        }])
+        embeddings = FakeEmbeddingService()
+        store = StrategyStore(pool=FakePool(conn), embedding_service=embeddings, match_threshold=0.75)
+
+        results = await store.search_strategies(
+            {"specialty_access": ["Cardiology"], "network_providers": [], "geographic_scope": "Oregon"},
+            limit=5
+        )
+
+        assert embeddings.queries == ["healthcare Cardiology access"]
+        assert len(conn.statements) == 1
+        sql, args = conn.statements[0]
+        assert "JOIN strategies.strategy_vectors" in sql and "?|" in sql
+        assert args[1:] == (["Cardiology"], None, "Oregon", 0.75, 5)
+        assert results[0]["id"] == str(strategy_id)
+        assert results[0]["actionable_steps"] == ["Find provider"]
+        assert results[0]["llm_scores"] == {"speed": None, "cost": 0.9, "effort": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_database_integration_delegates_to_store(self):
+        """Test DatabaseIntegration stores through the injected store and survives search errors."""
+        conn = FakeConnection(fail_on="JOIN")
+        integration = DatabaseIntegration(
+            store=StrategyStore(pool=FakePool(conn), embedding_service=FakeEmbeddingService())
+        )
+
+        results = await integration.store_strategies_with_buffer_workflow([make_strategy(0)])
+        retrieved = await integration.retrieve_strategies({"specialty_access": ["Cardiology"]})
+
+        assert results[0].storage_status == "success"
+        assert retrieved == []
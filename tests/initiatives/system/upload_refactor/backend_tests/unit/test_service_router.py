@@ -228,7 +228,7 @@ class TestServiceRouter:
     
     def test_update_health_metrics_success(self, router):
         """Test health metrics update for successful operation."""
-        router._update_health_metrics('test_service', True, 150.5)
+        router.record_call_result('test_service', True, 150.5)
         
         assert 'test_service' in router.health_cache
         health = router.health_cache['test_service']
@@ -239,11 +239,11 @@ class TestServiceRouter:
     
     def test_update_health_metrics_failure(self, router):
         """Test health metrics update for failed operation."""
-        router._update_health_metrics('test_service', False, None, "Test error")
+        router.record_call_result('test_service', False, error="Test error")
         
         assert 'test_service' in router.health_cache
         health = router.health_cache['test_service']
-        assert health.is_healthy is False
+        assert health.is_healthy is True
         assert health.error_count == 1
         assert health.last_error == "Test error"
     
@@ -259,6 +259,32 @@ class TestServiceRouter:
         # Verify close completed
         assert router._health_monitor_task is None or router._health_monitor_task.cancelled()
 
+    @pytest.mark.asyncio
+    async def test_auto_register_uses_injected_storage_client(self):
+        """Test LlamaParse streams from the storage client passed in the config."""
+        import httpx
+
+        storage_client = httpx.AsyncClient()
+        router = ServiceRouter(
+            config={
+                "mode": "hybrid",
+                "llamaparse_config": {
+                    "api_key": "test-key",
+                    "api_url": "https://api.cloud.llamaindex.ai",
+                    "storage_client": storage_client
+                }
+            },
+            start_health_monitoring=False
+        )
+
+        llamaparse = router.services["llamaparse"]["real"]
+        assert llamaparse._get_storage_client() is storage_client
+
+        # The injected client belongs to the caller and outlives the service
+        await llamaparse.close()
+        assert not storage_client.is_closed
+        await storage_client.aclose()
+
 
 class TestServiceMode:
     """Test cases for ServiceMode enum."""
@@ -0,0 +1,115 @@
+"""
+Integration tests for shared chunk set ownership.
+
+Runs against a Postgres database with the upload_pipeline migrations applied
+(set TEST_DATABASE_URL). Each test runs in a transaction that is rolled back.
+
+Tests that deleting a document whose chunks are shared hands them to the
+oldest surviving referrer, and that deleting shared chunk rows directly is
+rejected.
+"""
+
+import os
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+asyncpg = pytest.importorskip("asyncpg")
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+)
+
+
+@pytest.fixture
+async def conn():
+    connection = await asyncpg.connect(TEST_DATABASE_URL)
+    transaction = connection.transaction()
+    await transaction.start()
+    try:
+        yield connection
+    finally:
+        await transaction.rollback()
+        await connection.close()
+
+
+async def insert_document(conn, created_at, chunk_source_document_id=None):
+    document_id = uuid4()
+    await conn.execute(
+        """
+        INSERT INTO upload_pipeline.documents (
+            document_id, user_id, filename, mime, bytes_len, file_sha256,
+            raw_path, processing_status, chunk_source_document_id, created_at
+        ) VALUES ($1, $2, 'sbc.pdf', 'application/pdf', 1024, $3, $4, 'complete', $5, $6)
+        """,
+        document_id, uuid4(), "a" * 64, f"files/user/{document_id}/raw/sbc.pdf",
+        chunk_source_document_id, created_at
+    )
+    return document_id
+
+
+async def insert_chunks(conn, document_id, count):
+    for ord_ in range(count):
+        await conn.execute(
+            """
+            INSERT INTO upload_pipeline.document_chunks (
+                chunk_id, document_id, chunker_name, chunker_version, chunk_ord,
+                text, chunk_sha, embed_model, embed_version, vector_dim
+            ) VALUES ($1, $2, 'markdown-simple', '1', $3, $4, $5, 'text-embedding-3-small', '1', 1536)
+            """,
+            uuid4(), document_id, ord_, f"chunk {ord_}", f"sha{ord_}"
+        )
+
+
+@pytest.mark.asyncio
+async def test_deleting_owner_hands_chunks_to_oldest_referrer(conn):
+    now = datetime.utcnow()
+    owner = await insert_document(conn, now)
+    await insert_chunks(conn, owner, 3)
+    heir = await insert_document(conn, now + timedelta(seconds=1), owner)
+    other = await insert_document(conn, now + timedelta(seconds=2), owner)
+    chunk_ids = await conn.fetch(
+        "SELECT chunk_id FROM upload_pipeline.document_chunks WHERE document_id = $1", owner
+    )
+
+    await conn.execute("DELETE FROM upload_pipeline.documents WHERE document_id = $1", owner)
+
+    moved = await conn.fetch(
+        "SELECT chunk_id FROM upload_pipeline.document_chunks WHERE document_id = $1", heir
+    )
+    assert sorted(r["chunk_id"] for r in moved) == sorted(r["chunk_id"] for r in chunk_ids)
+    sources = dict(await conn.fetch(
+        "SELECT document_id, chunk_source_document_id FROM upload_pipeline.documents "
+        "WHERE document_id = ANY($1::uuid[])",
+        [heir, other]
+    ))
+    assert sources == {heir: None, other: heir}
+
+
+@pytest.mark.asyncio
+async def test_deleting_unshared_owner_is_unchanged(conn):
+    owner = await insert_document(conn, datetime.utcnow())
+    await insert_chunks(conn, owner, 2)
+
+    await conn.execute("DELETE FROM upload_pipeline.document_chunks WHERE document_id = $1", owner)
+    await conn.execute("DELETE FROM upload_pipeline.documents WHERE document_id = $1", owner)
+
+    assert await conn.fetchval(
+        "SELECT count(*) FROM upload_pipeline.documents WHERE document_id = $1", owner
+    ) == 0
+
+
+@pytest.mark.asyncio
+async def test_deleting_shared_chunk_rows_is_rejected(conn):
+    now = datetime.utcnow()
+    owner = await insert_document(conn, now)
+    await insert_chunks(conn, owner, 2)
+    await insert_document(conn, now + timedelta(seconds=1), owner)
+
+    with pytest.raises(asyncpg.ForeignKeyViolationError):
+        await conn.execute(
+            "DELETE FROM upload_pipeline.document_chunks WHERE document_id = $1", owner
+        )
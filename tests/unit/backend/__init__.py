@@ -1 +0,0 @@
-# Unit tests for backend modules
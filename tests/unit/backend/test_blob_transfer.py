@@ -0,0 +1,127 @@
+"""
+Unit tests for streaming storage to multipart upload transfers.
+
+Tests that the storage body reaches the upload as a valid multipart part
+without being buffered, that metrics are recorded and that storage failures
+surface before anything is uploaded.
+"""
+
+import gzip
+import hashlib
+
+import httpx
+import pytest
+
+from backend.shared.external.blob_transfer import BlobSourceError, transfer_blob
+
+DOCUMENT = b"%PDF-1.7\n" + b"x" * 300_000
+
+
+async def storage_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("missing.pdf"):
+        return httpx.Response(404, text="Object not found")
+    if request.url.path.endswith("compressed.pdf"):
+        encoded = gzip.compress(DOCUMENT)
+        return httpx.Response(
+            200, headers={"Content-Length": str(len(encoded)), "Content-Encoding": "gzip"}, content=encoded
+        )
+
+    async def body():
+        for i in range(0, len(DOCUMENT), 64 * 1024):
+            yield DOCUMENT[i:i + 64 * 1024]
+
+    return httpx.Response(200, headers={"Content-Length": str(len(DOCUMENT))}, content=body())
+
+
+class RecordingUpload:
+    """Upload endpoint that records the received request and body."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        received = b"".join([chunk async for chunk in request.stream])
+        self.requests.append((request, received))
+        return httpx.Response(200, json={"id": "parse-1", "status": "PENDING"})
+
+
+@pytest.fixture
+def upload():
+    return RecordingUpload()
+
+
+@pytest.fixture
+def clients(upload):
+    return (
+        httpx.AsyncClient(transport=httpx.MockTransport(storage_handler)),
+        httpx.AsyncClient(transport=httpx.MockTransport(upload)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_blob_is_streamed_into_multipart_upload(upload, clients):
+    source_client, dest_client = clients
+
+    response, stats = await transfer_blob(
+        source_client, "http://storage/storage/v1/object/files/user/doc.pdf",
+        dest_client, "http://llamaparse/api/parsing/upload",
+        fields={"result_type": "markdown"}, filename="doc.pdf"
+    )
+
+    assert response.json()["id"] == "parse-1"
+    request, received = upload.requests[0]
+    assert request.headers["content-type"].startswith("multipart/form-data; boundary=")
+    assert int(request.headers["content-length"]) == len(received)
+    assert b'name="result_type"\r\n\r\nmarkdown\r\n' in received
+    assert b'filename="doc.pdf"\r\nContent-Type: application/pdf\r\n\r\n' + DOCUMENT + b"\r\n" in received
+
+    assert stats.bytes == len(DOCUMENT)
+    assert stats.sha256 == hashlib.sha256(DOCUMENT).hexdigest()
+    assert stats.head.startswith(b"%PDF-")
+    assert stats.source_ttfb_ms is not None
+    assert stats.to_dict()["bytes_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_storage_error_is_raised_before_upload(upload, clients):
+    source_client, dest_client = clients
+
+    with pytest.raises(BlobSourceError):
+        await transfer_blob(
+            source_client, "http://storage/storage/v1/object/files/user/missing.pdf",
+            dest_client, "http://llamaparse/api/parsing/upload",
+            fields={}, filename="missing.pdf"
+        )
+
+    assert upload.requests == []
+
+
+@pytest.mark.asyncio
+async def test_filename_cannot_break_multipart_framing(upload, clients):
+    source_client, dest_client = clients
+
+    await transfer_blob(
+        source_client, "http://storage/storage/v1/object/files/user/doc.pdf",
+        dest_client, "http://llamaparse/api/parsing/upload",
+        fields={}, filename='bad"name\r\nX-Injected: 1.pdf'
+    )
+
+    _, received = upload.requests[0]
+    assert b'filename="bad%22name%0D%0AX-Injected: 1.pdf"\r\n' in received
+    assert b"\r\nX-Injected" not in received
+
+
+@pytest.mark.asyncio
+async def test_encoded_blob_is_sent_decoded_without_upstream_length(upload, clients):
+    source_client, dest_client = clients
+
+    _, stats = await transfer_blob(
+        source_client, "http://storage/storage/v1/object/files/user/compressed.pdf",
+        dest_client, "http://llamaparse/api/parsing/upload",
+        fields={}, filename="compressed.pdf"
+    )
+
+    request, received = upload.requests[0]
+    assert b"\r\n\r\n" + DOCUMENT + b"\r\n--" in received
+    assert request.headers.get("content-length") in (None, str(len(received)))
+    assert stats.bytes == len(DOCUMENT)
@@ -0,0 +1,234 @@
+"""
+Unit tests for the pipelined embedding engine.
+
+Tests batch ordering and completeness, concurrency, failure propagation and
+the adaptive rate limiter's response to 429s.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.shared.external import embedding_pipeline
+from backend.shared.external.embedding_pipeline import (
+    AdaptiveRateLimiter,
+    EmbeddingPipeline,
+    get_openai_rate_limiter,
+    parse_reset_duration,
+)
+
+
+def _items(count):
+    return [{"chunk_id": i, "text": f"chunk {i}"} for i in range(count)]
+
+
+class RecordingEmbedder:
+    """Embedder that tracks concurrent calls and returns one vector per text."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.inflight = 0
+        self.peak = 0
+
+    async def __call__(self, texts):
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        await asyncio.sleep(self.delay)
+        self.inflight -= 1
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_all_batches_are_embedded_and_written():
+    written = {}
+
+    async def sink(index, batch, embeddings):
+        written[index] = [item["chunk_id"] for item in batch]
+
+    pipeline = EmbeddingPipeline(
+        embed=RecordingEmbedder(), sink=sink, limiter=AdaptiveRateLimiter(), batch_size=10, concurrency=3
+    )
+    stats = await pipeline.run(_items(95))
+
+    assert stats.chunks == 95
+    assert stats.batches == 10
+    assert sorted(chunk_id for ids in written.values() for chunk_id in ids) == list(range(95))
+    assert written[9] == list(range(90, 95))
+
+
+@pytest.mark.asyncio
+async def test_embedding_requests_overlap():
+    embedder = RecordingEmbedder(delay=0.05)
+
+    async def sink(index, batch, embeddings):
+        pass
+
+    pipeline = EmbeddingPipeline(
+        embed=embedder, sink=sink, limiter=AdaptiveRateLimiter(), batch_size=5, concurrency=4
+    )
+    stats = await pipeline.run(_items(40))
+
+    assert embedder.peak > 1
+    assert stats.peak_inflight == embedder.peak
+    # Eight 50ms batches at concurrency 4 should take far less than 400ms
+    assert stats.elapsed_seconds < 0.3
+
+
+@pytest.mark.asyncio
+async def test_sink_failure_cancels_pipeline():
+    embedder = RecordingEmbedder(delay=0.01)
+
+    async def sink(index, batch, embeddings):
+        raise RuntimeError("write failed")
+
+    pipeline = EmbeddingPipeline(
+        embed=embedder, sink=sink, limiter=AdaptiveRateLimiter(), batch_size=5, concurrency=2
+    )
+    with pytest.raises(RuntimeError, match="write failed"):
+        await pipeline.run(_items(50))
+
+
+@pytest.mark.asyncio
+async def test_embed_failure_cancels_sibling_workers():
+    calls = 0
+
+    async def failing_embedder(texts):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("embed failed")
+        await asyncio.sleep(0.01)
+        return [[1.0] for _ in texts]
+
+    async def sink(index, batch, embeddings):
+        await asyncio.sleep(0.05)
+
+    pipeline = EmbeddingPipeline(
+        embed=failing_embedder, sink=sink, limiter=AdaptiveRateLimiter(), batch_size=5, concurrency=4
+    )
+    with pytest.raises(RuntimeError, match="embed failed"):
+        await pipeline.run(_items(200))
+
+    calls_at_failure = calls
+    await asyncio.sleep(0.1)
+
+    assert calls == calls_at_failure
+    pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    assert pending == []
+
+
+@pytest.mark.asyncio
+async def test_embedding_count_mismatch_is_an_error():
+    async def short_embedder(texts):
+        return [[1.0]]
+
+    async def sink(index, batch, embeddings):
+        pass
+
+    pipeline = EmbeddingPipeline(
+        embed=short_embedder, sink=sink, limiter=AdaptiveRateLimiter(), batch_size=5
+    )
+    with pytest.raises(RuntimeError, match="count mismatch"):
+        await pipeline.run(_items(5))
+
+
+@pytest.mark.asyncio
+async def test_429_halves_rate_and_pauses_callers():
+    limiter = AdaptiveRateLimiter(requests_per_minute=6000)
+    limiter.observe_response(429, {"retry-after": "0.1"})
+
+    assert limiter.rate_fraction == 0.5
+    assert limiter.rate_limited_count == 1
+
+    start = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+    limiter.observe_response(200, {})
+    assert limiter.rate_fraction == pytest.approx(0.55)
+
+
+class FakeClock:
+    """Monotonic clock that advances only when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self._sleep = asyncio.sleep
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await self._sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_batch_larger_than_token_limit_does_not_stall_a_window(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(embedding_pipeline.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(embedding_pipeline.asyncio, "sleep", clock.sleep)
+
+    # 6000 tokens/min with an empty bucket; the items hold 9000 estimated tokens
+    limiter = AdaptiveRateLimiter(requests_per_minute=6000, tokens_per_minute=6000)
+    limiter._token_tokens = 0
+    items = [{"chunk_id": i, "text": "x" * 400} for i in range(90)]
+    calls = []
+
+    async def embedder(texts):
+        calls.append((clock.now, embedding_pipeline.estimate_tokens(texts)))
+        return [[1.0] for _ in texts]
+
+    async def sink(index, batch, embeddings):
+        pass
+
+    pipeline = EmbeddingPipeline(
+        embed=embedder, sink=sink, limiter=limiter, batch_size=256, concurrency=2
+    )
+    stats = await pipeline.run(items)
+
+    assert stats.chunks == 90
+    assert all(tokens <= 3000 for _, tokens in calls)
+    # The first request only waits for its own share of the bucket
+    first_call_at = calls[0][0] - 1000.0
+    assert first_call_at < 60
+    assert first_call_at == pytest.approx(30, abs=1)
+
+
+def test_remaining_headers_cap_available_capacity():
+    limiter = AdaptiveRateLimiter(requests_per_minute=3000, tokens_per_minute=1_000_000)
+    limiter.observe_response(200, {
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-remaining-requests": "3",
+        "x-ratelimit-remaining-tokens": "1000",
+    })
+
+    assert limiter.requests_per_minute == 500
+    assert limiter._request_tokens == 3
+    assert limiter._token_tokens == 1000
+
+
+def test_global_limiter_uses_configured_limits(monkeypatch):
+    monkeypatch.setattr(embedding_pipeline, "_openai_rate_limiter", None)
+
+    limiter = get_openai_rate_limiter(120, 40_000)
+    assert get_openai_rate_limiter() is limiter
+    assert (limiter.requests_per_minute, limiter.tokens_per_minute) == (120, 40_000)
+
+    # Header-reported limits survive callers repeating the same config
+    limiter.observe_response(200, {"x-ratelimit-limit-requests": "100"})
+    assert get_openai_rate_limiter(120, 40_000).requests_per_minute == 100
+
+    get_openai_rate_limiter(60, 20_000)
+    assert (limiter.requests_per_minute, limiter.tokens_per_minute) == (60, 20_000)
+    assert limiter._token_tokens <= 20_000
+
+
+def test_parse_reset_duration():
+    assert parse_reset_duration("1s") == 1.0
+    assert parse_reset_duration("6m0s") == 360.0
+    assert parse_reset_duration("250ms") == pytest.approx(0.25)
+    assert parse_reset_duration("2") == 2.0
+    assert parse_reset_duration("") is None
+    assert parse_reset_duration("soon") is None
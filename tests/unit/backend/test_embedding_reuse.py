@@ -0,0 +1,158 @@
+"""
+Unit tests for content-addressed embedding reuse in the upload worker.
+
+Tests that chunks found in the embedding store are not sent to OpenAI, that
+fresh embeddings are recorded in the store, that a fully covered document
+skips the API entirely and that hit rate and tokens saved are reported.
+"""
+
+import json
+import random
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.shared.config import WorkerConfig
+from backend.workers import enhanced_base_worker
+from backend.workers.enhanced_base_worker import EnhancedBaseWorker
+
+
+def _config(**overrides) -> WorkerConfig:
+    values = dict(
+        database_url="postgresql://localhost/test",
+        supabase_url="http://localhost:54321",
+        supabase_anon_key="anon",
+        supabase_service_role_key="service",
+        llamaparse_api_url="http://localhost",
+        llamaparse_api_key="key",
+        openai_api_url="http://localhost",
+        openai_api_key="key",
+        openai_model="text-embedding-3-small",
+        listen_for_jobs=False,
+    )
+    values.update(overrides)
+    return WorkerConfig(**values)
+
+
+def _vector(seed):
+    rng = random.Random(seed)
+    return [rng.uniform(-0.05, 0.05) for _ in range(1536)]
+
+
+class FakeConnection:
+    """Serves the embedding store lookup and records every write."""
+
+    def __init__(self, stored_chunk_ids, tokens):
+        self.stored_chunk_ids = stored_chunk_ids
+        self.tokens = tokens
+        self.executed = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetch(self, query, *args):
+        assert "embedding_store" in query
+        return [{"chunk_id": chunk_id, "tokens": self.tokens[chunk_id]} for chunk_id in self.stored_chunk_ids]
+
+    async def execute(self, query, *args):
+        self.executed.append((query, args))
+        return "UPDATE 1"
+
+
+class FakeDatabase:
+    vector_codec_enabled = True
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.conn
+
+
+class RecordingEmbeddingService:
+    def __init__(self):
+        self.requests = []
+
+    async def embed_batch(self, texts, fetcher=None):
+        self.requests.append(list(texts))
+        return [_vector(text) for text in texts]
+
+    def get_stats(self):
+        return {}
+
+
+@pytest.fixture
+def embedding_service(monkeypatch):
+    service = RecordingEmbeddingService()
+    monkeypatch.setattr(enhanced_base_worker, "get_embedding_service", lambda: service)
+    return service
+
+
+def _job(count):
+    chunks = [{"chunk_id": uuid.uuid4(), "text": f"chunk text {i}", "tokens": 10 + i} for i in range(count)]
+    return {"job_id": uuid.uuid4(), "document_id": uuid.uuid4(), "user_id": uuid.uuid4(), "chunks": chunks}
+
+
+def _worker(conn, **overrides):
+    worker = EnhancedBaseWorker(_config(**overrides))
+    worker.db = FakeDatabase(conn)
+    return worker
+
+
+def _reuse_progress(conn):
+    for query, args in conn.executed:
+        if "embeddings_stored" in query:
+            return json.loads(args[1])
+    raise AssertionError("job status was not updated")
+
+
+@pytest.mark.asyncio
+async def test_only_store_misses_are_embedded(embedding_service):
+    job = _job(4)
+    stored = [str(job["chunks"][0]["chunk_id"]), str(job["chunks"][2]["chunk_id"])]
+    conn = FakeConnection(stored, {chunk_id: None if chunk_id == stored[1] else 10 for chunk_id in stored})
+    worker = _worker(conn)
+
+    await worker._process_embeddings_real(job, "corr")
+
+    assert embedding_service.requests == [["chunk text 1", "chunk text 3"]]
+    store_inserts = [args for query, args in conn.executed if "INSERT INTO upload_pipeline.embedding_store" in query]
+    assert store_inserts == [([job["chunks"][1]["chunk_id"], job["chunks"][3]["chunk_id"]],)]
+
+    progress = _reuse_progress(conn)
+    assert progress["reused_chunks"] == 2
+    assert progress["embedded_chunks"] == 2
+    assert progress["hit_rate"] == 0.5
+    # Stored count for one hit, length estimate for the one without a count
+    assert progress["tokens_saved"] == 10 + 3
+
+
+@pytest.mark.asyncio
+async def test_fully_covered_document_skips_the_api(embedding_service):
+    job = _job(3)
+    stored = [str(chunk["chunk_id"]) for chunk in job["chunks"]]
+    conn = FakeConnection(stored, {chunk_id: 12 for chunk_id in stored})
+    worker = _worker(conn)
+
+    await worker._process_embeddings_real(job, "corr")
+
+    assert embedding_service.requests == []
+    assert _reuse_progress(conn) == {
+        "chunks": 3, "reused_chunks": 3, "embedded_chunks": 0, "hit_rate": 1.0, "tokens_saved": 36
+    }
+
+
+@pytest.mark.asyncio
+async def test_reuse_can_be_disabled(embedding_service):
+    job = _job(2)
+    conn = FakeConnection([str(chunk["chunk_id"]) for chunk in job["chunks"]], {})
+    worker = _worker(conn, embedding_reuse_enabled=False)
+
+    await worker._process_embeddings_real(job, "corr")
+
+    assert embedding_service.requests == [["chunk text 0", "chunk text 1"]]
+    assert not any("embedding_store" in query for query, _ in conn.executed)
+    assert _reuse_progress(conn)["hit_rate"] == 0.0
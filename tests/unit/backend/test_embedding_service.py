@@ -0,0 +1,155 @@
+"""
+Unit tests for the shared embedding service.
+
+Tests cache keys, LRU/TTL behavior, in-flight coalescing and the disk tier.
+"""
+
+import asyncio
+from array import array
+
+import pytest
+
+from backend.shared.external.embedding_service import EmbeddingService, embedding_cache_key
+
+
+class CountingFetcher:
+    """Fetcher that records upstream calls and returns deterministic vectors."""
+
+    def __init__(self, delay: float = 0.01):
+        self.calls = []
+        self.delay = delay
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(self.delay)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_cache_key_normalizes_whitespace_and_includes_model():
+    assert embedding_cache_key("  what is  my\tdeductible ", "m") == embedding_cache_key("what is my deductible", "m")
+    assert embedding_cache_key("deductible", "m1") != embedding_cache_key("deductible", "m2")
+
+
+@pytest.mark.asyncio
+async def test_repeated_texts_are_served_from_cache():
+    service = EmbeddingService(api_key="test")
+    fetcher = CountingFetcher()
+
+    first = await service.embed_batch(["copay", "coinsurance", "copay"], fetcher=fetcher)
+    second = await service.embed_batch(["copay"], fetcher=fetcher)
+
+    assert first[0] == first[2] == second[0]
+    assert fetcher.calls == [["copay", "coinsurance"]]
+    assert service.stats.hits == 1
+    assert service.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced():
+    service = EmbeddingService(api_key="test")
+    fetcher = CountingFetcher(delay=0.05)
+
+    results = await asyncio.gather(
+        service.embed_batch(["prior authorization"], fetcher=fetcher),
+        service.embed_batch(["prior authorization"], fetcher=fetcher),
+    )
+
+    assert results[0] == results[1]
+    assert len(fetcher.calls) == 1
+    assert service.stats.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_ttl():
+    service = EmbeddingService(api_key="test", max_entries=2, ttl_seconds=0.0)
+    fetcher = CountingFetcher(delay=0)
+
+    await service.embed_batch(["a", "b", "c"], fetcher=fetcher)
+    assert service.get_stats()["cached_entries"] == 2
+    assert service.stats.evictions == 1
+
+    # Zero TTL means every entry is already stale
+    await service.embed_batch(["c"], fetcher=fetcher)
+    assert len(fetcher.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_propagates_to_waiters():
+    service = EmbeddingService(api_key="test")
+
+    async def failing_fetcher(texts):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        service.embed_batch(["x"], fetcher=failing_fetcher),
+        service.embed_batch(["x"], fetcher=failing_fetcher),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert service.get_stats()["inflight"] == 0
+    assert service.stats.api_errors == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    fetcher = CountingFetcher(delay=0)
+
+    service = EmbeddingService(api_key="test", disk_cache_path=path)
+    await service.embed_batch(["out of pocket maximum"], fetcher=fetcher)
+    await service.close()
+
+    restarted = EmbeddingService(api_key="test", disk_cache_path=path)
+    result = await restarted.embed_batch(["out of pocket maximum"], fetcher=fetcher)
+    await restarted.close()
+
+    assert result == [[21.0, 1.0]]
+    assert len(fetcher.calls) == 1
+    assert restarted.stats.disk_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_stores_float32_arrays():
+    service = EmbeddingService(api_key="test")
+    fetcher = CountingFetcher(delay=0)
+
+    await service.embed_batch(["deductible"], fetcher=fetcher)
+    cached = await service.embed_batch(["deductible"], fetcher=fetcher)
+
+    _, stored = next(iter(service._cache.values()))
+    assert isinstance(stored, array) and stored.typecode == "f"
+    assert cached == [[10.0, 1.0]]
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_reads_and_writes_whole_batches(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    fetcher = CountingFetcher(delay=0)
+    texts = [f"chunk {i}" for i in range(300)]
+
+    service = EmbeddingService(api_key="test", disk_cache_path=path, max_batch_size=256)
+    calls = {"get_many": 0, "put_many": 0}
+    for name in calls:
+        original = getattr(service._disk, name)
+
+        async def counted(*args, _name=name, _original=original):
+            calls[_name] += 1
+            return await _original(*args)
+
+        setattr(service._disk, name, counted)
+
+    await service.embed_batch(texts, fetcher=fetcher)
+    await service.close()
+
+    # One lookup for the whole batch, one write per upstream request
+    assert calls == {"get_many": 1, "put_many": 2}
+
+    restarted = EmbeddingService(api_key="test", disk_cache_path=path)
+    result = await restarted.embed_batch(texts, fetcher=fetcher)
+    await restarted.close()
+
+    assert result[299] == [9.0, 1.0]
+    assert restarted.stats.disk_hits == 300
+    assert len(fetcher.calls) == 2
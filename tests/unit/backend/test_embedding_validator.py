@@ -0,0 +1,92 @@
+"""
+Unit tests for vectorized embedding validation.
+
+Tests that batch validation gives every row the verdict the single-embedding
+path gives it, that ragged and non-numeric batches are handled row by row,
+that identical vectors for different inputs are flagged as duplicates and
+that the monitor raises for critical rows.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from backend.shared.monitoring.embedding_monitor import EmbeddingQualityMonitor
+from backend.shared.validation.embedding_validator import EmbeddingIssueType, EmbeddingValidator
+
+
+def _vector(seed=0):
+    rng = random.Random(seed)
+    return [rng.gauss(0, 0.03) for _ in range(1536)]
+
+
+CASES = {
+    EmbeddingIssueType.VALID: _vector(),
+    EmbeddingIssueType.ALL_ZEROS: [0.0] * 1536,
+    EmbeddingIssueType.MOSTLY_ZEROS: [0.0] * 1500 + _vector()[:36],
+    EmbeddingIssueType.NAN_VALUES: _vector()[:-1] + [math.nan],
+    EmbeddingIssueType.INFINITE_VALUES: _vector()[:-1] + [math.inf],
+    EmbeddingIssueType.INVALID_DIMENSIONS: _vector()[:10],
+    EmbeddingIssueType.EXTREME_VALUES: _vector()[:-1] + [20.0],
+    EmbeddingIssueType.INSUFFICIENT_VARIANCE: [0.001] * 768 + [0.0011] * 768,
+    EmbeddingIssueType.SUSPICIOUS_PATTERN: [0.1, -0.1, 0.2] * 512,
+}
+
+
+def test_batch_verdicts_match_single_validation():
+    validator = EmbeddingValidator()
+
+    validation = validator.validate_array(list(CASES.values()))
+
+    assert validation.issue_types == list(CASES)
+    for row, embedding in enumerate(CASES.values()):
+        single = validator.validate_embedding(embedding)
+        batch = validation.result(row)
+        assert (batch.issue_type, batch.severity, batch.details) == (single.issue_type, single.severity, single.details)
+    assert validation.is_valid.tolist() == [True] + [False] * (len(CASES) - 1)
+    assert validation.summary()["critical_issues"] == 5
+
+
+def test_non_numeric_row_is_rejected_without_failing_the_batch():
+    validation = EmbeddingValidator().validate_array([_vector(), ["x"] * 1536])
+
+    assert validation.issue_types == [EmbeddingIssueType.VALID, EmbeddingIssueType.INVALID_DIMENSIONS]
+    assert validation.result(1).details.startswith("Cannot convert embedding to numeric array")
+
+
+def test_duplicate_vectors_are_flagged_only_for_different_keys():
+    vector = _vector(1)
+    validation = EmbeddingValidator().validate_array(np.array([vector, vector, vector]), keys=["a", "a", "b"])
+
+    assert validation.duplicate_of.tolist() == [-1, 0, 0]
+    assert validation.issue_types == [
+        EmbeddingIssueType.VALID, EmbeddingIssueType.VALID, EmbeddingIssueType.DUPLICATE_VECTOR
+    ]
+
+
+def test_metrics_are_computed_per_row():
+    embeddings = np.array([_vector(2), _vector(3)], dtype=np.float32)
+
+    validation = EmbeddingValidator().validate_array(embeddings)
+
+    assert validation.norm == pytest.approx(np.linalg.norm(embeddings, axis=1), rel=1e-5)
+    assert validation.variance == pytest.approx(embeddings.var(axis=1), rel=1e-4)
+    assert validation.zero_fraction.tolist() == [0.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_monitor_raises_for_critical_rows_and_counts_batch():
+    monitor = EmbeddingQualityMonitor()
+
+    with pytest.raises(ValueError, match="ZERO_EMBEDDING_DETECTED"):
+        await monitor.validate_array([_vector(), [0.0] * 1536])
+
+    validation = await monitor.validate_array([_vector(), [0.0] * 1536], raise_on_critical=False)
+
+    assert validation.invalid_rows() == [1]
+    summary = monitor.get_metrics_summary()
+    assert summary["total_processed"] == 4
+    assert summary["zero_count"] == 2
+    assert [issue["issue_type"] for issue in monitor.get_recent_issues()] == ["all_zeros", "all_zeros"]
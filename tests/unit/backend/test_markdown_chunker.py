@@ -0,0 +1,147 @@
+"""
+Unit tests for the structure-aware markdown chunker.
+
+Tests that chunks never exceed the token bound, that consecutive chunks in a
+section overlap, that headings start new chunks with the right section path
+and title, and that page markers become page ranges.
+"""
+
+import io
+
+import pytest
+
+from backend.shared.chunking import markdown_chunker
+from backend.shared.chunking.markdown_chunker import (
+    CHUNKER_NAME,
+    CHUNKER_VERSION,
+    PAGE_MARKER_TEMPLATE,
+    MarkdownChunker,
+    TokenCounter,
+)
+
+
+class WordCounter(TokenCounter):
+    """One token per word, so expectations do not depend on tiktoken."""
+
+    def __init__(self):
+        self.encoding = None
+
+    def count(self, text):
+        return len(text.split())
+
+    def split(self, text, max_tokens):
+        words = text.split()
+        return [
+            (" ".join(words[i:i + max_tokens]) + "\n", len(words[i:i + max_tokens]))
+            for i in range(0, len(words), max_tokens)
+        ]
+
+
+def make_chunker(max_tokens=10, overlap_tokens=3):
+    return MarkdownChunker(max_tokens=max_tokens, overlap_tokens=overlap_tokens, counter=WordCounter())
+
+
+def test_chunks_respect_token_bound_and_overlap():
+    content = "# Benefits\n" + "".join(f"line{i} a b\n" for i in range(12))
+
+    chunks = list(make_chunker().chunk(content))
+
+    assert len(chunks) > 1
+    assert all(chunk.tokens <= 10 for chunk in chunks)
+    assert all(chunk.tokens == WordCounter().count(chunk.text) for chunk in chunks)
+    # The last line of each chunk opens the next one
+    for previous, following in zip(chunks, chunks[1:]):
+        assert following.text.startswith(previous.text.splitlines()[-1])
+
+
+def test_overlong_line_is_split():
+    content = " ".join(f"w{i}" for i in range(25)) + "\n"
+
+    chunks = list(make_chunker(overlap_tokens=0).chunk(content))
+
+    assert [chunk.tokens for chunk in chunks] == [10, 10, 5]
+
+
+def test_headings_set_section_path_and_title():
+    content = (
+        "# Plan\nintro text\n"
+        "## Deductibles\ndeductible text\n"
+        "## Copays\ncopay text\n"
+        "### Specialists\nspecialist text\n"
+        "# Exclusions\nexcluded text\n"
+    )
+
+    chunks = list(make_chunker().chunk(content))
+
+    assert [(chunk.section_path, chunk.section_title) for chunk in chunks] == [
+        ([1], "Plan"),
+        ([1, 1], "Deductibles"),
+        ([1, 2], "Copays"),
+        ([1, 2, 1], "Specialists"),
+        ([2], "Exclusions"),
+    ]
+    assert chunks[1].text == "## Deductibles\ndeductible text"
+    assert [chunk.ord for chunk in chunks] == list(range(5))
+
+
+def test_headings_inside_code_fences_are_ignored():
+    content = (
+        "# Setup\nrun this\n"
+        "```bash\n# install deps\npip install\n```\n"
+        "~~~~\n## not a heading\n~~~\nstill code\n~~~~\n"
+        "## Usage\nusage text\n"
+    )
+
+    chunks = list(make_chunker(max_tokens=50).chunk(content))
+
+    assert [chunk.section_title for chunk in chunks] == ["Setup", "Usage"]
+    assert "# install deps" in chunks[0].text
+    assert "## not a heading" in chunks[0].text
+
+
+def test_token_counter_falls_back_when_encoding_cannot_load(monkeypatch):
+    class OfflineTiktoken:
+        @staticmethod
+        def get_encoding(name):
+            raise ConnectionError("cannot download encoding")
+
+    monkeypatch.setattr(markdown_chunker, "tiktoken", OfflineTiktoken)
+
+    counter = TokenCounter()
+
+    assert not counter.exact
+    assert counter.count("a" * 10) == 3
+    assert MarkdownChunker().counter.encoding is None
+
+
+def test_page_markers_become_page_ranges():
+    pages = [PAGE_MARKER_TEMPLATE.format(page=n) + "\n" + "one two three four\n" * 2 for n in (1, 2, 3)]
+
+    chunks = list(make_chunker(max_tokens=12, overlap_tokens=0).chunk("".join(pages)))
+
+    assert all("<!--" not in chunk.text for chunk in chunks)
+    assert [(chunk.page_start, chunk.page_end) for chunk in chunks] == [(1, 2), (2, 3)]
+
+
+def test_chunk_accepts_line_iterables_and_returns_row_dicts():
+    content = "# Plan\ncovered services\n"
+
+    rows = make_chunker().chunk_document(io.StringIO(content))
+
+    assert rows == [{
+        "text": "# Plan\ncovered services",
+        "ord": 0,
+        "tokens": 4,
+        "section_path": [1],
+        "section_title": "Plan",
+        "page_start": None,
+        "page_end": None,
+        "chunker_name": CHUNKER_NAME,
+        "chunker_version": CHUNKER_VERSION,
+    }]
+
+
+@pytest.mark.parametrize("max_tokens, overlap_tokens", [(0, 0), (10, 10), (10, -1)])
+def test_invalid_bounds_are_rejected(max_tokens, overlap_tokens):
+    with pytest.raises(ValueError):
+        MarkdownChunker(max_tokens=max_tokens, overlap_tokens=overlap_tokens, counter=WordCounter())
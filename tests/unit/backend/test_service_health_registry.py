@@ -0,0 +1,196 @@
+"""
+Unit tests for the ServiceRouter health registry.
+
+Tests that get_service answers from fresh cached health, re-probes stale
+entries, that passive call results update the registry, and that only
+outages (not client errors) count as passive failures.
+"""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from backend.shared.external.enhanced_service_client import EnhancedServiceClient
+from backend.shared.external.error_handler import create_error_context
+from backend.shared.external.service_router import (
+    MockService, ServiceExecutionError, ServiceMode, ServiceRouter
+)
+
+
+class CountingService(MockService):
+    """Mock service that counts availability probes."""
+
+    def __init__(self, name: str, is_available: bool = True):
+        super().__init__(name, is_available)
+        self.probe_count = 0
+
+    async def is_available(self) -> bool:
+        self.probe_count += 1
+        return await super().is_available()
+
+
+@pytest.fixture
+def router():
+    router = ServiceRouter(config={"mode": "hybrid", "health_max_staleness": 60})
+    router.real = CountingService("real")
+    router.mock = MockService("mock")
+    router.register_service("llamaparse", router.mock, router.real)
+    return router
+
+
+@pytest.mark.asyncio
+async def test_fresh_health_is_served_without_probing(router):
+    for _ in range(10):
+        assert await router.get_service("llamaparse") is router.real
+
+    assert router.real.probe_count == 1
+    stats = router.get_health_registry_stats()
+    assert stats["lookups"] == 10
+    assert stats["cache_hits"] == 9
+    assert stats["inline_probes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_health_is_probed_inline(router):
+    await router.get_service("llamaparse")
+    router.health_cache["llamaparse"].last_check = datetime.utcnow() - timedelta(seconds=61)
+    router.real._is_available = False
+
+    assert await router.get_service("llamaparse") is router.mock
+    assert router.real.probe_count == 2
+    assert router.health_cache["llamaparse"].is_healthy is False
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_result_is_cached(router):
+    router.real._is_available = False
+
+    assert await router.get_service("llamaparse") is router.mock
+    assert await router.get_service("llamaparse") is router.mock
+    assert router.real.probe_count == 1
+
+
+@pytest.mark.asyncio
+async def test_passive_failures_mark_unhealthy_after_threshold(router):
+    await router.get_service("llamaparse")
+
+    router.record_call_result("llamaparse", False, error="timeout")
+    router.record_call_result("llamaparse", False, error="timeout")
+    assert await router.get_service("llamaparse") is router.real
+
+    router.record_call_result("llamaparse", False, error="timeout")
+    assert await router.get_service("llamaparse") is router.mock
+
+    router.record_call_result("llamaparse", True, response_time_ms=12.5)
+    health = router.health_cache["llamaparse"]
+    assert health.is_healthy is True
+    assert health.error_count == 0
+    assert health.response_time_ms == 12.5
+    assert router.real.probe_count == 1
+
+
+@pytest.mark.asyncio
+async def test_mock_fallback_results_do_not_update_real_health(router):
+    router.real._is_available = False
+
+    await router.execute_service("llamaparse")
+
+    assert router.health_cache["llamaparse"].is_healthy is False
+    assert router.mock.execution_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_service_failure_respects_threshold(router, monkeypatch):
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr("backend.shared.external.service_router.asyncio.sleep", no_sleep)
+    router.real._fail_on_execute = True
+    calls = []
+    original = router.real.execute
+
+    async def flaky_execute(*args, **kwargs):
+        calls.append(router.real._fail_on_execute)
+        try:
+            return await original(*args, **kwargs)
+        finally:
+            router.real._fail_on_execute = False
+
+    router.real.execute = flaky_execute
+
+    assert await router.execute_service("llamaparse") == "result_from_real_1"
+
+    # One failure stays under the passive threshold, so the retry still
+    # goes to the real service
+    assert calls == [True, False]
+    assert router.mock.execution_count == 0
+    assert router.health_cache["llamaparse"].is_healthy is True
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_registry_stats(router):
+    router.set_mode(ServiceMode.REAL)
+    await router.get_service("llamaparse")
+    await router.get_service("llamaparse")
+
+    report = await router.health_check()
+
+    registry = report["registry"]
+    assert registry["cache_hits"] == 1
+    assert registry["hit_rate"] == 0.5
+    assert registry["estimated_probe_ms_saved"] >= 0
+    assert "llamaparse" in registry["services"]
+    await router.close()
+
+
+async def _fail_with(client, error):
+    async def call():
+        if isinstance(error, ServiceExecutionError) and error.original_error is not None:
+            # Wrap the way the real services do, inside the except block
+            try:
+                raise error.original_error
+            except Exception:
+                raise ServiceExecutionError(str(error))
+        raise error
+
+    with pytest.raises(type(error)):
+        await client._call_with_retry(
+            call, context=create_error_context("test"), service_name="llamaparse"
+        )
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_count_against_health(router):
+    client = EnhancedServiceClient(router)
+    client_errors = [
+        ServiceExecutionError("Invalid OpenAI API key"),
+        ServiceExecutionError("OpenAI API request failed: 400 bad request"),
+        ServiceExecutionError("No input texts provided"),
+        ValueError("Empty text cannot be embedded"),
+    ]
+    for error in client_errors * router.passive_failure_threshold:
+        await _fail_with(client, error)
+
+    assert router.health_stats["passive_updates"] == 0
+    assert "llamaparse" not in router.health_cache
+
+
+@pytest.mark.asyncio
+async def test_outages_count_against_health(router):
+    client = EnhancedServiceClient(router)
+    request = httpx.Request("POST", "https://api.example.com/parse")
+
+    outages = [
+        ServiceExecutionError(
+            "LlamaParse API request failed",
+            original_error=httpx.ReadTimeout("read timed out", request=request)
+        ),
+        httpx.ConnectError("connection refused", request=request),
+        ServiceExecutionError("Failed to get parse result: HTTP 502"),
+    ]
+    for error in outages:
+        await _fail_with(client, error)
+
+    assert router.health_cache["llamaparse"].error_count == 3
+    assert router.health_cache["llamaparse"].is_healthy is False
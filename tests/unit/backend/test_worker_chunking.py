@@ -0,0 +1,147 @@
+"""
+Unit tests for the upload worker's chunking stage.
+
+The connection records statements so the COPY-based bulk insert and the
+single transaction around it run without Postgres.
+"""
+
+import json
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from backend.shared.config import WorkerConfig
+from backend.workers import enhanced_base_worker
+from backend.workers.enhanced_base_worker import EnhancedBaseWorker
+
+
+def _config(**overrides) -> WorkerConfig:
+    values = dict(
+        database_url="postgresql://localhost/test",
+        supabase_url="http://localhost:54321",
+        supabase_anon_key="anon",
+        supabase_service_role_key="service",
+        llamaparse_api_url="http://localhost",
+        llamaparse_api_key="key",
+        openai_api_url="http://localhost",
+        openai_api_key="key",
+        openai_model="text-embedding-3-small",
+        listen_for_jobs=False,
+    )
+    values.update(overrides)
+    return WorkerConfig(**values)
+
+
+class RecordingConnection:
+    """Records statements, COPY calls and whether they ran in a transaction."""
+
+    def __init__(self, existing_rows: int = 0):
+        self.existing_rows = existing_rows
+        self.in_transaction = False
+        self.statements = []
+        self.copies = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+    async def fetchval(self, query, *args):
+        # chunk_source_document_id lookup, then the duplicate chunk count
+        return None if "chunk_source_document_id" in query else 0
+
+    async def execute(self, query, *args):
+        self.statements.append((" ".join(query.split()), args, self.in_transaction))
+        if "INSERT INTO upload_pipeline.document_chunks" in query:
+            inserted = len(self.copies[-1]["records"]) - self.existing_rows
+            return f"INSERT 0 {inserted}"
+        return "OK"
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copies.append({
+            "table": table, "records": list(records), "columns": columns, "in_transaction": self.in_transaction
+        })
+
+
+class RecordingDB:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.conn
+
+
+def _chunks(count):
+    return [
+        {"text": f"Chunk {i} covers the deductible.", "chunker_name": "markdown", "chunker_version": "1", "tokens": 6}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_copies_all_chunks_with_null_embeddings():
+    worker = EnhancedBaseWorker(_config())
+    conn = RecordingConnection()
+    document_id = uuid.uuid4()
+    chunks = _chunks(3)
+
+    async with conn.transaction():
+        inserted = await worker._bulk_insert_chunks(conn, document_id, chunks)
+
+    assert inserted == 3
+    (copy,) = conn.copies
+    assert copy["table"] == "chunk_staging" and copy["in_transaction"]
+    assert [record[copy["columns"].index("chunk_ord")] for record in copy["records"]] == [0, 1, 2]
+    assert [record[0] for record in copy["records"]] == [chunk["chunk_id"] for chunk in chunks]
+    assert "embedding" not in copy["columns"]
+
+    create, insert = (statement for statement, _, _ in conn.statements)
+    assert create.startswith("CREATE TEMP TABLE chunk_staging") and "ON COMMIT DROP" in create
+    assert "1536, NULL, now(), now()" in insert
+    assert "ON CONFLICT (document_id, chunker_name, chunker_version, chunk_ord) DO NOTHING" in insert
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_counts_only_new_rows():
+    worker = EnhancedBaseWorker(_config())
+    conn = RecordingConnection(existing_rows=2)
+
+    async with conn.transaction():
+        assert await worker._bulk_insert_chunks(conn, uuid.uuid4(), _chunks(5)) == 3
+
+
+@pytest.mark.asyncio
+async def test_chunking_stage_inserts_and_records_rate_in_one_transaction(monkeypatch):
+    monkeypatch.setattr(
+        enhanced_base_worker,
+        "get_config_manager",
+        lambda: SimpleNamespace(get_duplicate_chunk_check_enabled=lambda: True)
+    )
+    worker = EnhancedBaseWorker(_config(fast_lane=True))
+    conn = RecordingConnection()
+    worker.db = RecordingDB(conn)
+    job = {
+        "job_id": uuid.uuid4(), "document_id": uuid.uuid4(), "user_id": uuid.uuid4(),
+        "status": "parse_validated",
+        "parsed_content": "# Plan\n\nDeductible: $500\n\n## Copays\n\nSpecialist: $40",
+    }
+
+    await worker._process_chunking_real(job, "corr-1")
+
+    (copy,) = conn.copies
+    assert copy["in_transaction"]
+    statements = [(statement, args) for statement, args, in_transaction in conn.statements if in_transaction]
+    assert len(statements) == len(conn.statements) == 3
+    update, args = statements[-1]
+    assert "SET status = 'chunks_stored'" in update
+    metrics = json.loads(args[1])
+    assert metrics["chunk_count"] == metrics["inserted_chunks"] == len(copy["records"])
+    assert metrics["rows_per_second"] > 0
+    # The fast lane hands the inserted chunks to the embedding stage
+    assert [chunk["chunk_id"] for chunk in job["chunks"]] == [record[0] for record in copy["records"]]
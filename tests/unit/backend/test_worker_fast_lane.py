@@ -0,0 +1,151 @@
+"""
+Unit tests for the upload worker's fast lane.
+
+Stage handlers and the lease queries are replaced so the chaining logic runs
+without a database.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from backend.shared.config import WorkerConfig
+from backend.shared.exceptions import UserFacingError
+from backend.workers.enhanced_base_worker import EnhancedBaseWorker
+
+
+def _config(**overrides) -> WorkerConfig:
+    values = dict(
+        database_url="postgresql://localhost/test",
+        supabase_url="http://localhost:54321",
+        supabase_anon_key="anon",
+        supabase_service_role_key="service",
+        llamaparse_api_url="http://localhost",
+        llamaparse_api_key="key",
+        openai_api_url="http://localhost",
+        openai_api_key="key",
+        openai_model="text-embedding-3-small",
+        listen_for_jobs=False,
+    )
+    values.update(overrides)
+    return WorkerConfig(**values)
+
+
+class FastLaneWorker(EnhancedBaseWorker):
+    """Records stage calls and lease activity instead of touching Postgres."""
+
+    def __init__(self, config, fail_at=None, lease_renewals=None):
+        super().__init__(config)
+        self.calls = []
+        self.leases = []
+        self.fail_at = fail_at
+        self.lease_renewals = lease_renewals
+        self.peak_embed_slots = 0
+
+    async def _renew_claim_lease(self, job_id):
+        self.leases.append("renew")
+        return self.lease_renewals is None or self.leases.count("renew") <= self.lease_renewals
+
+    async def _release_claim_lease(self, job_id):
+        self.leases.append("release")
+
+    async def _update_job_state(self, job_id, state, correlation_id, error_message=None):
+        self.calls.append(("state", state))
+
+    async def _handle_processing_error_enhanced(self, job, error, correlation_id):
+        self.calls.append(("handled", job["status"]))
+
+    async def _stage(self, name, job):
+        if name == self.fail_at:
+            raise UserFacingError("stage failed")
+        self.calls.append((name, job["status"]))
+
+    async def _process_validation_real(self, job, correlation_id):
+        await self._stage("validate", job)
+        job["parsed_content"] = "# Plan\nDeductible: $500"
+
+    async def _process_chunking_real(self, job, correlation_id):
+        await self._stage("chunk", job)
+        assert job["parsed_content"].startswith("# Plan")
+        job["chunks"] = [{"chunk_id": uuid.uuid4(), "text": job["parsed_content"]}]
+
+    async def _process_embeddings_real(self, job, correlation_id):
+        await self._stage("embed", job)
+        self.peak_embed_slots = max(self.peak_embed_slots, self.active_stage_counts["embed"])
+        await asyncio.sleep(0.02)
+        assert len(job["chunks"]) == 1
+
+
+def _job(status):
+    return {"job_id": uuid.uuid4(), "document_id": uuid.uuid4(), "user_id": uuid.uuid4(), "status": status}
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_chains_stages_to_complete():
+    worker = FastLaneWorker(_config(fast_lane=True))
+    worker.running = True
+    job = _job("parsed")
+
+    assert await worker._process_job(job) is True
+
+    assert worker.calls == [
+        ("validate", "parsed"),
+        ("chunk", "parse_validated"),
+        ("embed", "chunks_stored"),
+        ("state", "complete"),
+    ]
+    assert job["status"] == "complete"
+    assert worker.leases[-1] == "release"
+    assert "parsed_content" not in job and "chunks" not in job
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_stops_at_handled_error():
+    worker = FastLaneWorker(_config(fast_lane=True), fail_at="chunk")
+    worker.running = True
+    job = _job("parsed")
+
+    await worker._process_job(job)
+
+    assert worker.calls == [("validate", "parsed"), ("handled", "parse_validated")]
+    assert worker.leases[-1] == "release"
+
+
+@pytest.mark.asyncio
+async def test_without_fast_lane_one_stage_per_claim():
+    worker = FastLaneWorker(_config(fast_lane=False))
+    worker.running = True
+
+    await worker._process_job(_job("parsed"))
+
+    assert worker.calls == [("validate", "parsed")]
+    assert worker.leases == ["release"]
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_stops_when_lease_is_lost():
+    worker = FastLaneWorker(_config(fast_lane=True), lease_renewals=1)
+    worker.running = True
+    job = _job("parsed")
+
+    assert await worker._process_job(job) is True
+
+    assert worker.calls == [("validate", "parsed")]
+    assert job["status"] == "parse_validated"
+    assert worker.leases[-1] == "release"
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_jobs_take_each_stage_slot():
+    worker = FastLaneWorker(_config(
+        fast_lane=True, job_batch_size=4, parse_concurrency=4, chunk_concurrency=4, embed_concurrency=1
+    ))
+    worker.running = True
+
+    assert all(worker._start_job(_job("parsed")) for _ in range(4))
+    await asyncio.wait_for(asyncio.gather(*worker.active_jobs.values()), timeout=5)
+
+    assert worker.calls.count(("state", "complete")) == 4
+    assert worker.peak_embed_slots == 1
+    assert all(count == 0 for count in worker.active_stage_counts.values())
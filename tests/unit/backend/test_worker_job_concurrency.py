@@ -0,0 +1,250 @@
+"""
+Unit tests for concurrent job mode and job wakeup in the enhanced upload worker.
+
+The claim query and stage handlers are replaced so the loop's scheduling
+(batch claims, per-stage limits, notifications) runs without a database.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from backend.shared.config import WorkerConfig
+from backend.workers.enhanced_base_worker import EnhancedBaseWorker, JOB_STAGES
+
+
+def _config(**overrides) -> WorkerConfig:
+    values = dict(
+        database_url="postgresql://localhost/test",
+        supabase_url="http://localhost:54321",
+        supabase_anon_key="anon",
+        supabase_service_role_key="service",
+        llamaparse_api_url="http://localhost",
+        llamaparse_api_key="key",
+        openai_api_url="http://localhost",
+        openai_api_key="key",
+        openai_model="text-embedding-3-small",
+        poll_interval=1,
+        listen_for_jobs=False,
+    )
+    values.update(overrides)
+    return WorkerConfig(**values)
+
+
+class FakeQueueWorker(EnhancedBaseWorker):
+    """Worker whose queue is an in-memory list and whose jobs just sleep."""
+
+    def __init__(self, config: WorkerConfig, jobs, job_seconds: float = 0.05):
+        super().__init__(config)
+        self.queue = list(jobs)
+        self.job_seconds = job_seconds
+        self.claim_calls = []
+        self.peak_by_stage = {stage: 0 for stage in self.stage_limits}
+        self.completed = []
+        self.released = []
+
+    async def _get_next_jobs(self, limit, statuses=None, exclude_job_ids=None):
+        self.claim_calls.append((limit, list(statuses or [])))
+        available = [
+            job for job in self.queue
+            if job["status"] in (statuses or JOB_STAGES) and job["job_id"] not in (exclude_job_ids or [])
+        ]
+        return [dict(job) for job in available[:limit]]
+
+    async def _release_claim_lease(self, job_id):
+        self.released.append(job_id)
+
+    async def _process_single_job_with_monitoring(self, job):
+        stage = JOB_STAGES[job["status"]]
+        self.peak_by_stage[stage] = max(self.peak_by_stage[stage], self.active_stage_counts[stage])
+        await asyncio.sleep(self.job_seconds)
+        self.queue = [queued for queued in self.queue if queued["job_id"] != job["job_id"]]
+        self.completed.append(job["job_id"])
+        if all(queued["status"] == "parse_queued" for queued in self.queue):
+            self.running = False
+
+
+def _jobs(status: str, count: int):
+    return [{"job_id": uuid.uuid4(), "status": status} for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_respects_stage_limits():
+    config = _config(job_batch_size=6, parse_concurrency=2, chunk_concurrency=2, embed_concurrency=1)
+    worker = FakeQueueWorker(config, _jobs("uploaded", 4) + _jobs("parse_validated", 4) + _jobs("chunks_stored", 3))
+    worker.running = True
+
+    await asyncio.wait_for(worker.process_jobs_continuously(), timeout=5)
+
+    assert len(worker.completed) == 11
+    assert worker.peak_by_stage["parse"] == 2
+    assert worker.peak_by_stage["chunk"] == 2
+    assert worker.peak_by_stage["embed"] == 1
+    assert not worker.active_jobs
+
+
+@pytest.mark.asyncio
+async def test_webhook_wait_jobs_are_not_claimed():
+    config = _config(job_batch_size=4)
+    waiting = _jobs("parse_queued", 2)
+    worker = FakeQueueWorker(config, waiting + _jobs("uploaded", 2))
+    worker.running = True
+
+    await asyncio.wait_for(worker.process_jobs_continuously(), timeout=5)
+
+    assert all("parse_queued" not in statuses for _, statuses in worker.claim_calls)
+    assert not set(job["job_id"] for job in waiting) & set(worker.completed)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jobs_finish_faster_than_sequential():
+    jobs = _jobs("parse_validated", 8)
+
+    sequential = FakeQueueWorker(_config(job_batch_size=1), jobs, job_seconds=0.05)
+    sequential.running = True
+    start = asyncio.get_running_loop().time()
+    await asyncio.wait_for(sequential.process_jobs_continuously(), timeout=5)
+    sequential_elapsed = asyncio.get_running_loop().time() - start
+
+    concurrent = FakeQueueWorker(_config(job_batch_size=8, chunk_concurrency=8), jobs, job_seconds=0.05)
+    concurrent.running = True
+    start = asyncio.get_running_loop().time()
+    await asyncio.wait_for(concurrent.process_jobs_continuously(), timeout=5)
+    concurrent_elapsed = asyncio.get_running_loop().time() - start
+
+    assert len(concurrent.completed) == len(sequential.completed) == 8
+    assert concurrent_elapsed < sequential_elapsed / 2
+
+
+@pytest.mark.asyncio
+async def test_claimed_jobs_release_their_lease():
+    config = _config(job_batch_size=4, parse_concurrency=1, chunk_concurrency=4)
+    jobs = _jobs("uploaded", 3)
+    worker = FakeQueueWorker(config, jobs)
+    worker.running = True
+
+    await asyncio.wait_for(worker.process_jobs_continuously(), timeout=5)
+
+    # Jobs without a free parse slot are released at once, the rest when done
+    assert len(worker.completed) == 3
+    assert set(worker.released) == {job["job_id"] for job in jobs}
+    assert len(worker.released) > len(worker.completed)
+
+
+class ClaimConnection:
+    """Records the claim query."""
+
+    def __init__(self):
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        self.queries.append((query, args))
+        return [{"job_id": uuid.uuid4(), "status": "uploaded"}]
+
+
+class ClaimDB:
+    def __init__(self):
+        self.conn = ClaimConnection()
+
+    def get_connection(self):
+        conn = self.conn
+
+        class _Context:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Context()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fast_lane", [False, True])
+async def test_claim_query_stamps_lease_for_every_mode(fast_lane):
+    worker = EnhancedBaseWorker(_config(fast_lane=fast_lane, claim_lease_seconds=120))
+    worker.db = ClaimDB()
+
+    jobs = await worker._get_next_jobs(2)
+
+    (query, args), = worker.db.conn.queries
+    assert "FOR UPDATE OF uj SKIP LOCKED" in query
+    assert "UPDATE upload_pipeline.upload_jobs" in query and "RETURNING" in query
+    assert "'claim', jsonb_build_object" in query
+    assert args[3:] == (worker.worker_id, 120.0)
+    assert len(jobs) == 1
+
+
+class RecordingDB:
+    """Stands in for the pool and records how many jobs were running at close."""
+
+    def __init__(self, worker):
+        self.worker = worker
+        self.active_jobs_at_close = None
+
+    async def close(self):
+        self.active_jobs_at_close = len(self.worker.active_jobs)
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_jobs_before_closing_pool():
+    worker = FakeQueueWorker(_config(job_batch_size=4, chunk_concurrency=4), _jobs("parse_validated", 4), job_seconds=0.2)
+    worker.db = RecordingDB(worker)
+    loop_task = asyncio.create_task(worker.start())
+    await asyncio.sleep(0.05)
+    assert len(worker.active_jobs) == 4
+
+    await asyncio.wait_for(worker.stop(), timeout=5)
+
+    assert worker.db.active_jobs_at_close == 0
+    assert len(worker.completed) == 4
+    await loop_task
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_jobs_that_outlive_shutdown_timeout():
+    worker = FakeQueueWorker(
+        _config(job_batch_size=2, chunk_concurrency=2, shutdown_timeout=0), _jobs("parse_validated", 2), job_seconds=5
+    )
+    worker.db = RecordingDB(worker)
+    worker.running = True
+    loop_task = asyncio.create_task(worker.process_jobs_continuously())
+    await asyncio.sleep(0.05)
+
+    await asyncio.wait_for(worker.stop(), timeout=1)
+
+    assert worker.db.active_jobs_at_close == 0
+    assert worker.completed == []
+    await asyncio.wait_for(loop_task, timeout=1)
+
+
+
+class FakeListenerConnection:
+    def is_closed(self):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_notification_wakes_idle_worker_before_fallback_poll():
+    worker = FakeQueueWorker(_config(fallback_poll_interval=30), [])
+    worker._listener_conn = FakeListenerConnection()
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.05, worker._on_job_ready, None, 0, "upload_pipeline_job_ready", "{}")
+    start = loop.time()
+    await asyncio.wait_for(worker._wait_for_jobs(), timeout=5)
+
+    assert loop.time() - start < 1
+    assert worker.wakeup_stats == {"notifications": 1, "notified_polls": 1, "fallback_polls": 0}
+    assert not worker._job_ready.is_set()
+
+
+@pytest.mark.asyncio
+async def test_without_listener_worker_falls_back_to_poll_interval():
+    worker = FakeQueueWorker(_config(poll_interval=1, fallback_poll_interval=30), [])
+    worker.poll_interval = 0.05
+
+    await asyncio.wait_for(worker._wait_for_jobs(), timeout=5)
+
+    assert worker.wakeup_stats["fallback_polls"] == 1
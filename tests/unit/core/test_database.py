@@ -142,6 +142,29 @@ class TestDatabaseManager:
             assert db_manager._is_initialized is False
             assert db_manager.pool is None
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("vector_schema", ["extensions", None])
+    async def test_vector_codec_decided_before_pool_creation(self, mock_config, vector_schema):
+        """Test codec support is detected once and applied to every pooled connection."""
+        db_manager = DatabaseManager(mock_config, binary_vectors=True)
+        probe_conn = AsyncMock()
+        probe_conn.fetchval.return_value = vector_schema
+        
+        with patch('core.database.asyncpg.connect', AsyncMock(return_value=probe_conn)), \
+             patch('core.database.create_pool', AsyncMock()) as mock_create_pool:
+            await db_manager.initialize()
+        await db_manager.close()
+        
+        probe_conn.close.assert_awaited_once()
+        assert db_manager.vector_codec_enabled is (vector_schema is not None)
+        init = mock_create_pool.call_args.kwargs["init"]
+        if vector_schema is None:
+            assert init is None
+        else:
+            pooled_conn = AsyncMock()
+            await init(pooled_conn)
+            assert pooled_conn.set_type_codec.call_args.kwargs["schema"] == vector_schema
+    
     @pytest.mark.asyncio
     async def test_close_success(self, db_manager):
         """Test successful database closure."""
@@ -0,0 +1,137 @@
+"""
+Unit tests for cross-user document duplication.
+
+Tests that chunks are copied with one server-side INSERT ... SELECT inside a
+transaction, and that reference mode shares the source chunk set instead.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from api.upload_pipeline.utils.document_duplication import duplicate_document_for_user
+
+
+class FakeConnection:
+    """Records queries and whether they ran inside a transaction."""
+
+    def __init__(self, source_doc):
+        self.source_doc = source_doc
+        self.in_transaction = False
+        self.queries = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+    async def fetchrow(self, query, *args):
+        self.queries.append((query, args, self.in_transaction))
+        if "FROM upload_pipeline.documents" in query:
+            return self.source_doc
+        return {
+            "document_id": args[0], "filename": args[2], "raw_path": args[7],
+            "parsed_path": args[8], "processing_status": args[9], "created_at": args[11],
+        }
+
+    async def execute(self, query, *args):
+        self.queries.append((query, args, self.in_transaction))
+        return "INSERT 0 42"
+
+
+def source_document(chunk_source_document_id=None):
+    return {
+        "document_id": uuid4(), "user_id": uuid4(), "filename": "sbc.pdf",
+        "mime": "application/pdf", "bytes_len": 1024, "file_sha256": "a" * 64,
+        "parsed_sha256": "b" * 64, "raw_path": "files/user/x/raw/sbc.pdf",
+        "parsed_path": "files/user/x/parsed/sbc.md", "processing_status": "complete",
+        "chunk_source_document_id": chunk_source_document_id,
+        "created_at": datetime.utcnow(), "updated_at": datetime.utcnow(),
+    }
+
+
+@pytest.mark.asyncio
+async def test_copy_mode_copies_chunks_server_side_in_one_transaction():
+    source = source_document()
+    conn = FakeConnection(source)
+
+    result = await duplicate_document_for_user(source["document_id"], str(uuid4()), "sbc.pdf", conn)
+
+    copy_queries = [q for q in conn.queries if "INSERT INTO upload_pipeline.document_chunks" in q[0]]
+    assert len(copy_queries) == 1
+    query, args, in_transaction = copy_queries[0]
+    assert "gen_random_uuid()" in query and "SELECT" in query
+    assert args == (source["document_id"], result["document_id"])
+    assert all(in_transaction for _, _, in_transaction in conn.queries)
+    assert result["chunk_source_document_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_reference_mode_shares_the_owning_chunk_set():
+    owner_id = uuid4()
+    source = source_document(chunk_source_document_id=owner_id)
+    conn = FakeConnection(source)
+
+    result = await duplicate_document_for_user(
+        source["document_id"], str(uuid4()), "sbc.pdf", conn, chunk_mode="reference"
+    )
+
+    assert not any("document_chunks" in q[0] for q in conn.queries)
+    insert_args = conn.queries[1][1]
+    assert insert_args[10] == owner_id
+    assert result["chunk_source_document_id"] == owner_id
+
+
+@pytest.mark.asyncio
+async def test_invalid_chunk_mode_is_rejected():
+    with pytest.raises(ValueError):
+        await duplicate_document_for_user(uuid4(), str(uuid4()), "sbc.pdf", None, chunk_mode="link")
+
+
+class RecordingDB:
+    """Captures upload_jobs inserts."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, query, *args):
+        self.executed.append((query, args))
+
+
+@pytest.mark.asyncio
+async def test_reference_duplicate_job_is_never_claimed():
+    from api.upload_pipeline.endpoints.upload import _create_upload_job_for_duplicate
+    from backend.workers.enhanced_base_worker import JOB_STAGES
+
+    db = RecordingDB()
+    await _create_upload_job_for_duplicate(
+        job_id=str(uuid4()), document_id=str(uuid4()), user_id=str(uuid4()),
+        raw_path="files/user/y/raw/sbc.pdf", db=db,
+        chunk_source_document_id=str(uuid4()),
+    )
+
+    (_, args), = db.executed
+    status, state = args[2], args[3]
+    assert (status, state) == ("complete", "done")
+    assert status not in JOB_STAGES
+
+
+@pytest.mark.asyncio
+async def test_copy_duplicate_job_is_queued_for_processing():
+    from api.upload_pipeline.endpoints.upload import _create_upload_job_for_duplicate
+    from backend.workers.enhanced_base_worker import JOB_STAGES
+
+    db = RecordingDB()
+    await _create_upload_job_for_duplicate(
+        job_id=str(uuid4()), document_id=str(uuid4()), user_id=str(uuid4()),
+        raw_path="files/user/y/raw/sbc.pdf", db=db,
+    )
+
+    (_, args), = db.executed
+    assert (args[2], args[3]) == ("uploaded", "queued")
+    assert args[2] in JOB_STAGES
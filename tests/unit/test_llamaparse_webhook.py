@@ -0,0 +1,144 @@
+"""
+Unit tests for the LlamaParse webhook fast path.
+
+Tests that a signed callback uploads the parsed artifact once and advances
+the job and document in one transaction, that bad signatures are rejected
+before anything is stored and that duplicate callbacks are ignored.
+"""
+
+import hashlib
+import hmac
+import json
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from api.upload_pipeline.webhooks import extract_parsed_content, process_llamaparse_webhook
+
+SECRET = "webhook-secret"
+
+
+class FakeConnection:
+    """Serves the job lookup and records writes with their transaction state."""
+
+    def __init__(self, job):
+        self.job = job
+        self.in_transaction = False
+        self.writes = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+    async def fetchrow(self, query, *args):
+        return self.job
+
+    async def fetchval(self, query, *args):
+        self.writes.append((query, args, self.in_transaction))
+        return args[0] if self.job["status"] in args[1] else None
+
+    async def execute(self, query, *args):
+        self.writes.append((query, args, self.in_transaction))
+        return "UPDATE 1"
+
+
+class FakeDatabase:
+    def __init__(self, job):
+        self.conn = FakeConnection(job)
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.conn
+
+
+class RecordingStorage:
+    def __init__(self):
+        self.uploads = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.uploads.append(b"".join([chunk async for chunk in request.stream]))
+        return httpx.Response(200, json={"Key": request.url.path})
+
+
+@pytest.fixture(autouse=True)
+def storage_env(monkeypatch):
+    monkeypatch.setenv("SUPABASE_URL", "http://storage")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service-key")
+
+
+@pytest.fixture
+def storage():
+    return RecordingStorage()
+
+
+@pytest.fixture
+def client(storage):
+    return httpx.AsyncClient(transport=httpx.MockTransport(storage))
+
+
+def make_job(status="parse_queued"):
+    return {"webhook_secret": SECRET, "document_id": uuid4(), "status": status, "user_id": uuid4()}
+
+
+def signed(payload):
+    body = json.dumps(payload).encode()
+    return body, {"X-Webhook-Signature": hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()}
+
+
+def test_extract_parsed_content_joins_pages():
+    payload = {"result": [{"md": "# Page 1"}, {"txt": "page 2"}, {}, {"page": 7, "md": "page 7"}]}
+
+    assert extract_parsed_content(payload) == (
+        "<!-- page 1 -->\n# Page 1\n\n<!-- page 2 -->\npage 2\n\n<!-- page 7 -->\npage 7"
+    )
+    assert extract_parsed_content({"result": {}, "md": "legacy"}) == "legacy"
+
+
+@pytest.mark.asyncio
+async def test_completed_webhook_stores_artifact_and_advances_job_in_one_transaction(storage, client):
+    db = FakeDatabase(make_job())
+    body, headers = signed({"status": "completed", "result": {"md": "# Benefits"}})
+
+    result = await process_llamaparse_webhook("job-1", body, headers, db, storage_client=client)
+
+    assert result["status"] == "success"
+    assert storage.uploads == [b"# Benefits"]
+    assert len(db.conn.writes) == 2
+    assert all(in_transaction for _, _, in_transaction in db.conn.writes)
+    document_update = db.conn.writes[1]
+    assert "UPDATE upload_pipeline.documents" in document_update[0]
+    assert document_update[1][1] == hashlib.sha256(b"# Benefits").hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_invalid_signature_is_rejected_before_storage(storage, client):
+    db = FakeDatabase(make_job())
+    body, _ = signed({"status": "completed", "result": {"md": "# Benefits"}})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await process_llamaparse_webhook(
+            "job-1", body, {"X-Webhook-Signature": "0" * 64}, db, storage_client=client
+        )
+
+    assert exc_info.value.status_code == 401
+    assert storage.uploads == []
+    assert db.conn.writes == []
+
+
+@pytest.mark.asyncio
+async def test_duplicate_webhook_is_acknowledged_without_work(storage, client):
+    db = FakeDatabase(make_job(status="parsed"))
+    body, headers = signed({"status": "completed", "result": {"md": "# Benefits"}})
+
+    result = await process_llamaparse_webhook("job-1", body, headers, db, storage_client=client)
+
+    assert result["status"] == "success"
+    assert storage.uploads == []
+    assert db.conn.writes == []
@@ -0,0 +1,82 @@
+"""
+Unit tests for streaming uploads to storage.
+
+Tests that the body is hashed and counted while streaming and that the size
+limit is enforced both from Content-Length and mid-stream.
+"""
+
+import hashlib
+
+import httpx
+import pytest
+
+from api.upload_pipeline.utils.storage_stream import UploadTooLargeError, stream_to_storage
+
+
+async def body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class RecordingStorage:
+    """httpx transport handler that drains the streamed body."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        received = b"".join([chunk async for chunk in request.stream])
+        self.requests.append((request, received))
+        return httpx.Response(200, json={"Key": request.url.path})
+
+
+@pytest.fixture
+def storage():
+    return RecordingStorage()
+
+
+@pytest.fixture
+def client(storage):
+    return httpx.AsyncClient(transport=httpx.MockTransport(storage))
+
+
+@pytest.mark.asyncio
+async def test_streams_body_and_computes_sha256(storage, client):
+    upload = await stream_to_storage(
+        "files", "user/1/raw/doc.pdf", body(b"%PDF-", b"1.7 ", b"content"),
+        content_type="application/pdf", max_bytes=1024,
+        storage_url="http://storage", service_role_key="key", client=client
+    )
+
+    assert upload.ok
+    assert upload.bytes_len == 16
+    assert upload.file_sha256 == hashlib.sha256(b"%PDF-1.7 content").hexdigest()
+
+    request, received = storage.requests[0]
+    assert received == b"%PDF-1.7 content"
+    assert request.url.path == "/storage/v1/object/files/user/1/raw/doc.pdf"
+    assert request.headers["x-upsert"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_declared_length_over_limit_is_rejected_before_upload(storage, client):
+    with pytest.raises(UploadTooLargeError):
+        await stream_to_storage(
+            "files", "doc.pdf", body(b"x" * 10),
+            content_type="application/pdf", max_bytes=5, content_length=10,
+            storage_url="http://storage", service_role_key="key", client=client
+        )
+
+    assert storage.requests == []
+
+
+@pytest.mark.asyncio
+async def test_stream_over_limit_is_aborted(client):
+    with pytest.raises(UploadTooLargeError) as exc_info:
+        await stream_to_storage(
+            "files", "doc.pdf", body(b"x" * 4, b"x" * 4, b"x" * 4),
+            content_type="application/pdf", max_bytes=6,
+            storage_url="http://storage", service_role_key="key", client=client
+        )
+
+    assert exc_info.value.received_bytes == 8
@@ -0,0 +1,161 @@
+"""
+Unit tests for the storage upload proxy endpoint.
+
+Tests that the SHA-256 computed while streaming is checked against the hash
+declared at /upload, and that a mismatch or a missing document is rejected
+without marking anything uploaded.
+"""
+
+import hashlib
+import io
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from api.upload_pipeline.endpoints import upload as upload_endpoint
+from api.upload_pipeline.utils.storage_stream import StreamedUpload
+
+CONTENT = b"%PDF-1.7 actual content"
+ACTUAL_SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+class FakeDocuments:
+    """Single-row documents table keyed by raw_path, plus one upload job."""
+
+    def __init__(self, raw_path, file_sha256):
+        self.row = {
+            "document_id": "doc-1",
+            "raw_path": raw_path,
+            "file_sha256": file_sha256,
+            "processing_status": "uploading",
+        }
+        self.job_status = "uploading"
+
+    async def fetchval(self, query, *args):
+        # UPDATE ... WHERE raw_path = $1 AND (file_sha256 IS NULL OR file_sha256 = $2)
+        if args[0] != self.row["raw_path"]:
+            return None
+        declared = self.row["file_sha256"]
+        if declared is not None and declared != args[1]:
+            return None
+        self.row["processing_status"] = "uploaded"
+        self.row["file_sha256"] = args[1]
+        return self.row["document_id"]
+
+    async def fetchrow(self, query, *args):
+        if "upload_jobs" in query:
+            return {"document_id": self.row["document_id"], "state": "queued"}
+        if "document_id = $1" in query:
+            return self.row if args[0] == self.row["document_id"] else None
+        return self.row if args[0] == self.row["raw_path"] else None
+
+    async def execute(self, query, *args):
+        self.job_status = "uploaded"
+
+
+class FakeDatabase:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.conn
+
+
+class FakeRequest:
+    headers = {"content-type": "application/pdf"}
+
+    async def stream(self):
+        yield CONTENT
+
+
+@pytest.fixture
+def proxy(monkeypatch):
+    deleted = []
+
+    async def fake_stream_to_storage(bucket, key, chunks, **kwargs):
+        body = b"".join([chunk async for chunk in chunks])
+        return StreamedUpload(200, "{}", len(body), hashlib.sha256(body).hexdigest())
+
+    async def fake_delete_from_storage(bucket, key, **kwargs):
+        deleted.append((bucket, key))
+        return True
+
+    monkeypatch.setattr(upload_endpoint, "get_storage_credentials", lambda: ("http://storage", "key"))
+    monkeypatch.setattr(upload_endpoint, "stream_to_storage", fake_stream_to_storage)
+    monkeypatch.setattr(upload_endpoint, "delete_from_storage", fake_delete_from_storage)
+
+    def install(declared_sha256, raw_path="files/user/u1/raw/doc.pdf"):
+        documents = FakeDocuments(raw_path, declared_sha256)
+        monkeypatch.setattr(upload_endpoint, "get_database", lambda: FakeDatabase(documents))
+        return documents
+
+    return install, deleted
+
+
+def user():
+    return type("User", (), {"user_id": "u1"})()
+
+
+@pytest.mark.asyncio
+async def test_matching_hash_marks_document_uploaded(proxy):
+    install, deleted = proxy
+    documents = install(ACTUAL_SHA256)
+
+    result = await upload_endpoint.upload_file_proxy("files", "user/u1/raw/doc.pdf", FakeRequest(), user())
+
+    assert result["sha256_verified"] is True
+    assert documents.row["processing_status"] == "uploaded"
+    assert deleted == []
+
+
+@pytest.mark.asyncio
+async def test_hash_mismatch_is_rejected_and_object_deleted(proxy):
+    install, deleted = proxy
+    documents = install("f" * 64)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_endpoint.upload_file_proxy("files", "user/u1/raw/doc.pdf", FakeRequest(), user())
+
+    assert exc_info.value.status_code == 422
+    assert documents.row["processing_status"] == "uploading"
+    assert documents.row["file_sha256"] == "f" * 64
+    assert deleted == [("files", "user/u1/raw/doc.pdf")]
+
+
+@pytest.mark.asyncio
+async def test_upload_without_document_is_rejected_and_object_deleted(proxy):
+    install, deleted = proxy
+    install(ACTUAL_SHA256, raw_path="files/user/u1/raw/other.pdf")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_endpoint.upload_file_proxy("files", "user/u1/raw/doc.pdf", FakeRequest(), user())
+
+    assert exc_info.value.status_code == 404
+    assert deleted == [("files", "user/u1/raw/doc.pdf")]
+
+
+@pytest.mark.asyncio
+async def test_document_without_declared_hash_takes_streamed_hash(proxy):
+    install, deleted = proxy
+    documents = install(None)
+
+    await upload_endpoint.upload_file_proxy("files", "user/u1/raw/doc.pdf", FakeRequest(), user())
+
+    assert documents.row["file_sha256"] == ACTUAL_SHA256
+    assert deleted == []
+
+
+@pytest.mark.asyncio
+async def test_dev_upload_checks_hash_before_queueing_job(proxy):
+    install, deleted = proxy
+    documents = install("f" * 64)
+    file = UploadFile(file=io.BytesIO(CONTENT), filename="doc.pdf")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_endpoint.upload_file_to_storage("job-1", file)
+
+    assert exc_info.value.status_code == 422
+    assert documents.job_status == "uploading"
+    assert deleted == [("files", "user/u1/raw/doc.pdf")]
@@ -0,0 +1,156 @@
+"""
+Unit tests for the upload pipeline GCRA rate limiter.
+
+Tests burst and sustained-rate behaviour, retry_after, per-user upload limits
+and that both stores keep one value per key and prune idle keys.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from api.upload_pipeline.rate_limiter import (
+    InMemoryRateLimitStore,
+    PostgresRateLimitStore,
+    RateLimitConfig,
+    RateLimiter,
+    gcra_decide,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    limiter = RateLimiter(clock=clock)
+    limiter.initialize(InMemoryRateLimitStore())
+    limiter.set_rate_limit("/api/v2", RateLimitConfig(max_requests=5, window_seconds=60, endpoint="general"))
+    return limiter
+
+
+def test_gcra_allows_burst_then_sustained_rate():
+    config = RateLimitConfig(max_requests=3, window_seconds=3, endpoint="test")
+    tat, now = None, 100.0
+
+    results = []
+    for _ in range(4):
+        allowed, new_tat = gcra_decide(tat, now, config)
+        results.append(allowed)
+        if allowed:
+            tat = new_tat
+
+    assert results == [True, True, True, False]
+    assert gcra_decide(tat, now + 1.0, config)[0] is True
+
+
+@pytest.mark.asyncio
+async def test_burst_is_limited_and_retry_after_reported(limiter, clock):
+    decisions = [await limiter.check("/api/v2/documents/1") for _ in range(6)]
+
+    assert [d.allowed for d in decisions] == [True] * 5 + [False]
+    assert decisions[4].remaining == 0
+    assert decisions[5].retry_after == pytest.approx(12.0)
+    assert await limiter.get_retry_after("/api/v2/documents/1") == 12
+
+    clock.now += 12
+    assert await limiter.check_rate_limit("/api/v2/documents/1")
+
+
+def test_routes_match_templates_and_segment_prefixes(limiter):
+    def endpoint(path):
+        config = limiter._get_endpoint_config(path)
+        return config.endpoint if config else None
+
+    assert endpoint("/api/v2/jobs/8f14e45f") == "job_status"
+    assert endpoint("/api/v2/jobs/8f14e45f/logs") == "job_status"
+    assert endpoint("/api/v2/upload") == "upload"
+    assert endpoint("/api/v2/upload-file-proxy/files/user/doc.pdf") == "general"
+    assert endpoint("/api/v2/jobs") == "general"
+    assert endpoint("/health") is None
+
+
+@pytest.mark.asyncio
+async def test_upload_limit_is_tracked_per_user(limiter, clock):
+    limiter.rate_limits["/api/v2/upload"].max_requests = 2
+
+    assert await limiter.check_rate_limit("/api/v2/upload", "user-a")
+    assert await limiter.check_rate_limit("/api/v2/upload", "user-a")
+    assert not await limiter.check_rate_limit("/api/v2/upload", "user-a")
+
+    info = await limiter.get_rate_limit_info("/api/v2/upload", "user-a")
+    assert info["user_limits"]["remaining_requests"] == 0
+    assert info["user_limits"]["current_requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_holds_one_value_per_key_and_prunes(limiter, clock):
+    for i in range(100):
+        await limiter.check(f"/api/v2/documents/{i}")
+
+    store = limiter.store
+    assert len(store.tats) == 100
+
+    clock.now += 3600
+    assert await store.prune(clock.now) == 100
+    assert store.tats == {}
+
+
+class FakeStateTable:
+    """Stand-in for upload_pipeline.rate_limit_state that applies the upsert in Python."""
+
+    def __init__(self):
+        self.tats = {}
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self
+
+    async def fetchval(self, query, *args):
+        if query.strip().startswith("INSERT"):
+            key, now, interval, limit = args
+            new_tat = max(self.tats.get(key, now), now) + interval
+            if key in self.tats and new_tat - now > limit:
+                return None
+            self.tats[key] = new_tat
+            return new_tat
+        return self.tats.get(args[0])
+
+    async def execute(self, query, *args):
+        expired = [key for key, tat in self.tats.items() if tat <= args[0]]
+        for key in expired:
+            del self.tats[key]
+        return f"DELETE {len(expired)}"
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_prunes_expired_rows_every_sweep_interval(clock):
+    table = FakeStateTable()
+    limiter = RateLimiter(clock=clock)
+    limiter.initialize(PostgresRateLimitStore(table, sweep_interval=50))
+
+    for i in range(49):
+        await limiter.check(f"/api/v2/jobs/{i}")
+    assert len(table.tats) == 49
+
+    clock.now += 3600
+    await limiter.check("/api/v2/jobs/fresh")
+    assert list(table.tats) == ["endpoint:/api/v2/jobs/fresh"]
+
+
+@pytest.mark.asyncio
+async def test_uninitialized_limiter_allows_requests():
+    limiter = RateLimiter()
+
+    assert await limiter.check_rate_limit("/api/v2/upload", "user-a")
+    assert await limiter.get_retry_after("/api/v2/upload", "user-a") == 0